@@ -1,5 +1,7 @@
 import json
 import logging
+import threading
+import time
 from typing import Any, Dict, List, Optional, Union
 
 from openai import AzureOpenAI, OpenAIError
@@ -45,6 +47,20 @@ class APIService:
             timeout = httpx.Timeout(APIConfig.API_TIMEOUT_SECONDS)
             self.client._client = httpx.Client(timeout=timeout)
 
+        # Token usage reported by the API (calls also come from prefetch threads,
+        # so the usage of the last call is kept per thread)
+        self._usage_lock = threading.Lock()
+        self._thread_usage = threading.local()
+        self.usage_stats = {
+            "calls": 0,
+            "prompt_tokens": 0,
+            "cached_tokens": 0,
+            "completion_tokens": 0,
+            "latency_seconds": 0.0,
+            "cached_calls": 0,
+            "cached_latency_seconds": 0.0,
+        }
+
     def make_api_call(
         self,
         messages: List[Dict[str, str]],
@@ -70,6 +86,7 @@ class APIService:
         Returns:
             API response content or None if error occurred
         """
+        self._thread_usage.last = None
         try:
             # Add system message if provided
             if system_content:
@@ -99,7 +116,9 @@ class APIService:
             if response_format:
                 api_params["response_format"] = response_format
 
+            start = time.perf_counter()
             response = self.client.chat.completions.create(**api_params)
+            self._thread_usage.last = self._record_usage(response, time.perf_counter() - start)
 
             # Handle tool calls if present (return JSON arguments)
             if (
@@ -127,6 +146,68 @@ class APIService:
             logger.error(f"[API Error] Unexpected error during API call: {e}")
             return None
 
+    @property
+    def last_usage(self) -> Optional[Dict[str, Any]]:
+        """Token usage of the last call made by the current thread (None if not reported)"""
+        return getattr(self._thread_usage, "last", None)
+
+    def _record_usage(self, response: Any, latency: float) -> Optional[Dict[str, Any]]:
+        """
+        Record the token usage of a response, including prompt tokens served
+        from the provider's prompt cache (only reported for long, stable prefixes)
+        Args:
+            response: Chat completion response
+            latency: Seconds spent waiting for the response
+        Returns:
+            Usage of this call, or None if the response reports none
+        """
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return None
+
+        details = getattr(usage, "prompt_tokens_details", None)
+        call_usage = {
+            "prompt_tokens": getattr(usage, "prompt_tokens", 0) or 0,
+            "cached_tokens": getattr(details, "cached_tokens", 0) or 0,
+            "completion_tokens": getattr(usage, "completion_tokens", 0) or 0,
+            "latency_seconds": latency,
+        }
+
+        with self._usage_lock:
+            self.usage_stats["calls"] += 1
+            for key in ("prompt_tokens", "cached_tokens", "completion_tokens", "latency_seconds"):
+                self.usage_stats[key] += call_usage[key]
+            if call_usage["cached_tokens"]:
+                self.usage_stats["cached_calls"] += 1
+                self.usage_stats["cached_latency_seconds"] += latency
+        return call_usage
+
+    def get_usage_statistics(self) -> Dict[str, Any]:
+        """
+        Get token usage statistics
+        Returns:
+            Totals, share of prompt tokens served from the prompt cache and mean
+            latency of calls with and without cached tokens
+        """
+        with self._usage_lock:
+            stats = dict(self.usage_stats)
+
+        calls = stats["calls"]
+        cached_calls = stats["cached_calls"]
+        uncached_calls = calls - cached_calls
+        stats["cached_token_share"] = (
+            round(stats["cached_tokens"] / stats["prompt_tokens"], 3) if stats["prompt_tokens"] else 0.0
+        )
+        stats["mean_latency_ms"] = round(stats["latency_seconds"] / calls * 1000, 1) if calls else 0.0
+        stats["mean_cached_latency_ms"] = (
+            round(stats["cached_latency_seconds"] / cached_calls * 1000, 1) if cached_calls else 0.0
+        )
+        stats["mean_uncached_latency_ms"] = (
+            round((stats["latency_seconds"] - stats["cached_latency_seconds"]) / uncached_calls * 1000, 1)
+            if uncached_calls else 0.0
+        )
+        return stats
+
     def parse_json_response(
         self, content: str, fallback_response: Dict[str, Any]
     ) -> Dict[str, Any]:
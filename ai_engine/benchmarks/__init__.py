@@ -0,0 +1,18 @@
+"""
+AI Benchmarks
+Harnesses comparing latency and quality of alternative AI pipelines
+"""
+
+from .common import (
+    RecordingAPIService,
+    create_api_service_from_env,
+    create_benchmark_game_state,
+    summarize_latencies,
+)
+
+__all__ = [
+    'RecordingAPIService',
+    'create_api_service_from_env',
+    'create_benchmark_game_state',
+    'summarize_latencies',
+]
@@ -0,0 +1,184 @@
+"""
+Character response mode comparison harness
+
+Runs the same conversation topics through the standard (neutral + personality)
+and fused (single call) handlers and compares latency, API calls and answer quality.
+
+Usage:
+    python -m ai_engine.benchmarks.character_modes --character "Martha" --output results.json
+"""
+
+import argparse
+import copy
+import json
+import time
+from typing import Any, Dict, List, Optional
+
+from ai_engine.processors.character.factory import (
+    CharacterResponseMode,
+    ConversationComponentFactory,
+)
+from ai_engine.processors.character.memory import (
+    CharacterMemoryManager,
+    GameStateLoreRetriever,
+)
+from game_engine.core.game_state import GameMode, GameState
+from game_engine.models.character import Character
+
+from .common import (
+    RecordingAPIService,
+    create_api_service_from_env,
+    create_benchmark_game_state,
+    summarize_latencies,
+)
+
+DEFAULT_TOPICS: List[str] = [
+    "Good evening. Who are you?",
+    "Where were you when the incident happened?",
+    "Who else is in the manor tonight?",
+    "Did you notice anything strange recently?",
+    "I think you are hiding something from me.",
+    "Thank you, that will be all.",
+]
+
+REQUIRED_KEYS = ("think", "answer", "action")
+VALID_ACTIONS = (GameMode.CONVERSATION.value, GameMode.EXPLORATION.value)
+
+
+def compare_response_modes(
+    api_service,
+    game_state: GameState,
+    character: Character,
+    topics: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Play the same topics with every response mode and collect comparison metrics
+
+    Args:
+        api_service: Real APIService (wrapped for timing)
+        game_state: Game state with the character reachable by the player
+        character: Character to talk to (copied per mode, never mutated)
+        topics: Player lines to send, in order
+
+    Returns:
+        Dictionary with per-mode metrics, action agreement and answer samples
+    """
+    topics = topics or DEFAULT_TOPICS
+    recorder = RecordingAPIService(api_service)
+    responses: Dict[str, List[Dict[str, Any]]] = {}
+    results: Dict[str, Any] = {"character": character.name, "topics": topics, "modes": {}}
+
+    for mode in CharacterResponseMode:
+        memory_manager = CharacterMemoryManager(GameStateLoreRetriever(recorder))
+        handler = ConversationComponentFactory.create_conversation_handler(
+            recorder, memory_manager, mode
+        )
+        mode_character = copy.deepcopy(character)
+        turn_latencies: List[float] = []
+        responses[mode.value] = []
+        recorder.reset()
+
+        for topic in topics:
+            start = time.perf_counter()
+            raw = handler.handle_conversation(
+                mode_character, game_state.player, topic, game_state
+            )
+            turn_latencies.append(time.perf_counter() - start)
+            responses[mode.value].append(_parse_response(raw))
+
+        results["modes"][mode.value] = {
+            "turn_latency": summarize_latencies(turn_latencies),
+            "api_call_latency": summarize_latencies(recorder.call_latencies),
+            "api_calls_per_turn": round(recorder.call_count / len(topics), 2),
+            **_score_responses(responses[mode.value]),
+        }
+
+    results["action_agreement"] = _action_agreement(
+        responses[CharacterResponseMode.STANDARD.value],
+        responses[CharacterResponseMode.FUSED.value],
+    )
+    results["samples"] = [
+        {
+            "topic": topic,
+            **{mode: responses[mode][i].get("answer", "") for mode in responses},
+        }
+        for i, topic in enumerate(topics)
+    ]
+    return results
+
+
+def _parse_response(raw: str) -> Dict[str, Any]:
+    """Parse a handler response, keeping an empty dict when invalid"""
+    try:
+        parsed = json.loads(raw)
+        return parsed if isinstance(parsed, dict) else {}
+    except (TypeError, json.JSONDecodeError):
+        return {}
+
+
+def _score_responses(responses: List[Dict[str, Any]]) -> Dict[str, float]:
+    """Score structural quality of responses"""
+    total = len(responses) or 1
+    well_formed = [r for r in responses if all(key in r for key in REQUIRED_KEYS)]
+    answers = [str(r.get("answer", "")) for r in responses]
+
+    return {
+        "json_valid_rate": round(len(well_formed) / total, 3),
+        "action_valid_rate": round(
+            sum(1 for r in responses if r.get("action") in VALID_ACTIONS) / total, 3
+        ),
+        "mean_answer_chars": round(sum(len(a) for a in answers) / total, 1),
+    }
+
+
+def _action_agreement(
+    reference: List[Dict[str, Any]], candidate: List[Dict[str, Any]]
+) -> float:
+    """Share of turns where both modes chose the same action"""
+    pairs = list(zip(reference, candidate))
+    if not pairs:
+        return 0.0
+    same = sum(1 for ref, cand in pairs if ref.get("action") == cand.get("action"))
+    return round(same / len(pairs), 3)
+
+
+def _find_character(game_state: GameState, name: Optional[str]) -> Character:
+    """Find the character to benchmark and move the player next to them"""
+    for room in game_state.rooms.values():
+        for character in room.characters:
+            if name is None or character.name.lower() == name.lower():
+                game_state.player.current_location = room
+                game_state.current_location = room.name
+                return character
+    raise ValueError(f"Character not found: {name}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare character response modes")
+    parser.add_argument("--character", default=None, help="Character name (default: first found)")
+    parser.add_argument("--output", default=None, help="Write full results to this JSON file")
+    args = parser.parse_args()
+
+    game_state = create_benchmark_game_state()
+    character = _find_character(game_state, args.character)
+    results = compare_response_modes(create_api_service_from_env(), game_state, character)
+
+    print(f"Character: {results['character']} ({len(results['topics'])} topics)")
+    for mode, metrics in results["modes"].items():
+        print(
+            f"  {mode:<9} turn p50={metrics['turn_latency']['p50_ms']}ms "
+            f"mean={metrics['turn_latency']['mean_ms']}ms "
+            f"calls/turn={metrics['api_calls_per_turn']} "
+            f"json_valid={metrics['json_valid_rate']} "
+            f"answer_chars={metrics['mean_answer_chars']}"
+        )
+    print(f"  action agreement: {results['action_agreement']}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
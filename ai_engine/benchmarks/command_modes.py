@@ -0,0 +1,156 @@
+"""
+Command pipeline comparison harness
+
+Runs the same commands through the two-phase (analysis + execution) and the
+fused (single tool call) pipelines, then compares latency, API calls and how
+often both pipelines agree on the final action.
+
+Usage:
+    python -m ai_engine.benchmarks.command_modes --output results.json
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Dict, List, Optional
+
+from ai_engine.cache.cache_config import CacheConfig
+from ai_engine.cache.cache_manager import AICache
+from ai_engine.processors.command.factory import (
+    CommandComponentFactory,
+    CommandPipelineMode,
+)
+from game_engine.core.game_state import GameState
+
+from .common import (
+    RecordingAPIService,
+    create_api_service_from_env,
+    create_benchmark_game_state,
+    summarize_latencies,
+)
+
+DEFAULT_COMMANDS: List[str] = [
+    "look around",
+    "go to the main salon",
+    "aller dans la salle à manger",
+    "talk to the inspector",
+    "examine the chandelier",
+    "what do I have in my pockets?",
+    "go to the kitchen",
+    "kick the inspector",
+    "help",
+]
+
+AGREEMENT_KEYS = ("valid", "action", "target", "target_type")
+
+
+def compare_pipeline_modes(
+    api_service,
+    game_state: GameState,
+    commands: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Resolve the same commands with every pipeline mode and collect comparison metrics
+
+    Args:
+        api_service: Real APIService (wrapped for timing)
+        game_state: Game state the commands are resolved against
+        commands: Player commands, in order
+
+    Returns:
+        Dictionary with per-mode metrics, agreement rates and per-command results
+    """
+    commands = commands or DEFAULT_COMMANDS
+    ai_state = game_state.to_ai_format()
+    recorder = RecordingAPIService(api_service)
+    cache = AICache(CacheConfig(enable_cache=False))
+    outputs: Dict[str, List[Dict[str, Any]]] = {}
+    results: Dict[str, Any] = {"commands": commands, "modes": {}}
+
+    for mode in CommandPipelineMode:
+        analyzer, executor = CommandComponentFactory.create_pipeline(
+            recorder, cache, False, mode
+        )
+        latencies: List[float] = []
+        outputs[mode.value] = []
+        recorder.reset()
+
+        for command in commands:
+            start = time.perf_counter()
+            reasoning_result = analyzer.analyze_command(command, ai_state)
+            outputs[mode.value].append(executor.execute_command(reasoning_result, ai_state))
+            latencies.append(time.perf_counter() - start)
+
+        results["modes"][mode.value] = {
+            "command_latency": summarize_latencies(latencies),
+            "api_calls_per_command": round(recorder.call_count / len(commands), 2),
+            "valid_rate": round(
+                sum(1 for r in outputs[mode.value] if r.get("valid")) / len(commands), 3
+            ),
+        }
+
+    reference = outputs[CommandPipelineMode.TWO_PHASE.value]
+    candidate = outputs[CommandPipelineMode.FUSED.value]
+    results["agreement"] = {
+        key: _agreement(reference, candidate, key) for key in AGREEMENT_KEYS
+    }
+    results["full_agreement"] = round(
+        sum(
+            1 for ref, cand in zip(reference, candidate)
+            if all(_same(ref, cand, key) for key in AGREEMENT_KEYS)
+        ) / len(commands), 3
+    )
+    results["results"] = [
+        {
+            "command": command,
+            **{mode: {k: outputs[mode][i].get(k) for k in (*AGREEMENT_KEYS, "message")} for mode in outputs},
+        }
+        for i, command in enumerate(commands)
+    ]
+    return results
+
+
+def _same(reference: Dict[str, Any], candidate: Dict[str, Any], key: str) -> bool:
+    """Compare one field, ignoring case for names"""
+    ref, cand = reference.get(key), candidate.get(key)
+    if isinstance(ref, str) and isinstance(cand, str):
+        return ref.strip().lower() == cand.strip().lower()
+    return ref == cand
+
+
+def _agreement(
+    reference: List[Dict[str, Any]], candidate: List[Dict[str, Any]], key: str
+) -> float:
+    """Share of commands where both pipelines agree on a field"""
+    pairs = list(zip(reference, candidate))
+    if not pairs:
+        return 0.0
+    return round(sum(1 for ref, cand in pairs if _same(ref, cand, key)) / len(pairs), 3)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare command pipeline modes")
+    parser.add_argument("--output", default=None, help="Write full results to this JSON file")
+    args = parser.parse_args()
+
+    game_state = create_benchmark_game_state()
+    results = compare_pipeline_modes(create_api_service_from_env(), game_state)
+
+    print(f"Commands: {len(results['commands'])}")
+    for mode, metrics in results["modes"].items():
+        print(
+            f"  {mode:<9} p50={metrics['command_latency']['p50_ms']}ms "
+            f"mean={metrics['command_latency']['mean_ms']}ms "
+            f"calls/command={metrics['api_calls_per_command']} "
+            f"valid={metrics['valid_rate']}"
+        )
+    print(f"  agreement: {results['agreement']} (all fields: {results['full_agreement']})")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
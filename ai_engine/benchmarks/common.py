@@ -0,0 +1,82 @@
+"""
+Shared helpers for AI benchmark harnesses
+"""
+
+import os
+import statistics
+import time
+from typing import Any, Dict, List, Optional
+
+from ai_engine.api.client import create_azure_client
+from ai_engine.api.service import APIService
+from game_engine.core.game_state import GameState
+from game_engine.setup.game_setup import setup_game
+
+
+class RecordingAPIService:
+    """Wraps an APIService and records latency and token usage for every API call"""
+
+    def __init__(self, api_service):
+        self.api_service = api_service
+        self.call_latencies: List[float] = []
+        self.usages: List[Optional[Dict[str, Any]]] = []
+
+    def make_api_call(self, *args, **kwargs) -> Optional[str]:
+        """Forward the call to the wrapped service and time it"""
+        start = time.perf_counter()
+        try:
+            return self.api_service.make_api_call(*args, **kwargs)
+        finally:
+            self.call_latencies.append(time.perf_counter() - start)
+            self.usages.append(getattr(self.api_service, "last_usage", None))
+
+    def parse_json_response(self, content: str, fallback_response: Dict[str, Any]) -> Dict[str, Any]:
+        return self.api_service.parse_json_response(content, fallback_response)
+
+    def reset(self) -> None:
+        """Forget recorded calls"""
+        self.call_latencies = []
+        self.usages = []
+
+    @property
+    def call_count(self) -> int:
+        return len(self.call_latencies)
+
+
+def create_api_service_from_env() -> APIService:
+    """Create an APIService from the same environment variables as the game"""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    client = create_azure_client(
+        os.getenv("AZURE_OPENAI_API_KEY", ""),
+        os.getenv("AZURE_OPENAI_ENDPOINT", ""),
+        os.getenv("API_VERSION", ""),
+    )
+    return APIService(client, os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME", ""))
+
+
+def create_benchmark_game_state(player_name: str = "Benchmark") -> GameState:
+    """Create a fresh game state with the world loaded, like GameService.initialize_game"""
+    rooms, player = setup_game(player_name)
+
+    state = GameState(rooms=rooms, player=player, player_name=player_name)
+    state.current_location = player.current_location.name
+    state.rooms_visited.add(state.current_location)
+    state.game_running = True
+
+    return state
+
+
+def summarize_latencies(latencies: List[float]) -> Dict[str, float]:
+    """Summarize latencies in milliseconds"""
+    if not latencies:
+        return {"count": 0, "mean_ms": 0.0, "p50_ms": 0.0, "max_ms": 0.0}
+
+    ordered = sorted(latencies)
+    return {
+        "count": len(ordered),
+        "mean_ms": round(statistics.mean(ordered) * 1000, 2),
+        "p50_ms": round(statistics.median(ordered) * 1000, 2),
+        "max_ms": round(ordered[-1] * 1000, 2),
+    }
@@ -0,0 +1,141 @@
+"""
+Prompt building micro-benchmark
+
+Builds the prompts of one conversation/exploration turn (room description, neutral
+character, lore lookup, theory verification) many times, with templates rebuilt on
+every call (previous behavior) and with the precompiled template cache, then compares
+CPU time and memory allocated per turn. No API call is made.
+
+Usage:
+    python -m ai_engine.benchmarks.prompt_building --turns 2000 --output results.json
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from ai_engine.prompts import (
+    create_analyse_theory,
+    create_get_lore_information,
+    create_neutral_character_prompt,
+    create_room_description_prompt,
+)
+from ai_engine.prompts.templates import get_template_cache
+from ai_engine.utils.formatters import format_game_state
+
+from .common import create_benchmark_game_state, summarize_latencies
+
+
+def create_turn(game_state) -> Callable[[], List[str]]:
+    """Prompt builds of one turn in the benchmark game state"""
+    player = game_state.player
+    room = player.current_location
+    character = next(
+        (c for r in game_state.rooms.values() for c in r.characters), None
+    )
+    game_state_str = format_game_state(game_state.to_ai_format())
+
+    def turn() -> List[str]:
+        return [
+            create_room_description_prompt(room, "first_entry"),
+            create_neutral_character_prompt(character, player),
+            create_get_lore_information(game_state_str, player, character, "Where is the kitchen knife?"),
+            create_analyse_theory(),
+        ]
+
+    return turn
+
+
+def measure(turn: Callable[[], List[str]], turns: int) -> Dict[str, Any]:
+    """
+    CPU time and peak memory allocated by the prompt builds
+
+    Args:
+        turn: Builds the prompts of one turn
+        turns: Number of turns timed
+
+    Returns:
+        Per-turn latency summary, CPU time and peak allocated bytes
+    """
+    turn()  # Warm-up: imports, template compilation
+
+    latencies: List[float] = []
+    cpu_start = time.process_time()
+    for _ in range(turns):
+        start = time.perf_counter()
+        turn()
+        latencies.append(time.perf_counter() - start)
+    cpu_seconds = time.process_time() - cpu_start
+
+    # Allocations measured separately: tracing slows the timed loop down
+    sample = min(turns, 200)
+    peak_bytes = 0
+    tracemalloc.start()
+    for _ in range(sample):
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        turn()
+        peak_bytes += tracemalloc.get_traced_memory()[1] - current
+    tracemalloc.stop()
+
+    return {
+        "turn_latency": summarize_latencies(latencies),
+        "cpu_us_per_turn": round(cpu_seconds / turns * 1e6, 1),
+        "peak_alloc_bytes_per_turn": round(peak_bytes / sample, 1),
+        "prompt_chars": sum(len(prompt) for prompt in turn()),
+    }
+
+
+def compare_prompt_building(turns: int = 2000) -> Dict[str, Any]:
+    """
+    Build the same turn's prompts with and without the template cache
+
+    Args:
+        turns: Number of turns timed per mode
+
+    Returns:
+        Dictionary with per-mode metrics
+    """
+    cache = get_template_cache()
+    turn = create_turn(create_benchmark_game_state())
+    results: Dict[str, Any] = {"turns": turns, "modes": {}}
+
+    enabled = cache.enabled
+    try:
+        for mode, use_templates in (("rebuild", False), ("templates", True)):
+            cache.enabled = use_templates
+            cache.clear()
+            results["modes"][mode] = measure(turn, turns)
+        results["template_cache"] = cache.get_statistics()
+    finally:
+        cache.enabled = enabled
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare prompt building cost with and without precompiled templates")
+    parser.add_argument("--turns", type=int, default=2000, help="Number of turns timed per mode")
+    parser.add_argument("--output", default=None, help="Write full results to this JSON file")
+    args = parser.parse_args()
+
+    results = compare_prompt_building(args.turns)
+
+    for mode, metrics in results["modes"].items():
+        print(
+            f"  {mode:<9} cpu={metrics['cpu_us_per_turn']}us/turn "
+            f"p50={metrics['turn_latency']['p50_ms']}ms "
+            f"peak_alloc={metrics['peak_alloc_bytes_per_turn']}B/turn "
+            f"chars={metrics['prompt_chars']}"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
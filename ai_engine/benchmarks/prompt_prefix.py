@@ -0,0 +1,244 @@
+"""
+Prompt prefix stability and prompt caching harness
+
+Renders every agent prompt over several turns (player in a different room, other
+command, topic and clue each turn) and reports how much of each prompt is a prefix
+shared by all turns. Providers reuse the cached tokens of a repeated prefix, so the
+stable rules and formats come first and the turn's data last.
+
+Unless --offline is given, the turns are also sent to the API (command pipeline and
+room description, caches disabled) and the cached-token share and latency are read
+from the `usage` reported with every response.
+
+Usage:
+    python -m ai_engine.benchmarks.prompt_prefix --offline
+    python -m ai_engine.benchmarks.prompt_prefix --output results.json
+"""
+
+import argparse
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+from ai_engine.cache.cache_config import CacheConfig
+from ai_engine.cache.cache_manager import AICache
+from ai_engine.processors.command.factory import CommandComponentFactory, get_command_pipeline_mode
+from ai_engine.processors.story.room_description import RoomDescriptionGenerator
+from ai_engine.prompts import (
+    create_character_description_prompt,
+    create_clue_analysis_prompt,
+    create_conversation_summary_prompt,
+    create_fused_character_prompt,
+    create_get_lore_information,
+    create_neutral_character_prompt,
+    create_personality_character_prompt,
+    create_room_description_prompt,
+)
+from ai_engine.prompts.command import (
+    create_command_pipeline_prompt,
+    create_command_prompt,
+    create_nonsense_action_prompt,
+    create_reasoning_prompt,
+)
+from ai_engine.utils.formatters import format_game_state
+from game_engine.core.game_state import GameState
+
+from .common import (
+    RecordingAPIService,
+    create_api_service_from_env,
+    create_benchmark_game_state,
+    summarize_latencies,
+)
+
+DEFAULT_TURNS: List[Dict[str, str]] = [
+    {"command": "look around", "topic": "Where were you last night?"},
+    {"command": "examine the chandelier", "topic": "Who found the body?"},
+    {"command": "talk to the inspector", "topic": "Did Judith have enemies?"},
+    {"command": "aller dans la salle à manger", "topic": "What do you know about the knife?"},
+]
+
+
+def move_player(game_state: GameState, room_name: str) -> None:
+    """Put the player in another room"""
+    game_state.player.current_location = game_state.rooms[room_name]
+    game_state.current_location = room_name
+    game_state.rooms_visited.add(room_name)
+
+
+def render_agent_prompts(game_state: GameState, turn: int, command: str, topic: str) -> Dict[str, str]:
+    """
+    Every agent prompt of one turn
+
+    Args:
+        game_state: Game state, with the player in the turn's room
+        turn: Turn number, picks the clue and the described character
+        command: Player's command
+        topic: What the player says to the character
+
+    Returns:
+        Prompt text by agent name
+    """
+    player = game_state.player
+    room = player.current_location
+    characters = [c for r in game_state.rooms.values() for c in r.characters]
+    clues = [c for r in game_state.rooms.values() for c in r.clues]
+    # Conversation prompts: always the same character, only the turn's data changes
+    character = characters[0]
+    game_state_str = format_game_state(game_state.to_ai_format())
+    reasoning_result = {"intended_action": "look", "intended_target": command, "validation_result": "valid"}
+
+    return {
+        "reasoning": create_reasoning_prompt(game_state_str, command),
+        "executor": create_command_prompt(reasoning_result, game_state_str),
+        "pipeline": create_command_pipeline_prompt(game_state_str, command),
+        "nonsense": create_nonsense_action_prompt(game_state_str),
+        "neutral": create_neutral_character_prompt(character, player),
+        "fused": create_fused_character_prompt(character, player),
+        "personality": create_personality_character_prompt(f"I cannot tell you about that: {topic}", character, topic),
+        "lore": create_get_lore_information(game_state_str, player, character, topic),
+        "summary": create_conversation_summary_prompt(
+            character, player, [{"role": "user", "content": topic}]
+        ),
+        "room_description": create_room_description_prompt(room, "first_entry"),
+        "clue_analysis": create_clue_analysis_prompt(clues[turn % len(clues)]),
+        "character_description": create_character_description_prompt(
+            characters[(turn + 1) % len(characters)], room
+        ),
+    }
+
+
+def render_turns(game_state: GameState, turns: Optional[List[Dict[str, str]]] = None) -> List[Dict[str, str]]:
+    """Agent prompts of several turns, the player entering another room every turn"""
+    turns = turns or DEFAULT_TURNS
+    room_names = list(game_state.rooms)
+    start = game_state.current_location
+    try:
+        rendered = []
+        for i, turn in enumerate(turns):
+            move_player(game_state, room_names[i % len(room_names)])
+            rendered.append(render_agent_prompts(game_state, i, turn["command"], turn["topic"]))
+        return rendered
+    finally:
+        move_player(game_state, start)
+
+
+def shared_prefix_length(prompts: List[str]) -> int:
+    """Length of the text every prompt starts with"""
+    return len(os.path.commonprefix(prompts))
+
+
+def prefix_stability(rendered: List[Dict[str, str]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Shared prefix of every agent's prompts over the turns
+
+    Args:
+        rendered: Agent prompts of each turn
+
+    Returns:
+        Shared prefix length, mean prompt length and prefix share by agent
+    """
+    results = {}
+    for agent in rendered[0]:
+        prompts = [turn[agent] for turn in rendered]
+        prefix = shared_prefix_length(prompts)
+        mean_chars = sum(len(p) for p in prompts) / len(prompts)
+        results[agent] = {
+            "prefix_chars": prefix,
+            "mean_prompt_chars": round(mean_chars),
+            "prefix_share": round(prefix / mean_chars, 3),
+        }
+    return results
+
+
+def measure_prompt_caching(
+    api_service,
+    game_state: GameState,
+    turns: Optional[List[Dict[str, str]]] = None,
+) -> Dict[str, Any]:
+    """
+    Send the turns to the API and read the cached-token share from `usage`
+
+    Args:
+        api_service: Real APIService (wrapped to record usage)
+        game_state: Game state the turns are played in
+        turns: Commands of each turn, in order
+
+    Returns:
+        Cached-token share and latency by phase, and the service's usage totals
+    """
+    turns = turns or DEFAULT_TURNS
+    recorder = RecordingAPIService(api_service)
+    cache = AICache(CacheConfig(enable_cache=False))
+    analyzer, executor = CommandComponentFactory.create_pipeline(
+        recorder, cache, False, get_command_pipeline_mode()
+    )
+    room_generator = RoomDescriptionGenerator(recorder, cache, False)
+    room_names = list(game_state.rooms)
+    phases: Dict[str, List[int]] = {"room_description": [], "command": []}
+
+    def record(phase: str, call) -> None:
+        first = recorder.call_count
+        call()
+        phases[phase].extend(range(first, recorder.call_count))
+
+    for i, turn in enumerate(turns):
+        move_player(game_state, room_names[i % len(room_names)])
+        room = game_state.player.current_location
+        ai_state = game_state.to_ai_format()
+        record("room_description", lambda: room_generator.generate_description(room, game_state, "move"))
+        record("command", lambda: executor.execute_command(analyzer.analyze_command(turn["command"], ai_state), ai_state))
+
+    results: Dict[str, Any] = {"turns": turns, "phases": {}}
+    for phase, calls in phases.items():
+        usages = [recorder.usages[i] for i in calls if recorder.usages[i]]
+        prompt_tokens = sum(u["prompt_tokens"] for u in usages)
+        cached_tokens = sum(u["cached_tokens"] for u in usages)
+        results["phases"][phase] = {
+            "calls": len(calls),
+            "prompt_tokens": prompt_tokens,
+            "cached_tokens": cached_tokens,
+            "cached_token_share": round(cached_tokens / prompt_tokens, 3) if prompt_tokens else 0.0,
+            "latency": summarize_latencies([recorder.call_latencies[i] for i in calls]),
+        }
+    results["usage"] = api_service.get_usage_statistics()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure prompt prefix stability and prompt caching")
+    parser.add_argument("--offline", action="store_true", help="Only measure prefix stability, no API call")
+    parser.add_argument("--output", default=None, help="Write full results to this JSON file")
+    args = parser.parse_args()
+
+    game_state = create_benchmark_game_state()
+    results: Dict[str, Any] = {"prefix_stability": prefix_stability(render_turns(game_state))}
+
+    print(f"{'agent':<22} {'prefix':>7} {'prompt':>7} {'share':>6}")
+    for agent, metrics in results["prefix_stability"].items():
+        print(
+            f"{agent:<22} {metrics['prefix_chars']:>7} "
+            f"{metrics['mean_prompt_chars']:>7} {metrics['prefix_share']:>6}"
+        )
+
+    if not args.offline:
+        results["prompt_caching"] = measure_prompt_caching(create_api_service_from_env(), game_state)
+        for phase, metrics in results["prompt_caching"]["phases"].items():
+            print(
+                f"  {phase:<17} calls={metrics['calls']} "
+                f"cached_share={metrics['cached_token_share']} "
+                f"p50={metrics['latency']['p50_ms']}ms"
+            )
+        usage = results["prompt_caching"]["usage"]
+        print(
+            f"  total cached_share={usage['cached_token_share']} "
+            f"cached={usage['mean_cached_latency_ms']}ms uncached={usage['mean_uncached_latency_ms']}ms"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
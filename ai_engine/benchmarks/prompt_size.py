@@ -0,0 +1,363 @@
+"""
+Prompt size profiler
+
+Builds representative game states (early, mid and late game, long conversation),
+renders every agent prompt in each of them and counts the tokens of every prompt
+section with the local tokenizer (tiktoken when installed, estimated otherwise).
+Prints a per-agent, per-section table; the JSON output can be compared to a saved
+baseline so CI flags prompt-size regressions. No API call is made.
+
+Usage:
+    python -m ai_engine.benchmarks.prompt_size --output sizes.json
+    python -m ai_engine.benchmarks.prompt_size --baseline sizes.json --tolerance 0.05
+"""
+
+import argparse
+import json
+import random
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+from ai_engine.prompts import (
+    create_analyse_theory,
+    create_collect_theory,
+    create_conversation_summary_prompt,
+    create_fused_character_prompt,
+    create_get_lore_information,
+    create_neutral_character_prompt,
+    create_personality_character_prompt,
+    get_rules_prompt,
+)
+from ai_engine.prompts.character import lore_agent, neutral_agent, personality_agent
+from ai_engine.prompts.character.fused_agent import _build_personality_voice_section
+from ai_engine.prompts.command import (
+    create_command_pipeline_prompt,
+    create_command_prompt,
+    create_reasoning_prompt,
+)
+from ai_engine.prompts.command import executor_agent, pipeline_agent, reasoning_agent
+from ai_engine.prompts.theory import analyse_theory_agent, collect_theory_agent
+from ai_engine.utils.formatters import format_game_state
+from ai_engine.utils.tokens import count_text_tokens, get_tokenizer_name
+from game_engine.core.game_state import GameState
+
+from .common import create_benchmark_game_state
+
+# Prompt text not produced by a section builder (the template around the sections)
+TEMPLATE_SECTION = "(template)"
+
+COMMAND = "examine the letter on the desk"
+TOPIC = "Where were you when Judith died, and who else knew about the letter?"
+REASONING_RESULT = {
+    "detected_language": "english",
+    "translated_command": COMMAND,
+    "intended_action": "look",
+    "intended_target": "letter",
+    "target_type": "clue",
+    "reasoning": "The player wants to inspect a clue present in the room.",
+    "validation_result": "valid",
+    "validation_reason": "The clue exists in the current room.",
+}
+
+QUESTIONS = [
+    "Where were you last night?",
+    "Did you hear anything unusual after dinner?",
+    "How well did you know Judith?",
+    "Who had a reason to want her dead?",
+    "Can you explain this clue to me?",
+    "Why did you lie to me earlier?",
+]
+
+
+def _collect(game_state: GameState, count: int) -> None:
+    """Put the first clues of the manor in the player's inventory"""
+    for room in game_state.rooms.values():
+        for clue in list(room.clues):
+            if len(game_state.player.inventory) >= count:
+                return
+            clue.collect()
+            game_state.player.inventory.append(clue)
+            room.remove_clue(clue)
+            game_state.mark_changed()
+
+
+def _talk(character, turns: int) -> None:
+    """Fill the character's ongoing conversation"""
+    for i in range(turns):
+        question = QUESTIONS[i % len(QUESTIONS)]
+        character.remember(question, "user")
+        character.remember(
+            f"{character.name} considers the question for a while. \"{question}\" "
+            "I told the inspector everything already, Detective. I was in my room, "
+            "and I only heard the clock strike midnight before the scream.",
+            "assistant",
+        )
+
+
+def _remember_past(character, conversations: int, witnessed: int) -> None:
+    """Give the character summaries of past conversations and witnessed incidents"""
+    character.memory_global = [
+        f"- The detective asked about {QUESTIONS[i % len(QUESTIONS)].lower()}\n"
+        f"- {character.name} stayed evasive and grew wary of the detective's questions"
+        for i in range(conversations)
+    ]
+    for i in range(witnessed):
+        character.memory.add_witness(f"incident-{i}", f"The detective knocked over a vase ({i + 1})")
+        character.memory.add_reputation(f"rumor-{i}", f"The detective was heard singing in another room ({i + 1})")
+
+
+def create_fixtures(seed: int = 0) -> Dict[str, GameState]:
+    """
+    Representative game states
+
+    Args:
+        seed: Seed of the random character placement, so sizes are comparable between runs
+
+    Returns:
+        Game state by stage: early, mid, late and long_conversation
+    """
+    fixtures: Dict[str, GameState] = {}
+    room_names = None
+    random_state = random.getstate()
+
+    for stage, clues, visited, conversations, witnessed, turns in (
+        ("early", 0, 1, 0, 0, 1),
+        ("mid", 4, 4, 2, 1, 4),
+        ("late", 99, 99, 6, 3, 6),
+        ("long_conversation", 4, 4, 2, 1, 30),
+    ):
+        random.seed(seed)
+        game_state = create_benchmark_game_state()
+        room_names = room_names or list(game_state.rooms)
+        _collect(game_state, clues)
+        for name in room_names[:visited]:
+            game_state.rooms_visited.add(name)
+
+        character = _get_character(game_state)
+        _remember_past(character, conversations, witnessed)
+        _talk(character, turns)
+        fixtures[stage] = game_state
+
+    random.setstate(random_state)
+    return fixtures
+
+
+def _get_character(game_state: GameState):
+    """Character the profiled conversation is held with"""
+    return next(c for r in game_state.rooms.values() for c in r.characters)
+
+
+def _agent_sections(game_state: GameState) -> Dict[str, Tuple[Callable[[], str], Dict[str, str]]]:
+    """Prompt builder and section texts of every agent"""
+    player = game_state.player
+    character = _get_character(game_state)
+    game_state_str = format_game_state(game_state.to_ai_format())
+    rules_prompt = get_rules_prompt()
+    base_answer = "I was in my room all night, Detective, and I know nothing about any letter."
+    conversation = character.get_conversation_memory()
+
+    character_sections = {
+        "secrets": neutral_agent._build_secrets_section(neutral_agent._get_available_secrets(character, player)),
+        "nonsense_awareness": neutral_agent._build_nonsense_awareness_section(character),
+        "behavior_rules": neutral_agent._get_character_behavior_rules(rules_prompt),
+        "recent_events": str(character.prompt),
+        "global_memory": str(character.memory_global),
+    }
+
+    return {
+        "reasoning": (
+            lambda: create_reasoning_prompt(game_state_str, COMMAND),
+            {
+                "movement_rules": reasoning_agent._get_movement_rules(),
+                "game_state": game_state_str,
+                "command": COMMAND,
+            },
+        ),
+        "command": (
+            lambda: create_command_prompt(REASONING_RESULT, game_state_str),
+            {
+                "validation_rules": executor_agent._get_validation_rules(),
+                "narrative_guidelines": executor_agent._get_narrative_guidelines(),
+                "response_guidelines": executor_agent._get_response_guidelines(),
+                "rules": rules_prompt,
+                "output_format": executor_agent._get_output_format(),
+                "game_state": game_state_str,
+                "analysis": str(REASONING_RESULT),
+            },
+        ),
+        "pipeline": (
+            lambda: create_command_pipeline_prompt(game_state_str, COMMAND),
+            {
+                "movement_rules": reasoning_agent._get_movement_rules(),
+                "analysis_steps": pipeline_agent._get_analysis_steps(),
+                "narrative_guidelines": executor_agent._get_narrative_guidelines(),
+                "response_guidelines": executor_agent._get_response_guidelines(),
+                "rules": rules_prompt,
+                "game_state": game_state_str,
+                "command": COMMAND,
+            },
+        ),
+        "neutral": (
+            lambda: create_neutral_character_prompt(character, player),
+            character_sections,
+        ),
+        "fused": (
+            lambda: create_fused_character_prompt(character, player),
+            {**character_sections, "personality_voice": _build_personality_voice_section(character)},
+        ),
+        "lore": (
+            lambda: create_get_lore_information(game_state_str, player, character, TOPIC),
+            {
+                "core_rule": lore_agent._build_core_rule_section(),
+                "when_to_respond": lore_agent._build_when_to_respond_section(),
+                "when_not_to_respond": lore_agent._build_when_not_to_respond_section(),
+                "response_rules": lore_agent._build_response_rules_section(),
+                "character_info_format": lore_agent._build_character_info_format_section(),
+                "special_cases": lore_agent._build_special_cases_section(),
+                "examples": lore_agent._build_examples_section(),
+                "game_state": lore_agent._build_game_state_section(game_state_str),
+                "context": lore_agent._build_context_section(
+                    character.name, character.role, player.current_location.name, TOPIC
+                ),
+            },
+        ),
+        "personality": (
+            lambda: create_personality_character_prompt(base_answer, character, TOPIC),
+            {
+                "character_info": personality_agent._build_character_info_section(character),
+                "personality_instructions": personality_agent._build_personality_instructions(character),
+                "guidelines": personality_agent._build_personality_guidelines(rules_prompt),
+                "context": personality_agent._build_context_section(TOPIC, base_answer),
+            },
+        ),
+        "summary": (
+            lambda: create_conversation_summary_prompt(character, player),
+            {"conversation": str(conversation)},
+        ),
+        "collect_theory": (
+            create_collect_theory,
+            {
+                "response_format": collect_theory_agent._get_response_format_section(),
+                "character_list": collect_theory_agent._get_character_list_section(),
+                "collection_steps": collect_theory_agent._get_collection_steps_section(),
+                "json_structure": collect_theory_agent._get_json_structure_section(),
+                "guidelines": collect_theory_agent._get_guidelines_section(rules_prompt),
+            },
+        ),
+        "analyse_theory": (
+            create_analyse_theory,
+            {
+                "response_format": analyse_theory_agent._get_response_format_section(),
+                "possible_scenarios": analyse_theory_agent._get_possible_scenarios_section(),
+                "verification_process": analyse_theory_agent._get_verification_process_section(),
+                "enhanced_response_format": analyse_theory_agent._get_enhanced_response_format_section(),
+                "improved_response_rules": analyse_theory_agent._get_improved_response_rules_section(),
+                "semantic_matching": analyse_theory_agent._get_semantic_matching_section(),
+                "edge_cases": analyse_theory_agent._get_edge_cases_section(),
+                "final_note": analyse_theory_agent._get_final_note_section(rules_prompt),
+            },
+        ),
+    }
+
+
+def profile_prompts(game_state: GameState) -> Dict[str, Dict[str, Any]]:
+    """
+    Token counts of every agent prompt and its sections in one game state
+
+    Args:
+        game_state: Game state the prompts are rendered in
+
+    Returns:
+        Prompt tokens, conversation history tokens and tokens by section, by agent
+    """
+    character = _get_character(game_state)
+    history_tokens = sum(count_text_tokens(m["content"]) + 4 for m in character.render_memory())
+    results = {}
+
+    for agent, (build, sections) in _agent_sections(game_state).items():
+        prompt = build()
+        total = count_text_tokens(prompt)
+        section_tokens = {name: count_text_tokens(text) for name, text in sections.items() if text}
+        section_tokens[TEMPLATE_SECTION] = max(0, total - sum(section_tokens.values()))
+        results[agent] = {
+            "prompt_tokens": total,
+            # Character agents also send the rendered conversation memory as messages
+            "history_tokens": history_tokens if agent in ("neutral", "fused") else 0,
+            "sections": section_tokens,
+        }
+
+    return results
+
+
+def profile_fixtures() -> Dict[str, Any]:
+    """Profile every agent prompt in every fixture"""
+    return {
+        "tokenizer": get_tokenizer_name(),
+        "fixtures": {stage: profile_prompts(state) for stage, state in create_fixtures().items()},
+    }
+
+
+def find_regressions(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """
+    Agent prompts that grew beyond the tolerance since the baseline
+
+    Args:
+        results: Current profile
+        baseline: Saved profile
+        tolerance: Allowed relative growth (0.05 = 5%)
+
+    Returns:
+        One line per regression
+    """
+    regressions = []
+    for stage, agents in results["fixtures"].items():
+        for agent, metrics in agents.items():
+            previous = baseline.get("fixtures", {}).get(stage, {}).get(agent)
+            if not previous:
+                continue
+            limit = previous["prompt_tokens"] * (1 + tolerance)
+            if metrics["prompt_tokens"] > limit:
+                regressions.append(
+                    f"{stage}/{agent}: {previous['prompt_tokens']} -> {metrics['prompt_tokens']} tokens"
+                )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Profile prompt sizes per agent and section")
+    parser.add_argument("--output", default=None, help="Write full results to this JSON file")
+    parser.add_argument("--baseline", default=None, help="Fail if a prompt grew beyond this saved profile")
+    parser.add_argument("--tolerance", type=float, default=0.05, help="Allowed relative growth over the baseline")
+    parser.add_argument("--stage", default=None, help="Only print this fixture (early, mid, late, long_conversation)")
+    args = parser.parse_args()
+
+    results = profile_fixtures()
+
+    print(f"Tokenizer: {results['tokenizer']}")
+    for stage, agents in results["fixtures"].items():
+        if args.stage and stage != args.stage:
+            continue
+        print(f"\n[{stage}]")
+        print(f"  {'agent':<15} {'section':<26} {'tokens':>7}")
+        for agent, metrics in agents.items():
+            history = f" (+{metrics['history_tokens']} history)" if metrics["history_tokens"] else ""
+            print(f"  {agent:<15} {'TOTAL':<26} {metrics['prompt_tokens']:>7}{history}")
+            for section, tokens in sorted(metrics["sections"].items(), key=lambda item: -item[1]):
+                print(f"  {'':<15} {section:<26} {tokens:>7}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = find_regressions(results, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Room lookahead harness
+
+Walks the same route through the manor with and without the room-graph lookahead,
+pausing between moves like a player reading the description, then compares how
+long each move waits for its room description and how many API calls were spent.
+
+Usage:
+    python -m ai_engine.benchmarks.room_lookahead --moves 8 --think 3 --output results.json
+"""
+
+import argparse
+import json
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+from ai_engine.cache.cache_config import CacheConfig
+from ai_engine.cache.cache_manager import AICache
+from ai_engine.processors.story import RoomLookahead, StoryProcessor, build_room_graph
+from game_engine.core.game_state import GameState
+
+from .common import (
+    RecordingAPIService,
+    create_api_service_from_env,
+    create_benchmark_game_state,
+    summarize_latencies,
+)
+
+
+def plan_route(game_state: GameState, moves: int) -> List[str]:
+    """
+    Route of adjacent moves that enters a new room whenever one is reachable:
+    an unvisited neighbour if any, else the shortest path to the nearest one
+    """
+    graph = build_room_graph(game_state.rooms)
+    current = game_state.current_location
+    visited = set(game_state.rooms_visited) | {current}
+    route: List[str] = []
+
+    while len(route) < moves:
+        path = _path_to_unvisited(graph, current, visited)
+        if not path:
+            break
+        for room_name in path[:moves - len(route)]:
+            route.append(room_name)
+            visited.add(room_name)
+        current = route[-1]
+
+    return route
+
+
+def _path_to_unvisited(graph: Dict[str, List[str]], start: str, visited: set) -> List[str]:
+    """Breadth-first path (excluding start) to the closest unvisited room"""
+    parents: Dict[str, Optional[str]] = {start: None}
+    queue = deque([start])
+    while queue:
+        room_name = queue.popleft()
+        if room_name not in visited:
+            path = []
+            while room_name != start:
+                path.append(room_name)
+                room_name = parents[room_name]
+            return path[::-1]
+        for neighbour in graph.get(room_name, []):
+            if neighbour not in parents:
+                parents[neighbour] = room_name
+                queue.append(neighbour)
+    return []
+
+
+def compare_lookahead(
+    api_service,
+    moves: int = 8,
+    think_seconds: float = 3.0,
+    max_concurrency: int = 2,
+) -> Dict[str, Any]:
+    """
+    Walk one route with and without lookahead and collect move latencies
+
+    Args:
+        api_service: Real APIService (wrapped for timing)
+        moves: Number of moves in the route
+        think_seconds: Pause between moves (the player reading)
+        max_concurrency: Lookahead worker count
+
+    Returns:
+        Dictionary with per-mode metrics and the route walked
+    """
+    route = plan_route(create_benchmark_game_state(), moves)
+    results: Dict[str, Any] = {"route": route, "think_seconds": think_seconds, "modes": {}}
+
+    for enabled in (False, True):
+        game_state = create_benchmark_game_state()
+        recorder = RecordingAPIService(api_service)
+        cache = AICache(CacheConfig(enable_cache=True, enable_disk_cache=False))
+
+        processor = StoryProcessor(recorder, cache)
+        processor.prefetcher = None
+        processor.lookahead = (
+            RoomLookahead(processor.room_generator, cache, max_concurrency=max_concurrency)
+            if enabled else None
+        )
+
+        latencies: List[float] = []
+        for room_name in route:
+            # Same state changes as ExplorationService.move_player
+            game_state.rooms_visited.add(game_state.current_location)
+            game_state.current_location = room_name
+            game_state.player.current_location = game_state.rooms[room_name]
+
+            start = time.perf_counter()
+            processor.generate_room_description(game_state.rooms[room_name], game_state, "move")
+            latencies.append(time.perf_counter() - start)
+            time.sleep(think_seconds)
+
+        metrics: Dict[str, Any] = {"move_latency": summarize_latencies(latencies)}
+        if processor.lookahead:
+            processor.lookahead.wait_idle()
+            metrics["lookahead"] = processor.lookahead.get_statistics()
+        metrics["api_calls"] = recorder.call_count
+        results["modes"]["lookahead" if enabled else "baseline"] = metrics
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare move latency with and without room lookahead")
+    parser.add_argument("--moves", type=int, default=8, help="Number of moves in the route")
+    parser.add_argument("--think", type=float, default=3.0, help="Seconds between moves")
+    parser.add_argument("--concurrency", type=int, default=2, help="Lookahead worker count")
+    parser.add_argument("--output", default=None, help="Write full results to this JSON file")
+    args = parser.parse_args()
+
+    results = compare_lookahead(
+        create_api_service_from_env(), args.moves, args.think, args.concurrency
+    )
+
+    print(f"Route: {' -> '.join(results['route'])}")
+    for mode, metrics in results["modes"].items():
+        print(
+            f"  {mode:<9} p50={metrics['move_latency']['p50_ms']}ms "
+            f"mean={metrics['move_latency']['mean_ms']}ms "
+            f"api_calls={metrics['api_calls']}"
+        )
+    lookahead = results["modes"]["lookahead"]["lookahead"]
+    print(
+        f"  lookahead hit_rate={lookahead['hit_rate']} stale={lookahead['stale']} "
+        f"tokens_spent={lookahead['tokens_spent']}"
+    )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
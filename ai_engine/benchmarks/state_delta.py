@@ -0,0 +1,151 @@
+"""
+Delta-state prompting benchmark
+
+Plays a scripted session (a few nonsense actions per room, clues taken, moves) and
+renders the nonsense agent prompt of every turn twice: with a fresh game state
+snapshot (STATE_DELTA_PROMPTS=false) and with the delta renderer. For each turn it
+counts the prompt tokens and the new tokens, the ones after the prefix shared with
+the previous prompt, which the provider cannot serve from its prompt cache.
+
+No API call is made.
+
+Usage:
+    python -m ai_engine.benchmarks.state_delta
+    python -m ai_engine.benchmarks.state_delta --rooms 6 --actions 4 --output results.json
+"""
+
+import argparse
+import json
+import os
+import random
+from typing import Any, Callable, Dict, List
+
+from ai_engine.prompts.command import create_nonsense_action_prompt
+from ai_engine.utils.formatters import format_game_state
+from ai_engine.utils.state_delta import GameStateDeltaRenderer
+from ai_engine.utils.tokens import count_text_tokens, get_tokenizer_name
+from game_engine.core.game_state import GameState
+
+from .common import create_benchmark_game_state
+from .prompt_prefix import move_player
+
+
+def populate_lore(game_state: GameState) -> None:
+    """Room and character lore, like GameService.initialize_game"""
+    for room in game_state.rooms.values():
+        game_state.lore["rooms"][room.name] = room.description
+        for character in room.characters:
+            game_state.lore["characters"][character.name] = {
+                "role": character.role,
+                "location": room.name,
+            }
+    game_state.mark_changed()
+
+
+def play_session(game_state: GameState, rooms: int, actions: int, on_turn: Callable[[Dict[str, Any]], None]) -> int:
+    """
+    Scripted session: in each room, nonsense actions with a clue taken halfway
+
+    Args:
+        game_state: Game state the session is played in
+        rooms: Number of rooms visited, in order
+        actions: Nonsense actions per room
+        on_turn: Called with the AI game state of every turn
+
+    Returns:
+        Number of turns played
+    """
+    turns = 0
+    for room_name in list(game_state.rooms)[:rooms]:
+        move_player(game_state, room_name)
+        room = game_state.player.current_location
+        for action in range(actions):
+            if action == actions // 2 and room.clues:
+                clue = room.clues[0]
+                clue.collect()
+                game_state.player.inventory.append(clue)
+                room.remove_clue(clue)
+                game_state.mark_changed()
+            on_turn(game_state.to_ai_format())
+            turns += 1
+    return turns
+
+
+def measure_mode(delta: bool, rooms: int, actions: int, snapshot_every: int, seed: int = 0) -> Dict[str, Any]:
+    """
+    Prompt tokens and new tokens per turn of the nonsense agent
+
+    Args:
+        delta: Render the game state with the delta renderer
+        rooms: Number of rooms visited
+        actions: Nonsense actions per room
+        snapshot_every: Turns between two snapshots of the delta renderer
+        seed: Seed of the random character placement
+
+    Returns:
+        Per-turn token counts and their means
+    """
+    random_state = random.getstate()
+    random.seed(seed)
+    game_state = create_benchmark_game_state()
+    random.setstate(random_state)
+    populate_lore(game_state)
+
+    renderer = GameStateDeltaRenderer(snapshot_every)
+    prompts: List[str] = []
+
+    def on_turn(ai_state: Dict[str, Any]) -> None:
+        state_text = (
+            renderer.render(ai_state["session_id"], "nonsense", ai_state)
+            if delta else format_game_state(ai_state)
+        )
+        prompts.append(create_nonsense_action_prompt(state_text))
+
+    turns = play_session(game_state, rooms, actions, on_turn)
+    prompt_tokens = [count_text_tokens(p) for p in prompts]
+    new_tokens = [prompt_tokens[0]] + [
+        count_text_tokens(current[len(os.path.commonprefix([previous, current])):])
+        for previous, current in zip(prompts, prompts[1:])
+    ]
+
+    results: Dict[str, Any] = {
+        "turns": turns,
+        "prompt_tokens": prompt_tokens,
+        "new_tokens": new_tokens,
+        "mean_prompt_tokens": round(sum(prompt_tokens) / turns, 1),
+        "mean_new_tokens": round(sum(new_tokens) / turns, 1),
+    }
+    if delta:
+        results["renderer"] = renderer.get_statistics()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure delta-state prompting on a scripted session")
+    parser.add_argument("--rooms", type=int, default=6, help="Rooms visited")
+    parser.add_argument("--actions", type=int, default=4, help="Nonsense actions per room")
+    parser.add_argument("--snapshot-every", type=int, default=5, help="Turns between two snapshots")
+    parser.add_argument("--output", default=None, help="Write full results to this JSON file")
+    args = parser.parse_args()
+
+    results = {
+        "tokenizer": get_tokenizer_name(),
+        "modes": {
+            "full": measure_mode(False, args.rooms, args.actions, args.snapshot_every),
+            "delta": measure_mode(True, args.rooms, args.actions, args.snapshot_every),
+        },
+    }
+
+    print(f"Tokenizer: {results['tokenizer']}")
+    print(f"{'mode':<6} {'turns':>5} {'prompt/turn':>12} {'new/turn':>9}")
+    for mode, metrics in results["modes"].items():
+        print(f"{mode:<6} {metrics['turns']:>5} {metrics['mean_prompt_tokens']:>12} {metrics['mean_new_tokens']:>9}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Game state projection memoization benchmark
+
+Replays the projections one turn asks for: to_ai_format for the command processor,
+the lore retriever and the nonsense handler, format_game_state for the prompts of
+the analyzer, executor, lore and nonsense agents, and to_dict for two UI updates.
+The state changes every --mutate-every turns (a clue taken), like a real session.
+
+Each turn is timed with the memoized projections and with every projection rebuilt
+(the previous behavior). No API call is made.
+
+Usage:
+    python -m ai_engine.benchmarks.state_memo
+    python -m ai_engine.benchmarks.state_memo --turns 2000 --mutate-every 3 --output results.json
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict
+
+from ai_engine.utils.formatters import _format_game_state, format_game_state
+from game_engine.core.game_state import GameState
+
+from .common import create_benchmark_game_state, summarize_latencies
+from .state_delta import populate_lore
+
+AI_FORMAT_CALLS = 3
+FORMAT_CALLS = 4
+DICT_CALLS = 2
+
+
+def memoized_turn(game_state: GameState) -> None:
+    """Projections of one turn, through the memoized entry points"""
+    for _ in range(AI_FORMAT_CALLS):
+        ai_state = game_state.to_ai_format()
+    for _ in range(FORMAT_CALLS):
+        format_game_state(ai_state)
+    for _ in range(DICT_CALLS):
+        game_state.to_dict()
+
+
+def rebuilt_turn(game_state: GameState) -> None:
+    """Projections of one turn, every one rebuilt"""
+    for _ in range(AI_FORMAT_CALLS):
+        ai_state = game_state._build_ai_format()
+    for _ in range(FORMAT_CALLS):
+        _format_game_state(ai_state)
+    for _ in range(DICT_CALLS):
+        game_state._build_dict()
+
+
+def mutate(game_state: GameState) -> None:
+    """Take a clue of the current room, or move to the next room when none is left"""
+    room = game_state.get_current_room()
+    if room and room.clues:
+        clue = room.clues[0]
+        game_state.player.inventory.append(clue)
+        room.remove_clue(clue)
+        game_state.mark_changed()
+        return
+    names = list(game_state.rooms)
+    game_state.current_location = names[(names.index(game_state.current_location) + 1) % len(names)]
+    game_state.player.current_location = game_state.rooms[game_state.current_location]
+
+
+def measure(turn: Callable[[GameState], None], turns: int, mutate_every: int) -> Dict[str, Any]:
+    """
+    CPU time of the projections per turn
+
+    Args:
+        turn: Projections of one turn
+        turns: Number of turns played
+        mutate_every: Turns between two state changes
+
+    Returns:
+        Per-turn latency summary
+    """
+    game_state = create_benchmark_game_state()
+    populate_lore(game_state)
+    latencies = []
+    for i in range(turns):
+        if mutate_every and i % mutate_every == 0:
+            mutate(game_state)
+        start = time.process_time()
+        turn(game_state)
+        latencies.append(time.process_time() - start)
+    return summarize_latencies(latencies)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure the CPU saved by memoized game state projections")
+    parser.add_argument("--turns", type=int, default=1000, help="Turns played")
+    parser.add_argument("--mutate-every", type=int, default=3, help="Turns between two state changes")
+    parser.add_argument("--output", default=None, help="Write full results to this JSON file")
+    args = parser.parse_args()
+
+    results: Dict[str, Any] = {
+        "turns": args.turns,
+        "mutate_every": args.mutate_every,
+        "rebuilt": measure(rebuilt_turn, args.turns, args.mutate_every),
+        "memoized": measure(memoized_turn, args.turns, args.mutate_every),
+    }
+    rebuilt_ms = results["rebuilt"]["mean_ms"]
+    memoized_ms = results["memoized"]["mean_ms"]
+    results["saved_ms_per_turn"] = round(rebuilt_ms - memoized_ms, 3)
+
+    print(f"{'mode':<9} {'mean':>9} {'p50':>9}")
+    for mode in ("rebuilt", "memoized"):
+        print(f"{mode:<9} {results[mode]['mean_ms']:>7}ms {results[mode]['p50_ms']:>7}ms")
+    print(f"Saved per turn: {results['saved_ms_per_turn']}ms")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
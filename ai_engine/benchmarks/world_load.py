@@ -0,0 +1,83 @@
+"""
+World data load benchmark
+
+Times loading the world template from data/, in three modes:
+- directory: walk data/rooms, data/clues and data/characters and open every file
+  (dev mode, and previous behavior)
+- bundle: one read of the compiled world bundle, integrity checked, after a
+  staleness check that stats the data/ source files (WORLD_BUNDLE_CHECK=true)
+- bundle_unchecked: the bundle read alone (WORLD_BUNDLE_CHECK=false, the Docker image)
+
+All modes are timed cold (the template is parsed again every run). The bundle is
+compiled to a temporary file, data/ is not changed. No API call is made.
+
+Usage:
+    python -m ai_engine.benchmarks.world_load
+    python -m ai_engine.benchmarks.world_load --runs 50 --output results.json
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+from game_engine.setup.game_data import GameDataLoader
+from game_engine.setup.world_bundle import write_world_bundle
+
+from .common import summarize_latencies
+
+
+def measure_mode(loader: GameDataLoader, runs: int) -> Dict[str, Any]:
+    """
+    World template load latency
+
+    Args:
+        loader: Loader reading either the bundle or the data directory
+        runs: Number of loads
+
+    Returns:
+        Latency summary and world version
+    """
+    latencies = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        world = loader.load_world_template()
+        latencies.append(time.perf_counter() - start)
+    return {"runs": runs, "latency": summarize_latencies(latencies), "version": world.version}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure world data load latency")
+    parser.add_argument("--runs", type=int, default=20, help="Loads per mode")
+    parser.add_argument("--output", default=None, help="Write full results to this JSON file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        bundle_path = Path(tmp_dir) / "world.bundle"
+        write_world_bundle(GameDataLoader(use_bundle=False).read_world_data(), bundle_path)
+        results = {
+            "directory": measure_mode(GameDataLoader(use_bundle=False), args.runs),
+            "bundle": measure_mode(GameDataLoader(bundle_path=str(bundle_path)), args.runs),
+            "bundle_unchecked": measure_mode(
+                GameDataLoader(bundle_path=str(bundle_path), check_staleness=False), args.runs
+            ),
+        }
+        results["bundle"]["bundle_bytes"] = bundle_path.stat().st_size
+
+    print(f"{'mode':<17} {'mean':>9} {'p50':>9} {'max':>9}  version")
+    for mode, metrics in results.items():
+        print(
+            f"{mode:<17} {metrics['latency']['mean_ms']:>7}ms {metrics['latency']['p50_ms']:>7}ms "
+            f"{metrics['latency']['max_ms']:>7}ms  {metrics['version'][:16]}"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
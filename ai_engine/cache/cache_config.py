@@ -25,6 +25,8 @@ class CacheConfig:
     # Hash settings
     hash_algorithm: str = "sha256"
     include_timestamp_in_key: bool = False
+    # Game data version, part of every key so responses cached for older data are not reused
+    data_version: str = field(default_factory=lambda: _get_data_version())
 
     enable_cache: bool = field(default_factory=lambda: _get_cache_enabled_from_env())
 
@@ -41,6 +43,12 @@ def _get_cache_enabled_from_env() -> bool:
     cache_enabled = os.getenv("AI_CACHE_ENABLED", "false").lower()
     return cache_enabled in ["true", "1", "yes", "on"]
 
+def _get_data_version() -> str:
+    """Content hash of the game data (rooms, clues, characters)"""
+    from game_engine.setup.game_data import get_world_version
+
+    return get_world_version()
+
 @dataclass
 class CacheEntry:
     """Single cache entry with metadata"""
@@ -35,7 +35,8 @@ class CacheKeyGenerator:
         cache_data = {
             "prompt": prompt,
             "params": normalized_params,
-            "context": context or {}
+            "context": context or {},
+            "data_version": self.config.data_version,
         }
         
         # Convert to deterministic JSON
@@ -44,6 +44,12 @@ class AIManager:
     def conversation_summary(self, character, player) -> str:
         return self.character_processor.conversation_summary(character, player)
 
+    def store_conversation_summary(self, character, player) -> None:
+        self.character_processor.store_conversation_summary(character, player)
+
+    def wait_for_conversation_summary(self, character, timeout=None) -> bool:
+        return self.character_processor.wait_for_conversation_summary(character, timeout)
+
     def generate_character_description(self, character, room) -> str:
         return self.story_processor.generate_character_description(character, room)
 
@@ -51,18 +57,21 @@ class AIManager:
     def generate_room_description(self, room, game_state: GameState, action: str) -> str:
         return self.story_processor.generate_room_description(room, game_state, action)
 
+    def prefetch_room(self, room, game_state: GameState) -> int:
+        return self.story_processor.prefetch_room(room, game_state)
+
     def analyze_clue(self, clue, collected_clues=None) -> str:
         return self.story_processor.analyze_clue(clue, collected_clues)
 
-    def give_useless_answer(self, object) -> str:
-        return self.story_processor.give_useless_answer(object)
+    def give_useless_answer(self, object, room_name=None) -> str:
+        return self.story_processor.give_useless_answer(object, room_name)
 
     # Theory processor
     def final_scene(self, player, conversation, game_state):
         return self.theory_processor.final_scene(player, conversation, game_state)
 
-    def verify_theory(self, conversation):
-        return self.theory_processor.verify_theory(conversation)
+    def verify_theory(self, conversation, theory=None, collected_clues=None):
+        return self.theory_processor.verify_theory(conversation, theory, collected_clues)
 
     def write_ending(self, scenario: int, player_theory: str):
         return self.theory_processor.write_ending(scenario, player_theory)
@@ -78,4 +87,32 @@ class AIManager:
         Returns:
             Reaction considering reputation escalation
         """
-        return self.command_processor.nonsense_reaction(command, game_state)
\ No newline at end of file
+        return self.command_processor.nonsense_reaction(command, game_state)
+
+    def classify_nonsense(self, command: str):
+        """
+        Severity of a nonsense action decided without the AI
+
+        Args:
+            command: Player's nonsense command
+
+        Returns:
+            Severity value, or None when the AI decides the severity
+        """
+        return self.command_processor.classify_nonsense(command)
+
+    def reset_state_prompts(self, session_id: str = None) -> None:
+        """
+        Forget the game state snapshots the agents were sent, so the next
+        prompts start from a fresh snapshot (after a save is restored)
+
+        Args:
+            session_id: Session to reset, all sessions when None
+        """
+        self.command_processor.reset_state_prompts(session_id)
+        self.character_processor.reset_state_prompts(session_id)
+
+    # API usage
+    def get_api_usage(self):
+        """Token usage of this session's API calls, with the share served from the prompt cache"""
+        return self.api_service.get_usage_statistics()
@@ -8,7 +8,27 @@ Main exports for backward compatibility and new features.
 from .processor import CharacterProcessor
 
 # Advanced components (for extensions)
-from .factory import ConversationComponentFactory
+from .factory import (
+    CharacterResponseMode,
+    ConversationComponentFactory,
+    LoreRetrieverMode,
+    SummaryMode,
+    get_character_response_mode,
+    get_lore_retriever_mode,
+    get_summary_mode,
+    get_consolidation_mode
+)
+from .memory import GameStateLoreRetriever, LocalLoreRetriever
+from .lore_index import LoreIndex
+from .secrets import SecretSelection, SecretSelector
+from .summary import BackgroundSummaryService, ConversationSummaryService
+from .compaction import MemoryCompactor
+from .consolidation import ConsolidationMode, GlobalMemoryConsolidator
+from .conversation import (
+    BaseConversationHandler,
+    FusedConversationHandler,
+    StandardConversationHandler
+)
 from .interfaces import (
     IConversationHandler,
     IPersonalityEngine, 
@@ -30,6 +50,34 @@ __all__ = [
     
     # Factory for custom setups
     'ConversationComponentFactory',
+    'CharacterResponseMode',
+    'get_character_response_mode',
+    'LoreRetrieverMode',
+    'get_lore_retriever_mode',
+    'SummaryMode',
+    'get_summary_mode',
+    'ConsolidationMode',
+    'get_consolidation_mode',
+    
+    # Conversation handlers
+    'BaseConversationHandler',
+    'StandardConversationHandler',
+    'FusedConversationHandler',
+    
+    # Lore retrievers
+    'GameStateLoreRetriever',
+    'LocalLoreRetriever',
+    'LoreIndex',
+    
+    # Secret selection
+    'SecretSelector',
+    'SecretSelection',
+    
+    # Summary services
+    'ConversationSummaryService',
+    'BackgroundSummaryService',
+    'MemoryCompactor',
+    'GlobalMemoryConsolidator',
     
     # Interfaces for custom implementations
     'IConversationHandler',
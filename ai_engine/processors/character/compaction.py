@@ -0,0 +1,128 @@
+"""
+Rolling compaction of the ongoing conversation memory
+"""
+
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from ai_engine.prompts.character import create_memory_compaction_prompt
+from ai_engine.utils.tokens import estimate_tokens
+from game_engine.models.character import Character
+from game_engine.models.player import Player
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _CompactionJob:
+    """Compaction running in background for one character"""
+    future: Future
+    compacted: List[Dict[str, str]]
+
+
+class MemoryCompactor:
+    """
+    Keeps character.memory_current bounded during long conversations.
+
+    When the current memory passes the token threshold, the older messages are folded
+    into character.memory_digest by a background AI call and only the last messages are
+    kept verbatim. Results are applied on the caller's thread at the next turn, so
+    memory_current is never modified concurrently.
+    """
+
+    def __init__(
+        self,
+        api_service,
+        token_threshold: int = 1500,
+        keep_messages: int = 6,
+        dev_mode: bool = False,
+    ):
+        self.api_service = api_service
+        self.token_threshold = token_threshold
+        self.keep_messages = keep_messages
+        self.dev_mode = dev_mode
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="memory-compaction")
+        self._jobs: Dict[str, _CompactionJob] = {}
+        self.stats = {"scheduled": 0, "applied": 0, "discarded": 0}
+
+    def maybe_compact(self, character: Character, player: Player) -> None:
+        """
+        Apply a finished compaction, then schedule a new one if the memory is too large
+
+        Args:
+            character: Character in conversation
+            player: Detective
+        """
+        try:
+            self.apply_ready(character)
+
+            if character.name in self._jobs:
+                return
+            if len(character.memory_current) <= self.keep_messages:
+                return
+            if estimate_tokens(character.get_conversation_memory()) <= self.token_threshold:
+                return
+
+            compacted = list(character.memory_current[:-self.keep_messages])
+            future = self._executor.submit(
+                self._create_digest, character, player, character.memory_digest, compacted
+            )
+            self._jobs[character.name] = _CompactionJob(future, compacted)
+            self.stats["scheduled"] += 1
+
+            if self.dev_mode:
+                print(f"🗜️ MEMORY COMPACTION: {character.name} ({len(compacted)} messages)")
+
+        except Exception as e:
+            logger.error(f"Error in maybe_compact: {e}")
+
+    def apply_ready(self, character: Character) -> bool:
+        """
+        Apply the character's finished compaction, if any
+
+        Returns:
+            True if the current memory was compacted
+        """
+        job = self._jobs.get(character.name)
+        if job is None or not job.future.done():
+            return False
+
+        del self._jobs[character.name]
+        digest = job.future.result()
+        count = len(job.compacted)
+
+        # The conversation may have ended (or been summarized) meanwhile
+        if not digest or character.memory_current[:count] != job.compacted:
+            self.stats["discarded"] += 1
+            return False
+
+        character.compact_memory(digest, count)
+        self.stats["applied"] += 1
+        return True
+
+    def _create_digest(
+        self,
+        character: Character,
+        player: Player,
+        previous_digest: str,
+        compacted: List[Dict[str, str]],
+    ) -> Optional[str]:
+        """Worker: fold the older messages into the running digest"""
+        try:
+            prompt = create_memory_compaction_prompt(character, player, previous_digest, compacted)
+
+            return self.api_service.make_api_call(
+                messages=[{"role": "user", "content": prompt}],
+                system_content="You are compacting the memory of an ongoing conversation.",
+                max_tokens=250,
+            )
+
+        except Exception as e:
+            logger.error(f"Error creating memory digest: {e}")
+            return None
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Get compaction statistics"""
+        return {**self.stats, "running": len(self._jobs)}
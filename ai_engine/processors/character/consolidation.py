@@ -0,0 +1,144 @@
+"""
+Global memory consolidation - keeps character.memory_global bounded across conversations
+"""
+
+import logging
+import re
+from enum import Enum
+from typing import Dict, List, Optional
+
+from ai_engine.prompts.character import create_relationship_dossier_prompt
+from ai_engine.utils.tokens import estimate_text_tokens
+from game_engine.models.character import Character
+from game_engine.models.player import Player
+
+logger = logging.getLogger(__name__)
+
+
+class ConsolidationMode(Enum):
+    """How past conversation summaries are merged into a dossier"""
+    LLM = "llm"        # AI call merging the summaries, local extraction as fallback
+    LOCAL = "local"    # Deduplicated bullet points, most recent first, no AI call
+    OFF = "off"        # Summaries accumulate unbounded
+
+
+class GlobalMemoryConsolidator:
+    """
+    Merges a character's past conversation summaries into one capped relationship
+    dossier once there are more than max_summaries of them.
+    Called right after a summary is stored (on the summary worker in background mode).
+    """
+
+    def __init__(
+        self,
+        api_service,
+        mode: ConsolidationMode = ConsolidationMode.LLM,
+        max_summaries: int = 3,
+        max_tokens: int = 300,
+        dev_mode: bool = False,
+    ):
+        self.api_service = api_service
+        self.mode = mode
+        self.max_summaries = max_summaries
+        self.max_tokens = max_tokens
+        self.dev_mode = dev_mode
+        self.global_memory_tokens: Dict[str, int] = {}
+        self.stats = {"consolidations": 0, "llm": 0, "local": 0}
+
+    def consolidate(self, character: Character, player: Player) -> bool:
+        """
+        Merge the character's global memory into a dossier when it has too many summaries
+
+        Returns:
+            True if the global memory was consolidated
+        """
+        try:
+            summaries = list(character.memory_global)
+            consolidated = False
+
+            if self.mode != ConsolidationMode.OFF and len(summaries) > self.max_summaries:
+                dossier = None
+                if self.mode == ConsolidationMode.LLM:
+                    dossier = self._create_llm_dossier(character, player, summaries)
+                    if dossier:
+                        self.stats["llm"] += 1
+
+                if not dossier:
+                    dossier = extract_dossier(summaries, self.max_tokens)
+                    self.stats["local"] += 1
+
+                character.consolidate_global_memory(dossier, len(summaries))
+                self.stats["consolidations"] += 1
+                consolidated = True
+
+                if self.dev_mode:
+                    print(f"📚 MEMORY DOSSIER: {character.name} ({len(summaries)} summaries merged)")
+
+            self.global_memory_tokens[character.name] = sum(
+                estimate_text_tokens(summary) for summary in character.memory_global
+            )
+            return consolidated
+
+        except Exception as e:
+            logger.error(f"Error in consolidate: {e}")
+            return False
+
+    def _create_llm_dossier(
+        self, character: Character, player: Player, summaries: List[str]
+    ) -> Optional[str]:
+        """Merge the summaries with an AI call, capped to the token budget"""
+        try:
+            prompt = create_relationship_dossier_prompt(
+                character, player, summaries, max_words=int(self.max_tokens * 0.75)
+            )
+
+            content = self.api_service.make_api_call(
+                messages=[{"role": "user", "content": prompt}],
+                system_content="You are consolidating a character's memory of past conversations.",
+                max_tokens=self.max_tokens,
+            )
+
+            if not content:
+                return None
+            if estimate_text_tokens(content) > self.max_tokens:
+                return extract_dossier([content], self.max_tokens)
+            return content
+
+        except Exception as e:
+            logger.error(f"Error creating relationship dossier: {e}")
+            return None
+
+    def get_statistics(self) -> Dict[str, object]:
+        """Get consolidation statistics and global memory size per character"""
+        return {
+            **self.stats,
+            "mode": self.mode.value,
+            "global_memory_tokens": dict(self.global_memory_tokens),
+        }
+
+
+def extract_dossier(summaries: List[str], max_tokens: int) -> str:
+    """
+    Build a dossier from bullet points without AI: deduplicate, keep the most recent
+    points within the token budget, then restore chronological order
+    """
+    points: List[str] = []
+    for summary in summaries:
+        for line in summary.splitlines():
+            point = line.strip().lstrip("-•* ").strip()
+            if point:
+                points.append(point)
+
+    seen = set()
+    kept: List[str] = []
+    budget = max_tokens
+    for point in reversed(points):
+        key = re.sub(r"\W+", " ", point.lower()).strip()
+        cost = estimate_text_tokens(point) + 1
+        if key in seen or cost > budget:
+            continue
+        seen.add(key)
+        kept.append(point)
+        budget -= cost
+
+    return "\n".join(f"- {point}" for point in reversed(kept))
@@ -4,10 +4,13 @@ Main conversation handler that orchestrates the conversation flow
 
 import json
 import logging
-from typing import Any
+from typing import Any, Callable, Dict, List, Optional
 
 from ai_engine.api.service import APIConfig
-from ai_engine.prompts.character import create_neutral_character_prompt
+from ai_engine.prompts.character import (
+    create_fused_character_prompt,
+    create_neutral_character_prompt,
+)
 from ai_engine.utils.ai_logger import log_ai_response
 from game_engine.models.character import Character
 from game_engine.models.player import Player
@@ -19,23 +22,34 @@ from .errors import (
     ConversationValidator
 )
 from .interfaces import IConversationHandler, IMemoryManager, IPersonalityEngine
+from .secrets import SecretSelector
 
 logger = logging.getLogger(__name__)
 
 
-class StandardConversationHandler(IConversationHandler):
-    """Handles standard character conversations"""
-    
+class BaseConversationHandler(IConversationHandler):
+    """
+    Shared conversation flow: validation, context, secret selection, one character
+    call, memory store and error handling. Handlers differ by the prompt builder and
+    the post-processing step applied to the parsed response.
+    """
+
     def __init__(
-        self, 
-        api_service, 
+        self,
+        api_service,
         memory_manager: IMemoryManager,
-        personality_engine: IPersonalityEngine
+        prompt_builder: Callable[[Character, Player, Optional[List[Any]]], str],
+        agent_name: str,
+        secret_selector: Optional[SecretSelector] = None,
+        post_process: Optional[Callable[[Dict[str, Any], Character, str], Dict[str, Any]]] = None,
     ):
         self.api_service = api_service
         self.memory_manager = memory_manager
-        self.personality_engine = personality_engine
-    
+        self.prompt_builder = prompt_builder
+        self.agent_name = agent_name
+        self.secret_selector = secret_selector
+        self.post_process = post_process
+
     def handle_conversation(
         self, character: Character, player: Player, topic: str, game_state: Any
     ) -> str:
@@ -45,60 +59,104 @@ class StandardConversationHandler(IConversationHandler):
             is_valid, error_msg = ConversationValidator.validate_conversation_inputs(
                 character, player, topic, game_state
             )
-            
+
             if not is_valid:
                 return ConversationResponseFormatter.format_error_response(error_msg)
-            
+
             # Get conversation context with memory and lore
             messages = self.memory_manager.get_conversation_context(
                 character, topic, game_state, player
             )
-            
-            # Create base character prompt
-            character_prompt = create_neutral_character_prompt(character, player)
-            
-            # Get base AI response
-            base_content = self.api_service.make_api_call(
+
+            # Only the secrets relevant to this turn (all unlocked ones without selector)
+            selection = (
+                self.secret_selector.select(character, player, topic)
+                if self.secret_selector else None
+            )
+
+            character_prompt = self.prompt_builder(
+                character, player, selection.secrets if selection else None
+            )
+
+            content = self.api_service.make_api_call(
                 messages=messages,
                 system_content=character_prompt,
                 max_tokens=APIConfig.MAX_TOKENS_LARGE,
                 response_format={"type": "json_object"},
             )
-            
-            if base_content is None:
-                return ConversationErrorHandler.handle_ai_timeout("base_conversation")
-            
-
-            log_ai_response(base_content, "Neutral Character Agent", "json")
-            
-            # Parse base response
+
+            if content is None:
+                return ConversationErrorHandler.handle_ai_timeout(self.agent_name)
+
+            log_ai_response(content, self.agent_name, "json")
+
             try:
-                base_response_dict = json.loads(base_content)
+                response_dict = json.loads(content)
             except json.JSONDecodeError:
-                logger.error("Failed to parse base AI response")
+                logger.error(f"Failed to parse {self.agent_name} response")
                 return ConversationErrorHandler.handle_conversation_error(
                     Exception("JSON decode error"), "response_parsing"
                 )
-            
-            # Apply personality enhancement
-            enhanced_response = self.personality_engine.apply_personality(
-                base_response_dict, character, topic
-            )
-            
+
+            if self.post_process:
+                response_dict = self.post_process(response_dict, character, topic)
+
             # Store conversation in memory
             self.memory_manager.store_conversation(
-                character, topic, enhanced_response.get("answer", "")
+                character, topic, response_dict.get("answer", "")
             )
+            if selection:
+                self.secret_selector.mark_shown(selection)
+
+            return json.dumps(response_dict)
 
-            log_ai_response(
-                enhanced_response.get("answer", "No answer found"), 
-                "Personalized Character Agent", 
-                "text"
-            )
-            
-            return json.dumps(enhanced_response)
-            
         except Exception as e:
             return ConversationErrorHandler.handle_conversation_error(
                 e, "conversation_handling"
-            )
\ No newline at end of file
+            )
+
+
+class StandardConversationHandler(BaseConversationHandler):
+    """Handles standard character conversations (neutral call, then personality)"""
+    
+    def __init__(
+        self, 
+        api_service, 
+        memory_manager: IMemoryManager,
+        personality_engine: IPersonalityEngine,
+        secret_selector: Optional[SecretSelector] = None
+    ):
+        super().__init__(
+            api_service, memory_manager, create_neutral_character_prompt,
+            "Neutral Character Agent", secret_selector, self._apply_personality,
+        )
+        self.personality_engine = personality_engine
+
+    def _apply_personality(
+        self, response_dict: Dict[str, Any], character: Character, topic: str
+    ) -> Dict[str, Any]:
+        """Rewrite the neutral answer in the character's voice"""
+        enhanced_response = self.personality_engine.apply_personality(
+            response_dict, character, topic
+        )
+        log_ai_response(
+            enhanced_response.get("answer", "No answer found"), 
+            "Personalized Character Agent", 
+            "text"
+        )
+        return enhanced_response
+
+
+class FusedConversationHandler(BaseConversationHandler):
+    """Handles character conversations in a single structured call (rules + personality)"""
+    
+    def __init__(
+        self,
+        api_service,
+        memory_manager: IMemoryManager,
+        secret_selector: Optional[SecretSelector] = None
+    ):
+        super().__init__(
+            api_service, memory_manager, create_fused_character_prompt,
+            "Fused Character Agent", secret_selector,
+        )
@@ -2,34 +2,230 @@
 Factory for creating conversation components
 """
 
-from typing import Tuple
-from .conversation import StandardConversationHandler
-from .memory import CharacterMemoryManager, GameStateLoreRetriever
+import os
+from enum import Enum
+from typing import Optional, Tuple
+from ai_engine.utils.state_delta import GameStateDeltaRenderer
+from .compaction import MemoryCompactor
+from .consolidation import ConsolidationMode, GlobalMemoryConsolidator
+from .conversation import FusedConversationHandler, StandardConversationHandler
+from .interfaces import IConversationHandler, ILoreRetriever
+from .memory import CharacterMemoryManager, GameStateLoreRetriever, LocalLoreRetriever
 from .personality import CharacterPersonalityEngine
-from .summary import ConversationSummaryService
+from .secrets import SecretSelector
+from .summary import BackgroundSummaryService, ConversationSummaryService
+
+
+class CharacterResponseMode(Enum):
+    """How a character reply is produced"""
+    STANDARD = "standard"  # Neutral call, then personality rewrite call
+    FUSED = "fused"        # Single call with rules and personality together
+
+
+class LoreRetrieverMode(Enum):
+    """Where conversation lore facts come from"""
+    LLM = "llm"            # AI call over the formatted game state
+    LOCAL = "local"        # Inverted index over the game state, no AI call
+
+
+class SummaryMode(Enum):
+    """When an ended conversation is summarized"""
+    SYNC = "sync"              # Before the last reply is returned
+    BACKGROUND = "background"  # On a worker thread, awaited by the next conversation
 
 
 class ConversationComponentFactory:
     """Factory for creating conversation components"""
-    
+
     @staticmethod
-    def create_standard_setup(api_service) -> Tuple[
-        StandardConversationHandler, 
+    def create_standard_setup(
+        api_service,
+        response_mode: Optional[CharacterResponseMode] = None,
+        lore_mode: Optional[LoreRetrieverMode] = None,
+        summary_mode: Optional[SummaryMode] = None,
+        dev_mode: bool = False,
+    ) -> Tuple[
+        IConversationHandler,
         ConversationSummaryService
     ]:
         """Create a standard conversation setup"""
-        
+
+        if response_mode is None:
+            response_mode = get_character_response_mode()
+        if lore_mode is None:
+            lore_mode = get_lore_retriever_mode()
+        if summary_mode is None:
+            summary_mode = get_summary_mode()
+
         # Create components
-        lore_retriever = GameStateLoreRetriever(api_service)
+        lore_retriever = ConversationComponentFactory.create_lore_retriever(
+            api_service, lore_mode
+        )
         memory_manager = CharacterMemoryManager(lore_retriever)
-        personality_engine = CharacterPersonalityEngine(api_service)
-        
+
         # Create main handler
-        conversation_handler = StandardConversationHandler(
-            api_service, memory_manager, personality_engine
+        conversation_handler = ConversationComponentFactory.create_conversation_handler(
+            api_service, memory_manager, response_mode,
+            ConversationComponentFactory.create_secret_selector(dev_mode),
         )
-        
+
         # Create summary service
-        summary_service = ConversationSummaryService(api_service)
-        
-        return conversation_handler, summary_service
\ No newline at end of file
+        summary_service = ConversationComponentFactory.create_summary_service(
+            api_service, summary_mode, dev_mode
+        )
+
+        return conversation_handler, summary_service
+
+    @staticmethod
+    def create_summary_service(
+        api_service, summary_mode: SummaryMode, dev_mode: bool = False
+    ) -> ConversationSummaryService:
+        """Create the summary service matching the summary mode"""
+        consolidator = ConversationComponentFactory.create_memory_consolidator(
+            api_service, dev_mode=dev_mode
+        )
+        if summary_mode == SummaryMode.BACKGROUND:
+            return BackgroundSummaryService(api_service, consolidator, dev_mode)
+        return ConversationSummaryService(api_service, consolidator)
+
+    @staticmethod
+    def create_memory_consolidator(
+        api_service,
+        consolidation_mode: Optional[ConsolidationMode] = None,
+        dev_mode: bool = False,
+    ) -> GlobalMemoryConsolidator:
+        """Create the global memory consolidator (MEMORY_CONSOLIDATION_MODE and limits from env)"""
+        if consolidation_mode is None:
+            consolidation_mode = get_consolidation_mode()
+        return GlobalMemoryConsolidator(
+            api_service,
+            mode=consolidation_mode,
+            max_summaries=int(os.getenv("MEMORY_GLOBAL_MAX_SUMMARIES", "3")),
+            max_tokens=int(os.getenv("MEMORY_DOSSIER_TOKENS", "300")),
+            dev_mode=dev_mode,
+        )
+
+    @staticmethod
+    def create_memory_compactor(api_service, dev_mode: bool = False) -> Optional[MemoryCompactor]:
+        """
+        Create the rolling memory compactor, unless disabled
+        via the MEMORY_COMPACTION environment variable
+
+        Args:
+            api_service: API service instance
+            dev_mode: Enable development mode features
+
+        Returns:
+            Memory compactor or None when compaction is disabled
+        """
+        compaction = os.getenv("MEMORY_COMPACTION", "true").lower()
+        if compaction not in ["true", "1", "yes", "on"]:
+            return None
+        return MemoryCompactor(
+            api_service,
+            token_threshold=int(os.getenv("MEMORY_COMPACTION_TOKENS", "1500")),
+            keep_messages=int(os.getenv("MEMORY_KEEP_MESSAGES", "6")),
+            dev_mode=dev_mode,
+        )
+
+    @staticmethod
+    def create_secret_selector(dev_mode: bool = False) -> Optional[SecretSelector]:
+        """
+        Create the secret selector, unless disabled
+        via the CHARACTER_SECRET_SELECTION environment variable
+
+        Args:
+            dev_mode: Enable development mode features
+
+        Returns:
+            Secret selector or None when every unlocked secret is sent
+        """
+        selection = os.getenv("CHARACTER_SECRET_SELECTION", "true").lower()
+        if selection not in ["true", "1", "yes", "on"]:
+            return None
+        return SecretSelector(
+            recent_turns=int(os.getenv("SECRET_RECENT_TURNS", "2")),
+            max_revealed=int(os.getenv("SECRET_MAX_REVEALED", "3")),
+            dev_mode=dev_mode,
+        )
+
+    @staticmethod
+    def create_lore_retriever(
+        api_service, lore_mode: LoreRetrieverMode
+    ) -> ILoreRetriever:
+        """Create the lore retriever matching the lore mode"""
+        if lore_mode == LoreRetrieverMode.LOCAL:
+            return LocalLoreRetriever()
+        return GameStateLoreRetriever(
+            api_service, ConversationComponentFactory.create_state_renderer()
+        )
+
+    @staticmethod
+    def create_state_renderer(dev_mode: bool = False) -> Optional[GameStateDeltaRenderer]:
+        """
+        Create the game state delta renderer when enabled
+        via the STATE_DELTA_PROMPTS environment variable (off by default:
+        the measured token saving does not yet justify the longer prompts)
+
+        Args:
+            dev_mode: Enable development mode features
+
+        Returns:
+            Delta renderer or None when every turn gets a fresh snapshot
+        """
+        delta = os.getenv("STATE_DELTA_PROMPTS", "false").lower()
+        if delta not in ["true", "1", "yes", "on"]:
+            return None
+        return GameStateDeltaRenderer(int(os.getenv("STATE_SNAPSHOT_EVERY", "5")), dev_mode)
+
+    @staticmethod
+    def create_conversation_handler(
+        api_service,
+        memory_manager: CharacterMemoryManager,
+        response_mode: CharacterResponseMode,
+        secret_selector: Optional[SecretSelector] = None,
+    ) -> IConversationHandler:
+        """Create the conversation handler matching the response mode"""
+        if response_mode == CharacterResponseMode.FUSED:
+            return FusedConversationHandler(api_service, memory_manager, secret_selector)
+
+        personality_engine = CharacterPersonalityEngine(api_service)
+        return StandardConversationHandler(
+            api_service, memory_manager, personality_engine, secret_selector
+        )
+
+
+def get_character_response_mode() -> CharacterResponseMode:
+    """Get character response mode from environment variable"""
+    mode = os.getenv("CHARACTER_RESPONSE_MODE", "standard").lower()
+    try:
+        return CharacterResponseMode(mode)
+    except ValueError:
+        return CharacterResponseMode.STANDARD
+
+
+def get_lore_retriever_mode() -> LoreRetrieverMode:
+    """Get lore retriever mode from environment variable"""
+    mode = os.getenv("LORE_RETRIEVER_MODE", "llm").lower()
+    try:
+        return LoreRetrieverMode(mode)
+    except ValueError:
+        return LoreRetrieverMode.LLM
+
+
+def get_summary_mode() -> SummaryMode:
+    """Get conversation summary mode from environment variable"""
+    mode = os.getenv("CONVERSATION_SUMMARY_MODE", "background").lower()
+    try:
+        return SummaryMode(mode)
+    except ValueError:
+        return SummaryMode.BACKGROUND
+
+
+def get_consolidation_mode() -> ConsolidationMode:
+    """Get global memory consolidation mode from environment variable"""
+    mode = os.getenv("MEMORY_CONSOLIDATION_MODE", "llm").lower()
+    try:
+        return ConsolidationMode(mode)
+    except ValueError:
+        return ConsolidationMode.LLM
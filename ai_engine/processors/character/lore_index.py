@@ -0,0 +1,238 @@
+"""
+Inverted index over game entities for deterministic lore retrieval
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+# Entity types
+CHARACTER = "character"
+ROOM = "room"
+CLUE = "clue"
+
+# Special locations for clues that are not lying in a room
+INVENTORY_LOCATION = "__inventory__"
+
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+STOPWORDS: Set[str] = {
+    "the", "and", "for", "you", "your", "are", "was", "were", "has", "have", "had",
+    "with", "this", "that", "what", "where", "who", "whom", "how", "why", "when",
+    "does", "did", "any", "there", "here", "his", "her", "him", "she", "they", "them",
+    "about", "from", "into", "late", "often", "many", "long", "time", "young", "old",
+    "not", "can", "see", "know", "tell", "seen",
+}
+
+# Question cues for room-wide and manor-wide character listings
+WHO_WORDS: Set[str] = {"who", "anyone", "anybody", "someone", "somebody"}
+HERE_WORDS: Set[str] = {"here", "room", "around"}
+MANOR_WORDS: Set[str] = {"manor", "house", "household", "everyone", "everybody"}
+
+# Role or lore tokens matching more entities of a type than this are too generic to identify one
+MAX_WEAK_MATCHES = 2
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stopwords and short fragments (possessive 's)"""
+    tokens = TOKEN_PATTERN.findall(text.lower())
+    return [t for t in tokens if len(t) > 2 and t not in STOPWORDS]
+
+
+@dataclass
+class IndexedEntity:
+    """One indexed game entity and its current location"""
+
+    key: Tuple[str, str]
+    name: str
+    location: str
+    tokens: Set[str] = field(default_factory=set)
+    weak_tokens: Set[str] = field(default_factory=set)
+    obj: Any = None
+    lore: str = ""
+
+
+class LoreIndex:
+    """
+    Inverted index over character names, room names and clue names
+
+    Character roles and the lore text of rooms and characters (game_state.lore)
+    are indexed as weak postings, only searched when no name matches. Token
+    postings only change when entities appear or disappear or their lore changes;
+    locations (who is where, which clue is in the inventory) are refreshed
+    incrementally by sync() from the live game state.
+    """
+
+    def __init__(self):
+        self.entities: Dict[Tuple[str, str], IndexedEntity] = {}
+        self.postings: Dict[str, Set[Tuple[str, str]]] = {}
+        self.weak_postings: Dict[str, Set[Tuple[str, str]]] = {}
+        self.stats: Dict[str, int] = {"builds": 0, "updates": 0, "queries": 0}
+
+    def build(self, game_state: Any) -> None:
+        """Index the whole game world"""
+        self.entities.clear()
+        self.postings.clear()
+        self.weak_postings.clear()
+        self.stats["builds"] += 1
+        self.sync(game_state)
+
+    def sync(self, game_state: Any) -> int:
+        """
+        Bring the index in line with the game state, touching only changed entities
+
+        Returns:
+            Number of entities added, moved or removed
+        """
+        seen: Dict[Tuple[str, str], Tuple[str, Any]] = {}
+
+        for room in game_state.rooms.values():
+            seen[(ROOM, room.name)] = (room.name, room)
+            for character in room.characters:
+                seen[(CHARACTER, character.name)] = (room.name, character)
+            for clue in room.clues:
+                seen[(CLUE, clue.name)] = (room.name, clue)
+
+        player = game_state.player
+        for clue in getattr(player, "inventory", None) or []:
+            seen[(CLUE, clue.name)] = (INVENTORY_LOCATION, clue)
+
+        lore = getattr(game_state, "lore", None) or {}
+
+        changes = 0
+        for key, (location, obj) in seen.items():
+            entity = self.entities.get(key)
+            lore_text = self._lore_text(key, lore)
+            if entity is None or entity.lore != lore_text:
+                if entity is not None:
+                    self._remove_entity(key)
+                self._add_entity(key, location, obj, lore_text)
+                changes += 1
+            elif entity.location != location or entity.obj is not obj:
+                entity.location = location
+                entity.obj = obj
+                changes += 1
+
+        for key in [k for k in self.entities if k not in seen]:
+            self._remove_entity(key)
+            changes += 1
+
+        self.stats["updates"] += changes
+        return changes
+
+    def search(self, text: str) -> Dict[str, List[IndexedEntity]]:
+        """
+        Find the entities mentioned in a text, best matches per entity type
+
+        Returns:
+            Dict of entity type to matched entities (best score only)
+        """
+        self.stats["queries"] += 1
+        tokens = set(tokenize(text))
+        scores: Dict[Tuple[str, str], int] = {}
+
+        distinctive: Set[Tuple[str, str]] = set()
+        character_tokens = {
+            t for t in tokens
+            if any(k[0] == CHARACTER for k in self.postings.get(t, ()))
+        }
+
+        for token in tokens:
+            for key in self.postings.get(token, ()):
+                scores[key] = scores.get(key, 0) + 1
+                if key[0] == CHARACTER or token not in character_tokens:
+                    distinctive.add(key)
+
+        # A room or clue named after someone ("Edgar's Bedroom") needs more than the name
+        scores = {k: s for k, s in scores.items() if k in distinctive}
+
+        results: Dict[str, List[IndexedEntity]] = {CHARACTER: [], ROOM: [], CLUE: []}
+        for entity_type in results:
+            typed = {k: s for k, s in scores.items() if k[0] == entity_type}
+            if typed:
+                best = max(typed.values())
+                results[entity_type] = [
+                    self.entities[k] for k, s in typed.items() if s == best
+                ]
+
+        # Fall back on distinctive role and lore words ("the governess", "the piano")
+        # when no name matched
+        for entity_type in (CHARACTER, ROOM):
+            if not results[entity_type]:
+                results[entity_type] = self._weak_matches(tokens, entity_type)
+
+        return results
+
+    def _weak_matches(self, tokens: Set[str], entity_type: str) -> List[IndexedEntity]:
+        """Entities of a type best matched by distinctive weak tokens"""
+        scores: Dict[Tuple[str, str], int] = {}
+        for token in tokens:
+            keys = [k for k in self.weak_postings.get(token, ()) if k[0] == entity_type]
+            if len(keys) <= MAX_WEAK_MATCHES:
+                for key in keys:
+                    scores[key] = scores.get(key, 0) + 1
+        if not scores:
+            return []
+        best = max(scores.values())
+        return [self.entities[k] for k, s in scores.items() if s == best]
+
+    def characters_in(self, room_name: str) -> List[IndexedEntity]:
+        """Indexed characters currently in a room"""
+        return [
+            e for e in self.entities.values()
+            if e.key[0] == CHARACTER and e.location == room_name
+        ]
+
+    def all_characters(self) -> List[IndexedEntity]:
+        """All indexed characters"""
+        return [e for e in self.entities.values() if e.key[0] == CHARACTER]
+
+    @staticmethod
+    def _lore_text(key: Tuple[str, str], lore: Dict[str, Any]) -> str:
+        """Lore text of a room (description) or character (description and traits)"""
+        entity_type, name = key
+        if entity_type == ROOM:
+            return str((lore.get("rooms") or {}).get(name) or "")
+        if entity_type == CHARACTER:
+            info = (lore.get("characters") or {}).get(name) or {}
+            traits = info.get("traits") or []
+            return " ".join([str(info.get("description") or ""), *map(str, traits)]).strip()
+        return ""
+
+    def _add_entity(self, key: Tuple[str, str], location: str, obj: Any, lore_text: str = "") -> None:
+        """Index a new entity"""
+        entity_type, name = key
+        aliases = getattr(obj, "aliases", None) or []
+        tokens = set(tokenize(" ".join([name, *aliases])))
+
+        weak_text = lore_text
+        if entity_type == CHARACTER:
+            weak_text = " ".join([getattr(obj, "role", "") or "", lore_text])
+        weak_tokens = set(tokenize(weak_text)) - tokens
+
+        entity = IndexedEntity(key, name, location, tokens, weak_tokens, obj, lore_text)
+        self.entities[key] = entity
+
+        for token in tokens:
+            self.postings.setdefault(token, set()).add(key)
+        for token in weak_tokens:
+            self.weak_postings.setdefault(token, set()).add(key)
+
+    def _remove_entity(self, key: Tuple[str, str]) -> None:
+        """Drop an entity and its postings"""
+        entity = self.entities.pop(key)
+        for token in entity.tokens:
+            self._discard_posting(self.postings, token, key)
+        for token in entity.weak_tokens:
+            self._discard_posting(self.weak_postings, token, key)
+
+    @staticmethod
+    def _discard_posting(
+        postings: Dict[str, Set[Tuple[str, str]]], token: str, key: Tuple[str, str]
+    ) -> None:
+        keys: Optional[Set[Tuple[str, str]]] = postings.get(token)
+        if keys is None:
+            return
+        keys.discard(key)
+        if not keys:
+            del postings[token]
@@ -9,9 +9,22 @@ from ai_engine.api.service import APIConfig
 from ai_engine.prompts.character import create_get_lore_information
 from ai_engine.utils.ai_logger import log_ai_response
 from ai_engine.utils.formatters import format_game_state
+from ai_engine.utils.state_delta import GameStateDeltaRenderer
 from game_engine.models.character import Character
 from game_engine.models.player import Player
 from .interfaces import IMemoryManager, ILoreRetriever
+from .lore_index import (
+    CHARACTER,
+    CLUE,
+    HERE_WORDS,
+    INVENTORY_LOCATION,
+    MANOR_WORDS,
+    ROOM,
+    TOKEN_PATTERN,
+    WHO_WORDS,
+    IndexedEntity,
+    LoreIndex,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -19,8 +32,9 @@ logger = logging.getLogger(__name__)
 class GameStateLoreRetriever(ILoreRetriever):
     """Retrieves lore information from game state"""
     
-    def __init__(self, api_service):
+    def __init__(self, api_service, state_renderer: Optional[GameStateDeltaRenderer] = None):
         self.api_service = api_service
+        self.state_renderer = state_renderer
     
     def get_relevant_lore(
         self, game_state: Any, topic: str, player: Player, character: Character
@@ -32,12 +46,18 @@ class GameStateLoreRetriever(ILoreRetriever):
             if ai_state is None:
                 return None
             
+            # Snapshot and changes since, with a renderer
+            game_state_str = (
+                self.state_renderer.render(ai_state.get("session_id"), "lore", ai_state)
+                if self.state_renderer else format_game_state(ai_state)
+            )
+            
             # Create lore retrieval prompt
             prompt_get_info = create_get_lore_information(
-                format_game_state(ai_state), player, character, topic
+                game_state_str, player, character, topic
             )
             
-            messages = [*character.memory_current, {"role": "user", "content": topic}]
+            messages = [*character.render_memory(), {"role": "user", "content": topic}]
             
             return self.api_service.make_api_call(
                 messages=messages,
@@ -65,6 +85,86 @@ class GameStateLoreRetriever(ILoreRetriever):
             return None
 
 
+class LocalLoreRetriever(ILoreRetriever):
+    """Retrieves lore facts from an inverted index over the game state, without AI calls"""
+    
+    def __init__(self):
+        self.index = LoreIndex()
+        self._indexed_state_id: Optional[int] = None
+    
+    def get_relevant_lore(
+        self, game_state: Any, topic: str, player: Player, character: Character
+    ) -> Optional[str]:
+        """Get factual lore about the characters, rooms and objects a topic mentions"""
+        try:
+            self._sync_index(game_state)
+            
+            words = set(TOKEN_PATTERN.findall(topic.lower()))
+            matches = self.index.search(topic)
+            current_room = player.current_location.name if player and player.current_location else ""
+            facts: List[str] = []
+            
+            # Characters: explicit mentions, or room / manor listings for "who" questions
+            characters: List[IndexedEntity] = matches[CHARACTER]
+            if not characters and words & WHO_WORDS:
+                if words & MANOR_WORDS:
+                    characters = self.index.all_characters()
+                elif words & HERE_WORDS:
+                    characters = self.index.characters_in(current_room)
+            
+            for entity in characters:
+                if entity.obj is character:
+                    continue
+                facts.append(self._character_fact(entity, current_room))
+            
+            for entity in matches[ROOM]:
+                facts.append(self._room_fact(entity))
+            
+            for entity in matches[CLUE]:
+                facts.append(self._clue_fact(entity, current_room))
+            
+            return " ".join(facts) if facts else None
+            
+        except Exception as e:
+            logger.error(f"Error getting local lore information: {e}")
+            return None
+    
+    def _sync_index(self, game_state: Any) -> None:
+        """Build the index for a new game, then keep it updated incrementally"""
+        if self._indexed_state_id != id(game_state):
+            self.index.build(game_state)
+            self._indexed_state_id = id(game_state)
+        else:
+            self.index.sync(game_state)
+    
+    def _character_fact(self, entity: IndexedEntity, current_room: str) -> str:
+        """Describe a character's identity, status and location"""
+        char = entity.obj
+        status = getattr(char, "status", "alive")
+        if entity.location == current_room:
+            return f"{char.name} is here ({status}), clearly visible right beside you."
+        role = (char.role or "").split(".")[0].strip()
+        return f"{char.name} ({role}; {status}) is in {entity.location}."
+    
+    def _room_fact(self, entity: IndexedEntity) -> str:
+        """Describe who is in a room and where it leads"""
+        present = [e.name for e in self.index.characters_in(entity.name)]
+        exits = ", ".join(getattr(entity.obj, "exits", []) or [])
+        fact = f"{entity.name} is a room of the manor"
+        fact += f" leading to {exits}." if exits else "."
+        if present:
+            fact += f" Present there: {', '.join(present)}."
+        return fact
+    
+    def _clue_fact(self, entity: IndexedEntity, current_room: str) -> str:
+        """Describe whether the detective holds an object or can see it"""
+        if entity.location == INVENTORY_LOCATION:
+            return f"The detective has {entity.name}."
+        if entity.location == current_room:
+            return f"The {entity.name} is visible in the room but the detective has not yet examined or picked it up."
+        return "The detective does not seem to have the mentioned object."
+
+
 class CharacterMemoryManager(IMemoryManager):
     """Manages character memory and conversation context"""
     
@@ -77,7 +177,7 @@ class CharacterMemoryManager(IMemoryManager):
         """Build complete conversation context"""
         try:
             # Start with character's current memory
-            messages = list(character.memory_current)
+            messages = character.render_memory()
             
             # Add user topic
             messages.append({"role": "user", "content": topic})
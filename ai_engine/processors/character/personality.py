@@ -38,7 +38,7 @@ class CharacterPersonalityEngine(IPersonalityEngine):
             )
             
             messages = [
-                *character.memory_current,
+                *character.render_memory(),
                 {"role": "user", "content": personality_prompt},
             ]
             
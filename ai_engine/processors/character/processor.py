@@ -3,7 +3,7 @@ Main CharacterProcessor - Clean interface with refactored components
 """
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from ai_engine.processors.base_processor import BaseProcessor
 
@@ -28,7 +28,13 @@ class CharacterProcessor(BaseProcessor):
         
         # Create conversation components using factory
         self.conversation_handler, self.summary_service = (
-            ConversationComponentFactory.create_standard_setup(api_service)
+            ConversationComponentFactory.create_standard_setup(
+                api_service, dev_mode=dev_mode
+            )
+        )
+        
+        self.memory_compactor = ConversationComponentFactory.create_memory_compactor(
+            api_service, dev_mode
         )
         
         self._log_debug("CharacterProcessor initialized with refactored components")
@@ -48,6 +54,10 @@ class CharacterProcessor(BaseProcessor):
         if not ConversationValidator.validate_topic(topic):
             return ConversationResponseFormatter.format_empty_topic_response()
         
+        # Keep the ongoing conversation memory bounded
+        if self.memory_compactor and character:
+            self.memory_compactor.maybe_compact(character, player)
+        
         # Delegate to conversation handler
         try:
             result = self.conversation_handler.handle_conversation(
@@ -72,12 +82,45 @@ class CharacterProcessor(BaseProcessor):
             self.logger.error(f"Error creating conversation summary: {e}")
             return "Unable to generate conversation summary."
     
+    def store_conversation_summary(self, character, player) -> None:
+        """Summarize the ended conversation into the character's global memory (possibly in background)"""
+        self._log_debug(f"Storing conversation summary for {character.name if character else 'Unknown'}")
+        
+        try:
+            self.summary_service.summarize_and_store(character, player)
+        except Exception as e:
+            self.logger.error(f"Error storing conversation summary: {e}")
+    
+    def wait_for_conversation_summary(self, character, timeout=None) -> bool:
+        """Wait until the character's previous conversation summary is stored"""
+        return self.summary_service.wait_for_summary(character, timeout)
+    
+    def reset_state_prompts(self, session_id: Optional[str] = None) -> None:
+        """Forget the game state snapshots sent to the lore agent"""
+        memory_manager = getattr(self.conversation_handler, "memory_manager", None)
+        lore_retriever = getattr(memory_manager, "lore_retriever", None)
+        renderer = getattr(lore_retriever, "state_renderer", None)
+        if renderer:
+            renderer.reset(session_id)
+
     def health_check(self) -> Dict[str, Any]:
         """Check the health of character processor components"""
         return {
             "processor_name": self.get_processor_name(),
             "conversation_handler": self.conversation_handler is not None,
+            "conversation_handler_type": type(self.conversation_handler).__name__,
             "summary_service": self.summary_service is not None,
+            "summary_service_type": type(self.summary_service).__name__,
+            "pending_summaries": self.summary_service.get_pending_count(),
+            "memory_compaction": self.memory_compactor is not None,
+            "secret_selection": (
+                self.conversation_handler.secret_selector.get_statistics()
+                if getattr(self.conversation_handler, "secret_selector", None) else None
+            ),
+            "memory_consolidation": (
+                self.summary_service.consolidator.get_statistics()
+                if self.summary_service.consolidator else None
+            ),
             "api_service": self.api_service is not None,
             "cache": self.cache is not None,
             "dev_mode": self.dev_mode
@@ -0,0 +1,125 @@
+"""
+Secret selection for character prompts
+Only the unlocked secrets the detective brings up are sent in full, revealed ones as references
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Set
+
+from game_engine.models.character import Character
+from game_engine.models.player import Player
+from game_engine.models.secret_list import Secret
+from game_engine.utils.entity_resolver import normalize_entity_name
+
+from .lore_index import tokenize
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SecretSelection:
+    """Secrets of one character turn"""
+
+    # Prompt order: secrets brought up this turn, then references to revealed ones
+    secrets: List[Secret] = field(default_factory=list)
+    # Unrevealed secrets brought up this turn, shown once the character has answered
+    triggered: List[Secret] = field(default_factory=list)
+    unlocked: int = 0
+
+
+class SecretSelector:
+    """
+    Picks the unlocked secrets relevant to the current turn.
+
+    A secret is unlocked by the clue named in its condition and indexed by the words
+    of that clue's name and aliases. It is relevant when the topic or the detective's
+    recent turns mention one of those words. Secrets already revealed are kept as
+    one-line references (see Secret.shown), at most max_revealed of them.
+    """
+
+    def __init__(self, recent_turns: int = 2, max_revealed: int = 3, dev_mode: bool = False):
+        self.recent_turns = recent_turns
+        self.max_revealed = max_revealed
+        self.dev_mode = dev_mode
+        # Clue name -> keywords of its name and aliases
+        self._keywords: Dict[str, Set[str]] = {}
+        self.stats = {"selections": 0, "unlocked": 0, "selected": 0, "references": 0, "revealed": 0}
+
+    def select(self, character: Character, player: Player, topic: str) -> SecretSelection:
+        """
+        Select the secrets to put in the character prompt
+
+        Args:
+            character: Character holding the secrets
+            player: Player whose inventory unlocks them
+            topic: What the detective just said
+
+        Returns:
+            Secrets for the prompt and the ones revealed by this turn
+        """
+        try:
+            inventory = {clue.name: clue for clue in player.inventory}
+            unlocked = [s for s in character.secrets if s.condition in inventory]
+            if not unlocked:
+                return SecretSelection()
+
+            words = self._words(topic, character)
+            mentioned = [s for s in unlocked if self._clue_keywords(inventory[s.condition]) & words]
+            triggered = [s for s in mentioned if not s.shown]
+
+            # Revealed secrets brought up again come first, then the other revealed ones
+            revealed = [s for s in mentioned if s.shown]
+            revealed += [s for s in unlocked if s.shown and s not in revealed]
+            revealed = revealed[:self.max_revealed]
+
+            self.stats["selections"] += 1
+            self.stats["unlocked"] += len(unlocked)
+            self.stats["selected"] += len(triggered)
+            self.stats["references"] += len(revealed)
+
+            if self.dev_mode:
+                print(
+                    f"🔐 SECRETS: {len(triggered)} selected, {len(revealed)} revealed "
+                    f"of {len(unlocked)} unlocked for {character.name}"
+                )
+
+            return SecretSelection([*triggered, *revealed], triggered, len(unlocked))
+
+        except Exception as e:
+            logger.error(f"Error in SecretSelector.select: {e}")
+            # Previous behavior: every unlocked secret in full
+            unlocked = [s for s in character.secrets if s.condition in {c.name for c in player.inventory}]
+            return SecretSelection(unlocked, [], len(unlocked))
+
+    def mark_shown(self, selection: SecretSelection) -> None:
+        """Mark the secrets brought up this turn as revealed, once the character answered"""
+        for secret in selection.triggered:
+            secret.set_shown(True)
+        self.stats["revealed"] += len(selection.triggered)
+
+    def _words(self, topic: str, character: Character) -> Set[str]:
+        """Words of the topic and of the detective's recent turns"""
+        recent = [
+            message["content"] for message in character.memory_current
+            if message.get("role") == "user"
+        ][-self.recent_turns:] if self.recent_turns > 0 else []
+        return set(tokenize(normalize_entity_name(" ".join([topic, *recent]))))
+
+    def _clue_keywords(self, clue) -> Set[str]:
+        """Keywords of a clue's name and aliases, indexed on first use"""
+        keywords = self._keywords.get(clue.name)
+        if keywords is None:
+            keywords = set()
+            for surface in [clue.name, *getattr(clue, "aliases", [])]:
+                keywords.update(tokenize(normalize_entity_name(surface)))
+            self._keywords[clue.name] = keywords
+        return keywords
+
+    def get_statistics(self) -> Dict[str, float]:
+        """Get secret selection statistics"""
+        unlocked = self.stats["unlocked"]
+        return {
+            **self.stats,
+            "selected_rate": round(self.stats["selected"] / unlocked, 3) if unlocked else 0.0,
+        }
@@ -3,37 +3,147 @@ Conversation summary service
 """
 
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional
 
 from ai_engine.prompts.character import create_conversation_summary_prompt
 from game_engine.models.character import Character
 from game_engine.models.player import Player
 
+from .consolidation import GlobalMemoryConsolidator
+
 logger = logging.getLogger(__name__)
 
 
 class ConversationSummaryService:
     """Handles conversation summarization"""
-    
-    def __init__(self, api_service):
+
+    def __init__(self, api_service, consolidator: Optional[GlobalMemoryConsolidator] = None):
         self.api_service = api_service
-    
-    def create_summary(self, character: Character, player: Player) -> str:
+        self.consolidator = consolidator
+
+    def create_summary(
+        self,
+        character: Character,
+        player: Player,
+        conversation: Optional[List[Dict[str, str]]] = None,
+    ) -> str:
         """Generate a summary of conversation between character and player"""
         try:
-            prompt = create_conversation_summary_prompt(character, player)
+            prompt = create_conversation_summary_prompt(character, player, conversation)
             messages = [{"role": "user", "content": prompt}]
             system_content = (
                 "You are summarizing a conversation between a character and a player."
             )
-            
+
             content = self.api_service.make_api_call(
-                messages=messages, 
-                system_content=system_content, 
+                messages=messages,
+                system_content=system_content,
                 max_tokens=200
             )
-            
+
             return content or "Unable to generate conversation summary."
-            
+
         except Exception as e:
             logger.error(f"Error in conversation_summary: {e}")
-            return "Unable to generate conversation summary."
\ No newline at end of file
+            return "Unable to generate conversation summary."
+
+    def summarize_and_store(self, character: Character, player: Player) -> None:
+        """Summarize the ended conversation and store it in the character's global memory"""
+        summary = self.create_summary(character, player)
+        character.summarize_and_store_memory(summary)
+        self.consolidate(character, player)
+
+    def consolidate(self, character: Character, player: Player) -> None:
+        """Merge past summaries into a dossier when the global memory grows too large"""
+        if self.consolidator:
+            self.consolidator.consolidate(character, player)
+
+    def wait_for_summary(self, character: Character, timeout: Optional[float] = None) -> bool:
+        """Wait until the character has no pending summary - always true when synchronous"""
+        return True
+
+    def get_pending_count(self) -> int:
+        """Number of summaries still being generated"""
+        return 0
+
+
+class BackgroundSummaryService(ConversationSummaryService):
+    """
+    Summarizes ended conversations on a worker thread so the last reply is not delayed.
+    The conversation is frozen in character.memory_pending until the summary lands in
+    memory_global; a new conversation with the character waits on it first.
+    """
+
+    def __init__(
+        self,
+        api_service,
+        consolidator: Optional[GlobalMemoryConsolidator] = None,
+        dev_mode: bool = False,
+    ):
+        super().__init__(api_service, consolidator)
+        self.dev_mode = dev_mode
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="conversation-summary")
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def summarize_and_store(self, character: Character, player: Player) -> None:
+        """Freeze the conversation and summarize it in the background"""
+        if not character.memory_current:
+            return
+
+        with self._lock:
+            conversation = character.freeze_current_memory()
+            future = self._executor.submit(self._summarize, character, player, conversation)
+            self._pending[character.name] = future
+
+        if self.dev_mode:
+            print(f"📝 SUMMARY QUEUED: {character.name} ({len(conversation)} messages)")
+
+    def _summarize(
+        self, character: Character, player: Player, conversation: List[Dict[str, str]]
+    ) -> str:
+        """Worker: generate the summary and store it in global memory"""
+        summary = self.create_summary(character, player, conversation)
+
+        with self._lock:
+            character.store_pending_summary(summary)
+            self._pending.pop(character.name, None)
+
+        # Queued after this task: the next conversation does not wait for it
+        if self.consolidator:
+            self._executor.submit(self.consolidate, character, player)
+
+        if self.dev_mode:
+            print(f"📝 SUMMARY STORED: {character.name}: {summary}")
+        return summary
+
+    def wait_for_summary(self, character: Character, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the character's pending summary
+
+        Args:
+            character: Character about to be talked to or saved
+            timeout: Maximum wait in seconds (None waits until done)
+
+        Returns:
+            True if no summary is pending anymore
+        """
+        with self._lock:
+            future = self._pending.get(character.name)
+
+        if future is None:
+            return True
+
+        try:
+            future.result(timeout=timeout)
+            return True
+        except Exception as e:
+            logger.error(f"Error waiting for conversation summary: {e}")
+            return future.done()
+
+    def get_pending_count(self) -> int:
+        """Number of summaries still being generated"""
+        with self._lock:
+            return len(self._pending)
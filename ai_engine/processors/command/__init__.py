@@ -8,17 +8,25 @@ Main exports for backward compatibility and new features.
 from .processor import CommandProcessor
 
 # Advanced components (for extensions)
-from .factory import CommandComponentFactory
+from .factory import (
+    CommandComponentFactory,
+    CommandPipelineMode,
+    get_command_pipeline_mode,
+    get_nonsense_severity_mode
+)
 from .interfaces import (
     ICommandAnalyzer,
     ICommandExecutor,
+    ICommandParser,
     INonsenseHandler
 )
 
 # Individual components (for custom setups)
 from .command_analyzer import CommandAnalyzer
 from .command_executor import CommandExecutor
-from .nonsense_handler import NonsenseHandler
+from .command_parser import RuleBasedCommandParser
+from .command_pipeline import FusedCommandAnalyzer, FusedCommandExecutor
+from .nonsense_handler import NonsenseHandler, NonsenseSeverityMode
 
 __all__ = [
     # Main interface (same as before)
@@ -26,14 +34,22 @@ __all__ = [
     
     # Factory for custom setups
     'CommandComponentFactory',
+    'CommandPipelineMode',
+    'get_command_pipeline_mode',
+    'get_nonsense_severity_mode',
     
     # Interfaces for custom implementations
     'ICommandAnalyzer',
     'ICommandExecutor',
+    'ICommandParser',
     'INonsenseHandler',
     
     # Individual components
     'CommandAnalyzer',
     'CommandExecutor',
+    'RuleBasedCommandParser',
+    'FusedCommandAnalyzer',
+    'FusedCommandExecutor',
     'NonsenseHandler',
+    'NonsenseSeverityMode',
 ]
\ No newline at end of file
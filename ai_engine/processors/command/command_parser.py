@@ -0,0 +1,193 @@
+"""
+Rule-based command parser - deterministic fast path ahead of the AI pipeline
+"""
+
+import logging
+import re
+from typing import Any, Dict, List, Optional
+
+from ai_engine.prompts.prompt_config import get_current_language, get_current_teleportation
+from game_engine.setup.game_data import get_entity_resolver
+
+from .interfaces import ICommandParser
+
+logger = logging.getLogger(__name__)
+
+
+class RuleBasedCommandParser(ICommandParser):
+    """
+    Matches high-confidence commands (move, look, collect, speak, inventory)
+    against the current room. Returns None whenever it is not sure, so the
+    AI analyzer/executor pipeline handles everything else.
+    """
+
+    INVENTORY_PATTERN = re.compile(
+        r"^(?:i|inv|inventory|(?:check|show|open|see)\s+(?:my\s+)?(?:inventory|bag|clues)|my\s+(?:inventory|clues)|what\s+do\s+i\s+have)$"
+    )
+    LOOK_AROUND_PATTERN = re.compile(
+        r"^(?:l|look|look\s+around|look\s+at\s+(?:the\s+)?room|(?:examine|describe|inspect|search)\s+(?:the\s+)?room)$"
+    )
+    ACTION_PATTERNS: List[tuple] = [
+        ("move", re.compile(r"^(?:go|move|walk|head|run|return|enter)(?:\s+(?:to|into|in|back\s+to))?\s+(?P<target>.+)$")),
+        ("speak", re.compile(r"^(?:talk|speak|chat)\s+(?:to|with)\s+(?P<target>.+)$")),
+        ("collect", re.compile(r"^(?:take|grab|collect|pick\s+up|get)\s+(?P<target>.+)$")),
+        ("look", re.compile(r"^(?:look\s+at|examine|inspect|observe|check|study)\s+(?P<target>.+)$")),
+    ]
+
+    SPEAK_MESSAGES = {
+        "english": "You approach {target}.",
+        "french": "Vous vous approchez de {target}.",
+        "spanish": "Te acercas a {target}.",
+        "german": "Sie nähern sich {target}.",
+        "italian": "Ti avvicini a {target}.",
+        "portuguese": "Você se aproxima de {target}.",
+    }
+
+    def __init__(self, dev_mode: bool = False):
+        self.dev_mode = dev_mode
+        self.stats = {"total": 0, "handled": 0, "fallthrough": 0}
+        self.action_counts: Dict[str, int] = {}
+
+    def parse_command(self, command: str, game_state: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Try to resolve a command without AI.
+
+        Args:
+            command: Player's input command
+            game_state: AI-format game state (from to_ai_format)
+
+        Returns:
+            Command result dict (same shape as CommandExecutor) or None to fall through
+        """
+        self.stats["total"] += 1
+
+        try:
+            result = self._match(self._normalize(command), game_state)
+        except Exception as e:
+            logger.error(f"Error in parse_command: {e}")
+            result = None
+
+        if result is None:
+            self.stats["fallthrough"] += 1
+            return None
+
+        result["translated_command"] = command
+        self.stats["handled"] += 1
+        self.action_counts[result["action"]] = self.action_counts.get(result["action"], 0) + 1
+
+        if self.dev_mode:
+            print(f"⚡ FAST PATH: '{command}' -> {result['action']} {result['target']} (coverage {self.get_coverage_rate():.0%})")
+
+        return result
+
+    def get_coverage_rate(self) -> float:
+        """Share of commands resolved without AI"""
+        total = self.stats["total"]
+        return round(self.stats["handled"] / total, 3) if total else 0.0
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get parser statistics"""
+        return {
+            **self.stats,
+            "coverage_rate": self.get_coverage_rate(),
+            "actions": dict(self.action_counts),
+        }
+
+    def _match(self, command: str, game_state: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Match a normalized command against the room entities"""
+        room = game_state.get("current_room", {})
+
+        if self.INVENTORY_PATTERN.match(command):
+            return self._create_result("look", "inventory", "inventory", "You check your collected clues.")
+
+        if self.LOOK_AROUND_PATTERN.match(command):
+            room_name = room.get("name", "")
+            return self._create_result("look", room_name, "location", f"You look around the {room_name}.")
+
+        for action, pattern in self.ACTION_PATTERNS:
+            match = pattern.match(command)
+            if not match:
+                continue
+            target_text = match.group("target")
+
+            if action == "move":
+                target = self._resolve(target_text, self._get_reachable_rooms(game_state))
+                if target and target != room.get("name"):
+                    return self._create_result("move", target, "location", f"You head to the {target}.")
+
+            elif action == "speak":
+                alive = [c["name"] for c in room.get("characters", []) if c.get("status", "alive") != "dead"]
+                target = self._resolve(target_text, alive)
+                template = self.SPEAK_MESSAGES.get(get_current_language().lower())
+                if target and template:
+                    return self._create_result("speak", target, "character", template.format(target=target))
+
+            elif action == "collect":
+                target = self._resolve(target_text, room.get("clues", []))
+                if target:
+                    return self._create_result("collect", target, "clue", f"You pick up the {target}.")
+
+            elif action == "look":
+                characters = [c["name"] for c in room.get("characters", [])]
+                target = self._resolve(target_text, characters)
+                if target:
+                    return self._create_result("look", target, "character", f"You look at {target}.")
+                target = self._resolve(target_text, room.get("clues", []))
+                if target:
+                    return self._create_result("look", target, "clue", f"You examine the {target}.")
+
+            # A verb matched but the target is uncertain: let the AI decide
+            return None
+
+        return None
+
+    def _get_reachable_rooms(self, game_state: Dict[str, Any]) -> List[str]:
+        """Rooms the player may move to: exits, or every room in teleportation mode"""
+        if get_current_teleportation():
+            return list(game_state.get("lore", {}).get("rooms", {}).keys())
+        return list(game_state.get("current_room", {}).get("exits", []))
+
+    def _resolve(self, text: str, candidates: List[str]) -> Optional[str]:
+        """
+        Resolve a target to a single canonical name.
+        Exact normalized match first, then a unique candidate containing every word,
+        then aliases and near-miss spellings through the entity resolver.
+        """
+        query = self._strip_articles(text)
+        if not query:
+            return None
+
+        normalized = {self._normalize(c): c for c in candidates}
+        if query in normalized:
+            return normalized[query]
+
+        words = set(query.split())
+        partial = [c for key, c in normalized.items() if words <= set(key.split())]
+        if partial:
+            return partial[0] if len(partial) == 1 else None
+
+        return get_entity_resolver().resolve(text, candidates=candidates) if candidates else None
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """Lowercase, drop apostrophes and punctuation, collapse spaces"""
+        text = text.lower().replace("’", "'").replace("'s", "s").replace("'", "")
+        text = re.sub(r"[^\w\s]", " ", text)
+        return " ".join(text.split())
+
+    @staticmethod
+    def _strip_articles(text: str) -> str:
+        """Remove leading articles and determiners from a target"""
+        return re.sub(r"^(?:the|a|an|this|that|my|mister|mr|mrs|miss)\s+", "", text).strip()
+
+    @staticmethod
+    def _create_result(action: str, target: str, target_type: str, message: str) -> Dict[str, Any]:
+        """Create a command result in the executor format"""
+        return {
+            "valid": True,
+            "action": action,
+            "target": target,
+            "target_type": target_type,
+            "alternatives": [],
+            "message": message,
+        }
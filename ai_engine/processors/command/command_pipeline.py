@@ -0,0 +1,170 @@
+"""
+Fused command pipeline - analysis and execution in a single tool call
+"""
+
+import logging
+from typing import Any, Dict
+
+from ai_engine.api.service import APIConfig
+from ai_engine.prompts.command.pipeline_agent import create_command_pipeline_prompt
+from ai_engine.utils.ai_logger import log_ai_response
+from ai_engine.utils.formatters import format_game_state
+from ai_engine.utils.constants import DefaultAlternatives, ErrorMessages
+
+from .interfaces import ICommandAnalyzer, ICommandExecutor
+
+logger = logging.getLogger(__name__)
+
+
+class FusedCommandAnalyzer(ICommandAnalyzer):
+    """Analyzes and resolves player commands in one function-calling round trip"""
+
+    def __init__(self, api_service, cache, dev_mode: bool = False):
+        self.api_service = api_service
+        self.cache = cache
+        self.dev_mode = dev_mode
+
+    def analyze_command(self, command: str, game_state: Any) -> Dict[str, Any]:
+        """
+        Analyze player command and decide the final action at once.
+        The result already holds the execution fields (valid, action, target...).
+
+        Args:
+            command: Player's input command in any language
+            game_state: Current game state
+
+        Returns:
+            Dictionary with the resolved command and its translation
+        """
+        try:
+            if self.dev_mode:
+                print(f"🔍 COMMAND PIPELINE: Resolving '{command}'")
+
+            # Convert game state to text representation
+            game_state_str: str = format_game_state(game_state)
+
+            # Create fused pipeline prompt
+            pipeline_prompt: str = create_command_pipeline_prompt(game_state_str, command)
+
+            player_location = game_state.get("player", {}).get("location", "unknown")
+            cache_context = {
+                "type": "command_pipeline",
+                "location": player_location,
+            }
+
+            cached_result = self.cache.get(
+                pipeline_prompt,
+                {"temperature": APIConfig.COMMAND_TEMPERATURE, "format": "tool"},
+                cache_context
+            )
+
+            if cached_result:
+                if self.dev_mode:
+                    print("🚀 CACHE HIT: Command resolution found in cache!")
+                return self.api_service.parse_json_response(
+                    cached_result,
+                    self._get_fallback_result()
+                )
+
+            if self.dev_mode:
+                print("💭 CACHE MISS: Resolving command...")
+
+            pipeline_messages = [{"role": "user", "content": pipeline_prompt}]
+            pipeline_system_content = "You are a detective game command processor that understands, validates and resolves player commands."
+
+            pipeline_content = self.api_service.make_api_call(
+                messages=pipeline_messages,
+                system_content=pipeline_system_content,
+                temperature=APIConfig.COMMAND_TEMPERATURE,
+                max_tokens=APIConfig.MAX_TOKENS_XXLARGE,
+                tools="command_pipeline",
+            )
+
+            if pipeline_content is None:
+                if self.dev_mode:
+                    log_ai_response(
+                        "COMMAND PIPELINE: API call failed",
+                        "FusedCommandAnalyzer",
+                        "error"
+                    )
+                return self._get_fallback_result()
+
+            fallback_result = self._get_fallback_result()
+            result = self.api_service.parse_json_response(pipeline_content, fallback_result)
+            if result is fallback_result:
+                return result
+
+            # Store in cache, only a parsable resolution
+            self.cache.put(
+                pipeline_prompt,
+                {"temperature": APIConfig.COMMAND_TEMPERATURE, "format": "tool"},
+                pipeline_content,
+                cache_context
+            )
+
+            return result
+
+        except Exception as e:
+            logger.error(f"Error in fused analyze_command: {e}")
+            return self._get_fallback_result()
+
+    def _get_fallback_result(self) -> Dict[str, Any]:
+        """Get fallback result when the pipeline call fails"""
+        return {
+            "valid": False,
+            "message": ErrorMessages.COMMAND_NOT_UNDERSTOOD,
+            "alternatives": DefaultAlternatives.BASIC_COMMANDS,
+            "action": "help",
+            "target": "",
+            "target_type": "unknown",
+            "translated_command": "",
+        }
+
+
+class FusedCommandExecutor(ICommandExecutor):
+    """Finalizes a command already resolved by FusedCommandAnalyzer - no AI call"""
+
+    RESULT_KEYS = ("valid", "action", "target", "target_type", "alternatives", "message")
+
+    def __init__(self, dev_mode: bool = False):
+        self.dev_mode = dev_mode
+
+    def execute_command(self, reasoning_result: Dict[str, Any], game_state: Any) -> Dict[str, Any]:
+        """
+        Shape the fused result like the CommandExecutor output.
+
+        Args:
+            reasoning_result: Resolved command from FusedCommandAnalyzer
+            game_state: Current game state (unused, kept for the interface)
+
+        Returns:
+            Dictionary with execution results and player response
+        """
+        try:
+            if "action" not in reasoning_result or "valid" not in reasoning_result:
+                return self._get_fallback_execution()
+
+            execution_result = {key: reasoning_result.get(key) for key in self.RESULT_KEYS}
+            execution_result["valid"] = bool(execution_result["valid"])
+            execution_result["target"] = execution_result["target"] or ""
+            execution_result["target_type"] = execution_result["target_type"] or "unknown"
+            execution_result["alternatives"] = execution_result["alternatives"] or []
+            execution_result["message"] = execution_result["message"] or ""
+            execution_result["translated_command"] = reasoning_result.get("translated_command")
+
+            return execution_result
+
+        except Exception as e:
+            logger.error(f"Error in fused execute_command: {e}")
+            return self._get_fallback_execution()
+
+    def _get_fallback_execution(self) -> Dict[str, Any]:
+        """Get fallback execution result when the fused result is unusable"""
+        return {
+            "valid": False,
+            "message": ErrorMessages.COMMAND_NOT_UNDERSTOOD,
+            "alternatives": DefaultAlternatives.BASIC_COMMANDS,
+            "action": "help",
+            "target": "",
+            "target_type": "unknown",
+        }
@@ -2,41 +2,144 @@
 Factory for creating command processing components
 """
 
-from typing import Tuple
+import os
+from enum import Enum
+from typing import Optional, Tuple
+
+from ai_engine.utils.state_delta import GameStateDeltaRenderer
 
 from .command_analyzer import CommandAnalyzer
 from .command_executor import CommandExecutor
-from .nonsense_handler import NonsenseHandler
+from .command_parser import RuleBasedCommandParser
+from .command_pipeline import FusedCommandAnalyzer, FusedCommandExecutor
+from .interfaces import ICommandAnalyzer, ICommandExecutor
+from .nonsense_handler import NonsenseHandler, NonsenseSeverityMode
+
+
+class CommandPipelineMode(Enum):
+    """How a command is analyzed and executed by the AI"""
+    TWO_PHASE = "two_phase"  # Reasoning call, then execution call
+    FUSED = "fused"          # Single tool call returning the final result
 
 
 class CommandComponentFactory:
     """Factory for creating command processing components"""
-    
+
     @staticmethod
     def create_standard_setup(
-        api_service, 
-        cache, 
-        dev_mode: bool = False
+        api_service,
+        cache,
+        dev_mode: bool = False,
+        pipeline_mode: Optional[CommandPipelineMode] = None
     ) -> Tuple[
-        CommandAnalyzer,
-        CommandExecutor,
+        ICommandAnalyzer,
+        ICommandExecutor,
         NonsenseHandler
     ]:
         """
         Create a standard command processing setup
-        
+
         Args:
             api_service: API service instance
             cache: Cache manager instance
             dev_mode: Enable development mode features
-            
+            pipeline_mode: Analyzer/executor pipeline (defaults to COMMAND_PIPELINE_MODE)
+
         Returns:
             Tuple of all command processing components
         """
-        
+        if pipeline_mode is None:
+            pipeline_mode = get_command_pipeline_mode()
+
         # Create all components
-        command_analyzer = CommandAnalyzer(api_service, cache, dev_mode)
-        command_executor = CommandExecutor(api_service, cache, dev_mode)
-        nonsense_handler = NonsenseHandler(api_service, cache, dev_mode)
-        
-        return command_analyzer, command_executor, nonsense_handler
\ No newline at end of file
+        command_analyzer, command_executor = CommandComponentFactory.create_pipeline(
+            api_service, cache, dev_mode, pipeline_mode
+        )
+        nonsense_handler = NonsenseHandler(
+            api_service, cache, dev_mode, get_nonsense_severity_mode(),
+            CommandComponentFactory.create_state_renderer(dev_mode),
+        )
+
+        return command_analyzer, command_executor, nonsense_handler
+
+    @staticmethod
+    def create_state_renderer(dev_mode: bool = False) -> Optional[GameStateDeltaRenderer]:
+        """
+        Create the game state delta renderer when enabled
+        via the STATE_DELTA_PROMPTS environment variable (off by default:
+        the measured token saving does not yet justify the longer prompts)
+
+        Args:
+            dev_mode: Enable development mode features
+
+        Returns:
+            Delta renderer or None when every turn gets a fresh snapshot
+        """
+        delta = os.getenv("STATE_DELTA_PROMPTS", "false").lower()
+        if delta not in ["true", "1", "yes", "on"]:
+            return None
+        return GameStateDeltaRenderer(int(os.getenv("STATE_SNAPSHOT_EVERY", "5")), dev_mode)
+
+    @staticmethod
+    def create_pipeline(
+        api_service,
+        cache,
+        dev_mode: bool,
+        pipeline_mode: CommandPipelineMode
+    ) -> Tuple[ICommandAnalyzer, ICommandExecutor]:
+        """
+        Create the analyzer and executor pair for a pipeline mode
+
+        Args:
+            api_service: API service instance
+            cache: Cache manager instance
+            dev_mode: Enable development mode features
+            pipeline_mode: Analyzer/executor pipeline
+
+        Returns:
+            Tuple of command analyzer and command executor
+        """
+        if pipeline_mode == CommandPipelineMode.FUSED:
+            return (
+                FusedCommandAnalyzer(api_service, cache, dev_mode),
+                FusedCommandExecutor(dev_mode),
+            )
+        return (
+            CommandAnalyzer(api_service, cache, dev_mode),
+            CommandExecutor(api_service, cache, dev_mode),
+        )
+
+    @staticmethod
+    def create_command_parser(dev_mode: bool = False) -> Optional[RuleBasedCommandParser]:
+        """
+        Create the deterministic fast-path parser, unless disabled
+        via the COMMAND_FAST_PATH environment variable
+
+        Args:
+            dev_mode: Enable development mode features
+
+        Returns:
+            Command parser or None when the fast path is disabled
+        """
+        fast_path = os.getenv("COMMAND_FAST_PATH", "true").lower()
+        if fast_path not in ["true", "1", "yes", "on"]:
+            return None
+        return RuleBasedCommandParser(dev_mode)
+
+
+def get_command_pipeline_mode() -> CommandPipelineMode:
+    """Get command pipeline mode from environment variable"""
+    mode = os.getenv("COMMAND_PIPELINE_MODE", "two_phase").lower()
+    try:
+        return CommandPipelineMode(mode)
+    except ValueError:
+        return CommandPipelineMode.TWO_PHASE
+
+
+def get_nonsense_severity_mode() -> NonsenseSeverityMode:
+    """Get nonsense severity mode from environment variable"""
+    mode = os.getenv("NONSENSE_SEVERITY_MODE", "shadow").lower()
+    try:
+        return NonsenseSeverityMode(mode)
+    except ValueError:
+        return NonsenseSeverityMode.SHADOW
@@ -3,7 +3,7 @@ Abstract interfaces for command processing components
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 
 class ICommandAnalyzer(ABC):
@@ -30,4 +30,18 @@ class INonsenseHandler(ABC):
     @abstractmethod
     def handle_nonsense(self, command: str, game_state: Any) -> Dict[str, Any]:
         """Generate reaction to nonsense actions with humor and realism"""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def classify_severity(self, command: str) -> Optional[str]:
+        """Severity decided without the AI, or None when the AI decides it"""
+        pass
+
+
+class ICommandParser(ABC):
+    """Interface for resolving commands deterministically before any AI call"""
+    
+    @abstractmethod
+    def parse_command(self, command: str, game_state: Any) -> Optional[Dict[str, Any]]:
+        """Return a command result when confident, None to fall through to the AI"""
+        pass
@@ -4,30 +4,116 @@ Nonsense action handling component
 
 import json
 import logging
-from typing import Any, Dict
+from enum import Enum
+from typing import Any, Dict, Optional
 
 from ai_engine.api.service import APIConfig
 from ai_engine.prompts.command.nonsense_agent import create_nonsense_action_prompt
+from ai_engine.prompts.prompt_config import get_current_language
+from ai_engine.utils.action_classifier import ActionClassifier, ActionSeverity
 from ai_engine.utils.formatters import format_game_state
 from ai_engine.utils.constants import GameStateInput
+from ai_engine.utils.state_delta import GameStateDeltaRenderer
 
 from .interfaces import INonsenseHandler
 
 logger = logging.getLogger(__name__)
 
+SEVERITIES = {ActionSeverity.IMPROMPTU.value, ActionSeverity.AWKWARD.value, ActionSeverity.DANGEROUS.value}
+
+
+class NonsenseSeverityMode(Enum):
+    """Who decides the severity of a nonsense action"""
+    LOCAL = "local"    # Keyword classifier decides when a keyword matches, the AI otherwise
+    SHADOW = "shadow"  # AI decides, the classifier is only compared
+    LLM = "llm"        # AI decides, no classifier (previous behavior)
+
 
 class NonsenseHandler(INonsenseHandler):
     """Handles nonsensical or inappropriate player actions with humor and realism"""
     
-    def __init__(self, api_service, cache, dev_mode: bool = False):
+    def __init__(
+        self,
+        api_service,
+        cache,
+        dev_mode: bool = False,
+        severity_mode: NonsenseSeverityMode = NonsenseSeverityMode.SHADOW,
+        state_renderer: Optional[GameStateDeltaRenderer] = None,
+    ):
         self.api_service = api_service
         self.cache = cache
         self.dev_mode = dev_mode
+        self.severity_mode = severity_mode
+        self.state_renderer = state_renderer
+        self.stats = {"classified": 0, "keyword_matches": 0, "compared": 0, "agreements": 0}
+        self.disagreements: Dict[str, int] = {}
+
+    def classify_severity(self, command: str) -> Optional[str]:
+        """
+        Severity of a nonsense action decided locally, without waiting for the AI
+
+        Args:
+            command: The nonsensical command attempted by the player
+
+        Returns:
+            Severity value, or None when the AI decides the severity (other modes,
+            or no keyword matched)
+        """
+        if self.severity_mode != NonsenseSeverityMode.LOCAL:
+            return None
+        severity = ActionClassifier.find_severity(command, get_current_language())
+        return severity.value if severity else None
+
+    def _local_severity(self, command: str) -> Optional[str]:
+        """Classifier severity for the reaction (None without a keyword), counted in the statistics"""
+        if self.severity_mode == NonsenseSeverityMode.LLM:
+            return None
+        try:
+            severity = ActionClassifier.find_severity(command, get_current_language())
+            self.stats["classified"] += 1
+            if severity is None:
+                return None
+            self.stats["keyword_matches"] += 1
+            return severity.value
+        except Exception as e:
+            logger.error(f"Error in nonsense severity classification: {e}")
+            return None
+
+    def _apply_severity(self, result: Dict[str, Any], local_severity: Optional[str]) -> Dict[str, Any]:
+        """Compare the AI severity with the local one and keep the one the mode trusts"""
+        ai_severity = str(result.get("severity", "")).lower()
+        if local_severity is None:
+            return result
+
+        if ai_severity in SEVERITIES:
+            self.stats["compared"] += 1
+            if ai_severity == local_severity:
+                self.stats["agreements"] += 1
+            else:
+                key = f"{local_severity}->{ai_severity}"
+                self.disagreements[key] = self.disagreements.get(key, 0) + 1
+                if self.dev_mode:
+                    print(f"🤪 NONSENSE SEVERITY DISAGREEMENT: local={local_severity} ai={ai_severity}")
+
+        if self.severity_mode == NonsenseSeverityMode.LOCAL or ai_severity not in SEVERITIES:
+            result["severity"] = local_severity
+        return result
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get severity statistics with the agreement rate between classifier and AI"""
+        compared = self.stats["compared"]
+        return {
+            **self.stats,
+            "mode": self.severity_mode.value,
+            "agreement_rate": round(self.stats["agreements"] / compared, 3) if compared else None,
+            "disagreements": dict(self.disagreements),
+        }
     
     def handle_nonsense(self, command: str, game_state: GameStateInput) -> Dict[str, Any]:
         """
         Generate a humorous and realistic reaction to nonsensical player actions.
-        Uses conversation history to maintain continuity.
+        Uses conversation history to maintain continuity. In local severity
+        mode a matching keyword sets the severity, the AI only writes the reaction.
         
         Args:
             command: The nonsensical command/action attempted by the player
@@ -36,12 +122,17 @@ class NonsenseHandler(INonsenseHandler):
         Returns:
             Dict with message, severity classification and action details
         """
+        local_severity = self._local_severity(command)
+
         try:
             if self.dev_mode:
                 print(f"🤪 NONSENSE HANDLER: Processing '{command}'")
 
-            # Format game state for AI consumption
-            game_state_str: str = format_game_state(game_state)
+            # Format game state for AI consumption (snapshot and changes since, with a renderer)
+            game_state_str: str = (
+                self.state_renderer.render(game_state.get("session_id"), "nonsense", game_state)
+                if self.state_renderer else format_game_state(game_state)
+            )
             
             # Create the nonsense action prompt
             prompt: str = create_nonsense_action_prompt(game_state_str)
@@ -70,7 +161,7 @@ class NonsenseHandler(INonsenseHandler):
                 if self.dev_mode:
                     print("🚀 CACHE HIT: Nonsense response found in cache!")
                 try:
-                    return json.loads(cached_result)
+                    return self._apply_severity(json.loads(cached_result), local_severity)
                 except json.JSONDecodeError:
                     pass  # Fall through to generate new response
             
@@ -98,7 +189,7 @@ class NonsenseHandler(INonsenseHandler):
             if content is None:
                 if self.dev_mode:
                     print("❌ NONSENSE HANDLER: API call failed")
-                return self._get_fallback_response(command)
+                return self._get_fallback_response(command, local_severity)
             
             # Parse JSON response
             try:
@@ -115,19 +206,19 @@ class NonsenseHandler(INonsenseHandler):
                 if self.dev_mode:
                     print("💾 CACHE MISS: Generated and cached nonsense response")
                 
-                return {
+                return self._apply_severity({
                     "message": result.get("message", "Your absurd action leaves everyone speechless."),
                     "severity": result.get("severity", "awkward"),
                     "action_category": result.get("action_category", "unknown"),
                     "summary": result.get("summary", f"The detective attempted something unusual"),
                     "command_attempted": command
-                }
+                }, local_severity)
             except json.JSONDecodeError:
                 if self.dev_mode:
                     print("⚠️ NONSENSE HANDLER: JSON decode failed, using content as message")
                 return {
                     "message": content or "Your bizarre behavior causes an awkward silence.",
-                    "severity": "awkward",
+                    "severity": local_severity or "awkward",
                     "action_category": "unknown", 
                     "summary": f"The detective attempted something unusual",
                     "command_attempted": command
@@ -135,7 +226,7 @@ class NonsenseHandler(INonsenseHandler):
                 
         except Exception as e:
             logger.error(f"Error in handle_nonsense: {e}")
-            return self._get_fallback_response(command)
+            return self._get_fallback_response(command, local_severity)
     
     def _wrap_with_fictional_context(self, user_input: str) -> str:
         """Wrap user input with fictional context for AI safety"""
@@ -148,11 +239,11 @@ class NonsenseHandler(INonsenseHandler):
             "### END OF FICTIONAL GAME DIALOGUE ###\n"
         )
     
-    def _get_fallback_response(self, command: str) -> Dict[str, Any]:
+    def _get_fallback_response(self, command: str, severity: Optional[str] = None) -> Dict[str, Any]:
         """Get fallback response when nonsense handling fails"""
         return {
             "message": "Your bizarre behavior causes an awkward silence.",
-            "severity": "awkward",
+            "severity": severity or "awkward",
             "action_category": "unknown",
             "command_attempted": command,
             "summary": "The detective attempted something unusual"
@@ -3,7 +3,7 @@ Main CommandProcessor - Clean interface with refactored components
 """
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from ai_engine.processors.base_processor import BaseProcessor
 from ai_engine.utils.ai_logger import log_ai_response
@@ -34,6 +34,7 @@ class CommandProcessor(BaseProcessor):
          self.nonsense_handler) = CommandComponentFactory.create_standard_setup(
             api_service, cache, dev_mode
         )
+        self.command_parser = CommandComponentFactory.create_command_parser(dev_mode)
         
         self._log_debug("CommandProcessor initialized with refactored components")
     
@@ -43,7 +44,7 @@ class CommandProcessor(BaseProcessor):
     def process_command(self, command: str, game_state: Any) -> Dict[str, Any]:
         """
         Process a natural language command using the two-phase approach.
-        Now coordinated through specialized components.
+        Unambiguous commands are resolved first by the rule-based fast path.
         
         Args:
             command: Player's input command
@@ -63,6 +64,12 @@ class CommandProcessor(BaseProcessor):
             return self._create_error_response("Invalid game state format")
 
         try:
+            # Step 0: Fast path - resolve unambiguous commands without AI
+            if self.command_parser:
+                parsed_result = self.command_parser.parse_command(command, ai_state)
+                if parsed_result is not None:
+                    return parsed_result
+
             # Step 1: Analysis - Analyze and understand the command
             reasoning_result = self.command_analyzer.analyze_command(command, ai_state)
 
@@ -116,6 +123,28 @@ class CommandProcessor(BaseProcessor):
                 "action_category": "unknown",
                 "command_attempted": command,
             }
+
+    def classify_nonsense(self, command: str) -> Optional[str]:
+        """
+        Severity of a nonsense action decided without the AI
+
+        Args:
+            command: The nonsensical command/action attempted by the player
+
+        Returns:
+            Severity value, or None when the AI decides the severity
+        """
+        try:
+            return self.nonsense_handler.classify_severity(command)
+        except Exception as e:
+            logger.error(f"Error in classify_nonsense: {e}")
+            return None
+   
+    def get_fast_path_statistics(self) -> Dict[str, Any]:
+        """Get coverage statistics of the rule-based fast path"""
+        if not self.command_parser:
+            return {"enabled": False}
+        return {"enabled": True, **self.command_parser.get_statistics()}
    
     def _create_error_response(self, error_message: str) -> Dict[str, Any]:
         """Create standardized error response"""
@@ -128,6 +157,12 @@ class CommandProcessor(BaseProcessor):
             "target_type": "unknown",
         }
     
+    def reset_state_prompts(self, session_id: Optional[str] = None) -> None:
+        """Forget the game state snapshots sent to the nonsense agent"""
+        renderer = getattr(self.nonsense_handler, "state_renderer", None)
+        if renderer:
+            renderer.reset(session_id)
+
     def health_check(self) -> Dict[str, Any]:
         """Check the health of command processor components"""
         return {
@@ -135,6 +170,12 @@ class CommandProcessor(BaseProcessor):
             "command_analyzer": self.command_analyzer is not None,
             "command_executor": self.command_executor is not None,
             "nonsense_handler": self.nonsense_handler is not None,
+            "nonsense_severity": self.nonsense_handler.get_statistics() if self.nonsense_handler else None,
+            "state_delta": (
+                self.nonsense_handler.state_renderer.get_statistics()
+                if getattr(self.nonsense_handler, "state_renderer", None) else None
+            ),
+            "fast_path": self.get_fast_path_statistics(),
             "api_service": self.api_service is not None,
             "cache": self.cache is not None,
             "dev_mode": self.dev_mode
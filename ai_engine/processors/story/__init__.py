@@ -21,6 +21,9 @@ from .room_description import RoomDescriptionGenerator
 from .character_description import CharacterDescriptionGenerator
 from .clue_analyzer import ClueAnalyzer
 from .object_inspector import ObjectInspector
+from .prefetch import DescriptionPrefetcher
+from .lookahead import RoomLookahead, build_room_graph
+from .object_pool import ObjectPoolMode, ObjectResponsePool
 
 __all__ = [
     # Main interface (same as before)
@@ -40,4 +43,9 @@ __all__ = [
     'CharacterDescriptionGenerator',
     'ClueAnalyzer',
     'ObjectInspector',
+    'DescriptionPrefetcher',
+    'RoomLookahead',
+    'build_room_graph',
+    'ObjectResponsePool',
+    'ObjectPoolMode',
 ]
\ No newline at end of file
@@ -3,9 +3,13 @@ Character description generation component
 """
 
 import logging
+from typing import Any, Dict, List, Optional, Tuple
 
 from ai_engine.api.service import APIConfig
-from ai_engine.prompts import create_character_description_prompt
+from ai_engine.prompts import (
+    create_character_batch_description_prompt,
+    create_character_description_prompt,
+)
 from game_engine.models.character import Character
 from game_engine.models.room import Room
 
@@ -22,27 +26,40 @@ class CharacterDescriptionGenerator(ICharacterDescriptionGenerator):
         self.cache = cache
         self.dev_mode = dev_mode
     
-    def generate_description(self, character: Character, room: Room) -> str:
+    def create_request(self, character: Character, room: Room) -> Tuple[str, Dict[str, Any]]:
+        """Build the prompt and cache context of a character description"""
+        prompt: str = create_character_description_prompt(character, room)
+        cache_context = {
+            "type": "character", 
+            "character": character.name, 
+            "room": room.name
+        }
+        return prompt, cache_context
+    
+    def is_cached(self, character: Character, room: Room) -> bool:
+        """Check whether the description is already in cache"""
+        prompt, cache_context = self.create_request(character, room)
+        return self.cache.get(prompt, {"temperature": 0.7}, cache_context) is not None
+    
+    def generate_description(
+        self, character: Character, room: Room, cache_fallback: bool = True
+    ) -> Optional[str]:
         """
         Generates a description of a character.
 
         Args:
             character: Character to describe
             room: Room where the character is located
+            cache_fallback: Return and cache the fallback sentence when the API
+                call fails; background callers pass False and get None instead
 
         Returns:
             Description of the character
         """
         try:
-            prompt: str = create_character_description_prompt(character, room)
+            prompt, cache_context = self.create_request(character, room)
             
             # Check cache first
-            cache_context = {
-                "type": "character", 
-                "character": character.name, 
-                "room": room.name
-            }
-            
             cached_result = self.cache.get(
                 prompt, 
                 {"temperature": 0.7}, 
@@ -67,6 +84,8 @@ class CharacterDescriptionGenerator(ICharacterDescriptionGenerator):
             # Always define result with a fallback
             if content:
                 result = content
+            elif not cache_fallback:
+                return None
             else:
                 result = f"You inspect {character.name}. There is nothing special to note."
             
@@ -85,4 +104,81 @@ class CharacterDescriptionGenerator(ICharacterDescriptionGenerator):
 
         except Exception as e:
             logger.error(f"Error in generate_character_description: {e}")
-            return f"You inspect {character.name}. There is nothing special to note."
\ No newline at end of file
+            if not cache_fallback:
+                return None
+            return f"You inspect {character.name}. There is nothing special to note."
+
+    def create_batch_prompt(self, characters: List[Character], room: Room) -> str:
+        """Build the prompt describing several characters in one call"""
+        return create_character_batch_description_prompt(characters, room)
+
+    def generate_batch(
+        self, characters: List[Character], room: Room, cache_fallback: bool = True
+    ) -> Dict[str, str]:
+        """
+        Generates descriptions of several characters of a room in one JSON call.
+        Each description is cached under its own request, so a later look at
+        one character is a cache hit.
+
+        Args:
+            characters: Characters to describe
+            room: Room where the characters are located
+            cache_fallback: Passed to the single-character call (a failed batch caches nothing)
+
+        Returns:
+            Descriptions by character name (characters missing from the answer are left out)
+        """
+        try:
+            descriptions: Dict[str, str] = {}
+            pending: List[Character] = []
+            for character in characters:
+                prompt, cache_context = self.create_request(character, room)
+                cached_result = self.cache.get(prompt, {"temperature": 0.7}, cache_context)
+                if cached_result:
+                    descriptions[character.name] = cached_result
+                else:
+                    pending.append(character)
+
+            if len(pending) == 1:
+                description = self.generate_description(pending[0], room, cache_fallback)
+                if description is not None:
+                    descriptions[pending[0].name] = description
+            elif pending:
+                descriptions.update(self._generate_batch(pending, room))
+            return descriptions
+
+        except Exception as e:
+            logger.error(f"Error in generate_character_batch: {e}")
+            return {}
+
+    def _generate_batch(self, characters: List[Character], room: Room) -> Dict[str, str]:
+        """One JSON call for the characters, split and cached per character"""
+        content = self.api_service.make_api_call(
+            messages=[{"role": "user", "content": self.create_batch_prompt(characters, room)}],
+            system_content="You are the narrator of a detective game set in 19th century Blackwood Manor where a murder has been committed.",
+            max_tokens=APIConfig.MAX_TOKENS_LARGE,
+            response_format={"type": "json_object"},
+        )
+        if not content:
+            return {}
+
+        result = self.api_service.parse_json_response(content, {"descriptions": []})
+        entries = result.get("descriptions", []) if isinstance(result, dict) else []
+        by_name = {character.name.lower(): character for character in characters}
+
+        descriptions: Dict[str, str] = {}
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            character = by_name.get(str(entry.get("name", "")).strip().lower())
+            description = entry.get("description")
+            if character is None or not isinstance(description, str) or not description.strip():
+                continue
+
+            prompt, cache_context = self.create_request(character, room)
+            self.cache.put(prompt, {"temperature": 0.7}, description.strip(), cache_context)
+            descriptions[character.name] = description.strip()
+
+        if self.dev_mode:
+            print(f"💾 BATCH: Generated and cached {len(descriptions)}/{len(characters)} character descriptions in {room.name}")
+        return descriptions
@@ -3,10 +3,10 @@ Clue analysis component
 """
 
 import logging
-from typing import Any, Optional, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from ai_engine.api.service import APIConfig
-from ai_engine.prompts import create_clue_analysis_prompt
+from ai_engine.prompts import create_clue_analysis_prompt, create_clue_batch_analysis_prompt
 
 from .interfaces import IClueAnalyzer
 
@@ -16,32 +16,57 @@ logger = logging.getLogger(__name__)
 class ClueAnalyzer(IClueAnalyzer):
     """Analyzes clues and provides insights to the player"""
     
-    def __init__(self, api_service, cache, dev_mode: bool = False):
+    def __init__(self, api_service, cache, dev_mode: bool = False, clue_graph=None):
         self.api_service = api_service
         self.cache = cache
         self.dev_mode = dev_mode
+        self.clue_graph = clue_graph
     
-    def analyze_clue(self, clue: Any, collected_clues: Optional[List] = None) -> str:
+    def relevant_clues(self, clue: Any, collected_clues: Optional[List] = None) -> List:
+        """Collected clues the analysis depends on, from the clue relationship graph"""
+        if self.clue_graph is None:
+            from game_engine.setup.game_data import get_clue_graph
+            self.clue_graph = get_clue_graph()
+        return self.clue_graph.relevant_clues(clue, collected_clues)
+    
+    def create_request(
+        self, clue: Any, collected_clues: Optional[List] = None
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Build the prompt and cache context of a clue analysis"""
+        # Only related clues matter: the same analysis is reused whatever else was found
+        related = self.relevant_clues(clue, collected_clues)
+        prompt: str = create_clue_analysis_prompt(clue, related)
+        cache_context = {
+            "type": "clue_analysis",
+            "clue": clue.name,
+            "related_clues": [c.name for c in related]
+        }
+        return prompt, cache_context
+    
+    def is_cached(self, clue: Any, collected_clues: Optional[List] = None) -> bool:
+        """Check whether the analysis is already in cache"""
+        prompt, cache_context = self.create_request(clue, collected_clues)
+        return self.cache.get(prompt, {"temperature": 0.7}, cache_context) is not None
+    
+    def analyze_clue(
+        self, clue: Any, collected_clues: Optional[List] = None, cache_fallback: bool = True
+    ) -> Optional[str]:
         """
         Analyzes a clue and gives insights to the player.
 
         Args:
             clue: Clue to analyze
             collected_clues: Optional list of previously collected clues
+            cache_fallback: Return and cache the fallback sentence when the API
+                call fails; background callers pass False and get None instead
 
         Returns:
             Analysis of the clue
         """
         try:
-            prompt: str = create_clue_analysis_prompt(clue, collected_clues)
+            prompt, cache_context = self.create_request(clue, collected_clues)
             
             # Check cache first
-            cache_context = {
-                "type": "clue_analysis",
-                "clue": clue.name,
-                "clues_count": len(collected_clues) if collected_clues else 0
-            }
-            
             cached_result = self.cache.get(
                 prompt,
                 {"temperature": 0.7},
@@ -65,6 +90,8 @@ class ClueAnalyzer(IClueAnalyzer):
             # Always define result with a fallback
             if content:
                 result = content
+            elif not cache_fallback:
+                return None
             else:
                 result = "This clue seems significant, but its meaning eludes me for now."
             
@@ -83,4 +110,81 @@ class ClueAnalyzer(IClueAnalyzer):
 
         except Exception as e:
             logger.error(f"Error in analyze_clue: {e}")
-            return "This clue seems significant, but its meaning eludes me for now."
\ No newline at end of file
+            if not cache_fallback:
+                return None
+            return "This clue seems significant, but its meaning eludes me for now."
+
+    def create_batch_prompt(self, clues: List, collected_clues: Optional[List] = None) -> str:
+        """Build the prompt analysing several clues in one call"""
+        related = {clue.name: self.relevant_clues(clue, collected_clues) for clue in clues}
+        return create_clue_batch_analysis_prompt(clues, related)
+
+    def analyze_batch(
+        self, clues: List, collected_clues: Optional[List] = None, cache_fallback: bool = True
+    ) -> Dict[str, str]:
+        """
+        Analyzes several clues in one JSON call. Each analysis is cached under its
+        own request, so a later analysis of one clue is a cache hit.
+
+        Args:
+            clues: Clues to analyze
+            collected_clues: Optional list of previously collected clues
+            cache_fallback: Passed to the single-clue call (a failed batch caches nothing)
+
+        Returns:
+            Analyses by clue name (clues missing from the answer are left out)
+        """
+        try:
+            analyses: Dict[str, str] = {}
+            pending = []
+            for clue in clues:
+                prompt, cache_context = self.create_request(clue, collected_clues)
+                cached_result = self.cache.get(prompt, {"temperature": 0.7}, cache_context)
+                if cached_result:
+                    analyses[clue.name] = cached_result
+                else:
+                    pending.append(clue)
+
+            if len(pending) == 1:
+                analysis = self.analyze_clue(pending[0], collected_clues, cache_fallback)
+                if analysis is not None:
+                    analyses[pending[0].name] = analysis
+            elif pending:
+                analyses.update(self._analyze_batch(pending, collected_clues))
+            return analyses
+
+        except Exception as e:
+            logger.error(f"Error in analyze_clue_batch: {e}")
+            return {}
+
+    def _analyze_batch(self, clues: List, collected_clues: Optional[List]) -> Dict[str, str]:
+        """One JSON call for the clues, split and cached per clue"""
+        content = self.api_service.make_api_call(
+            messages=[{"role": "user", "content": self.create_batch_prompt(clues, collected_clues)}],
+            system_content="You are a perceptive detective analyzing clues.",
+            max_tokens=APIConfig.MAX_TOKENS_SMALL * (len(clues) + 1),
+            response_format={"type": "json_object"},
+        )
+        if not content:
+            return {}
+
+        result = self.api_service.parse_json_response(content, {"analyses": []})
+        entries = result.get("analyses", []) if isinstance(result, dict) else []
+        by_name = {clue.name.lower(): clue for clue in clues}
+
+        analyses: Dict[str, str] = {}
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            clue = by_name.get(str(entry.get("name", "")).strip().lower())
+            analysis = entry.get("analysis")
+            if clue is None or not isinstance(analysis, str) or not analysis.strip():
+                continue
+
+            prompt, cache_context = self.create_request(clue, collected_clues)
+            self.cache.put(prompt, {"temperature": 0.7}, analysis.strip(), cache_context)
+            analyses[clue.name] = analysis.strip()
+
+        if self.dev_mode:
+            print(f"💾 BATCH: Generated and cached {len(analyses)}/{len(clues)} clue analyses")
+        return analyses
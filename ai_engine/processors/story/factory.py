@@ -2,12 +2,16 @@
 Factory for creating story processing components
 """
 
-from typing import Tuple
+import os
+from typing import Optional, Tuple
 
 from .room_description import RoomDescriptionGenerator
 from .character_description import CharacterDescriptionGenerator
 from .clue_analyzer import ClueAnalyzer
 from .object_inspector import ObjectInspector
+from .lookahead import RoomLookahead
+from .object_pool import ObjectPoolMode, ObjectResponsePool
+from .prefetch import DescriptionPrefetcher
 
 
 class StoryComponentFactory:
@@ -40,6 +44,113 @@ class StoryComponentFactory:
         room_generator = RoomDescriptionGenerator(api_service, cache, dev_mode)
         character_generator = CharacterDescriptionGenerator(api_service, cache, dev_mode)
         clue_analyzer = ClueAnalyzer(api_service, cache, dev_mode)
-        object_inspector = ObjectInspector(api_service, cache, dev_mode)
+        response_pool = StoryComponentFactory.create_object_response_pool(
+            api_service, cache, dev_mode=dev_mode
+        )
+        object_inspector = ObjectInspector(api_service, cache, dev_mode, response_pool)
         
-        return room_generator, character_generator, clue_analyzer, object_inspector
\ No newline at end of file
+        return room_generator, character_generator, clue_analyzer, object_inspector
+    
+    @staticmethod
+    def create_prefetcher(
+        character_generator: CharacterDescriptionGenerator,
+        clue_analyzer: ClueAnalyzer,
+        cache,
+        dev_mode: bool = False
+    ) -> Optional[DescriptionPrefetcher]:
+        """
+        Create the room-entry prefetcher, if enabled via the STORY_PREFETCH
+        environment variable (budget from STORY_PREFETCH_TOKEN_BUDGET, batched
+        descriptions and analyses unless STORY_BATCH_DESCRIPTIONS is off)
+        
+        Args:
+            character_generator: Generator used for character descriptions
+            clue_analyzer: Analyzer used for clue analyses
+            cache: Session cache receiving the prefetched entries
+            dev_mode: Enable development mode features
+            
+        Returns:
+            Prefetcher or None when prefetch is disabled
+        """
+        prefetch = os.getenv("STORY_PREFETCH", "false").lower()
+        if prefetch not in ["true", "1", "yes", "on"]:
+            return None
+        return DescriptionPrefetcher(
+            character_generator,
+            clue_analyzer,
+            cache,
+            token_budget=int(os.getenv("STORY_PREFETCH_TOKEN_BUDGET", "20000")),
+            batch=os.getenv("STORY_BATCH_DESCRIPTIONS", "true").lower() in ["true", "1", "yes", "on"],
+            dev_mode=dev_mode,
+        )
+    
+    @staticmethod
+    def create_room_lookahead(
+        room_generator: RoomDescriptionGenerator,
+        cache,
+        dev_mode: bool = False
+    ) -> Optional[RoomLookahead]:
+        """
+        Create the room-graph lookahead, if enabled via the STORY_LOOKAHEAD
+        environment variable (bounds from STORY_LOOKAHEAD_CONCURRENCY and
+        STORY_LOOKAHEAD_TOKEN_BUDGET)
+        
+        Args:
+            room_generator: Generator used for room descriptions
+            cache: Session cache receiving the generated descriptions
+            dev_mode: Enable development mode features
+            
+        Returns:
+            Lookahead or None when lookahead is disabled
+        """
+        lookahead = os.getenv("STORY_LOOKAHEAD", "false").lower()
+        if lookahead not in ["true", "1", "yes", "on"]:
+            return None
+        return RoomLookahead(
+            room_generator,
+            cache,
+            max_concurrency=int(os.getenv("STORY_LOOKAHEAD_CONCURRENCY", "2")),
+            token_budget=int(os.getenv("STORY_LOOKAHEAD_TOKEN_BUDGET", "20000")),
+            dev_mode=dev_mode,
+        )
+    
+    @staticmethod
+    def create_object_response_pool(
+        api_service,
+        cache,
+        mode: Optional[ObjectPoolMode] = None,
+        dev_mode: bool = False
+    ) -> Optional[ObjectResponsePool]:
+        """
+        Create the non-clue object answer pool (OBJECT_RESPONSE_POOL and
+        OBJECT_RESPONSE_POOL_SIZE from env)
+        
+        Args:
+            api_service: API service instance
+            cache: Cache keeping the generated pools
+            mode: Pool mode, read from the environment when None
+            dev_mode: Enable development mode features
+            
+        Returns:
+            Response pool or None when pooling is off
+        """
+        if mode is None:
+            mode = get_object_pool_mode()
+        if mode == ObjectPoolMode.OFF:
+            return None
+        return ObjectResponsePool(
+            api_service,
+            cache,
+            mode=mode,
+            pool_size=int(os.getenv("OBJECT_RESPONSE_POOL_SIZE", "6")),
+            dev_mode=dev_mode,
+        )
+
+
+def get_object_pool_mode() -> ObjectPoolMode:
+    """Get object response pool mode from environment variable"""
+    mode = os.getenv("OBJECT_RESPONSE_POOL", "generated").lower()
+    try:
+        return ObjectPoolMode(mode)
+    except ValueError:
+        return ObjectPoolMode.GENERATED
@@ -3,7 +3,7 @@ Abstract interfaces for story processing components
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional, List
+from typing import Any, Dict, Optional, List
 from game_engine.models.room import Room
 from game_engine.models.character import Character
 
@@ -21,8 +21,17 @@ class ICharacterDescriptionGenerator(ABC):
     """Interface for generating character descriptions"""
     
     @abstractmethod
-    def generate_description(self, character: Character, room: Room) -> str:
-        """Generate a description of a character"""
+    def generate_description(
+        self, character: Character, room: Room, cache_fallback: bool = True
+    ) -> Optional[str]:
+        """Generate a description of a character (None on failure without cache_fallback)"""
+        pass
+
+    @abstractmethod
+    def generate_batch(
+        self, characters: List[Character], room: Room, cache_fallback: bool = True
+    ) -> Dict[str, str]:
+        """Generate descriptions of several characters of a room in one call"""
         pass
 
 
@@ -30,8 +39,17 @@ class IClueAnalyzer(ABC):
     """Interface for analyzing clues"""
     
     @abstractmethod
-    def analyze_clue(self, clue: Any, collected_clues: Optional[List] = None) -> str:
-        """Analyze a clue and provide insights"""
+    def analyze_clue(
+        self, clue: Any, collected_clues: Optional[List] = None, cache_fallback: bool = True
+    ) -> Optional[str]:
+        """Analyze a clue and provide insights (None on failure without cache_fallback)"""
+        pass
+
+    @abstractmethod
+    def analyze_batch(
+        self, clues: List, collected_clues: Optional[List] = None, cache_fallback: bool = True
+    ) -> Dict[str, str]:
+        """Analyze several clues in one call"""
         pass
 
 
@@ -39,6 +57,6 @@ class IObjectInspector(ABC):
     """Interface for inspecting non-clue objects"""
     
     @abstractmethod
-    def inspect_object(self, object_name: str) -> str:
+    def inspect_object(self, object_name: str, room_name: Optional[str] = None) -> str:
         """Inspect a useless object and provide a response"""
         pass
\ No newline at end of file
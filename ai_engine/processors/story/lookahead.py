@@ -0,0 +1,197 @@
+"""
+Room-graph lookahead - speculative first-entry descriptions of neighbouring rooms
+"""
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, Hashable, List, Set, Tuple
+
+from ai_engine.prompts import create_room_description_prompt
+from ai_engine.utils.tokens import estimate_text_tokens
+from game_engine.models.room import Room
+
+from .room_description import RoomDescriptionGenerator
+
+logger = logging.getLogger(__name__)
+
+
+def build_room_graph(rooms: Dict[str, Room]) -> Dict[str, List[str]]:
+    """Adjacency lists from room exits, keeping only exits to known rooms"""
+    return {
+        name: [exit_name for exit_name in room.exits if exit_name in rooms and exit_name != name]
+        for name, room in rooms.items()
+    }
+
+
+def room_signature(room: Room) -> Hashable:
+    """Everything of a room that changes its first-entry description"""
+    return (
+        tuple((c.name, c.status) for c in room.characters),
+        tuple((c.name, c.is_collected) for c in room.clues),
+        len(getattr(room, "nonsense_events", [])),
+    )
+
+
+class RoomLookahead:
+    """
+    After each move, generates the first-entry description of every unvisited
+    neighbour of the current room into the session cache, so the next move is a
+    cache hit. Bounded by a worker count and an estimated token budget.
+    The cache key is the prompt itself, so a description generated before the room
+    changed is never served; the room signature (characters, clues, nonsense events)
+    only decides whether a neighbour needs generating again and counts stale entries.
+    """
+
+    def __init__(
+        self,
+        room_generator: RoomDescriptionGenerator,
+        cache,
+        max_concurrency: int = 2,
+        token_budget: int = 20000,
+        dev_mode: bool = False,
+    ):
+        self.room_generator = room_generator
+        self.cache = cache
+        self.token_budget = token_budget
+        self.dev_mode = dev_mode
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_concurrency), thread_name_prefix="room-lookahead"
+        )
+        self._lock = threading.Lock()
+        self._graph: Dict[str, List[str]] = {}
+        self._graph_rooms: Tuple[str, ...] = ()
+        self._generated: Dict[str, Hashable] = {}  # room name -> signature when generated
+        self._in_flight: Set[str] = set()
+        self._futures: Set[Future] = set()
+        self.stats = {
+            "scheduled": 0,
+            "generated": 0,
+            "skipped_fresh": 0,
+            "skipped_budget": 0,
+            "tokens_spent": 0,
+            "entries": 0,
+            "lookahead_hits": 0,
+            "stale": 0,
+            "failed": 0,
+        }
+
+    def get_graph(self, rooms: Dict[str, Room]) -> Dict[str, List[str]]:
+        """Room graph, rebuilt only when the set of rooms changes"""
+        names = tuple(sorted(rooms))
+        if names != self._graph_rooms:
+            self._graph = build_room_graph(rooms)
+            self._graph_rooms = names
+        return self._graph
+
+    def record_entry(self, room: Room) -> bool:
+        """
+        Record a first entry into a room and whether a fresh lookahead covers it
+
+        Returns:
+            True if the lookahead description is still valid
+        """
+        with self._lock:
+            self.stats["entries"] += 1
+            signature = self._generated.get(room.name)
+            if signature is None:
+                return False
+            if signature != room_signature(room):
+                self.stats["stale"] += 1
+                del self._generated[room.name]
+                return False
+            self.stats["lookahead_hits"] += 1
+            return True
+
+    def schedule(self, game_state: Any) -> int:
+        """
+        Queue first-entry descriptions of the unvisited neighbours of the current room
+
+        Args:
+            game_state: Current game state (rooms, current_location, rooms_visited)
+
+        Returns:
+            Number of rooms queued
+        """
+        if getattr(self.cache, "cache_disabled", False):
+            return 0
+
+        rooms = game_state.rooms
+        visited = getattr(game_state, "rooms_visited", set())
+        current = game_state.current_location
+        queued = 0
+
+        for name in self.get_graph(rooms).get(current, []):
+            if name in visited:
+                continue
+            room = rooms[name]
+
+            with self._lock:
+                if name in self._in_flight:
+                    continue
+                if self._generated.get(name) == room_signature(room):
+                    self.stats["skipped_fresh"] += 1
+                    continue
+                if self.stats["tokens_spent"] >= self.token_budget:
+                    self.stats["skipped_budget"] += 1
+                    continue
+                self._in_flight.add(name)
+                self.stats["scheduled"] += 1
+
+            future = self._executor.submit(self._generate, room, game_state)
+            with self._lock:
+                self._futures.add(future)
+            future.add_done_callback(self._forget)
+            queued += 1
+
+        if self.dev_mode and queued:
+            print(f"🧭 LOOKAHEAD: {queued} neighbouring rooms queued from {current}")
+        return queued
+
+    def _generate(self, room: Room, game_state: Any) -> None:
+        """Worker: generate and cache one first-entry description"""
+        try:
+            signature = room_signature(room)
+            # Same prompt and cache entry as the move into the room
+            prompt = create_room_description_prompt(room, "first_entry")
+            description = self.room_generator.describe(
+                room, "first_entry", game_state, cache_fallback=False
+            )
+            if description is None:
+                # Nothing cached: the move into the room makes the call again
+                with self._lock:
+                    self.stats["failed"] += 1
+                return
+            tokens = estimate_text_tokens(prompt) + estimate_text_tokens(description)
+
+            with self._lock:
+                self._generated[room.name] = signature
+                self.stats["generated"] += 1
+                self.stats["tokens_spent"] += tokens
+
+        except Exception as e:
+            logger.error(f"Error in room lookahead: {e}")
+        finally:
+            with self._lock:
+                self._in_flight.discard(room.name)
+
+    def _forget(self, future: Future) -> None:
+        with self._lock:
+            self._futures.discard(future)
+
+    def wait_idle(self, timeout: float = None) -> None:
+        """Block until queued lookahead work is done (benchmarks and tests)"""
+        with self._lock:
+            futures = list(self._futures)
+        wait(futures, timeout=timeout)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get lookahead statistics"""
+        with self._lock:
+            entries = self.stats["entries"]
+            return {
+                **self.stats,
+                "token_budget": self.token_budget,
+                "hit_rate": round(self.stats["lookahead_hits"] / entries, 3) if entries else 0.0,
+            }
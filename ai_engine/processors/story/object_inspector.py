@@ -3,11 +3,13 @@ Object inspection component for non-clue items
 """
 
 import logging
+from typing import Optional
 
 from ai_engine.api.service import APIConfig
 from ai_engine.prompts import create_inspect_object_prompt
 
 from .interfaces import IObjectInspector
+from .object_pool import ObjectResponsePool
 
 logger = logging.getLogger(__name__)
 
@@ -15,22 +17,36 @@ logger = logging.getLogger(__name__)
 class ObjectInspector(IObjectInspector):
     """Handles inspection of useless/non-clue objects"""
     
-    def __init__(self, api_service, cache, dev_mode: bool = False):
+    def __init__(
+        self,
+        api_service,
+        cache,
+        dev_mode: bool = False,
+        response_pool: Optional[ObjectResponsePool] = None,
+    ):
         self.api_service = api_service
         self.cache = cache
         self.dev_mode = dev_mode
+        self.response_pool = response_pool
     
-    def inspect_object(self, object_name: str) -> str:
+    def inspect_object(self, object_name: str, room_name: Optional[str] = None) -> str:
         """
         Give a simple answer for a useless object
         
         Args:
             object_name: Name of the object to inspect
+            room_name: Optional room where the object is examined (selects the answer pool)
             
         Returns:
             Simple response about the object
         """
         try:
+            # Pooled answers need no AI call once the room's pool exists
+            if self.response_pool:
+                pooled = self.response_pool.get_response(object_name, room_name)
+                if pooled:
+                    return pooled
+            
             prompt: str = create_inspect_object_prompt(object_name)
             
             # Check cache first
@@ -0,0 +1,165 @@
+"""
+Local response pool for non-clue object inspection
+"""
+
+import json
+import logging
+import threading
+import zlib
+from enum import Enum
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ai_engine.api.service import APIConfig
+from ai_engine.prompts import create_object_response_pool_prompt
+from ai_engine.prompts.prompt_config import get_current_language
+
+logger = logging.getLogger(__name__)
+
+SEED_RESPONSES_PATH = Path(__file__).parent.parent.parent.parent / "data" / "narratives" / "object_responses.json"
+
+PLACEHOLDER = "{object}"
+
+
+class ObjectPoolMode(Enum):
+    """Where the "nothing special" answers come from"""
+    GENERATED = "generated"  # One AI call per room and language, seed answers as fallback
+    SEED = "seed"            # Seed answers only, no AI call
+    OFF = "off"              # One AI call per object (previous behavior)
+
+
+class ObjectResponsePool:
+    """
+    Answer templates with an {object} placeholder, pooled per (room, language).
+
+    A room's pool is produced once (seed file or a single AI call, kept in the session
+    cache), then every object examined there is answered locally. Answers rotate per
+    (room, object, language), so poking the same object twice reads differently.
+    """
+
+    def __init__(
+        self,
+        api_service,
+        cache,
+        mode: ObjectPoolMode = ObjectPoolMode.GENERATED,
+        pool_size: int = 6,
+        dev_mode: bool = False,
+    ):
+        self.api_service = api_service
+        self.cache = cache
+        self.mode = mode
+        self.pool_size = pool_size
+        self.dev_mode = dev_mode
+        self._seeds = _load_seed_responses()
+        self._pools: Dict[Tuple[str, str], List[str]] = {}
+        self._rotation: Dict[Tuple[str, str, str], int] = {}
+        self._lock = threading.Lock()
+        self.stats = {"answers": 0, "pools_generated": 0, "pools_seeded": 0, "misses": 0}
+
+    def get_response(self, object_name: str, room_name: Optional[str] = None) -> Optional[str]:
+        """
+        Answer for a non-clue object from the pool
+
+        Args:
+            object_name: Object as named by the player
+            room_name: Room where it is examined
+
+        Returns:
+            Answer, or None when no pool exists for the language (caller falls back to AI)
+        """
+        try:
+            language = get_current_language().lower()
+            room = room_name or ""
+            templates = self._get_pool(room, language)
+            if not templates:
+                self.stats["misses"] += 1
+                return None
+
+            key = (room, " ".join(str(object_name).lower().split()), language)
+            with self._lock:
+                count = self._rotation.get(key, 0)
+                self._rotation[key] = count + 1
+                self.stats["answers"] += 1
+
+            # Different objects start at different answers
+            offset = zlib.crc32(key[1].encode("utf-8"))
+            template = templates[(offset + count) % len(templates)]
+            answer = template.replace(PLACEHOLDER, str(object_name))
+            # Templates starting with the object would start in lowercase
+            return answer[:1].upper() + answer[1:]
+
+        except Exception as e:
+            logger.error(f"Error in object response pool: {e}")
+            return None
+
+    def _get_pool(self, room: str, language: str) -> List[str]:
+        """Pool of a room in a language, produced on first use"""
+        key = (room, language)
+        with self._lock:
+            pool = self._pools.get(key)
+        if pool is not None:
+            return pool
+
+        pool = []
+        if self.mode == ObjectPoolMode.GENERATED and room:
+            pool = self._generate_pool(room, language)
+            if pool:
+                self.stats["pools_generated"] += 1
+        if not pool:
+            pool = self._seeds.get(language, [])
+            if pool:
+                self.stats["pools_seeded"] += 1
+
+        with self._lock:
+            self._pools[key] = pool
+        return pool
+
+    def _generate_pool(self, room: str, language: str) -> List[str]:
+        """One AI call producing the room's answer templates, kept in the session cache"""
+        try:
+            prompt = create_object_response_pool_prompt(room, self.pool_size)
+            model_params = {"temperature": 0.7, "format": "json"}
+            cache_context = {"type": "object_pool", "room": room, "language": language}
+
+            content = self.cache.get(prompt, model_params, cache_context)
+            if not content:
+                content = self.api_service.make_api_call(
+                    messages=[{"role": "user", "content": prompt}],
+                    system_content="You are a game manager writing reusable answers.",
+                    max_tokens=APIConfig.MAX_TOKENS_MEDIUM,
+                    response_format={"type": "json_object"},
+                )
+                if not content:
+                    return []
+                self.cache.put(prompt, model_params, content, cache_context)
+
+            result = self.api_service.parse_json_response(content, {"responses": []})
+            responses = result.get("responses", []) if isinstance(result, dict) else []
+            pool = [r.strip() for r in responses if isinstance(r, str) and r.count(PLACEHOLDER) == 1]
+
+            if self.dev_mode:
+                print(f"🗃️ OBJECT POOL: {len(pool)} answers for {room} ({language})")
+            return pool if len(pool) >= 2 else []
+
+        except Exception as e:
+            logger.error(f"Error generating object response pool: {e}")
+            return []
+
+    def get_statistics(self) -> Dict[str, object]:
+        """Get pool statistics"""
+        with self._lock:
+            return {**self.stats, "mode": self.mode.value, "pools": len(self._pools)}
+
+
+def _load_seed_responses() -> Dict[str, List[str]]:
+    """Offline answer templates per language"""
+    try:
+        with open(SEED_RESPONSES_PATH, "r", encoding="utf-8") as f:
+            seeds = json.load(f)
+        return {
+            language.lower(): [t for t in templates if t.count(PLACEHOLDER) == 1]
+            for language, templates in seeds.items()
+        }
+    except Exception as e:
+        logger.error(f"Error loading seed object responses: {e}")
+        return {}
@@ -0,0 +1,323 @@
+"""
+Predictive prefetch of character descriptions and clue analyses on room entry
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set
+
+from ai_engine.utils.tokens import estimate_text_tokens
+from game_engine.models.room import Room
+
+from .character_description import CharacterDescriptionGenerator
+from .clue_analyzer import ClueAnalyzer
+
+logger = logging.getLogger(__name__)
+
+
+class DescriptionPrefetcher:
+    """
+    Pre-generates the likely next looks after a move into the session cache.
+
+    - One low-priority worker thread, paused while a foreground story call runs
+      (including the room description that follows the move)
+    - Work for a room is dropped as soon as the player moves again
+    - Generation stops once the session token budget (estimated) is spent
+    - With batching, the room's characters and its clues each take a single call
+    Looks served from prefetched entries (hit-through) and prefetched tokens never
+    used (waste) are tracked.
+    """
+
+    def __init__(
+        self,
+        character_generator: CharacterDescriptionGenerator,
+        clue_analyzer: ClueAnalyzer,
+        cache,
+        token_budget: int = 20000,
+        idle_timeout: float = 5.0,
+        batch: bool = False,
+        dev_mode: bool = False,
+    ):
+        self.character_generator = character_generator
+        self.clue_analyzer = clue_analyzer
+        self.cache = cache
+        self.token_budget = token_budget
+        self.idle_timeout = idle_timeout
+        self.batch = batch
+        self.dev_mode = dev_mode
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="story-prefetch")
+        self._lock = threading.Lock()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._foreground_calls = 0
+        self._generation = 0
+
+        self._prefetched: Dict[Hashable, int] = {}  # key -> estimated tokens spent
+        self._used: Set[Hashable] = set()
+        self.stats = {
+            "scheduled": 0,
+            "generated": 0,
+            "batches": 0,
+            "already_cached": 0,
+            "dropped_stale": 0,
+            "skipped_budget": 0,
+            "tokens_spent": 0,
+            "looks": 0,
+            "prefetch_hits": 0,
+            "failed": 0,
+        }
+
+    def prefetch_room(self, room: Room, inventory: List[Any]) -> int:
+        """
+        Queue descriptions of the room's characters and analyses of its clues
+
+        Args:
+            room: Room the player just entered
+            inventory: Player inventory (clue analyses depend on the related clues in it)
+
+        Returns:
+            Number of items queued
+        """
+        if getattr(self.cache, "cache_disabled", False) or self._budget_left() <= 0:
+            return 0
+
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            # The move's own room description comes first
+            if self._foreground_calls == 0:
+                self._idle.clear()
+
+        queued = 0
+        characters = list(room.characters)
+        if self.batch and len(characters) > 1:
+            self._submit_batch(
+                generation,
+                {c.name: self.character_key(c.name, room.name) for c in characters},
+                characters,
+                lambda c: self.character_generator.is_cached(c, room),
+                lambda pending: self.character_generator.create_batch_prompt(pending, room),
+                lambda pending: self.character_generator.generate_batch(pending, room, cache_fallback=False),
+            )
+            queued += len(characters)
+            characters = []
+
+        for character in characters:
+            key = self.character_key(character.name, room.name)
+            self._submit(
+                generation, key,
+                lambda c=character: self.character_generator.create_request(c, room)[0],
+                lambda c=character: self.character_generator.is_cached(c, room),
+                lambda c=character: self.character_generator.generate_description(c, room, cache_fallback=False),
+            )
+            queued += 1
+
+        clues = [clue for clue in room.clues if not clue.is_collected]
+        if self.batch and len(clues) > 1:
+            # A clue is not related to itself: the inventory alone gives the same analyses
+            collected = list(inventory)
+            self._submit_batch(
+                generation,
+                {c.name: self.clue_key(c.name, self.clue_analyzer.relevant_clues(c, collected)) for c in clues},
+                clues,
+                lambda c: self.clue_analyzer.is_cached(c, collected),
+                lambda pending: self.clue_analyzer.create_batch_prompt(pending, collected),
+                lambda pending: self.clue_analyzer.analyze_batch(pending, collected, cache_fallback=False),
+            )
+            queued += len(clues)
+            clues = []
+
+        for clue in clues:
+            # Analysis happens right after collecting: the clue is then in the inventory
+            collected = [*inventory, clue]
+            key = self.clue_key(clue.name, self.clue_analyzer.relevant_clues(clue, collected))
+            self._submit(
+                generation, key,
+                lambda c=clue, cc=collected: self.clue_analyzer.create_request(c, cc)[0],
+                lambda c=clue, cc=collected: self.clue_analyzer.is_cached(c, cc),
+                lambda c=clue, cc=collected: self.clue_analyzer.analyze_clue(c, cc, cache_fallback=False),
+            )
+            queued += 1
+
+        if self.dev_mode and queued:
+            print(f"🔮 PREFETCH: {queued} looks queued for {room.name}")
+        return queued
+
+    def _submit(
+        self,
+        generation: int,
+        key: Hashable,
+        build_prompt: Callable[[], str],
+        is_cached: Callable[[], bool],
+        generate: Callable[[], Optional[str]],
+    ) -> None:
+        self.stats["scheduled"] += 1
+        self._executor.submit(self._run, generation, key, build_prompt, is_cached, generate)
+
+    def _run(
+        self,
+        generation: int,
+        key: Hashable,
+        build_prompt: Callable[[], str],
+        is_cached: Callable[[], bool],
+        generate: Callable[[], Optional[str]],
+    ) -> None:
+        """Worker: generate one item unless stale, cached or over budget"""
+        try:
+            # Low priority: let foreground story calls go first
+            self._idle.wait(timeout=self.idle_timeout)
+
+            with self._lock:
+                if generation != self._generation:
+                    self.stats["dropped_stale"] += 1
+                    return
+                if key in self._prefetched:
+                    return
+                if self._budget_left() <= 0:
+                    self.stats["skipped_budget"] += 1
+                    return
+
+            if is_cached():
+                self.stats["already_cached"] += 1
+                return
+
+            prompt = build_prompt()
+            result = generate()
+            if result is None:
+                # Nothing cached: the player's look makes the call again
+                with self._lock:
+                    self.stats["failed"] += 1
+                return
+            tokens = estimate_text_tokens(prompt) + estimate_text_tokens(result)
+
+            with self._lock:
+                self._prefetched[key] = tokens
+                self.stats["generated"] += 1
+                self.stats["tokens_spent"] += tokens
+
+        except Exception as e:
+            logger.error(f"Error in prefetch: {e}")
+
+    def _submit_batch(
+        self,
+        generation: int,
+        keys: Dict[str, Hashable],
+        items: List[Any],
+        is_cached: Callable[[Any], bool],
+        build_prompt: Callable[[List[Any]], str],
+        generate: Callable[[List[Any]], Dict[str, str]],
+    ) -> None:
+        self.stats["scheduled"] += len(items)
+        self._executor.submit(
+            self._run_batch, generation, keys, items, is_cached, build_prompt, generate
+        )
+
+    def _run_batch(
+        self,
+        generation: int,
+        keys: Dict[str, Hashable],
+        items: List[Any],
+        is_cached: Callable[[Any], bool],
+        build_prompt: Callable[[List[Any]], str],
+        generate: Callable[[List[Any]], Dict[str, str]],
+    ) -> None:
+        """Worker: generate the items not yet cached in one call, unless stale or over budget"""
+        try:
+            self._idle.wait(timeout=self.idle_timeout)
+
+            with self._lock:
+                if generation != self._generation:
+                    self.stats["dropped_stale"] += len(items)
+                    return
+                if self._budget_left() <= 0:
+                    self.stats["skipped_budget"] += len(items)
+                    return
+                items = [item for item in items if keys[item.name] not in self._prefetched]
+
+            pending = []
+            for item in items:
+                if is_cached(item):
+                    self.stats["already_cached"] += 1
+                else:
+                    pending.append(item)
+            if not pending:
+                return
+
+            prompt = build_prompt(pending)
+            results = generate(pending)
+            if len(results) < len(pending):
+                with self._lock:
+                    self.stats["failed"] += len(pending) - len(results)
+            if not results:
+                return
+            tokens = estimate_text_tokens(prompt) + sum(
+                estimate_text_tokens(text) for text in results.values()
+            )
+
+            with self._lock:
+                # The batch's tokens are shared between the items it produced
+                share = tokens // max(len(results), 1)
+                for name in results:
+                    self._prefetched[keys[name]] = share
+                self.stats["generated"] += len(results)
+                self.stats["batches"] += 1
+                self.stats["tokens_spent"] += tokens
+
+        except Exception as e:
+            logger.error(f"Error in batch prefetch: {e}")
+
+    def _budget_left(self) -> int:
+        return self.token_budget - self.stats["tokens_spent"]
+
+    @contextmanager
+    def foreground(self):
+        """Mark a player-facing story call; the prefetch worker waits until it ends"""
+        with self._lock:
+            self._foreground_calls += 1
+            self._idle.clear()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._foreground_calls -= 1
+                if self._foreground_calls == 0:
+                    self._idle.set()
+
+    def record_look(self, key: Hashable) -> bool:
+        """
+        Record a player look and whether a prefetched entry serves it
+
+        Returns:
+            True if the look was served by prefetch
+        """
+        with self._lock:
+            self.stats["looks"] += 1
+            if key in self._prefetched and key not in self._used:
+                self._used.add(key)
+                self.stats["prefetch_hits"] += 1
+                return True
+            return False
+
+    @staticmethod
+    def character_key(character_name: str, room_name: str) -> Hashable:
+        return ("character", character_name, room_name)
+
+    @staticmethod
+    def clue_key(clue_name: str, related_clues: List[Any]) -> Hashable:
+        return ("clue", clue_name, tuple(c.name for c in related_clues))
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get prefetch statistics with hit-through and wasted-token rates"""
+        with self._lock:
+            looks = self.stats["looks"]
+            spent = self.stats["tokens_spent"]
+            wasted = sum(t for key, t in self._prefetched.items() if key not in self._used)
+            return {
+                **self.stats,
+                "token_budget": self.token_budget,
+                "hit_through_rate": round(self.stats["prefetch_hits"] / looks, 3) if looks else 0.0,
+                "wasted_token_rate": round(wasted / spent, 3) if spent else 0.0,
+            }
@@ -3,6 +3,7 @@ Main StoryProcessor - Clean interface with refactored components
 """
 
 import logging
+from contextlib import nullcontext
 from typing import Any, Dict, List, Optional
 
 from ai_engine.processors.base_processor import BaseProcessor
@@ -35,6 +36,12 @@ class StoryProcessor(BaseProcessor):
          self.object_inspector) = StoryComponentFactory.create_standard_setup(
             api_service, cache, dev_mode
         )
+        self.prefetcher = StoryComponentFactory.create_prefetcher(
+            self.character_generator, self.clue_analyzer, cache, dev_mode
+        )
+        self.lookahead = StoryComponentFactory.create_room_lookahead(
+            self.room_generator, cache, dev_mode
+        )
         
         self._log_debug("StoryProcessor initialized with refactored components")
     
@@ -57,7 +64,17 @@ class StoryProcessor(BaseProcessor):
         self._log_debug(f"Generating room description for: {room.name if room else 'Unknown'}")
         
         try:
-            return self.room_generator.generate_description(room, game_state, action)
+            is_move = self.lookahead is not None and action == "move" and room is not None
+            if is_move and room.name not in getattr(game_state, 'rooms_visited', set()):
+                self.lookahead.record_entry(room)
+
+            with self._foreground():
+                description = self.room_generator.generate_description(room, game_state, action)
+
+            # Describe the unvisited neighbours while the player reads this one
+            if is_move:
+                self.lookahead.schedule(game_state)
+            return description
         except Exception as e:
             self.logger.error(f"Error in generate_room_description: {e}")
             room_name = getattr(room, 'name', 'an unknown location')
@@ -77,13 +94,43 @@ class StoryProcessor(BaseProcessor):
         """
         self._log_debug(f"Generating character description for: {character.name if character else 'Unknown'}")
         
+        if self.prefetcher and character and room:
+            self.prefetcher.record_look(
+                self.prefetcher.character_key(character.name, room.name)
+            )
+        
         try:
-            return self.character_generator.generate_description(character, room)
+            with self._foreground():
+                return self.character_generator.generate_description(character, room)
         except Exception as e:
             self.logger.error(f"Error in generate_character_description: {e}")
             character_name = getattr(character, 'name', 'someone')
             return f"You inspect {character_name}. There is nothing special to note."
 
+    def generate_character_descriptions(self, characters: List[Character], room: Room) -> Dict[str, str]:
+        """
+        Generates descriptions of several characters of a room in one call.
+        Each description is cached on its own, so later looks are cache hits.
+
+        Args:
+            characters: Characters to describe
+            room: Room where the characters are located
+
+        Returns:
+            Descriptions by character name
+        """
+        self._log_debug(f"Generating {len(characters or [])} character descriptions for: {getattr(room, 'name', 'Unknown')}")
+        
+        if not characters or not room:
+            return {}
+        
+        try:
+            with self._foreground():
+                return self.character_generator.generate_batch(characters, room)
+        except Exception as e:
+            self.logger.error(f"Error in generate_character_descriptions: {e}")
+            return {}
+
     def analyze_clue(self, clue: Any, collected_clues: Optional[List] = None) -> str:
         """
         Analyzes a clue and gives insights to the player.
@@ -98,19 +145,52 @@ class StoryProcessor(BaseProcessor):
         """
         self._log_debug(f"Analyzing clue: {getattr(clue, 'name', 'Unknown clue')}")
         
+        if self.prefetcher and clue:
+            self.prefetcher.record_look(
+                self.prefetcher.clue_key(
+                    clue.name, self.clue_analyzer.relevant_clues(clue, collected_clues)
+                )
+            )
+        
         try:
-            return self.clue_analyzer.analyze_clue(clue, collected_clues)
+            with self._foreground():
+                return self.clue_analyzer.analyze_clue(clue, collected_clues)
         except Exception as e:
             self.logger.error(f"Error in analyze_clue: {e}")
             return "This clue seems significant, but its meaning eludes me for now."
 
-    def give_useless_answer(self, object_name: str) -> str:
+    def analyze_clues(self, clues: List[Any], collected_clues: Optional[List] = None) -> Dict[str, str]:
+        """
+        Analyzes several clues in one call.
+        Each analysis is cached on its own, so later analyses are cache hits.
+
+        Args:
+            clues: Clues to analyze
+            collected_clues: Optional list of previously collected clues
+
+        Returns:
+            Analyses by clue name
+        """
+        self._log_debug(f"Analyzing {len(clues or [])} clues")
+        
+        if not clues:
+            return {}
+        
+        try:
+            with self._foreground():
+                return self.clue_analyzer.analyze_batch(clues, collected_clues)
+        except Exception as e:
+            self.logger.error(f"Error in analyze_clues: {e}")
+            return {}
+
+    def give_useless_answer(self, object_name: str, room_name: Optional[str] = None) -> str:
         """
         Give a simple answer for a useless object.
         Now delegated to specialized component.
         
         Args:
             object_name: Name of the object to inspect
+            room_name: Optional room where the object is examined
             
         Returns:
             Simple response about the object
@@ -118,11 +198,38 @@ class StoryProcessor(BaseProcessor):
         self._log_debug(f"Inspecting useless object: {object_name}")
         
         try:
-            return self.object_inspector.inspect_object(object_name)
+            with self._foreground():
+                return self.object_inspector.inspect_object(object_name, room_name)
         except Exception as e:
             self.logger.error(f"Error in give_useless_answer: {e}")
             return "There is nothing special."
     
+    def prefetch_room(self, room: Room, game_state: GameState) -> int:
+        """
+        Pre-generate likely looks for a room the player just entered.
+        No-op unless prefetch is enabled.
+
+        Args:
+            room: Room just entered
+            game_state: Current game state
+
+        Returns:
+            Number of items queued
+        """
+        if not self.prefetcher or not room:
+            return 0
+        
+        try:
+            inventory = game_state.player.inventory if game_state.player else []
+            return self.prefetcher.prefetch_room(room, inventory)
+        except Exception as e:
+            self.logger.error(f"Error in prefetch_room: {e}")
+            return 0
+    
+    def _foreground(self):
+        """Context marking a player-facing call (prefetch waits for it)"""
+        return self.prefetcher.foreground() if self.prefetcher else nullcontext()
+    
     def health_check(self) -> Dict[str, Any]:
         """Check the health of story processor components"""
         return {
@@ -131,6 +238,12 @@ class StoryProcessor(BaseProcessor):
             "character_generator": self.character_generator is not None,
             "clue_analyzer": self.clue_analyzer is not None,
             "object_inspector": self.object_inspector is not None,
+            "prefetch": self.prefetcher.get_statistics() if self.prefetcher else None,
+            "lookahead": self.lookahead.get_statistics() if self.lookahead else None,
+            "object_pool": (
+                self.object_inspector.response_pool.get_statistics()
+                if self.object_inspector.response_pool else None
+            ),
             "api_service": self.api_service is not None,
             "cache": self.cache is not None,
             "dev_mode": self.dev_mode
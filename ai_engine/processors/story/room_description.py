@@ -3,7 +3,7 @@ Room description generation component
 """
 
 import logging
-from typing import Any
+from typing import Any, Optional
 
 from ai_engine.api.service import APIConfig
 from ai_engine.prompts import create_room_description_prompt
@@ -38,7 +38,32 @@ class RoomDescriptionGenerator(IRoomDescriptionGenerator):
         try:
             # Check if player inspect, enter or re-enter
             player_state = self._check_action_player(game_state, action, room)
+            return self.describe(room, player_state, game_state)
 
+        except Exception as e:
+            logger.error(f"Error in generate_room_description: {e}")
+            # Safe fallback that always works
+            room_name = getattr(room, 'name', 'an unknown location')
+            return f"You find yourself in {room_name}."
+
+    def describe(
+        self, room: Room, player_state: str, game_state: Any = None, cache_fallback: bool = True
+    ) -> Optional[str]:
+        """
+        Describes a room for an explicit player state (the lookahead describes
+        rooms before they are entered).
+
+        Args:
+            room: Room to describe
+            player_state: "first_entry", "re_entry" or "inspection"
+            game_state: Current game state (dev mode output only)
+            cache_fallback: Return and cache the fallback sentence when the API
+                call fails; background callers pass False and get None instead
+
+        Returns:
+            Atmospheric description of the room
+        """
+        try:
             # Debug info for dev mode
             if hasattr(game_state, 'dev_mode') and game_state.dev_mode:
                 nonsense_count = len(getattr(room, 'nonsense_events', []))
@@ -81,6 +106,8 @@ class RoomDescriptionGenerator(IRoomDescriptionGenerator):
             # Always define result with a fallback
             if content:
                 result = content
+            elif not cache_fallback:
+                return None
             else:
                 result = f"You find yourself in {room.name}."
             
@@ -98,7 +125,9 @@ class RoomDescriptionGenerator(IRoomDescriptionGenerator):
             return result
 
         except Exception as e:
-            logger.error(f"Error in generate_room_description: {e}")
+            logger.error(f"Error in describe: {e}")
+            if not cache_fallback:
+                return None
             # Safe fallback that always works
             room_name = getattr(room, 'name', 'an unknown location')
             return f"You find yourself in {room_name}."
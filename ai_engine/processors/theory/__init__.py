@@ -18,7 +18,9 @@ from .interfaces import (
 # Individual components (for custom setups)
 from .final_scene import FinalSceneHandler
 from .theory_verifier import TheoryVerifier
-from .ending_writer import EndingWriter
+from .ending_writer import EndingMode, EndingWriter
+from .ending_library import EndingLibrary
+from .pre_scorer import TheoryPreScoreMode, TheoryPreScorer
 
 __all__ = [
     # Main interface (same as before)
@@ -36,4 +38,8 @@ __all__ = [
     'FinalSceneHandler',
     'TheoryVerifier',
     'EndingWriter',
+    'EndingMode',
+    'EndingLibrary',
+    'TheoryPreScorer',
+    'TheoryPreScoreMode',
 ]
\ No newline at end of file
@@ -0,0 +1,80 @@
+"""
+Canonical endings loaded once from data/narratives/documents
+"""
+
+import logging
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from utils.markdown_utils import read_markdown_file
+
+logger = logging.getLogger(__name__)
+
+DOCUMENTS_DIR = Path(__file__).parent.parent.parent.parent / "data" / "narratives" / "documents"
+
+# ending3.md (English) or ending3.french.md (translation)
+ENDING_FILE_PATTERN = re.compile(r"^ending(\d+)(?:\.([a-z]+))?\.md$")
+
+DEFAULT_LANGUAGE = "english"
+
+
+class EndingLibrary:
+    """
+    In-memory index of the ending documents, read on first use.
+    Translations named ending<N>.<language>.md are picked up when present.
+    """
+
+    def __init__(self, documents_dir: Path = DOCUMENTS_DIR):
+        self.documents_dir = Path(documents_dir)
+        self._endings: Optional[Dict[Tuple[int, str], str]] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[Tuple[int, str], str]:
+        with self._lock:
+            if self._endings is None:
+                endings: Dict[Tuple[int, str], str] = {}
+                for path in sorted(self.documents_dir.glob("ending*.md")):
+                    match = ENDING_FILE_PATTERN.match(path.name)
+                    if not match:
+                        continue
+                    text = read_markdown_file(path)
+                    if text:
+                        key = (int(match.group(1)), match.group(2) or DEFAULT_LANGUAGE)
+                        endings[key] = text.strip()
+                self._endings = endings
+            return self._endings
+
+    def get(self, scenario: int, language: str = DEFAULT_LANGUAGE) -> Optional[str]:
+        """
+        Canonical ending of a scenario in a language
+
+        Args:
+            scenario: Ending type (0 = failure, 1-5 = culprit scenarios)
+            language: Language code, e.g. "english" or "french"
+
+        Returns:
+            Ending text, or None if there is no document for this scenario and language
+        """
+        try:
+            return self._load().get((int(scenario), (language or DEFAULT_LANGUAGE).lower()))
+        except (TypeError, ValueError) as e:
+            logger.error(f"Error in get ending: {e}")
+            return None
+
+    def has_scenario(self, scenario: int) -> bool:
+        """Whether the scenario has a canonical (English) ending"""
+        return self.get(scenario) is not None
+
+
+# Shared library: ending documents are read once per process
+_library: Optional[EndingLibrary] = None
+
+
+def get_ending_library() -> EndingLibrary:
+    """Get the shared ending library"""
+    global _library
+    if _library is None:
+        _library = EndingLibrary()
+    return _library
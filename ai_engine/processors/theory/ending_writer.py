@@ -3,24 +3,43 @@ Ending writing component
 """
 
 import logging
-from typing import Any, Dict
+import re
+from enum import Enum
+from typing import Any, Dict, Optional
 
 from ai_engine.api.service import APIConfig
-from ai_engine.prompts import create_write_ending
-from utils.markdown_utils import read_markdown_file
+from ai_engine.prompts import create_ending_personalization_prompt, create_write_ending
+from ai_engine.prompts.prompt_config import get_current_language
 
+from .ending_library import DEFAULT_LANGUAGE, EndingLibrary, get_ending_library
 from .interfaces import IEndingWriter
 
 logger = logging.getLogger(__name__)
 
 
+class EndingMode(Enum):
+    """How the ending shown on the game-over screen is produced"""
+    TEMPLATE = "template"          # Canonical ending document, no AI call
+    PERSONALIZED = "personalized"  # Canonical ending plus a short cached paragraph on the theory
+    LLM = "llm"                    # Whole ending rewritten around the theory
+
+
 class EndingWriter(IEndingWriter):
     """Generates game endings based on player theory and scenario"""
     
-    def __init__(self, api_service, cache, dev_mode: bool = False):
+    def __init__(
+        self,
+        api_service,
+        cache,
+        dev_mode: bool = False,
+        mode: EndingMode = EndingMode.LLM,
+        library: Optional[EndingLibrary] = None,
+    ):
         self.api_service = api_service
         self.cache = cache
         self.dev_mode = dev_mode
+        self.mode = mode
+        self.library = library or get_ending_library()
     
     def write_ending(self, scenario: int, player_theory: str) -> Dict[str, Any]:
         """
@@ -35,17 +54,81 @@ class EndingWriter(IEndingWriter):
         """
         try:
             if self.dev_mode:
-                print(f"📝 ENDING WRITER: Creating ending for scenario {scenario}")
+                print(f"📝 ENDING WRITER: Creating ending for scenario {scenario} ({self.mode.value})")
             
-            # Read the ending file
-            try:
-                text_ending: str = read_markdown_file(
-                    f"data/narratives/documents/ending{scenario}.md"
-                )
-            except Exception as e:
-                logger.error(f"Error reading ending file: {e}")
+            language = get_current_language().lower()
+            text_ending = self.library.get(scenario, language)
+            localized = text_ending is not None or language == DEFAULT_LANGUAGE
+            if text_ending is None:
+                text_ending = self.library.get(scenario)
+            if text_ending is None:
+                logger.error(f"Error reading ending file: no ending for scenario {scenario}")
                 return self._get_file_error_response()
 
+            # Without a translated document, only the rewrite answers in the player's language
+            if self.mode == EndingMode.LLM or not localized:
+                return self._rewrite_ending(scenario, text_ending, player_theory)
+
+            if self.mode == EndingMode.PERSONALIZED:
+                paragraph = self._personalize(scenario, text_ending, player_theory)
+                if paragraph:
+                    return {
+                        "think": f"Canonical ending {scenario} with a personalized paragraph",
+                        "answer": f"{text_ending}\n\n{paragraph}",
+                    }
+
+            return {
+                "think": f"Canonical ending {scenario}",
+                "answer": text_ending,
+            }
+
+        except Exception as e:
+            logger.error(f"Error in write_ending: {e}")
+            return {
+                "think": f"Error occurred: {str(e)}",
+                "answer": "The truth reveals itself in ways beyond words...",
+            }
+    
+    def _personalize(self, scenario: int, text_ending: str, player_theory: str) -> Optional[str]:
+        """Short paragraph on the player's theory, cached by scenario and normalized theory"""
+        try:
+            theory = normalize_theory(player_theory)
+            prompt = create_ending_personalization_prompt(text_ending, player_theory)
+            cache_context = {
+                "type": "ending_personalization",
+                "scenario": scenario,
+                "theory": theory,
+                "language": get_current_language().lower(),
+            }
+            model_params = {"temperature": APIConfig.ENDING_TEMPERATURE}
+            
+            cached_result = self.cache.get(theory, model_params, cache_context)
+            if cached_result:
+                if self.dev_mode:
+                    print("🚀 CACHE HIT: Ending personalization found in cache")
+                return cached_result
+            
+            content = self.api_service.make_api_call(
+                messages=[{"role": "user", "content": prompt}],
+                system_content="You are a game writer closing a detective game.",
+                temperature=APIConfig.ENDING_TEMPERATURE,
+                max_tokens=APIConfig.MAX_TOKENS_MEDIUM,
+            )
+            if not content:
+                return None
+            
+            self.cache.put(theory, model_params, content, cache_context)
+            if self.dev_mode:
+                print("💾 CACHE MISS: Generated and cached ending personalization")
+            return content
+
+        except Exception as e:
+            logger.error(f"Error personalizing ending: {e}")
+            return None
+    
+    def _rewrite_ending(self, scenario: int, text_ending: str, player_theory: str) -> Dict[str, Any]:
+        """Rewrite the whole ending around the player's theory"""
+        try:
             # Check cache first
             cache_key = f"ending_{scenario}_{hash(player_theory)}"
             cache_context = {
@@ -108,11 +191,8 @@ class EndingWriter(IEndingWriter):
             return result
 
         except Exception as e:
-            logger.error(f"Error in write_ending: {e}")
-            return {
-                "think": f"Error occurred: {str(e)}",
-                "answer": "The truth reveals itself in ways beyond words...",
-            }
+            logger.error(f"Error in rewrite_ending: {e}")
+            return self._get_fallback_response(text_ending)
     
     def _get_fallback_response(self, text_ending: str) -> Dict[str, Any]:
         """Get fallback response with original text"""
@@ -126,4 +206,9 @@ class EndingWriter(IEndingWriter):
         return {
             "think": "Error reading ending file",
             "answer": "The truth reveals itself in ways beyond words...",
-        }
\ No newline at end of file
+        }
+
+
+def normalize_theory(player_theory: str) -> str:
+    """Lowercase words of a theory, without punctuation or spacing differences"""
+    return " ".join(re.findall(r"\w+", (player_theory or "").lower()))
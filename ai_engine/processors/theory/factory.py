@@ -2,11 +2,13 @@
 Factory for creating theory processing components
 """
 
-from typing import Tuple
+import os
+from typing import Optional, Tuple
 
 from .final_scene import FinalSceneHandler
+from .pre_scorer import TheoryPreScoreMode, TheoryPreScorer
 from .theory_verifier import TheoryVerifier
-from .ending_writer import EndingWriter
+from .ending_writer import EndingMode, EndingWriter
 
 
 class TheoryComponentFactory:
@@ -37,6 +39,45 @@ class TheoryComponentFactory:
         # Create all components
         final_scene_handler = FinalSceneHandler(api_service, cache, dev_mode)
         theory_verifier = TheoryVerifier(api_service, cache, dev_mode)
-        ending_writer = EndingWriter(api_service, cache, dev_mode)
+        ending_writer = EndingWriter(api_service, cache, dev_mode, mode=get_ending_mode())
         
-        return final_scene_handler, theory_verifier, ending_writer
\ No newline at end of file
+        return final_scene_handler, theory_verifier, ending_writer
+    
+    @staticmethod
+    def create_pre_scorer(
+        mode: Optional[TheoryPreScoreMode] = None,
+        dev_mode: bool = False
+    ) -> Optional[TheoryPreScorer]:
+        """
+        Create the local theory pre-scorer (THEORY_PRESCORE_MODE from env)
+        
+        Args:
+            mode: Pre-score mode, read from the environment when None
+            dev_mode: Enable development mode features
+            
+        Returns:
+            Pre-scorer or None when pre-scoring is off
+        """
+        if mode is None:
+            mode = get_theory_prescore_mode()
+        if mode == TheoryPreScoreMode.OFF:
+            return None
+        return TheoryPreScorer(mode, dev_mode)
+
+
+def get_theory_prescore_mode() -> TheoryPreScoreMode:
+    """Get theory pre-score mode from environment variable"""
+    mode = os.getenv("THEORY_PRESCORE_MODE", "local").lower()
+    try:
+        return TheoryPreScoreMode(mode)
+    except ValueError:
+        return TheoryPreScoreMode.LOCAL
+
+
+def get_ending_mode() -> EndingMode:
+    """Get ending mode from environment variable"""
+    mode = os.getenv("ENDING_MODE", "template").lower()
+    try:
+        return EndingMode(mode)
+    except ValueError:
+        return EndingMode.TEMPLATE
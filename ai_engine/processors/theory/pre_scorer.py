@@ -0,0 +1,246 @@
+"""
+Local theory pre-scorer - decides clear theories without the verification AI call
+"""
+
+import json
+import logging
+import re
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from ai_engine.prompts.theory.scenarios import (
+    ScenarioEvidence,
+    TheoryScenario,
+    get_scenario_by_culprit,
+)
+from ai_engine.prompts.prompt_config import get_current_language
+from game_engine.utils.entity_resolver import CHARACTER, normalize_entity_name
+
+logger = logging.getLogger(__name__)
+
+# Words ignored when matching keywords
+STOPWORDS = {
+    "the", "and", "for", "with", "from", "that", "this", "was", "were", "her", "his",
+    "him", "she", "they", "their", "about", "into", "onto", "over", "toward", "towards",
+    "before", "after", "others", "someone", "who", "had", "has", "have", "could",
+}
+
+# Word prefix length used as a light stemmer (pregnancy / pregnant, jealousy / jealous)
+STEM_LENGTH = 5
+
+VERDICTS_PATH = Path(__file__).parent.parent.parent.parent / "data" / "narratives" / "theory_verdicts.json"
+
+
+class TheoryPreScoreMode(Enum):
+    """How the local pre-score is used before theory verification"""
+    OFF = "off"        # Every theory goes to the AI verifier
+    LOCAL = "local"    # Clear matches and mismatches are decided locally
+    SHADOW = "shadow"  # Every theory goes to the AI, local decisions are only compared
+
+
+class TheoryPreScorer:
+    """
+    Scores a completed theory against the scenario table:
+    - the culprit is normalized through the entity index
+    - motive and evidence are matched by keyword against the scenario's motive
+      keywords, evidence aliases and the names of the collected clues backing them
+
+    A culprit who is not in any scenario is a clear mismatch, a theory reaching every
+    threshold of its scenario a clear match; anything else is ambiguous and left to
+    the AI verifier. Verdicts are written in the player's language from
+    data/narratives/theory_verdicts.json; in a language without verdict texts, local
+    mode leaves the theory to the AI. Agreement with the AI is tracked whenever both decided.
+    """
+
+    def __init__(self, mode: TheoryPreScoreMode = TheoryPreScoreMode.LOCAL, dev_mode: bool = False):
+        self.mode = mode
+        self.dev_mode = dev_mode
+        self._verdicts = _load_verdicts()
+        self.stats = {
+            "theories": 0,
+            "local_match": 0,
+            "local_mismatch": 0,
+            "ambiguous": 0,
+            "untranslated": 0,
+            "compared": 0,
+            "agreements": 0,
+        }
+
+    def score(
+        self, theory: Dict[str, Any], collected_clues: Optional[Iterable] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Decide a theory locally when it is clear
+
+        Args:
+            theory: Dictionary with culprit, motive and evidence
+            collected_clues: Clues in the player's inventory
+
+        Returns:
+            Verification result in the verifier's format, or None when ambiguous
+        """
+        try:
+            self.stats["theories"] += 1
+            result = self._score(theory, [c.name for c in collected_clues or []])
+
+            # No verdict text in the player's language: the AI verifier answers instead
+            if result is not None and result["answer"] is None and self.mode == TheoryPreScoreMode.LOCAL:
+                self.stats["untranslated"] += 1
+                if self.dev_mode:
+                    print(f"⚖️ THEORY PRE-SCORE: no verdict text in {get_current_language()}")
+                return None
+
+            if result is None:
+                self.stats["ambiguous"] += 1
+            elif result["valid"]:
+                self.stats["local_match"] += 1
+            else:
+                self.stats["local_mismatch"] += 1
+
+            if self.dev_mode:
+                decision = "ambiguous" if result is None else ("match" if result["valid"] else "mismatch")
+                print(f"⚖️ THEORY PRE-SCORE: {decision}")
+            return result
+
+        except Exception as e:
+            logger.error(f"Error in theory pre-score: {e}")
+            return None
+
+    def _score(self, theory: Dict[str, Any], clue_names: List[str]) -> Optional[Dict[str, Any]]:
+        culprit_text = str(theory.get("culprit") or "")
+        culprit = self._resolve_culprit(culprit_text)
+        if culprit is None:
+            return None
+
+        scenario = get_scenario_by_culprit(culprit)
+        if scenario is None:
+            return self._result(
+                f"Local pre-score: {culprit} is not the culprit of any scenario",
+                scenario=None,
+                answer=self._verdict("unsupported_culprit", culprit=culprit),
+            )
+
+        motive_words = _stems(str(theory.get("motive") or ""))
+        evidence_words = _stems(f"{theory.get('evidence') or ''} {theory.get('motive') or ''}")
+
+        motive_match = any(_contains(motive_words, keyword) for keyword in scenario.motive_keywords)
+        matched = [
+            evidence for evidence in scenario.evidence
+            if _evidence_mentioned(evidence, evidence_words, clue_names)
+        ]
+        score = sum(evidence.points for evidence in matched)
+        evidence_match = len(matched) >= scenario.min_evidence and score >= scenario.min_score
+
+        if not (motive_match and evidence_match):
+            return None
+
+        return self._result(
+            f"Local pre-score: {culprit}, motive matched, evidence "
+            f"{[e.label for e in matched]} scoring {score:g}",
+            scenario=scenario,
+            answer=self._verdict("theory_confirmed"),
+        )
+
+    def _verdict(self, key: str, **values: str) -> Optional[str]:
+        """Verdict text in the player's language, None when it has none"""
+        text = self._verdicts.get(get_current_language().lower(), {}).get(key)
+        return text.format(**values) if text else None
+
+    def _resolve_culprit(self, culprit_text: str) -> Optional[str]:
+        """Canonical character name of the accused, None if not resolvable"""
+        if not culprit_text.strip():
+            return None
+
+        # Imported here: the loader depends on the game models
+        from game_engine.setup.game_data import get_entity_resolver
+
+        return get_entity_resolver().resolve(culprit_text, CHARACTER)
+
+    def _result(
+        self, think: str, scenario: Optional[TheoryScenario], answer: Optional[str]
+    ) -> Dict[str, Any]:
+        """Verification result in the same format as the AI verifier"""
+        valid = scenario is not None
+        return {
+            "think": think,
+            "culprit_match": valid,
+            "motive_match": valid,
+            "evidence_match": valid,
+            "valid": valid,
+            "confidence_score": 1.0 if valid else 0.0,
+            "matching_scenario": scenario.title if valid else False,
+            "scenario": scenario.number if valid else 0,
+            "answer": answer,
+            "source": "local",
+        }
+
+    def record_agreement(self, local_result: Dict[str, Any], ai_result: Dict[str, Any]) -> bool:
+        """
+        Compare a local decision with the AI verifier's result
+
+        Returns:
+            True if both agree on validity and scenario
+        """
+        agree = _is_valid(local_result) == _is_valid(ai_result)
+        if agree and _is_valid(local_result):
+            agree = str(local_result.get("scenario")) == str(ai_result.get("scenario"))
+
+        self.stats["compared"] += 1
+        if agree:
+            self.stats["agreements"] += 1
+        elif self.dev_mode:
+            print(f"⚖️ THEORY PRE-SCORE DISAGREEMENT: local={local_result.get('scenario')} ai={ai_result.get('scenario')}")
+        return agree
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get pre-score statistics with the local decision and agreement rates"""
+        theories = self.stats["theories"]
+        decided = self.stats["local_match"] + self.stats["local_mismatch"]
+        compared = self.stats["compared"]
+        return {
+            **self.stats,
+            "mode": self.mode.value,
+            "local_decision_rate": round(decided / theories, 3) if theories else 0.0,
+            "agreement_rate": round(self.stats["agreements"] / compared, 3) if compared else None,
+        }
+
+
+def _load_verdicts() -> Dict[str, Dict[str, str]]:
+    """Verdict texts per language"""
+    try:
+        with open(VERDICTS_PATH, "r", encoding="utf-8") as f:
+            verdicts = json.load(f)
+        return {language.lower(): texts for language, texts in verdicts.items()}
+    except Exception as e:
+        logger.error(f"Error loading theory verdicts: {e}")
+        return {}
+
+
+def _stems(text: str) -> Set[str]:
+    """Stemmed content words of a text"""
+    words = re.findall(r"[a-z0-9]+", normalize_entity_name(text))
+    return {word[:STEM_LENGTH] for word in words if len(word) > 2 and word not in STOPWORDS}
+
+
+def _contains(words: Set[str], phrase: str) -> bool:
+    """Whether every content word of the phrase appears in the text"""
+    phrase_words = _stems(phrase)
+    return bool(phrase_words) and phrase_words <= words
+
+
+def _evidence_mentioned(
+    evidence: ScenarioEvidence, words: Set[str], clue_names: List[str]
+) -> bool:
+    """Whether the theory names this evidence, by label, alias or a collected clue backing it"""
+    phrases = [evidence.label, *evidence.aliases]
+    phrases.extend(name for name in evidence.clues if name in clue_names)
+    return any(_contains(words, phrase) for phrase in phrases)
+
+
+def _is_valid(result: Dict[str, Any]) -> bool:
+    """Validity of a verifier result, which may use "true"/"false" strings"""
+    valid = result.get("valid")
+    if isinstance(valid, str):
+        return valid.strip().lower() == "true"
+    return bool(valid)
@@ -3,12 +3,13 @@ Main TheoryProcessor - Clean interface with refactored components
 """
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from ai_engine.processors.base_processor import BaseProcessor
 from ai_engine.utils.constants import GameStateInput
 
 from .factory import TheoryComponentFactory
+from .pre_scorer import TheoryPreScoreMode
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +33,7 @@ class TheoryProcessor(BaseProcessor):
          self.ending_writer) = TheoryComponentFactory.create_standard_setup(
             api_service, cache, dev_mode
         )
+        self.pre_scorer = TheoryComponentFactory.create_pre_scorer(dev_mode=dev_mode)
         
         self._log_debug("TheoryProcessor initialized with refactored components")
     
@@ -67,13 +69,21 @@ class TheoryProcessor(BaseProcessor):
             self.logger.error(f"Error in final_scene: {e}")
             return {"completed": False, "answer": "Forgive me, detective, but the Almighty clouds my understanding of your theory. Could you repeat please ?"}
 
-    def verify_theory(self, conversation: List[Dict[str, str]]) -> Dict[str, Any]:
+    def verify_theory(
+        self,
+        conversation: List[Dict[str, str]],
+        theory: Optional[Dict[str, Any]] = None,
+        collected_clues: Optional[List] = None,
+    ) -> Dict[str, Any]:
         """
         Verifies the detective's theory against possible scenarios.
-        Now delegated to specialized component.
+        Clear theories are decided by the local pre-scorer, the others
+        are delegated to specialized component.
 
         Args:
             conversation: The conversation history for the analyzer
+            theory: Optional structured theory (culprit, motive, evidence) for pre-scoring
+            collected_clues: Optional list of clues collected by the player
 
         Returns:
             Dict containing verification result including validity and response
@@ -81,7 +91,16 @@ class TheoryProcessor(BaseProcessor):
         self._log_debug("Verifying detective theory")
         
         try:
-            return self.theory_verifier.verify_theory(conversation)
+            local_result = None
+            if self.pre_scorer and theory:
+                local_result = self.pre_scorer.score(theory, collected_clues)
+                if local_result and self.pre_scorer.mode == TheoryPreScoreMode.LOCAL:
+                    return local_result
+            
+            result = self.theory_verifier.verify_theory(conversation)
+            if local_result:
+                self.pre_scorer.record_agreement(local_result, result)
+            return result
             
         except Exception as e:
             self.logger.error(f"Error in verify_theory: {e}")
@@ -126,6 +145,8 @@ class TheoryProcessor(BaseProcessor):
             "final_scene_handler": self.final_scene_handler is not None,
             "theory_verifier": self.theory_verifier is not None,
             "ending_writer": self.ending_writer is not None,
+            "ending_mode": self.ending_writer.mode.value,
+            "pre_scorer": self.pre_scorer.get_statistics() if self.pre_scorer else None,
             "api_service": self.api_service is not None,
             "cache": self.cache is not None,
             "dev_mode": self.dev_mode
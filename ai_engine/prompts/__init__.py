@@ -6,9 +6,12 @@ Template and prompt generation for different game scenarios
 # Character prompts
 from .character import (
     create_neutral_character_prompt,
+    create_fused_character_prompt,
     create_personality_character_prompt,
     create_get_lore_information,
     create_conversation_summary_prompt,
+    create_memory_compaction_prompt,
+    create_relationship_dossier_prompt,
     create_player_analysis_prompt,
 )
 
@@ -16,9 +19,13 @@ from .character import (
 from .story import (
     create_room_description_prompt,
     create_clue_analysis_prompt,
+    create_clue_batch_analysis_prompt,
     create_write_ending,
+    create_ending_personalization_prompt,
     create_character_description_prompt,
+    create_character_batch_description_prompt,
     create_inspect_object_prompt,
+    create_object_response_pool_prompt,
 )
 
 # Theory prompts
@@ -37,9 +44,12 @@ from .prompt_config import (
 __all__ = [
     # Character
     'create_neutral_character_prompt',
+    'create_fused_character_prompt',
     'create_personality_character_prompt',
     'create_get_lore_information',
     'create_conversation_summary_prompt',
+    'create_memory_compaction_prompt',
+    'create_relationship_dossier_prompt',
 
     # Command
     'create_reasoning_prompt',
@@ -48,8 +58,11 @@ __all__ = [
     # Story
     'create_room_description_prompt',
     'create_clue_analysis_prompt',
+    'create_clue_batch_analysis_prompt',
     'create_write_ending',
+    'create_ending_personalization_prompt',
     'create_character_description_prompt',
+    'create_character_batch_description_prompt',
    
     # Theory
     'create_collect_theory',
@@ -57,6 +70,7 @@ __all__ = [
    
     # Utility
     'create_inspect_object_prompt',
+    'create_object_response_pool_prompt',
     'create_player_analysis_prompt',
    
     # Language
@@ -1,13 +1,21 @@
 from .neutral_agent import create_neutral_character_prompt
+from .fused_agent import create_fused_character_prompt
 from .personality_agent import create_personality_character_prompt  
 from .lore_agent import create_get_lore_information
-from .summary_agent import create_conversation_summary_prompt
+from .summary_agent import (
+    create_conversation_summary_prompt,
+    create_memory_compaction_prompt,
+    create_relationship_dossier_prompt,
+)
 from .analysis_agent import create_player_analysis_prompt
 
 __all__ = [
     'create_neutral_character_prompt',
+    'create_fused_character_prompt',
     'create_personality_character_prompt',
     'create_get_lore_information', 
     'create_conversation_summary_prompt',
+    'create_memory_compaction_prompt',
+    'create_relationship_dossier_prompt',
     'create_player_analysis_prompt',
 ]
\ No newline at end of file
@@ -28,13 +28,7 @@ def create_player_analysis_prompt(
     return f"""
         # DETECTIVE BEHAVIOR ANALYSIS
 
-        Analyze the detective's input and provide reasoning guidance:
-
-        Detective said: "{player_input}"
-        Addressing: {character.name} ({character.role})
-
-        Game state:
-        {game_state_str}
+        Analyze the detective's input below and provide reasoning guidance.
 
         ## ANALYSIS REQUIRED:
 
@@ -53,4 +47,10 @@ def create_player_analysis_prompt(
         - Decide if the character has to stop the conversation or not
 
         Provide short, direct analysis focusing on tone detection and response guidance.
+
+        Game state:
+        {game_state_str}
+
+        Addressing: {character.name} ({character.role})
+        Detective said: "{player_input}"
         """
\ No newline at end of file
@@ -0,0 +1,112 @@
+"""
+Fused Character Agent
+Handles single-pass character prompt creation combining game logic and personality
+"""
+
+from typing import List, Optional
+
+from ai_engine.prompts.prompt_config import get_rules_prompt
+from ai_engine.utils.personality import generate_personality_instructions
+from game_engine.models.character import Character
+from game_engine.core.game_state import GameMode
+from game_engine.models.player import Player
+from game_engine.models.secret_list import Secret
+
+from .neutral_agent import (
+    _build_nonsense_awareness_section,
+    _build_secrets_section,
+    _get_available_secrets,
+    _get_character_behavior_rules,
+)
+
+
+def create_fused_character_prompt(
+    character: Character, player: Player, secrets: Optional[List[Secret]] = None
+) -> str:
+    """
+    Create a single-pass character prompt: neutral game rules and personality voice
+    in one structured call (replaces the neutral + personality agent round trips)
+
+    Args:
+        character: The character to roleplay
+        player: The player object
+        secrets: Secrets selected for this turn (defaults to every unlocked secret)
+
+    Returns:
+        Fused prompt string for the AI
+    """
+    rules_prompt: str = get_rules_prompt()
+
+    # Convert GameMode enum values to strings outside the f-string
+    conversation_mode: str = GameMode.CONVERSATION.value
+    exploration_mode: str = GameMode.EXPLORATION.value
+
+    # Reuse the neutral agent sections so both modes share the same game logic
+    secrets_rules: str = _build_secrets_section(_get_available_secrets(character, player, secrets))
+    nonsense_awareness: str = _build_nonsense_awareness_section(character)
+    character_behavior_rules: str = _get_character_behavior_rules(rules_prompt)
+
+    # Build personality voice section
+    personality_section: str = _build_personality_voice_section(character)
+
+    return f"""
+    # CHARACTER PROMPT
+    You are {character.name}:
+    - Your role in this story: {character.role}
+    - Your physical description: {character.description}
+    - Your personality: {character.traits}
+
+    # RULES
+    {character_behavior_rules}
+
+    {personality_section}
+
+    EXTREMELY IMPORTANT: You MUST respond in this EXACT JSON format and ORDER of keys:
+    {{
+        "think": "Your internal reasoning process: first decide WHAT to say from the facts and rules, then HOW {character.name} would say it (not shown to the player)",
+        "answer": "Your response as {character.name} to Detective {player.name}, factually correct and spoken in your own voice.",
+        "action": "MUST be {exploration_mode} if Detective {player.name} is ending the conversation as described above or if the detective is annoying you, otherwise use {conversation_mode}"
+    }}
+
+    The JSON MUST follow this EXACT structure with these THREE keys in this SPECIFIC ORDER:
+    1. "think" - Always first
+    2. "answer" - Always second
+    3. "action" - Always third
+
+    Do NOT add any additional keys or change this order under any circumstances.
+
+    # CURRENT SITUATION
+    - You are currently in this room: {player.current_location.name}
+
+    {secrets_rules}
+
+    {nonsense_awareness}
+
+    # This is a resume of the recent events from your perspective:
+    {character.prompt}
+
+    # Your memory of past conversations with the detective:
+    {character.memory_global}
+    """
+
+
+def _build_personality_voice_section(character: Character) -> str:
+    """
+    Build the personality voice section applied directly to the answer
+
+    Args:
+        character: Character object with traits
+
+    Returns:
+        Formatted personality section string
+    """
+    personality_instructions: str = generate_personality_instructions(character.traits)
+
+    return f"""
+    # VOICE AND PERSONALITY
+    Write the "answer" directly in the voice of {character.name}, using their tone, style,
+    and language when appropriate — but keep it natural and not exaggerated.
+    You don't need to force every trait into every sentence. Subtlety and believability are key.
+    The personality changes HOW you speak, never WHAT is true: facts, secrets and rules always win.
+    {personality_instructions}
+    """
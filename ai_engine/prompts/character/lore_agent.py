@@ -5,6 +5,7 @@ Handles lore information retrieval from game state for character conversations
 
 from typing import Dict, List
 from ai_engine.prompts.prompt_config import get_rules_prompt
+from ai_engine.prompts.templates import get_template, slot
 from game_engine.models.character import Character
 from game_engine.models.player import Player
 
@@ -27,6 +28,22 @@ def create_get_lore_information(
     # Validate inputs
     _validate_lore_inputs(topic, game_state_str)
     
+    return get_template("lore", _build_lore_template).render(
+        character_name=character.name,
+        character_role=character.role,
+        location=player.current_location.name,
+        topic=topic,
+        game_state=game_state_str,
+    )
+
+
+def _build_lore_template() -> str:
+    """
+    Build the lore prompt with slots for the context and the game state
+    
+    Returns:
+        Template text of the lore prompt
+    """
     # Build core rule section
     core_rule = _build_core_rule_section()
     
@@ -43,10 +60,12 @@ def create_get_lore_information(
     examples = _build_examples_section()
     
     # Build context section
-    context = _build_context_section(character, player, topic)
+    context = _build_context_section(
+        slot("character_name"), slot("character_role"), slot("location"), slot("topic")
+    )
     
     # Build game state section
-    game_state_section = _build_game_state_section(game_state_str)
+    game_state_section = _build_game_state_section(slot("game_state"))
     
     return f"""You are a game state analyzer for a detective game.
 
@@ -64,11 +83,11 @@ def create_get_lore_information(
 
 {examples}
 
-{context}
+Respond with factual information only, or empty string if no factual response needed.
 
 {game_state_section}
 
-Respond with factual information only, or empty string if no factual response needed."""
+{context}"""
 
 
 def _validate_lore_inputs(topic: str, game_state_str: str) -> None:
@@ -223,21 +242,22 @@ def _build_examples_section() -> str:
 **Response:** "Lord Blackwood is currently alive\""""
 
 
-def _build_context_section(character: Character, player: Player, topic: str) -> str:
+def _build_context_section(character_name: str, character_role: str, location: str, topic: str) -> str:
     """
     Build the context section with character, player, and topic information
     
     Args:
-        character: Character being addressed
-        player: Player object
+        character_name: Name of the character being addressed
+        character_role: Role of the character being addressed
+        location: Name of the player's current room
         topic: Topic being discussed
         
     Returns:
         Context section string
     """
     return f"""# CONTEXT
-Player addressing: {character.name} ({character.role})
-Current location: {player.current_location.name}
+Player addressing: {character_name} ({character_role})
+Current location: {location}
 Question: "{topic}\""""
 
 
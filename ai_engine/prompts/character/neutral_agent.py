@@ -3,53 +3,79 @@ Neutral Character Agent
 Handles core character prompt creation focused on game logic without personality
 """
 
-from typing import Dict, List
+import re
+from typing import Dict, List, Optional
 from ai_engine.prompts.prompt_config import get_rules_prompt
+from ai_engine.prompts.templates import get_template, slot
 from game_engine.models.character import Character
+from game_engine.models.character_memory import MemoryKind
 from game_engine.core.game_state import GameMode
 from game_engine.models.player import Player
+from game_engine.models.secret_list import Secret
 
+# Length of the excerpt kept for a secret already revealed
+REVEALED_SECRET_EXCERPT = 100
 
-def create_neutral_character_prompt(character: Character, player: Player) -> str:
+
+def create_neutral_character_prompt(
+    character: Character, player: Player, secrets: Optional[List[Secret]] = None
+) -> str:
     """
     Create a neutral character prompt focused on game logic without personality
     
     Args:
         character: The character to roleplay
         player: The player object
+        secrets: Secrets selected for this turn (defaults to every unlocked secret)
         
     Returns:
         Neutral prompt string for the AI
     """
+    # Create secrets rules section
+    secrets_rules: str = _build_secrets_section(_get_available_secrets(character, player, secrets))
+    
+    # Build nonsense awareness section
+    nonsense_awareness: str = _build_nonsense_awareness_section(character)
+    
+    return get_template("neutral_character", _build_neutral_template).render(
+        name=character.name,
+        role=character.role,
+        physical_description=character.description,
+        traits=str(character.traits),
+        location=player.current_location.name,
+        secrets_rules=secrets_rules,
+        nonsense_awareness=nonsense_awareness,
+        recent_events=str(character.prompt),
+        global_memory=str(character.memory_global),
+        player_name=player.name,
+    )
+
+
+def _build_neutral_template() -> str:
+    """
+    Build the neutral character prompt with slots for the character, the player
+    and the per-turn sections. The character sheet, rules and output format come
+    first so the prompt prefix stays identical from one turn to the next.
+    
+    Returns:
+        Template text of the neutral character prompt
+    """
     rules_prompt: str = get_rules_prompt()
-   
+    
     character_info: Dict[str, str] = {
-        "name": character.name,
-        "role": character.role,
-        "physical_description": character.description,
-        "traits": character.traits,
-        "global_memory": character.memory_global,
+        "name": slot("name"),
+        "role": slot("role"),
+        "physical_description": slot("physical_description"),
+        "traits": slot("traits"),
+        "global_memory": slot("global_memory"),
     }
     
     # Convert GameMode enum values to strings outside the f-string
     conversation_mode: str = GameMode.CONVERSATION.value
     exploration_mode: str = GameMode.EXPLORATION.value
     
-    # Get player inventory item names for condition checking
-    player_inventory_names: List[str] = [item.name for item in player.inventory]
-    
-    # Check for available secrets based on player inventory
-    secrets_available: List[str] = [
-        (f"PRIORITY SECRET - If {secret.condition} is mentioned or shown, reveal: {secret.secret}")
-        for secret in character.secrets
-        if secret.condition in player_inventory_names
-    ]
-    
-    # Create secrets rules section
-    secrets_rules: str = _build_secrets_section(secrets_available)
-    
-    # Build nonsense awareness section
-    nonsense_awareness: str = _build_nonsense_awareness_section(character)
+    secrets_rules: str = slot("secrets_rules")
+    nonsense_awareness: str = slot("nonsense_awareness")
     
     # Define rules for character behavior
     character_behavior_rules: str = _get_character_behavior_rules(rules_prompt)
@@ -60,17 +86,6 @@ def create_neutral_character_prompt(character: Character, player: Player) -> str
     - Your role in this story: {character_info["role"]}
     - Your physical description: {character_info["physical_description"]}
     - Your personality: {character_info["traits"]}
-    - You are currently in this room: {player.current_location.name}
-    
-    {secrets_rules}
-
-    {nonsense_awareness}
-   
-    # This is a resume of the recent events from your perspective:
-    {character.prompt}
-   
-    # Your memory of past conversations with the detective:
-    {character_info["global_memory"]}
        
     # RULES
     {character_behavior_rules}
@@ -78,8 +93,8 @@ def create_neutral_character_prompt(character: Character, player: Player) -> str
     EXTREMELY IMPORTANT: You MUST respond in this EXACT JSON format and ORDER of keys:
     {{
         "think": "Your internal reasoning process about how to respond (not shown to the player)",
-        "answer": "Your factual response as {character_info["name"]} to Detective {player.name}.",
-        "action": "MUST be {exploration_mode} if Detective {player.name} is ending the conversation as described above or if the detective is annoying you, otherwise use {conversation_mode}"
+        "answer": "Your factual response as {character_info["name"]} to Detective {slot("player_name")}.",
+        "action": "MUST be {exploration_mode} if Detective {slot("player_name")} is ending the conversation as described above or if the detective is annoying you, otherwise use {conversation_mode}"
     }}
    
     The JSON MUST follow this EXACT structure with these THREE keys in this SPECIFIC ORDER:
@@ -88,9 +103,57 @@ def create_neutral_character_prompt(character: Character, player: Player) -> str
     3. "action" - Always third
    
     Do NOT add any additional keys or change this order under any circumstances.
+    
+    # CURRENT SITUATION
+    - You are currently in this room: {slot("location")}
+    
+    {secrets_rules}
+
+    {nonsense_awareness}
+   
+    # This is a resume of the recent events from your perspective:
+    {slot("recent_events")}
+   
+    # Your memory of past conversations with the detective:
+    {character_info["global_memory"]}
     """
 
 
+def _get_available_secrets(
+    character: Character, player: Player, secrets: Optional[List[Secret]] = None
+) -> List[str]:
+    """
+    Secrets the detective can trigger with the clues in their inventory
+    
+    Args:
+        character: Character holding the secrets
+        player: Player whose inventory unlocks them
+        secrets: Secrets selected for this turn (defaults to every unlocked secret)
+        
+    Returns:
+        Secret instructions for the prompt, revealed secrets as one-line references
+    """
+    if secrets is None:
+        # Get player inventory item names for condition checking
+        player_inventory_names: List[str] = [item.name for item in player.inventory]
+        secrets = [s for s in character.secrets if s.condition in player_inventory_names]
+    
+    return [
+        (f"ALREADY REVEALED - {secret.condition}: {_excerpt(secret.secret)}")
+        if secret.shown else
+        (f"PRIORITY SECRET - If {secret.condition} is mentioned or shown, reveal: {secret.secret}")
+        for secret in secrets
+    ]
+
+
+def _excerpt(text: str) -> str:
+    """Start of a secret, without stage directions, on one line"""
+    text = " ".join(re.sub(r"\*[^*]*\*", " ", text).split())
+    if len(text) <= REVEALED_SECRET_EXCERPT:
+        return text
+    return text[:REVEALED_SECRET_EXCERPT].rsplit(" ", 1)[0] + "..."
+
+
 def _build_secrets_section(secrets_available: List[str]) -> str:
     """
     Build the secrets rules section for the prompt
@@ -149,25 +212,18 @@ def _build_nonsense_awareness_section(character: Character) -> str:
     Build the nonsense awareness section based on character memory
     
     Args:
-        character: Character object with memory_current
+        character: Character object with witness and reputation memories
         
     Returns:
         Formatted nonsense awareness section string
     """
-    if not hasattr(character, 'memory_current') or not character.memory_current:
-        return ""
-    
     # Separate local (witnessed) and global (heard about) memories
-    local_memories: List[str] = []
-    global_memories: List[str] = []
-    
-    for memory in character.memory_current:
-        if memory.get("role") == "assistant":
-            content: str = memory.get("content", "").lower()
-            if any(keyword in content for keyword in ["witnessed", "observed", "personally", "i watched", "i saw"]):
-                local_memories.append(memory.get("content", ""))
-            elif any(keyword in content for keyword in ["throughout the manor", "word has spread", "talk of the entire manor", "stories", "rumors"]):
-                global_memories.append(memory.get("content", ""))
+    local_memories: List[str] = [
+        entry.content for entry in character.memory.get_entries(MemoryKind.WITNESS)
+    ]
+    global_memories: List[str] = [
+        entry.content for entry in character.memory.get_entries(MemoryKind.REPUTATION)
+    ]
     
     if not local_memories and not global_memories:
         return ""
@@ -42,9 +42,9 @@ def create_personality_character_prompt(
 
 {personality_instructions}
 
-{context_section}
+{guidelines}
 
-{guidelines}"""
+{context_section}"""
 
 
 def _build_character_info_section(character: Character) -> str:
@@ -3,12 +3,27 @@ Summary Character Agent
 Handles conversation summarization between detective and character
 """
 
+from typing import Dict, List, Optional
+
 from game_engine.models.character import Character
 from game_engine.models.player import Player
 
 
-def create_conversation_summary_prompt(character: Character, player: Player):
-    """Create a prompt to generate a bullet-point summary of the entire conversation"""
+def create_conversation_summary_prompt(
+    character: Character,
+    player: Player,
+    conversation: Optional[List[Dict[str, str]]] = None,
+):
+    """
+    Create a prompt to generate a bullet-point summary of the entire conversation
+
+    Args:
+        character: Character the detective talked to
+        player: Detective
+        conversation: Messages to summarize (defaults to the ongoing conversation)
+    """
+    if conversation is None:
+        conversation = character.get_conversation_memory()
 
     return f"""
     You are an AI assistant tasked with summarizing a conversation between a detective ({player.name}) and a character ({character.name}) in a detective game.
@@ -17,10 +32,7 @@ def create_conversation_summary_prompt(character: Character, player: Player):
     - Name: {character.name}
     - Description: {character.description}
 
-    Full conversation history:
-    {character.memory_current}
-
-    Please provide a structured summary of this conversation in bullet points. Your summary must:
+    Please provide a structured summary of the conversation below in bullet points. Your summary must:
     - Start directly with bullet points (no introduction or conclusion)
     - Be concise and focused on facts and relevant exchanges
     - Include the following types of points when applicable:
@@ -33,4 +45,76 @@ def create_conversation_summary_prompt(character: Character, player: Player):
 
     Format each point as a short, standalone sentence (starting with a dash).
     Avoid repetition and keep the total summary under 150 words.
-    """
\ No newline at end of file
+
+    Full conversation history:
+    {conversation}
+    """
+
+
+def create_memory_compaction_prompt(
+    character: Character,
+    player: Player,
+    previous_digest: str,
+    conversation: List[Dict[str, str]],
+):
+    """
+    Create a prompt folding older turns of an ongoing conversation into a running digest
+
+    Args:
+        character: Character the detective is talking to
+        player: Detective
+        previous_digest: Digest of turns compacted earlier ("" if none)
+        conversation: Older messages to fold into the digest
+    """
+    return f"""
+    You are an AI assistant keeping a running digest of an ongoing conversation between a detective ({player.name}) and a character ({character.name}) in a detective game.
+
+    Rewrite the current digest below so it also covers the next part of the conversation. Your digest must:
+    - Start directly with bullet points (no introduction or conclusion)
+    - Keep questions asked, facts and secrets revealed, lies, emotional shifts, accusations and promises
+    - Keep anything the character witnessed or heard about the detective's behavior
+    - Drop greetings, repetitions and small talk
+
+    Format each point as a short, standalone sentence (starting with a dash).
+    Keep the total digest under 150 words.
+
+    Current digest of the earliest part of the conversation:
+    {previous_digest or "(empty)"}
+
+    Next part of the conversation to fold into the digest:
+    {conversation}
+    """
+
+
+def create_relationship_dossier_prompt(
+    character: Character,
+    player: Player,
+    summaries: List[str],
+    max_words: int,
+):
+    """
+    Create a prompt merging past conversation summaries into one relationship dossier
+
+    Args:
+        character: Character whose global memory is consolidated
+        player: Detective
+        summaries: Past conversation summaries (or a previous dossier), oldest first
+        max_words: Word budget of the dossier
+    """
+    numbered = "\n".join(f"{i}. {summary}" for i, summary in enumerate(summaries, 1))
+
+    return f"""
+    You are an AI assistant maintaining {character.name}'s memory of their past conversations with detective {player.name} in a detective game.
+
+    Merge the past conversation summaries below into a single relationship dossier. Your dossier must:
+    - Start directly with bullet points (no introduction or conclusion)
+    - Keep every fact revealed, secret disclosed, lie told, accusation and promise made
+    - Keep how {character.name}'s attitude toward the detective evolved
+    - Merge duplicates and drop small talk; prefer later information when it contradicts earlier information
+
+    Format each point as a short, standalone sentence (starting with a dash).
+    Keep the total dossier under {max_words} words.
+
+    Past conversation summaries, oldest first:
+    {numbered}
+    """
@@ -111,12 +111,6 @@ def create_command_prompt(reasoning_result: dict, game_state_str: str) -> str:
     
     return f"""You are a detective game command executor. Based on the analysis results, determine the final action.
 
-    Current game state:
-    {game_state_str}
-
-    Analysis results:
-    {reasoning_result}
-
     {validation_section}
 
     {narrative_section}
@@ -126,4 +120,10 @@ def create_command_prompt(reasoning_result: dict, game_state_str: str) -> str:
     {rules_prompt}
 
     {output_section}
+
+    Current game state:
+    {game_state_str}
+
+    Analysis results:
+    {reasoning_result}
     """
\ No newline at end of file
@@ -14,9 +14,6 @@ def create_nonsense_action_prompt(game_state_str: str):
     rules_prompt = get_rules_prompt()
     
     return f"""# Nonsense Action Handler - Blackwood Manor 1891
-    
-    ## Current Game State
-    {game_state_str}
 
     ## Context
     You are managing a murder investigation at Blackwood Manor in 1891. The player may sometimes perform inappropriate or absurd actions. These actions actually occur and have consequences in the story.
@@ -64,7 +61,7 @@ def create_nonsense_action_prompt(game_state_str: str):
     - **Persistent pattern**: Characters discussing the detective's behavior among themselves
     - **Severe escalation**: Threats of consequences or intervention
         
-    ## IMPORTANT: Use the Current Game State Above
+    ## IMPORTANT: Use the Current Game State Below
     - Only include characters who are PRESENT in the current room in your responses
     - Reference the specific location where the action takes place
     - If no characters are present, describe the detective's solitary embarrassment
@@ -165,4 +162,7 @@ def create_nonsense_action_prompt(game_state_str: str):
     - {rules_prompt}
     
     Remember: The goal is to gently discourage nonsense while entertaining the player and maintaining immersion in the Victorian murder mystery atmosphere.
+
+    ## Current Game State
+    {game_state_str}
     """
\ No newline at end of file
@@ -0,0 +1,90 @@
+"""
+Command Pipeline Agent
+Handles command analysis and execution in a single function-calling round trip
+"""
+
+from ai_engine.prompts.prompt_config import get_rules_prompt
+
+from .executor_agent import _get_narrative_guidelines, _get_response_guidelines
+from .reasoning_agent import _get_movement_rules
+
+
+def create_command_pipeline_prompt(game_state_str: str, command: str) -> str:
+    """
+    Creates a prompt that understands, validates and resolves a player command at once.
+    The output structure is enforced by the "command_pipeline" tool schema.
+
+    Args:
+        game_state_str: Current state of the game as a string
+        command: Player's input command in any language
+
+    Returns:
+        A formatted prompt string for the fused command pipeline
+    """
+    rules_prompt = get_rules_prompt()
+
+    # Build prompt using helper functions
+    movement_rules = _get_movement_rules()
+    analysis_section = _get_analysis_steps()
+    narrative_section = _get_narrative_guidelines()
+    response_section = _get_response_guidelines()
+
+    return f"""You are a detective game command processor. Understand the player's command, validate it against the game state and decide the final action.
+
+    GAME RULES:
+    The player can ONLY perform these 6 actions:
+    1. "look" - inspect/examine a character, clue, location or their inventory
+    2. "speak" - talk to a character
+    3. "collect" - take/collect a clue
+    4. "move" - move to another location
+    5. "help" - ask for help
+    6. "nonsense" - attempt unrealistic actions like fighting, destroying objects, or other non-detective behaviors
+
+    CRITICAL VALIDATION RULES:
+    - The player can target ONLY ONE entity per command (no multiple targets)
+    - The target entity MUST exist exactly in the current game state
+    - {movement_rules}
+    - If the targeted character has status "dead", TALKING to them is INVALID
+    - "speak" targets characters, "collect" targets clues, "move" targets locations, "look" targets anything
+    - "nonsense" is always valid: set valid to true so the game can react to it
+
+    {analysis_section}
+
+    {narrative_section}
+
+    {response_section}
+
+    {rules_prompt}
+
+    Call the provided function with your final decision.
+
+    Current game state:
+    {game_state_str}
+
+    Player's command: "{command}"
+    """
+
+
+def _get_analysis_steps() -> str:
+    """Helper function to return the analysis steps and target matching rules"""
+    return """
+    ANALYSIS STEPS (write them in "think"):
+    1. List the entities (characters, locations, clues) that exist in the current game state
+    2. Detect the language of the command and translate it to English ("translated_command")
+    3. Identify the action (must be one of the 6 above) and its single target
+    4. Map the target to its canonical English name from the game state
+    5. Verify the target exists and the action is compatible with its type
+
+    COMMAND CATEGORIES (with multilingual examples):
+    - "help": help, aide (French), ayuda (Spanish), Hilfe (German)
+    - "move": go, walk, move to, aller (French), ir (Spanish), gehen (German)
+    - "speak": talk to, speak with, parler (French), hablar (Spanish), sprechen (German)
+    - "collect": take, pick up, prendre (French), tomar (Spanish), nehmen (German)
+    - "look": look at, examine, inspect, regarder (French), mirar (Spanish), ansehen (German)
+    - "nonsense": any command that doesn't fit the above categories, e.g., "hit", "insult", "undress", "eat", "drink", "sleep", etc.
+
+    TARGET MATCHING RULES:
+    - Allow reasonable synonyms (e.g., "paper" for "letter", "blade" for "knife")
+    - Consider partial matches and semantic equivalents
+    - If no match exists in the game state, the command is INVALID
+    """
@@ -12,26 +12,11 @@ def create_reasoning_prompt(game_state_str: str, command: str) -> str:
         A formatted prompt string for command analysis
     """
 
-    # Get teleportation mode
-    teleportation_enabled = get_current_teleportation()
-    
     # Modify movement validation rules based on teleportation mode
-    if teleportation_enabled:
-        movement_rules = """
-    - For "move" action: the target room MUST exist in the game state (teleportation mode - can move to any room)"""
-    else:
-        movement_rules = """
-    - For "move" action: the target room MUST be in the "Possible exits" list (connected rooms only)
-    - If trying to move to a non-connected room, the command is INVALID
-    """
+    movement_rules = _get_movement_rules()
     
     return f"""You are a detective game command analyzer. Your job is to understand and validate player commands.
 
-    Current game state:
-    {game_state_str}
-
-    Player's command: "{command}"
-
     GAME RULES:
     The player can ONLY perform these 6 actions:
     1. "look" - inspect/examine a character, clue, location or their inventory
@@ -89,4 +74,20 @@ def create_reasoning_prompt(game_state_str: str, command: str) -> str:
         "validation_result": "valid/invalid",
         "validation_reason": "specific reason why valid or invalid"
     }}
-    """
\ No newline at end of file
+
+    Current game state:
+    {game_state_str}
+
+    Player's command: "{command}"
+    """
+
+
+def _get_movement_rules() -> str:
+    """Helper function to return movement validation rules for the teleportation mode"""
+    if get_current_teleportation():
+        return """
+    - For "move" action: the target room MUST exist in the game state (teleportation mode - can move to any room)"""
+    return """
+    - For "move" action: the target room MUST be in the "Possible exits" list (connected rooms only)
+    - If trying to move to a non-connected room, the command is INVALID
+    """
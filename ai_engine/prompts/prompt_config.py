@@ -1,24 +1,34 @@
 import os
 
+# Set once a frontend service turns out not to be importable (e.g. engine used
+# without the UI): the failed import is not retried on every prompt
+_language_service_unavailable = False
+_option_service_unavailable = False
+
 
 def get_current_language() -> str:
     """Get current language from service, fallback to environment, then default"""
-    try:
-        from frontend.services.language_service import get_current_language
-        return get_current_language()
-    except ImportError:
-        # Fallback to environment variable if service not available
-        return os.getenv('LANGUAGE', 'english')
+    global _language_service_unavailable
+    if not _language_service_unavailable:
+        try:
+            from frontend.services.language_service import get_current_language
+            return get_current_language()
+        except ImportError:
+            _language_service_unavailable = True
+    # Fallback to environment variable if service not available
+    return os.getenv('LANGUAGE', 'english')
     
 def get_current_teleportation() -> bool:
     """Get current teleportation mode setting"""
-    try:
-        from frontend.services.game_option_service import get_current_teleportation
-        return get_current_teleportation()
-    except ImportError:
-        # Fallback to environment variable if service not available
-        import os
-        return os.getenv('TELEPORTATION_MODE', 'false').lower() == 'true'
+    global _option_service_unavailable
+    if not _option_service_unavailable:
+        try:
+            from frontend.services.game_option_service import get_current_teleportation
+            return get_current_teleportation()
+        except ImportError:
+            _option_service_unavailable = True
+    # Fallback to environment variable if service not available
+    return os.getenv('TELEPORTATION_MODE', 'false').lower() == 'true'
 
 def get_rules_prompt() -> str:
     """Get language-specific rules prompt"""
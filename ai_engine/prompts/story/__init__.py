@@ -4,15 +4,22 @@ Separated into specialized agents for story generation and object interaction
 """
 
 from .room_description_agent import create_room_description_prompt
-from .character_description_agent import create_character_description_prompt
-from .clue_analysis_agent import create_clue_analysis_prompt
-from .ending_writer_agent import create_write_ending
-from .object_inspector_agent import create_inspect_object_prompt
+from .character_description_agent import (
+    create_character_batch_description_prompt,
+    create_character_description_prompt,
+)
+from .clue_analysis_agent import create_clue_analysis_prompt, create_clue_batch_analysis_prompt
+from .ending_writer_agent import create_ending_personalization_prompt, create_write_ending
+from .object_inspector_agent import create_inspect_object_prompt, create_object_response_pool_prompt
 
 __all__ = [
     'create_room_description_prompt',
     'create_character_description_prompt',
+    'create_character_batch_description_prompt',
     'create_clue_analysis_prompt',
+    'create_clue_batch_analysis_prompt',
     'create_write_ending',
+    'create_ending_personalization_prompt',
     'create_inspect_object_prompt',
+    'create_object_response_pool_prompt',
 ]
\ No newline at end of file
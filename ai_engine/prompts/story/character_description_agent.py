@@ -3,6 +3,8 @@ Character Description Agent
 Generates descriptions of characters in their environment
 """
 
+from typing import List
+
 from ai_engine.prompts.prompt_config import get_rules_prompt
 from game_engine.models.character import Character
 from game_engine.models.room import Room
@@ -26,6 +28,9 @@ def create_character_description_prompt(character: Character, room: Room) -> str
     description_guidelines = _get_description_guidelines()
     
     return f"""
+        {description_guidelines}
+        {rules_prompt}
+        
         Describe {character.name} to the player (detective) who is observing them.
         
         In one short sentence, describe what {character.name} looks like.
@@ -36,9 +41,48 @@ def create_character_description_prompt(character: Character, room: Room) -> str
         
         {character_info}
         {room_info}
-       
+    """
+
+
+def create_character_batch_description_prompt(characters: List[Character], room: Room) -> str:
+    """
+    Create a prompt describing several characters of the same room in one JSON answer.
+    The room context and the rules are sent once for all of them.
+    
+    Args:
+        characters: Characters to describe
+        room: Room where the characters are located
+        
+    Returns:
+        Formatted prompt for the batch of character descriptions
+    """
+    rules_prompt = get_rules_prompt()
+    
+    characters_info = "\n\n        ".join(
+        f"Character: {character.name}\n        {_extract_character_info(character)}"
+        for character in characters
+    )
+    description_guidelines = _get_description_guidelines()
+    
+    return f"""
         {description_guidelines}
         {rules_prompt}
+        
+        Describe each of the following characters to the player (detective) who is observing them.
+        
+        For each character, in one short sentence, describe what they look like.
+        
+        In a second sentence, describe what they are currently doing or their demeanor.
+        
+        Address the player directly using "you" when relevant (e.g., "You see that...", "You notice...").
+        
+        Return ONLY a JSON object, one entry per character, using the exact names below:
+        {{"descriptions": [{{"name": "character name", "description": "two or three sentences"}}]}}
+        
+        The player and these characters are in this current room of the manor: {room.name}
+        This is the description of the room: {room.description}
+        
+        {characters_info}
     """
 
 
@@ -12,7 +12,7 @@ def create_clue_analysis_prompt(clue, collected_clues=None) -> str:
 
     Args:
         clue: The newly discovered clue object (must have name, description, room_name attributes)
-        collected_clues: Optional list of previously collected clues
+        collected_clues: Optional list of previously collected clues related to this one
 
     Returns:
         Formatted prompt string for clue analysis
@@ -20,15 +20,50 @@ def create_clue_analysis_prompt(clue, collected_clues=None) -> str:
     rules_prompt = get_rules_prompt()
     
     clue_info = _extract_clue_info(clue)
+    related_info = _extract_related_info(clue, collected_clues)
     analysis_instructions = _get_analysis_instructions()
     
     return f"""You are a detective game narrator analyzing a newly discovered clue.
 
+        {analysis_instructions}
+
+        {rules_prompt}
+
         {clue_info}
+        {related_info}"""
+
+
+def create_clue_batch_analysis_prompt(clues, collected_clues_by_clue=None) -> str:
+    """
+    Create the prompt analysing several clues of the same room in one JSON answer.
+    The instructions and the rules are sent once for all of them.
+
+    Args:
+        clues: Clue objects to analyse
+        collected_clues_by_clue: Optional dict mapping a clue name to its related collected clues
+
+    Returns:
+        Formatted prompt string for the batch of clue analyses
+    """
+    rules_prompt = get_rules_prompt()
+    
+    related_by_clue = collected_clues_by_clue or {}
+    clues_info = "\n\n        ".join(
+        f"{_extract_clue_info(clue)}{_extract_related_info(clue, related_by_clue.get(clue.name))}"
+        for clue in clues
+    )
+    analysis_instructions = _get_analysis_instructions()
+    
+    return f"""You are a detective game narrator analyzing newly discovered clues, each one on its own.
 
         {analysis_instructions}
 
-        {rules_prompt}"""
+        {rules_prompt}
+
+        Return ONLY a JSON object, one entry per clue, using the exact clue names below:
+        {{"analyses": [{{"name": "clue name", "analysis": "2-3 sentences"}}]}}
+
+        {clues_info}"""
 
 
 def _extract_clue_info(clue) -> str:
@@ -38,6 +73,17 @@ def _extract_clue_info(clue) -> str:
         Location: Found in {clue.room_name}"""
 
 
+def _extract_related_info(clue, collected_clues) -> str:
+    """List the related clues the player already holds, if any"""
+    related = [c for c in collected_clues or [] if c.name != clue.name]
+    if not related:
+        return ""
+    lines = "\n".join(f"        - {c.name}: {c.description}" for c in related)
+    return f"""
+        Related clues the player already found (hint at the connection without solving it):
+{lines}"""
+
+
 def _get_analysis_instructions() -> str:
     """Get the analysis instructions for the clue"""
     return """INSTRUCTIONS:
@@ -35,6 +35,36 @@ def create_write_ending(scenario: str, player_theory: str):
         {formatting_rules}"""
 
 
+def create_ending_personalization_prompt(scenario: str, player_theory: str) -> str:
+    """
+    Generate the prompt for a short paragraph closing the canonical ending on the player's theory
+
+    Args:
+        scenario: Canonical ending text shown to the player
+        player_theory: Player's theory about the murder
+
+    Returns:
+        Formatted prompt for the personalization paragraph
+    """
+    rules_prompt = get_rules_prompt()
+
+    return f"""# Final Confrontation - Closing Words
+
+        ## Ending Shown to the Player
+        {scenario}
+
+        ## Player's Theory
+        {player_theory}
+
+        ## Instructions for the AI
+        Write ONE short paragraph (3 sentences max) that follows the ending above:
+        1. Address the detective directly with "you"
+        2. Acknowledge the reasoning of their theory: what they saw right, what they missed
+        3. Never contradict the ending or change its culprit
+        4. Plain text only, no title, no JSON
+        5. {rules_prompt}"""
+
+
 def _get_scenario_instructions(scenario: str, player_theory: str, rules_prompt: str) -> str:
     """Build scenario adaptation instructions"""
     return f"""## Scenario Information
@@ -25,13 +25,13 @@ def create_inspect_object_prompt(object_name: str) -> str:
     return f"""
     You are a game manager for a detective game.
 
-    {object_info}
-    
     {inspection_instructions}
     
     {response_format}
     
     {rules_prompt}
+
+    {object_info}
     """
 
 
@@ -52,4 +52,35 @@ def _get_response_format(object_name: str) -> str:
     """Get the response format guidelines"""
     return f"""Format: "You examine [object name], but there is nothing special about it."
     
-    Replace [object name] with the object mentioned by the player."""
\ No newline at end of file
+    Replace [object name] with the object mentioned by the player."""
+
+
+def create_object_response_pool_prompt(room_name: str, count: int) -> str:
+    """
+    Create prompt for a pool of reusable "nothing special" answers in a room
+
+    Args:
+        room_name: Room where the objects are examined
+        count: Number of answers to generate
+
+    Returns:
+        Formatted prompt asking for a JSON list of answer templates
+    """
+    rules_prompt = get_rules_prompt()
+
+    return f"""
+    You are a game manager for a detective game set in 19th century Blackwood Manor.
+
+    LOCATION: {room_name}
+
+    INSTRUCTIONS:
+    Write {count} different short sentences telling the detective that the object they examine in this room is of no interest to the investigation.
+    - Each sentence MUST contain the placeholder {{object}} exactly once, where the object name goes
+    - The name is inserted exactly as the player typed it, possibly in another language: never put an article, preposition or gender/number agreement that depends on it (e.g. "{{object}}: ..." rather than "dans {{object}}")
+    - Address the detective with "you", one short sentence each, varied wording
+    - A light touch of the room's atmosphere is welcome, never invent clues
+
+    Format: a JSON object {{"responses": ["You examine {{object}}, but there is nothing special about it.", ...]}}
+
+    {rules_prompt}
+    """
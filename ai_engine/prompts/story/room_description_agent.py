@@ -5,6 +5,7 @@ Generates atmospheric room descriptions with nonsense event integration
 
 from typing import Dict, List
 from ai_engine.prompts.prompt_config import get_rules_prompt
+from ai_engine.prompts.templates import get_template, slot
 from game_engine.models.room import Room
 
 
@@ -20,8 +21,6 @@ def create_room_description_prompt(room: Room, player_state: str) -> str:
     Returns:
         A formatted prompt string to guide immersive scene generation
     """
-    rules_prompt = get_rules_prompt()
-    
     # Extract room information
     characters_info = _build_characters_info(room.characters)
     clues_info = ", ".join([c.name for c in room.clues]) if room.clues else "none"
@@ -40,35 +39,57 @@ def create_room_description_prompt(room: Room, player_state: str) -> str:
     # Build clue instructions
     clue_instructions = _build_clue_instructions(has_clues, player_state, clues_info, room.clues)
     
+    return get_template("room_description", _build_room_description_template).render(
+        description=str(room.description),
+        exits_info=exits_info,
+        player_state=str(player_state),
+        action_opening=action_opening,
+        combined_context=combined_context,
+        characters_info=characters_info,
+        characters_note="Mention them briefly and naturally." if has_characters else "",
+        clues_status="Present: " + clues_info if has_clues else "None present",
+        clue_instructions=clue_instructions,
+        nonsense_note=(
+            "Subtly incorporate the consequences of recent nonsense events into the atmosphere and character reactions."
+            if combined_context else ""
+        ),
+    )
+
+
+def _build_room_description_template() -> str:
+    """Build the room description prompt: writing rules first, then slots for everything depending on the room"""
+    rules_prompt = get_rules_prompt()
+    
     # Anti-false intrigue instructions
     anti_false_intrigue = _get_anti_false_intrigue_rules()
     
     return f"""
-        Use the following base room description only as minimal context, do NOT expand on it:
-        "{room.description}"
+        Write one concise and factual paragraph (2 to 3 sentences) that describes only what actually exists in the room below.
+        Avoid creating atmosphere or mystery beyond the specific listed elements.
+        Keep the tone direct, visual, and grounded in observable facts.
+        {rules_prompt}
         
-        The room has these exits (do not mention them explicitly in your description, except if it helps to naturally position a character in the scene): {exits_info}
+        {anti_false_intrigue}
         
-        The player is currently in state: {player_state}.
-        {action_opening}
+        Use the following base room description only as minimal context, do NOT expand on it:
+        "{slot("description")}"
         
-        {combined_context}
+        The room has these exits (do not mention them explicitly in your description, except if it helps to naturally position a character in the scene): {slot("exits_info")}
         
-        {anti_false_intrigue}
+        The player is currently in state: {slot("player_state")}.
+        {slot("action_opening")}
+        
+        {slot("combined_context")}
         
         Focus on what the player notices:
         
-        - Characters present: {characters_info}
-        {f"Mention them briefly and naturally." if has_characters else ""}
+        - Characters present: {slot("characters_info")}
+        {slot("characters_note")}
         
-        - Clues status: {"Present: " + clues_info if has_clues else "None present"}
-        {clue_instructions}
+        - Clues status: {slot("clues_status")}
+        {slot("clue_instructions")}
         
-        Write one concise and factual paragraph (2 to 3 sentences) that describes only what actually exists.
-        {f"Subtly incorporate the consequences of recent nonsense events into the atmosphere and character reactions." if combined_context else ""}
-        Avoid creating atmosphere or mystery beyond the specific listed elements.
-        Keep the tone direct, visual, and grounded in observable facts.
-        {rules_prompt}
+        {slot("nonsense_note")}
     """
 
 
@@ -251,7 +272,7 @@ def _get_anti_false_intrigue_rules() -> str:
     """Get the anti-false intrigue rules"""
     return """
     **CRITICAL - NO FALSE INTRIGUE ALLOWED**: 
-    - DO NOT mention ANY mysterious elements, shadows, glints, anomalies unless they correspond to ACTUAL CLUES listed above
+    - DO NOT mention ANY mysterious elements, shadows, glints, anomalies unless they correspond to ACTUAL CLUES listed below
     - DO NOT create false intrigue or hint at non-existent elements
     - DO NOT use vague mysterious language like: "something seems off", "catches your eye", "out of place", "strange", "odd", "unusual", "suspicious" UNLESS referring to specific listed clues
     - Be factual and precise - only describe what actually exists in the room
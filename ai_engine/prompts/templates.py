@@ -0,0 +1,106 @@
+"""
+Precompiled prompt templates
+Static prompt sections are rendered once per (agent, language), only the slots are filled per call
+"""
+
+import threading
+from typing import Callable, Dict, Hashable, List, Tuple
+
+from ai_engine.prompts.prompt_config import get_current_language
+
+# Slot markers cannot appear in prompt text: builders never produce NUL characters
+SLOT_MARKER = "\x00"
+
+
+def slot(name: str) -> str:
+    """Placeholder for a value filled at render time"""
+    return f"{SLOT_MARKER}{name}{SLOT_MARKER}"
+
+
+class PromptTemplate:
+    """
+    Prompt text split once into static parts and named slots.
+    Rendering joins the parts with the slot values, nothing else is rebuilt.
+    """
+
+    def __init__(self, text: str):
+        pieces = text.split(SLOT_MARKER)
+        self.static_parts: List[str] = pieces[0::2]
+        self.slots: List[str] = pieces[1::2]
+
+    def render(self, **values: str) -> str:
+        """
+        Fill the slots
+
+        Args:
+            **values: Text of every slot, by name
+
+        Returns:
+            Complete prompt
+        """
+        parts = [self.static_parts[0]]
+        for name, static in zip(self.slots, self.static_parts[1:]):
+            parts.append(values[name])
+            parts.append(static)
+        return "".join(parts)
+
+
+class PromptTemplateCache:
+    """Templates by (agent, language, variant), built on first use"""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._templates: Dict[Tuple[Hashable, ...], PromptTemplate] = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "builds": 0}
+
+    def get(self, agent: str, build: Callable[[], str], *variant: Hashable) -> PromptTemplate:
+        """
+        Template of an agent in the current language
+
+        Args:
+            agent: Agent name
+            build: Builds the template text, with slot() placeholders for the dynamic parts
+            *variant: Other settings the static text depends on
+
+        Returns:
+            Compiled template
+        """
+        key = (agent, get_current_language(), *variant)
+        if self.enabled:
+            with self._lock:
+                template = self._templates.get(key)
+                if template is not None:
+                    self.stats["hits"] += 1
+                    return template
+
+        template = PromptTemplate(build())
+        with self._lock:
+            self.stats["builds"] += 1
+            if self.enabled:
+                self._templates[key] = template
+        return template
+
+    def clear(self) -> None:
+        """Drop all compiled templates"""
+        with self._lock:
+            self._templates.clear()
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Get template cache statistics"""
+        with self._lock:
+            return {**self.stats, "templates": len(self._templates)}
+
+
+# Shared cache: templates are compiled once per process
+_template_cache = PromptTemplateCache()
+
+
+def get_template_cache() -> PromptTemplateCache:
+    """Get the shared prompt template cache"""
+    return _template_cache
+
+
+def get_template(agent: str, build: Callable[[], str], *variant: Hashable) -> PromptTemplate:
+    """Template of an agent in the current language, from the shared cache"""
+    return _template_cache.get(agent, build, *variant)
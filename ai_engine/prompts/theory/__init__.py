@@ -5,8 +5,12 @@ Separated into agents for theory collection and verification
 
 from .collect_theory_agent import create_collect_theory
 from .analyse_theory_agent import create_analyse_theory
+from .scenarios import THEORY_SCENARIOS, ScenarioEvidence, TheoryScenario
 
 __all__ = [
     'create_collect_theory',
     'create_analyse_theory',
+    'THEORY_SCENARIOS',
+    'ScenarioEvidence',
+    'TheoryScenario',
 ]
\ No newline at end of file
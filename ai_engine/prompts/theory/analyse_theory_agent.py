@@ -4,6 +4,9 @@ Handles verification of detective's theory against possible murder scenarios
 """
 
 from ai_engine.prompts.prompt_config import get_rules_prompt
+from ai_engine.prompts.templates import get_template
+
+from .scenarios import THEORY_SCENARIOS, TheoryScenario
 
 
 def create_analyse_theory():
@@ -13,6 +16,12 @@ def create_analyse_theory():
     Returns:
         str: The formatted prompt with improved evidence recognition and validation.
     """
+    # Fully static: built once per language
+    return get_template("analyse_theory", _build_analyse_theory_template).render()
+
+
+def _build_analyse_theory_template():
+    """Build the complete verification prompt"""
     rules_prompt = get_rules_prompt()
     
     response_format = _get_response_format_section()
@@ -52,86 +61,26 @@ def _get_response_format_section():
 
 def _get_possible_scenarios_section():
     """Get the possible scenarios with evidence matching"""
-    return """## Possible Scenarios with Enhanced Evidence Matching
-    
-    ### Scenario 1: Margarett Holloway is guilty
-    **Motive Keywords:** pregnancy scandal, family honor, preserve reputation, prevent scandal, unwed pregnancy, bastard child, illegitimate child, family shame
-    **Required Evidence (need 2+ items with total score ≥ 3 points):**
-    - **Toxic mixtures/poison evidence (2 points):**
-      * Aliases: poison, toxic substance, deadly mixture, lethal compound, poisonous materials, chemical toxins, dangerous substances
-      * Location: Main Hall, Margarett's possession
-    - **Broken mirror in bedroom (1 point):**
-      * Aliases: shattered mirror, broken glass, damaged mirror, cracked mirror, destroyed mirror
-      * Location: Margarett's Bedroom
-    - **Opposition to Victor relationship (1.5 points):**
-      * Aliases: disapproval of Victor, against the relationship, opposed the romance, hostile to Victor, rejected Victor
-    - **Knowledge of pregnancy first (1.5 points):**
-      * Aliases: knew about pregnancy early, discovered pregnancy before others, was informed first, learned of condition
-    - **Access and opportunity (1 point):**
-      * Aliases: had access to poison, opportunity to poison, could administer toxin, access to victim's food/drink
-    
-    ### Scenario 2: Edgar Holloway is guilty
-    **Motive Keywords:** jealousy of Victor, secret love for Judith, unrequited love, romantic jealousy, love triangle, obsession with Judith
-    **Required Evidence (need 2+ items with total score ≥ 3 points):**
-    - **Fingerprint evidence (2 points):**
-      * Aliases: fingerprints on teacup, prints on cup, finger marks, digital evidence, forensic prints, hand prints
-      * Location: poisoned teacup, victim's cup
-    - **Alcohol bottles (1 point):**
-      * Aliases: empty bottles, alcohol containers, wine bottles, spirits, drinking evidence, bottle collection
-      * Location: Edgar's bedroom
-    - **Dark journal/diary (1.5 points):**
-      * Aliases: journal entries, diary, dark thoughts, written confessions, personal writings, disturbing notes
-    - **Jealousy toward Victor (1.5 points):**
-      * Aliases: envious of Victor, resentful of stable hand, hatred for Victor, competitive with Victor
-    - **Resentment toward Lord Blackwood (1 point):**
-      * Aliases: anger at uncle, bitter toward Lord, hostile to father figure, grudge against Blackwood
-    
-    ### Scenario 3: Arthur Cavendish is guilty
-    **Motive Keywords:** disinheritance, loss of inheritance, financial motive, cut from will, excluded from estate, money problems, inheritance threat
-    **Required Evidence (need 2+ items with total score ≥ 3 points):**
-    - **Ring with AC initials (2 points):**
-      * Aliases: signet ring, AC ring, Arthur's ring, initialed ring, monogrammed ring, personal jewelry
-      * Location: stable, near stables, horse area
-    - **Disinheritance letter (2 points):**
-      * Aliases: will changes, inheritance exclusion, Lord Blackwood's letter, legal document, estate papers
-    - **Father's marriage scheme (1.5 points):**
-      * Aliases: arranged marriage plot, father's plans, marriage arrangement, family scheme, strategic marriage
-    - **Loveless engagement (1 point):**
-      * Aliases: marriage without love, arranged engagement, forced betrothal, business arrangement
-    - **Financial interest (1 point):**
-      * Aliases: money motivation, estate interest, financial gain, material benefit, wealth pursuit
-    
-    ### Scenario 4: The Governess (Martha Higgins) is guilty
-    **Motive Keywords:** revenge for dismissal, fired suddenly, termination anger, employment revenge, dismissed unfairly, job loss revenge
-    **Required Evidence (need 2+ items with total score ≥ 3 points):**
-    - **Termination letter (2 points):**
-      * Aliases: dismissal letter, firing notice, termination document, Lady Blackwood's letter, employment end
-    - **Secret room knowledge (1.5 points):**
-      * Aliases: hidden room, secret passage, concealed area, servant's knowledge, house secrets
-      * Location: Servant's Quarters documentation
-    - **Household secrets access (1.5 points):**
-      * Aliases: knew family secrets, access to private information, insider knowledge, confidential access
-    - **Sudden dismissal (1 point):**
-      * Aliases: abrupt firing, unexpected termination, immediate dismissal, swift removal
-    - **Access to victim (1 point):**
-      * Aliases: access to Judith's food, medicine access, meal preparation, close contact opportunity
-    
-    ### Scenario 5: Victor Langley is guilty
-    **Motive Keywords:** forced marriage rage, Arthur marriage anger, secret relationship threatened, lover's jealousy, romantic desperation
-    **Required Evidence (need 2+ items with total score ≥ 3 points):**
-    - **Hidden message signed V (2 points):**
-      * Aliases: secret note, love letter, hidden letter, V signature, Victor's message, romantic correspondence
-    - **Struggle signs in stable (1.5 points):**
-      * Aliases: fight evidence, conflict signs, disturbance in stable, violence traces, altercation evidence
-      * Location: stable area
-    - **Victor's locket with Judith's picture (1.5 points):**
-      * Aliases: romantic locket, Judith's portrait, love token, hidden jewelry, personal memento
-      * Location: hidden in stables
-    - **Muddy boot prints (1.5 points):**
-      * Aliases: footprints, boot marks, mud tracks, shoe impressions, dirty prints
-      * Location: Judith's bedroom
-    - **Secret relationship (1 point):**
-      * Aliases: hidden romance, secret love affair, clandestine relationship, forbidden love"""
+    sections = "\n    \n".join(_format_scenario(scenario) for scenario in THEORY_SCENARIOS)
+    return f"""## Possible Scenarios with Enhanced Evidence Matching
+    
+{sections}"""
+
+
+def _format_scenario(scenario: TheoryScenario) -> str:
+    """Format one scenario of the table with its motive keywords and scored evidence"""
+    lines = [
+        f"    ### Scenario {scenario.number}: {scenario.title} is guilty",
+        f"    **Motive Keywords:** {', '.join(scenario.motive_keywords)}",
+        f"    **Required Evidence (need {scenario.min_evidence}+ items with total score ≥ {scenario.min_score:g} points):**",
+    ]
+    for evidence in scenario.evidence:
+        points = f"{evidence.points:g} point{'' if evidence.points == 1 else 's'}"
+        lines.append(f"    - **{evidence.label} ({points}):**")
+        lines.append(f"      * Aliases: {', '.join(evidence.aliases)}")
+        if evidence.location:
+            lines.append(f"      * Location: {evidence.location}")
+    return "\n".join(lines)
 
 
 def _get_verification_process_section():
@@ -0,0 +1,240 @@
+"""
+Theory Scenarios
+Structured table of the possible solutions, shared by the verification prompt
+and the local theory pre-scorer
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class ScenarioEvidence:
+    """One piece of evidence supporting a scenario"""
+    label: str
+    points: float
+    aliases: Tuple[str, ...]
+    location: Optional[str] = None
+    clues: Tuple[str, ...] = ()  # Game clues backing this evidence
+
+
+@dataclass(frozen=True)
+class TheoryScenario:
+    """One possible solution of the murder"""
+    number: int
+    title: str
+    culprit: str  # Canonical character name
+    motive_keywords: Tuple[str, ...]
+    evidence: Tuple[ScenarioEvidence, ...] = field(default_factory=tuple)
+    min_score: float = 3.0
+    min_evidence: int = 2
+
+
+THEORY_SCENARIOS: List[TheoryScenario] = [
+    TheoryScenario(
+        number=1,
+        title="Margarett Holloway",
+        culprit="Margarett Holloway",
+        motive_keywords=(
+            "pregnancy scandal", "family honor", "preserve reputation", "prevent scandal",
+            "unwed pregnancy", "bastard child", "illegitimate child", "family shame",
+        ),
+        evidence=(
+            ScenarioEvidence(
+                "Toxic mixtures/poison evidence", 2,
+                ("poison", "toxic substance", "deadly mixture", "lethal compound",
+                 "poisonous materials", "chemical toxins", "dangerous substances"),
+                location="Main Hall, Margarett's possession",
+                clues=("Small shrub", "Scented tea cup"),
+            ),
+            ScenarioEvidence(
+                "Broken mirror in bedroom", 1,
+                ("shattered mirror", "broken glass", "damaged mirror", "cracked mirror",
+                 "destroyed mirror"),
+                location="Margarett's Bedroom",
+                clues=("Broken mirror",),
+            ),
+            ScenarioEvidence(
+                "Opposition to Victor relationship", 1.5,
+                ("disapproval of Victor", "against the relationship", "opposed the romance",
+                 "hostile to Victor", "rejected Victor"),
+            ),
+            ScenarioEvidence(
+                "Knowledge of pregnancy first", 1.5,
+                ("knew about pregnancy early", "discovered pregnancy before others",
+                 "was informed first", "learned of condition"),
+                clues=("Basin",),
+            ),
+            ScenarioEvidence(
+                "Access and opportunity", 1,
+                ("had access to poison", "opportunity to poison", "could administer toxin",
+                 "access to victim's food/drink"),
+            ),
+        ),
+    ),
+    TheoryScenario(
+        number=2,
+        title="Edgar Holloway",
+        culprit="Edgar Holloway",
+        motive_keywords=(
+            "jealousy of Victor", "secret love for Judith", "unrequited love",
+            "romantic jealousy", "love triangle", "obsession with Judith",
+        ),
+        evidence=(
+            ScenarioEvidence(
+                "Fingerprint evidence", 2,
+                ("fingerprints on teacup", "prints on cup", "finger marks", "digital evidence",
+                 "forensic prints", "hand prints"),
+                location="poisoned teacup, victim's cup",
+                clues=("Scented tea cup",),
+            ),
+            ScenarioEvidence(
+                "Alcohol bottles", 1,
+                ("empty bottles", "alcohol containers", "wine bottles", "spirits",
+                 "drinking evidence", "bottle collection"),
+                location="Edgar's bedroom",
+                clues=("Empty alcohol bottles",),
+            ),
+            ScenarioEvidence(
+                "Dark journal/diary", 1.5,
+                ("journal entries", "diary", "dark thoughts", "written confessions",
+                 "personal writings", "disturbing notes"),
+                clues=("Edgar's personal journal", "Burnt journal page"),
+            ),
+            ScenarioEvidence(
+                "Jealousy toward Victor", 1.5,
+                ("envious of Victor", "resentful of stable hand", "hatred for Victor",
+                 "competitive with Victor"),
+            ),
+            ScenarioEvidence(
+                "Resentment toward Lord Blackwood", 1,
+                ("anger at uncle", "bitter toward Lord", "hostile to father figure",
+                 "grudge against Blackwood"),
+            ),
+        ),
+    ),
+    TheoryScenario(
+        number=3,
+        title="Arthur Cavendish",
+        culprit="Arthur Cavendish",
+        motive_keywords=(
+            "disinheritance", "loss of inheritance", "financial motive", "cut from will",
+            "excluded from estate", "money problems", "inheritance threat",
+        ),
+        evidence=(
+            ScenarioEvidence(
+                "Ring with AC initials", 2,
+                ("signet ring", "AC ring", "Arthur's ring", "initialed ring", "monogrammed ring",
+                 "personal jewelry"),
+                location="stable, near stables, horse area",
+                clues=("Ring with initials",),
+            ),
+            ScenarioEvidence(
+                "Disinheritance letter", 2,
+                ("will changes", "inheritance exclusion", "Lord Blackwood's letter",
+                 "legal document", "estate papers"),
+                clues=("Lord Blackwood's will",),
+            ),
+            ScenarioEvidence(
+                "Father's marriage scheme", 1.5,
+                ("arranged marriage plot", "father's plans", "marriage arrangement",
+                 "family scheme", "strategic marriage"),
+                clues=("Arthur's father's letter",),
+            ),
+            ScenarioEvidence(
+                "Loveless engagement", 1,
+                ("marriage without love", "arranged engagement", "forced betrothal",
+                 "business arrangement"),
+            ),
+            ScenarioEvidence(
+                "Financial interest", 1,
+                ("money motivation", "estate interest", "financial gain", "material benefit",
+                 "wealth pursuit"),
+            ),
+        ),
+    ),
+    TheoryScenario(
+        number=4,
+        title="The Governess (Martha Higgins)",
+        culprit="Martha Higgins",
+        motive_keywords=(
+            "revenge for dismissal", "fired suddenly", "termination anger", "employment revenge",
+            "dismissed unfairly", "job loss revenge",
+        ),
+        evidence=(
+            ScenarioEvidence(
+                "Termination letter", 2,
+                ("dismissal letter", "firing notice", "termination document",
+                 "Lady Blackwood's letter", "employment end"),
+                clues=("Dismissal letter",),
+            ),
+            ScenarioEvidence(
+                "Secret room knowledge", 1.5,
+                ("hidden room", "secret passage", "concealed area", "servant's knowledge",
+                 "house secrets"),
+                location="Servant's Quarters documentation",
+            ),
+            ScenarioEvidence(
+                "Household secrets access", 1.5,
+                ("knew family secrets", "access to private information", "insider knowledge",
+                 "confidential access"),
+            ),
+            ScenarioEvidence(
+                "Sudden dismissal", 1,
+                ("abrupt firing", "unexpected termination", "immediate dismissal", "swift removal"),
+            ),
+            ScenarioEvidence(
+                "Access to victim", 1,
+                ("access to Judith's food", "medicine access", "meal preparation",
+                 "close contact opportunity"),
+            ),
+        ),
+    ),
+    TheoryScenario(
+        number=5,
+        title="Victor Langley",
+        culprit="Victor Langley",
+        motive_keywords=(
+            "forced marriage rage", "Arthur marriage anger", "secret relationship threatened",
+            "lover's jealousy", "romantic desperation",
+        ),
+        evidence=(
+            ScenarioEvidence(
+                "Hidden message signed V", 2,
+                ("secret note", "love letter", "hidden letter", "V signature", "Victor's message",
+                 "romantic correspondence"),
+                clues=("Message signed V", "Hidden message"),
+            ),
+            ScenarioEvidence(
+                "Struggle signs in stable", 1.5,
+                ("fight evidence", "conflict signs", "disturbance in stable", "violence traces",
+                 "altercation evidence"),
+                location="stable area",
+                clues=("Signs of struggle",),
+            ),
+            ScenarioEvidence(
+                "Victor's locket with Judith's picture", 1.5,
+                ("romantic locket", "Judith's portrait", "love token", "hidden jewelry",
+                 "personal memento"),
+                location="hidden in stables",
+                clues=("Locket with photo",),
+            ),
+            ScenarioEvidence(
+                "Muddy boot prints", 1.5,
+                ("footprints", "boot marks", "mud tracks", "shoe impressions", "dirty prints"),
+                location="Judith's bedroom",
+                clues=("Fresh muddy boot prints", "Muddy boot prints"),
+            ),
+            ScenarioEvidence(
+                "Secret relationship", 1,
+                ("hidden romance", "secret love affair", "clandestine relationship",
+                 "forbidden love"),
+            ),
+        ),
+    ),
+]
+
+
+def get_scenario_by_culprit(culprit: str) -> Optional[TheoryScenario]:
+    """Scenario whose culprit is the given canonical character name"""
+    return next((s for s in THEORY_SCENARIOS if s.culprit == culprit), None)
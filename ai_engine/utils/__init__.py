@@ -18,9 +18,14 @@ from .tools import (
     get_collect_theory_tools,
     get_analyse_theory_tools,
     get_write_ending_tools,
-    get_process_command_tools
+    get_process_command_tools,
+    get_command_pipeline_tools
 )
 
+from .tokens import count_text_tokens, estimate_text_tokens, estimate_tokens, get_tokenizer_name
+
+from .state_delta import GameStateDeltaRenderer
+
 from .personality import (
     PersonalityContext,
     generate_personality_instructions,
@@ -41,11 +46,21 @@ __all__ = [
     'get_analyse_theory_tools', 
     'get_write_ending_tools',
     'get_process_command_tools',
+    'get_command_pipeline_tools',
     
     # Personality
     'PersonalityContext',
     'generate_personality_instructions',
-    'create_personality_context'
+    'create_personality_context',
+    
+    # Tokens
+    'count_text_tokens',
+    'estimate_text_tokens',
+    'estimate_tokens',
+    'get_tokenizer_name',
+
+    # State deltas
+    'GameStateDeltaRenderer',
 
     # Logs
     'log_ai_response',
@@ -1,67 +1,472 @@
-from enum import Enum
-from typing import Dict, List
+"""
+Keyword-based severity classifier for nonsense actions
+"""
+
 import re
+import unicodedata
+from enum import Enum
+from typing import Dict, List, Optional, Pattern
+
+DEFAULT_LANGUAGE = "english"
+
 
 class ActionSeverity(Enum):
     IMPROMPTU = "impromptu"
-    AWKWARD = "awkward"  
+    AWKWARD = "awkward"
     DANGEROUS = "dangerous"
     UNKNOWN = "unknown"
 
+
+# Checked from the most to the least severe: one dangerous word outweighs any other
+SEVERITY_ORDER = [ActionSeverity.DANGEROUS, ActionSeverity.AWKWARD, ActionSeverity.IMPROMPTU]
+
+# Keywords per language code and severity, one entry per word with its inflections
+# separated by "|". Languages written with spaces match whole words only ("kick" does
+# not match "kickboxing"); Korean keywords are stems matched at the start of a word,
+# since particles and verb endings attach to them; Chinese and Japanese keywords match
+# anywhere. Accents on Latin letters are ignored on both sides.
+SEVERITY_KEYWORDS: Dict[str, Dict[ActionSeverity, List[str]]] = {
+    "english": {
+        ActionSeverity.DANGEROUS: [
+            "hit|hits|hitting", "punch|punches|punched|punching", "slap|slaps|slapped|slapping",
+            "kick|kicks|kicked|kicking", "attack|attacks|attacked|attacking",
+            "strike|strikes|struck|striking", "beat|beats|beaten|beating",
+            "kill|kills|killed|killing", "murder|murders|murdered|murdering",
+            "strangle|strangles|strangled|strangling", "choke|chokes|choked|choking",
+            "stab|stabs|stabbed|stabbing", "shoot|shoots|shooting|shot at",
+            "destroy|destroys|destroyed|destroying", "break|breaks|broke|broken|breaking",
+            "smash|smashes|smashed|smashing", "burn|burns|burned|burnt|burning",
+            "vandalize|vandalizes|vandalized|vandalizing|vandalise|vandalises|vandalised|vandalising",
+            "poison|poisons|poisoned|poisoning", "deadly", "lethal", "hate|hates|hated|hating",
+            "racist|racists|racism", "threaten|threatens|threatened|threatening|threat|threats",
+            "knife|knives", "gun|guns",
+        ],
+        ActionSeverity.AWKWARD: [
+            "sing|sings|sang|singing", "dance|dances|danced|dancing",
+            "shout|shouts|shouted|shouting", "scream|screams|screamed|screaming",
+            "yell|yells|yelled|yelling", "jump|jumps|jumped|jumping",
+            "crawl|crawls|crawled|crawling", "roll|rolls|rolled|rolling",
+            "throw myself|throws myself|threw myself|throwing myself", "revolution",
+            "ritual|rituals", "ceremony|ceremonies", "strip|strips|stripped|stripping",
+            "undress|undresses|undressed|undressing", "naked",
+            "propose|proposes|proposed|proposing", "marry|marries|married|marrying",
+            "declare my love", "kiss|kisses|kissed|kissing", "lick|licks|licked|licking",
+            "howl|howls|howled|howling", "bark|barks|barked|barking",
+        ],
+        ActionSeverity.IMPROMPTU: [
+            "fart|farts|farted|farting", "burp|burps|burped|burping",
+            "hiccup|hiccups|hiccuped|hiccupped|hiccuping|hiccupping",
+            "belch|belches|belched|belching", "trip|trips|tripped|tripping",
+            "stumble|stumbles|stumbled|stumbling", "slip|slips|slipped|slipping",
+            "sneeze|sneezes|sneezed|sneezing", "cough|coughs|coughed|coughing",
+            "yawn|yawns|yawned|yawning", "giggle|giggles|giggled|giggling",
+            "whistle|whistles|whistled|whistling", "sniff|sniffs|sniffed|sniffing",
+            "scratch|scratches|scratched|scratching", "stretch|stretches|stretched|stretching",
+        ],
+    },
+    "french": {
+        ActionSeverity.DANGEROUS: [
+            "frappe|frappes|frappent|frapper|frappons|frappez|frappant",
+            "gifle|gifles|giflent|gifler|giflons|giflez", "cogne|cognes|cognent|cogner|cognez",
+            "attaque|attaques|attaquent|attaquer|attaquons|attaquez",
+            "tue|tues|tuent|tuer|tuons|tuez",
+            "assassine|assassines|assassinent|assassiner|assassinez",
+            "etrangle|etrangles|etranglent|etrangler|etranglez",
+            "egorge|egorges|egorgent|egorger|egorgez",
+            "poignarde|poignardes|poignardent|poignarder|poignardez",
+            "detruis|detruit|detruisent|detruire|detruisons|detruisez",
+            "casse|casses|cassent|casser|cassons|cassez", "brule|brules|brulent|bruler|brulez",
+            "incendie|incendies|incendient|incendier|incendiez",
+            "vandalise|vandalises|vandalisent|vandaliser|vandalisez|vandalisme",
+            "empoisonne|empoisonnes|empoisonnent|empoisonner|empoisonnez",
+            "mortel|mortelle|mortels|mortelles", "menace|menaces|menacent|menacer|menacez",
+            "haine", "hais|hait|haissent|hair|haissez", "raciste|racistes|racisme",
+            "couteau|couteaux", "pistolet|pistolets", "fusil|fusils",
+        ],
+        ActionSeverity.AWKWARD: [
+            "chante|chantes|chantent|chanter|chantons|chantez",
+            "danse|danses|dansent|danser|dansons|dansez", "crie|cries|crient|crier|criez",
+            "hurle|hurles|hurlent|hurler|hurlez", "saute|sautes|sautent|sauter|sautez",
+            "rampe|rampes|rampent|ramper|rampez", "roule|roules|roulent|rouler|roulez",
+            "revolution", "rituel|rituels", "ceremonie|ceremonies",
+            "deshabille|deshabilles|deshabillent|deshabiller|deshabillez", "a poil",
+            "en mariage", "epouse|epouses|epousent|epouser|epousez",
+            "embrasse|embrasses|embrassent|embrasser|embrassez",
+            "leche|leches|lechent|lecher|lechez", "aboie|aboies|aboient|aboyer|aboyez",
+            "mon amour",
+        ],
+        ActionSeverity.IMPROMPTU: [
+            "pete|petes|petent|peter|petez", "prout", "rote|rotes|rotent|roter|rotez",
+            "hoquet", "trebuche|trebuches|trebuchent|trebucher",
+            "glisse|glisses|glissent|glisser", "eternue|eternues|eternuent|eternuer",
+            "tousse|tousses|toussent|tousser", "baille|bailles|baillent|bailler",
+            "ricane|ricanes|ricanent|ricaner", "siffle|siffles|sifflent|siffler",
+            "gratte|grattes|grattent|gratter", "etire|etires|etirent|etirer",
+        ],
+    },
+    "spanish": {
+        ActionSeverity.DANGEROUS: [
+            "golpeo|golpeas|golpea|golpean|golpear|golpe|golpes", "pego|pegas|pega|pegan|pegar",
+            "abofeteo|abofeteas|abofetea|abofetear", "pateo|pateas|patea|patear|patada|patadas",
+            "ataco|atacas|ataca|atacan|atacar", "mato|matas|mata|matan|matar",
+            "asesino|asesinas|asesina|asesinar", "estrangulo|estrangulas|estrangula|estrangular",
+            "apunalo|apunalas|apunala|apunalar", "destruyo|destruyes|destruye|destruir",
+            "rompo|rompes|rompe|romper", "quemo|quemas|quema|quemar",
+            "incendio|incendias|incendia|incendiar", "vandalizo|vandaliza|vandalizar|vandalismo",
+            "enveneno|envenenas|envenena|envenenar", "mortal|mortales",
+            "odio|odias|odia|odiar", "racista|racistas|racismo",
+            "amenazo|amenazas|amenaza|amenazar", "cuchillo|cuchillos", "pistola|pistolas",
+        ],
+        ActionSeverity.AWKWARD: [
+            "canto|cantas|canta|cantar", "bailo|bailas|baila|bailar|baile",
+            "grito|gritas|grita|gritar", "chillo|chillas|chilla|chillar",
+            "salto|saltas|salta|saltar", "gateo|gateas|gatea|gatear", "ruedo|ruedas|rueda|rodar",
+            "revolucion", "ritual|rituales", "ceremonia",
+            "desnudo|desnuda|desnudarme|desnudar", "quito la ropa|quita la ropa", "matrimonio",
+            "me caso|casar|casarme|casarnos", "beso|besas|besa|besar", "lamo|lames|lame|lamer",
+            "ladro|ladras|ladra|ladrar", "aullo|aullas|aulla|aullar",
+        ],
+        ActionSeverity.IMPROMPTU: [
+            "pedo|pedos", "eructo|eructas|eructa|eructar",
+            "tropiezo|tropiezas|tropieza|tropezar", "resbalo|resbalas|resbala|resbalar",
+            "estornudo|estornudas|estornuda|estornudar", "toso|toses|tose|toser|tos",
+            "bostezo|bostezas|bosteza|bostezar", "silbo|silbas|silba|silbar",
+            "rasco|rascas|rasca|rascar",
+        ],
+    },
+    "german": {
+        ActionSeverity.DANGEROUS: [
+            "schlage|schlagst|schlagt|schlagen", "haue|haust|hauen",
+            "trete|trittst|tritt|treten", "angreifen|greife an|greift an|greifen an|angriff",
+            "tote|totest|totet|toten", "ermorde|ermordest|ermordet|ermorden", "morde|mordet|morden",
+            "erwurge|erwurgst|erwurgt|erwurgen", "wurge|wurgst|wurgt|wurgen",
+            "ersteche|erstichst|ersticht|erstechen", "zerstore|zerstorst|zerstort|zerstoren",
+            "kaputt", "zerbreche|zerbrichst|zerbricht|zerbrechen",
+            "brenne|brennst|brennt|brennen", "verbrenne|verbrennst|verbrennt|verbrennen",
+            "anzunden|zunde an|zundet an", "vergifte|vergiftest|vergiftet|vergiften",
+            "todlich|todliche", "hasse|hasst|hassen|hass", "rassist|rassistisch|rassistische",
+            "drohe|drohst|droht|drohen", "bedrohe|bedrohst|bedroht|bedrohen",
+            "messer", "pistole", "waffe|waffen",
+        ],
+        ActionSeverity.AWKWARD: [
+            "singe|singst|singt|singen", "tanze|tanzt|tanzen", "schreie|schreist|schreit|schreien",
+            "brulle|brullst|brullt|brullen", "springe|springst|springt|springen",
+            "krieche|kriechst|kriecht|kriechen", "rolle|rollst|rollt|rollen", "revolution",
+            "ritual", "zeremonie", "ziehe mich aus|ausziehen", "nackt",
+            "heirate|heiratest|heiratet|heiraten", "kusse|kusst|kussen|kuss",
+            "lecke|leckst|leckt|lecken", "belle|bellst|bellt|bellen",
+            "heule|heulst|heult|heulen",
+        ],
+        ActionSeverity.IMPROMPTU: [
+            "furze|furzt|furzen|furz", "rulpse|rulpst|rulpsen", "schluckauf",
+            "stolpere|stolperst|stolpert|stolpern", "rutsche|rutschst|rutscht|rutschen|ausrutschen",
+            "niese|niest|niesen", "huste|hustest|hustet|husten", "gahne|gahnst|gahnt|gahnen",
+            "kichere|kicherst|kichert|kichern", "pfeife|pfeifst|pfeift|pfeifen",
+            "kratze|kratzt|kratzen",
+        ],
+    },
+    "italian": {
+        ActionSeverity.DANGEROUS: [
+            "colpisco|colpisci|colpisce|colpire", "picchio|picchi|picchia|picchiare",
+            "schiaffeggio|schiaffeggia|schiaffeggiare|schiaffo", "calcia|calciare|prendo a calci",
+            "attacco|attacchi|attacca|attaccare", "uccido|uccidi|uccide|uccidere",
+            "ammazzo|ammazzi|ammazza|ammazzare", "assassino|assassina|assassinare",
+            "strangolo|strangola|strangolare", "soffoco|soffoca|soffocare",
+            "pugnalo|pugnala|pugnalare", "distruggo|distruggi|distrugge|distruggere",
+            "rompo|rompi|rompe|rompere", "brucio|bruci|brucia|bruciare",
+            "incendio|incendia|incendiare", "vandalizzo|vandalizza|vandalizzare",
+            "avveleno|avvelena|avvelenare", "mortale|mortali", "odio|odi|odia|odiare",
+            "razzista|razzisti|razzismo", "minaccio|minacci|minaccia|minacciare",
+            "coltello|coltelli", "pistola|pistole",
+        ],
+        ActionSeverity.AWKWARD: [
+            "canto|canti|canta|cantare", "ballo|balli|balla|ballare", "grido|gridi|grida|gridare",
+            "urlo|urli|urla|urlare", "salto|salti|salta|saltare",
+            "striscio|strisci|striscia|strisciare", "rotolo|rotoli|rotola|rotolare",
+            "rivoluzione", "rituale", "cerimonia", "spoglio|spogli|spoglia|spogliare|spogliarmi",
+            "nudo|nuda", "sposo|sposi|sposa|sposare|sposami", "matrimonio",
+            "bacio|baci|bacia|baciare", "lecco|lecchi|lecca|leccare",
+            "abbaio|abbai|abbaia|abbaiare", "ululo|ululi|ulula|ululare",
+        ],
+        ActionSeverity.IMPROMPTU: [
+            "scoreggio|scoreggi|scoreggia|scoreggiare", "rutto|rutti|rutta|ruttare",
+            "singhiozzo|singhiozza|singhiozzare", "inciampo|inciampi|inciampa|inciampare",
+            "scivolo|scivoli|scivola|scivolare", "starnutisco|starnutisce|starnutire|starnuto",
+            "tossisco|tossisce|tossire", "sbadiglio|sbadigli|sbadiglia|sbadigliare",
+            "ridacchio|ridacchi|ridacchia|ridacchiare", "fischio|fischi|fischia|fischiare",
+            "gratto|gratti|gratta|grattare",
+        ],
+    },
+    "portuguese": {
+        ActionSeverity.DANGEROUS: [
+            "bato|bates|bate|batem|bater", "soco|socos|soca|socar",
+            "esbofeteio|esbofeteia|esbofetear", "chuto|chutas|chuta|chutar",
+            "ataco|atacas|ataca|atacar", "mato|matas|mata|matar",
+            "assassino|assassina|assassinar", "estrangulo|estrangula|estrangular",
+            "esfaqueio|esfaqueia|esfaquear", "destruo|destroi|destruir",
+            "quebro|quebras|quebra|quebrar", "queimo|queimas|queima|queimar",
+            "incendeio|incendeia|incendiar", "vandalizo|vandaliza|vandalizar",
+            "enveneno|envenena|envenenar", "mortal|mortais", "odeio|odeias|odeia|odiar|odio",
+            "racista|racistas|racismo", "ameaco|ameacas|ameaca|ameacar", "faca|facas",
+            "pistola|pistolas",
+        ],
+        ActionSeverity.AWKWARD: [
+            "canto|cantas|canta|cantar", "danco|dancas|danca|dancar", "grito|gritas|grita|gritar",
+            "berro|berras|berra|berrar", "pulo|pulas|pula|pular", "salto|saltas|salta|saltar",
+            "rastejo|rastejas|rasteja|rastejar", "rolo|rolas|rola|rolar", "revolucao", "ritual",
+            "cerimonia", "dispo|despe|despir", "pelado|pelada", "casamento", "casar|casarmos",
+            "beijo|beijas|beija|beijar", "lambo|lambes|lambe|lamber", "lato|lates|late|latir",
+            "uivo|uivas|uiva|uivar",
+        ],
+        ActionSeverity.IMPROMPTU: [
+            "peido|peidas|peida|peidar", "arroto|arrotas|arrota|arrotar", "soluco|solucos|solucar",
+            "tropeco|tropecas|tropeca|tropecar", "escorrego|escorregas|escorrega|escorregar",
+            "espirro|espirras|espirra|espirrar", "tusso|tosses|tosse|tossir",
+            "bocejo|bocejas|boceja|bocejar", "assobio|assobias|assobia|assobiar",
+        ],
+    },
+    "russian": {
+        ActionSeverity.DANGEROUS: [
+            "ударить|ударю|ударил|ударила|ударяю|удар", "бить|бью|бьет|бьёт|бей|избить|избиваю",
+            "пнуть|пну|пнул|пнула|пинаю", "атаковать|атакую|атакует|напасть|нападу|нападаю",
+            "убить|убью|убил|убила|убей|убиваю|убийство", "задушить|задушу|душить",
+            "зарезать|зарежу", "разрушить|разрушу|разрушаю", "сломать|сломаю|ломаю",
+            "разбить|разобью|разбиваю|разбей", "сжечь|сожгу|сжигаю",
+            "поджечь|подожгу|поджигаю", "отравить|отравлю|отравляю",
+            "смертельный|смертельно", "ненавижу|ненавидеть|ненависть", "расист|расизм",
+            "угрожать|угрожаю|угроза", "нож|ножом", "пистолет|пистолетом",
+        ],
+        ActionSeverity.AWKWARD: [
+            "петь|пою|поет|поёт|спою|спеть", "танцевать|танцую|танцует",
+            "плясать|пляшу", "кричать|кричу|кричит", "вопить|воплю",
+            "прыгать|прыгаю|прыгнуть|прыгну", "ползти|ползу|ползаю", "катаюсь",
+            "революция|революцию", "ритуал", "церемония|церемонию",
+            "раздеваюсь|раздеться|раздеваться", "голый|голая|голым", "жениться|женюсь",
+            "выйти замуж", "предложение руки", "целовать|целую|поцеловать|поцелую",
+            "лизать|лижу", "лаять|лаю", "выть|вою",
+        ],
+        ActionSeverity.IMPROMPTU: [
+            "пукнуть|пукнул|пукаю", "пердеть", "рыгнуть|рыгнул|рыгаю",
+            "икать|икаю|икота|икоту", "споткнуться|споткнулся|спотыкаюсь",
+            "поскользнуться|поскользнулся|поскальзываюсь", "чихать|чихаю|чихнуть|чихнул",
+            "кашлять|кашляю", "зевать|зеваю|зевнуть", "хихикать|хихикаю",
+            "свистеть|свищу", "чесаться|чешусь|почесать",
+        ],
+    },
+    "chinese_simplified": {
+        ActionSeverity.DANGEROUS: [
+            "打人", "殴打", "打他", "打她", "揍", "踢", "攻击", "杀", "掐", "勒死", "刺",
+            "捅", "毁", "砸", "破坏", "烧", "放火", "毒", "致命", "恨", "种族", "威胁", "刀", "枪",
+        ],
+        ActionSeverity.AWKWARD: [
+            "唱", "跳", "舞", "喊", "尖叫", "大叫", "吼", "爬", "打滚", "滚", "革命", "仪式",
+            "典礼", "脱衣", "脱光", "裸", "求婚", "结婚", "吻", "舔", "狗叫", "嚎",
+        ],
+        ActionSeverity.IMPROMPTU: [
+            "屁", "打嗝", "嗝", "绊", "滑倒", "喷嚏", "咳", "哈欠", "傻笑", "口哨", "挠",
+            "伸懒腰",
+        ],
+    },
+    "japanese": {
+        ActionSeverity.DANGEROUS: [
+            "殴", "叩", "たたく", "蹴", "攻撃", "殺", "ころす", "絞め", "刺", "壊", "こわす",
+            "破壊", "燃や", "放火", "毒", "致命", "憎", "差別", "脅", "包丁", "ナイフ", "銃",
+        ],
+        ActionSeverity.AWKWARD: [
+            "歌", "踊", "叫", "跳", "ジャンプ", "這", "転が", "革命", "儀式", "脱", "裸",
+            "求婚", "プロポーズ", "結婚", "キス", "舐", "吠",
+        ],
+        ActionSeverity.IMPROMPTU: [
+            "おなら", "屁", "げっぷ", "しゃっくり", "つまず", "躓", "滑", "くしゃみ", "咳",
+            "あくび", "欠伸", "くすくす", "口笛", "掻",
+        ],
+    },
+    "korean": {
+        ActionSeverity.DANGEROUS: [
+            "때리", "때려", "때린", "주먹", "뺨", "발로 차", "걷어차", "공격", "죽이", "죽여",
+            "살해", "목을 조르", "찌르", "찔러", "부수", "부숴", "파괴", "깨뜨", "태우",
+            "불태", "불을 지르", "독을", "독살", "치명", "증오", "혐오", "인종차별", "협박",
+            "위협", "칼로", "칼을", "총으로", "총을",
+        ],
+        ActionSeverity.AWKWARD: [
+            "노래", "춤", "소리치", "소리 지르", "비명", "고함", "점프", "뛰어", "기어",
+            "구르", "굴러", "혁명", "의식", "의례", "옷을 벗", "벗어", "알몸", "청혼",
+            "결혼", "키스", "핥", "짖", "울부짖",
+        ],
+        ActionSeverity.IMPROMPTU: [
+            "방귀", "트림", "딸꾹질", "넘어지", "미끄러", "재채기", "기침", "하품", "킥킥",
+            "휘파람", "긁",
+        ],
+    },
+}
+
+# Harmless idioms built on a keyword, removed before matching ("break into song",
+# "kill time"). Regexes over folded text, a space matches any whitespace.
+HARMLESS_PHRASES: Dict[str, List[str]] = {
+    "english": [
+        r"(?:break|breaks|broke|breaking) into (?:a )?(?:song|dance|laughter|tears|smile|grin|applause)",
+        r"(?:break|breaks|broke|breaking) (?:the ice|the silence|the news|a leg|a sweat|bread)",
+        r"(?:hit|hits|hitting) (?:the dance floor|the road|the sack|the hay|the books|it off)",
+        r"(?:kick|kicks|kicked|kicking) (?:off|back|the habit)",
+        r"(?:shoot|shoots|shot|shooting) (?:a|an) (?:glance|look|smile|wink)",
+        r"(?:shoot|shoots|shot|shooting) the breeze",
+        r"(?:kill|kills|killed|killing) (?:some )?time", r"dressed to kill",
+        r"(?:beat|beats|beating) around the bush", r"(?:heart|hearts) (?:beat|beats|beating)",
+        r"(?:choke|chokes|choked|choking) on", r"(?:burn|burns|burned|burning) the midnight oil",
+        r"(?:hate|hates|hated) to",
+    ],
+    "french": [
+        r"(?:tue|tues|tuent|tuer|tuons|tuez) le temps",
+        r"(?:frappe|frappes|frappent|frapper|frappons|frappez) a la porte",
+        r"casse-croute", r"(?:casse|casser|cassons|cassez) la croute",
+        r"(?:me|te|se) (?:casse|casses|cassent|casser)",
+        r"(?:casse|casses|cassent|casser|cassez) les pieds",
+    ],
+    "spanish": [
+        r"(?:mato|matas|mata|matan|matar) el tiempo",
+        r"(?:rompo|rompes|rompe|romper) (?:a cantar|a reir|a llorar|a bailar|el hielo)",
+        r"(?:golpeo|golpea|golpear) la puerta",
+    ],
+    "german": [
+        r"(?:schlage|schlagst|schlagt|schlagen) vor", r"(?:trete|trittst|tritt|treten) ein",
+        r"(?:tote|totest|totet|toten) die zeit",
+    ],
+    "italian": [
+        r"(?:ammazzo|ammazzi|ammazza|ammazzare) il tempo",
+        r"(?:rompo|rompi|rompe|rompere) il ghiaccio",
+    ],
+    "portuguese": [
+        r"(?:mato|matas|mata|matar) o tempo",
+        r"(?:bato|bates|bate|bater) (?:a|na) porta",
+        r"(?:quebro|quebras|quebra|quebrar) o gelo",
+    ],
+    "russian": [
+        r"(?:убить|убиваю|убиваем) время",
+    ],
+}
+
+# Languages whose keywords are stems matched at the start of a word
+_STEM_LANGUAGES = {"korean"}
+
+# Scripts written without spaces between words
+_UNSPACED_SCRIPT = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff]")
+
+
+def fold_text(text: str) -> str:
+    """Lowercase text with accents removed from Latin letters (kana and hangul are kept intact)"""
+    folded = []
+    for char in unicodedata.normalize("NFD", text.casefold()):
+        if unicodedata.combining(char) and folded and folded[-1] < "\u0250":
+            continue
+        folded.append(char)
+    return unicodedata.normalize("NFC", "".join(folded))
+
+
+def _keyword_pattern(keyword: str, language: str) -> str:
+    """Regex for one keyword form: whole word (stem in Korean), any whitespace between words"""
+    keyword = fold_text(keyword)
+    body = r"\s+".join(re.escape(word) for word in keyword.split())
+    if _UNSPACED_SCRIPT.match(keyword):
+        return body
+    if language in _STEM_LANGUAGES:
+        return r"(?<!\w)" + body
+    return r"(?<!\w)" + body + r"(?!\w)"
+
+
 class ActionClassifier:
-    """Classifie automatiquement les actions nonsense selon leur gravité"""
-    
-    # Patterns d'actions par catégorie
-    IMPROMPTU_PATTERNS = [
-        r"fart|burp|hiccup|belch",
-        r"trip|stumble|slip", 
-        r"sneeze|cough|yawn",
-        r"minor.*social|small.*mistake|awkward.*silence"
-    ]
-    
-    AWKWARD_PATTERNS = [
-        r"sing|dance|shout|scream|yell",
-        r"jump|crawl|roll|throw.*self",
-        r"revolution|strange.*ritual|weird.*ceremony",
-        r"strip|undress|inappropriate.*touch",
-        r"propose.*marriage|declare.*love"
-    ]
-    
-    DANGEROUS_PATTERNS = [
-        r"hit|punch|slap|kick|attack|strike|beat",
-        r"kill|murder|strangle|choke",
-        r"destroy|break|smash|burn|vandalize",
-        r"poison|deadly|lethal|dangerous.*substance",
-        r"hate|racist|violent.*threat"
-    ]
-    
+    """
+    Classifies nonsense actions by severity without an AI call.
+
+    Each language's keywords (plus the English ones, which players often mix in) are
+    compiled once into a single alternation with one named group per severity, so a
+    command is scanned in one pass; the most severe match wins. Harmless idioms are
+    removed first, and a command without any keyword has no local severity.
+    """
+
+    _patterns: Dict[str, Pattern] = {}
+    _harmless: Dict[str, Optional[Pattern]] = {}
+
+    @staticmethod
+    def _languages(language: str) -> List[str]:
+        """Keyword tables used for a language: English first, then the language itself"""
+        language = (language or DEFAULT_LANGUAGE).lower()
+        if language not in SEVERITY_KEYWORDS or language == DEFAULT_LANGUAGE:
+            return [DEFAULT_LANGUAGE]
+        return [DEFAULT_LANGUAGE, language]
+
+    @classmethod
+    def get_pattern(cls, language: str = DEFAULT_LANGUAGE) -> Pattern:
+        """Compiled severity pattern of a language (unknown languages use English)"""
+        languages = cls._languages(language)
+        pattern = cls._patterns.get(languages[-1])
+        if pattern is None:
+            groups = []
+            for severity in SEVERITY_ORDER:
+                alternatives = {
+                    _keyword_pattern(form, code)
+                    for code in languages
+                    for keyword in SEVERITY_KEYWORDS[code][severity]
+                    for form in keyword.split("|")
+                }
+                # Longest first, so multi-word keywords win over their first word
+                alternatives = sorted(alternatives, key=len, reverse=True)
+                groups.append(f"(?P<{severity.value}>{'|'.join(alternatives)})")
+
+            pattern = re.compile("|".join(groups))
+            cls._patterns[languages[-1]] = pattern
+        return pattern
+
+    @classmethod
+    def get_harmless_pattern(cls, language: str = DEFAULT_LANGUAGE) -> Optional[Pattern]:
+        """Compiled harmless idiom pattern of a language, None when it has no idioms"""
+        languages = cls._languages(language)
+        if languages[-1] not in cls._harmless:
+            phrases = [
+                phrase.replace(" ", r"\s+")
+                for code in languages
+                for phrase in HARMLESS_PHRASES.get(code, [])
+            ]
+            cls._harmless[languages[-1]] = (
+                re.compile(r"(?<!\w)(?:" + "|".join(phrases) + r")(?!\w)") if phrases else None
+            )
+        return cls._harmless[languages[-1]]
+
+    @classmethod
+    def find_severity(cls, command: str, language: str = DEFAULT_LANGUAGE) -> Optional[ActionSeverity]:
+        """
+        Most severe keyword found in a command
+
+        Args:
+            command: Player's command
+            language: Language code of the player (e.g. "english", "french")
+
+        Returns:
+            ActionSeverity of the most severe keyword, None if no keyword matched
+        """
+        text = fold_text(command)
+        harmless = cls.get_harmless_pattern(language)
+        if harmless is not None:
+            text = harmless.sub(" ", text)
+
+        found = None
+        for match in cls.get_pattern(language).finditer(text):
+            severity = ActionSeverity(match.lastgroup)
+            if found is None or SEVERITY_ORDER.index(severity) < SEVERITY_ORDER.index(found):
+                found = severity
+                if found == ActionSeverity.DANGEROUS:
+                    break
+        return found
+
     @classmethod
-    def classify_action(cls, command: str) -> ActionSeverity:
+    def classify_action(cls, command: str, language: str = DEFAULT_LANGUAGE) -> ActionSeverity:
         """
-        Classifie une action selon sa gravité
-        
+        Classify an action by severity
+
         Args:
-            command: Commande du joueur
-            
+            command: Player's command
+            language: Language code of the player
+
         Returns:
-            ActionSeverity correspondante
+            Matching ActionSeverity, AWKWARD when no keyword matched
         """
-        command_lower = command.lower()
-        
-        # Vérifier les patterns dangereux en premier
-        for pattern in cls.DANGEROUS_PATTERNS:
-            if re.search(pattern, command_lower):
-                return ActionSeverity.DANGEROUS
-        
-        # Puis les patterns awkward
-        for pattern in cls.AWKWARD_PATTERNS:
-            if re.search(pattern, command_lower):
-                return ActionSeverity.AWKWARD
-        
-        # Puis les patterns impromptu
-        for pattern in cls.IMPROMPTU_PATTERNS:
-            if re.search(pattern, command_lower):
-                return ActionSeverity.IMPROMPTU
-        
-        # Par défaut, considérer comme awkward si non classifié
-        return ActionSeverity.AWKWARD
\ No newline at end of file
+        return cls.find_severity(command, language) or ActionSeverity.AWKWARD
@@ -2,16 +2,24 @@
 # Fichier: ai_engine/formatters.py
 
 import logging
-from typing import Any, Dict
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Rendered text by (session, state version), for dictionaries from GameState.to_ai_format()
+FORMATTED_STATE_CACHE_SIZE = 32
+_formatted_states: "OrderedDict[Tuple[str, int], str]" = OrderedDict()
+_formatted_states_lock = threading.Lock()
+
 
 def format_game_state(game_state: Dict[str, Any]) -> str:
     """
     Converts the game state to text format for the prompt.
     Now handles both legacy and new GameState formats defensively.
+    Versioned states (session_id and state_version keys) are rendered once per version.
 
     Args:
         game_state: Game state dictionary (from GameState.to_ai_format() or legacy format)
@@ -19,6 +27,26 @@ def format_game_state(game_state: Dict[str, Any]) -> str:
     Returns:
         Formatted text string for AI consumption
     """
+    key = None
+    if isinstance(game_state, dict) and "state_version" in game_state:
+        key = (game_state.get("session_id"), game_state["state_version"])
+        with _formatted_states_lock:
+            text = _formatted_states.get(key)
+            if text is not None:
+                _formatted_states.move_to_end(key)
+                return text
+
+    text = _format_game_state(game_state)
+    if key is not None:
+        with _formatted_states_lock:
+            _formatted_states[key] = text
+            while len(_formatted_states) > FORMATTED_STATE_CACHE_SIZE:
+                _formatted_states.popitem(last=False)
+    return text
+
+
+def _format_game_state(game_state: Dict[str, Any]) -> str:
+    """Render the game state text (see format_game_state)"""
     try:
         # Extract player data safely
         player_data = game_state.get("player", {})
@@ -0,0 +1,167 @@
+"""
+Delta rendering of the game state for multi-turn agents
+A snapshot is kept per (session, agent) thread, later turns only append what changed
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from .formatters import format_game_state
+
+logger = logging.getLogger(__name__)
+
+CHANGES_HEADER = "Changes since this snapshot (oldest first):"
+
+
+@dataclass
+class _StateThread:
+    """What one agent of one session was last sent"""
+
+    snapshot: str
+    view: Dict[str, Any]
+    changes: List[str] = field(default_factory=list)
+    turns: int = 0
+
+
+class GameStateDeltaRenderer:
+    """
+    Renders the game state section of multi-turn agent prompts.
+
+    The first turn of a thread gets the full format_game_state snapshot. Later turns
+    keep that snapshot word for word and append the changes since (clues taken,
+    characters arriving or leaving, inventory), so the section only grows by a few
+    lines and its start stays a cached prompt prefix. A new snapshot is rendered every
+    snapshot_every turns, on a room change, or when the manor itself changed.
+    """
+
+    def __init__(self, snapshot_every: int = 5, dev_mode: bool = False):
+        self.snapshot_every = max(1, snapshot_every)
+        self.dev_mode = dev_mode
+        self._threads: Dict[Tuple[str, str], _StateThread] = {}
+        self.stats = {"turns": 0, "snapshots": 0, "deltas": 0, "rendered_chars": 0, "new_chars": 0}
+
+    def render(self, session_id: Optional[str], agent: str, game_state: Dict[str, Any]) -> str:
+        """
+        Game state section of the agent's next prompt
+
+        Args:
+            session_id: Game session the thread belongs to
+            agent: Agent name, one thread per agent and session
+            game_state: Game state dictionary (from GameState.to_ai_format())
+
+        Returns:
+            Snapshot text, followed by the changes since when there are any
+        """
+        try:
+            key = (session_id or "", agent)
+            view = self._view(game_state)
+            thread = self._threads.get(key)
+            self.stats["turns"] += 1
+
+            if thread is None or self._needs_snapshot(thread, view):
+                thread = _StateThread(format_game_state(game_state), view)
+                self._threads[key] = thread
+                self.stats["snapshots"] += 1
+                new_chars = len(thread.snapshot)
+            else:
+                lines = self._diff(thread.view, view)
+                thread.changes.extend(lines)
+                thread.view = view
+                thread.turns += 1
+                self.stats["deltas"] += 1
+                new_chars = sum(len(line) + 3 for line in lines)
+
+            text = self._text(thread)
+            self.stats["rendered_chars"] += len(text)
+            self.stats["new_chars"] += new_chars
+
+            if self.dev_mode:
+                kind = "snapshot" if thread.turns == 0 else f"{len(thread.changes)} changes"
+                print(f"🧭 STATE DELTA: {agent} {kind} ({new_chars} new chars)")
+
+            return text
+
+        except Exception as e:
+            logger.error(f"Error in GameStateDeltaRenderer.render: {e}")
+            return format_game_state(game_state)
+
+    def reset(self, session_id: Optional[str] = None) -> None:
+        """Forget the threads of a session (all sessions when None)"""
+        if session_id is None:
+            self._threads.clear()
+            return
+        for key in [k for k in self._threads if k[0] == session_id]:
+            del self._threads[key]
+
+    def _needs_snapshot(self, thread: _StateThread, view: Dict[str, Any]) -> bool:
+        """Whether the thread starts again from a full snapshot"""
+        previous = thread.view
+        return (
+            thread.turns + 1 >= self.snapshot_every
+            or view["room"] != previous["room"]
+            or view["exits"] != previous["exits"]
+            or set(view["manor_rooms"]) != set(previous["manor_rooms"])
+            or set(view["manor_characters"]) != set(previous["manor_characters"])
+        )
+
+    @staticmethod
+    def _view(game_state: Dict[str, Any]) -> Dict[str, Any]:
+        """The parts of the game state format_game_state renders"""
+        player = game_state.get("player", {}) or {}
+        room = game_state.get("current_room", {}) or {}
+        lore = game_state.get("lore", {}) or {}
+        characters = lore.get("characters", {}) or {}
+        return {
+            "room": (room.get("name"), room.get("description")),
+            "exits": list(room.get("exits", [])),
+            "characters": {
+                c.get("name") if isinstance(c, dict) else str(c): c.get("status") if isinstance(c, dict) else None
+                for c in room.get("characters", [])
+            },
+            "clues": list(room.get("clues", [])),
+            "inventory": [
+                item.get("name") if isinstance(item, dict) else getattr(item, "name", str(item))
+                for item in player.get("inventory", [])
+            ],
+            "manor_rooms": list((lore.get("rooms", {}) or {}).keys()),
+            "manor_characters": {
+                name: info.get("location") if isinstance(info, dict) else str(info)
+                for name, info in characters.items()
+            },
+        }
+
+    @staticmethod
+    def _diff(previous: Dict[str, Any], current: Dict[str, Any]) -> List[str]:
+        """Change lines between two views of the same room"""
+        lines = []
+        for name in current["characters"]:
+            if name not in previous["characters"]:
+                lines.append(f"{name} entered the room ({current['characters'][name]})")
+            elif current["characters"][name] != previous["characters"][name]:
+                lines.append(f"{name} is now: {current['characters'][name]}")
+        lines += [f"{name} left the room" for name in previous["characters"] if name not in current["characters"]]
+        lines += [f"No longer visible: {clue}" for clue in previous["clues"] if clue not in current["clues"]]
+        lines += [f"Now visible: {clue}" for clue in current["clues"] if clue not in previous["clues"]]
+        lines += [f"Added to inventory: {item}" for item in current["inventory"] if item not in previous["inventory"]]
+        lines += [f"Removed from inventory: {item}" for item in previous["inventory"] if item not in current["inventory"]]
+        for name, location in current["manor_characters"].items():
+            if location != previous["manor_characters"].get(name):
+                lines.append(f"{name} is now in: {location}")
+        return lines
+
+    @staticmethod
+    def _text(thread: _StateThread) -> str:
+        """Snapshot followed by the changes since"""
+        if not thread.changes:
+            return thread.snapshot
+        return f"{thread.snapshot}\n\n{CHANGES_HEADER}\n" + "\n".join(f"- {line}" for line in thread.changes)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get rendering statistics, new_chars counting the text not sent before in the thread"""
+        rendered = self.stats["rendered_chars"]
+        return {
+            **self.stats,
+            "threads": len(self._threads),
+            "new_share": round(self.stats["new_chars"] / rendered, 3) if rendered else 0.0,
+        }
@@ -0,0 +1,47 @@
+"""
+Token counting helpers (tiktoken is optional, estimates are used without it)
+"""
+
+from typing import Dict, List
+
+# Local tokenizer used when tiktoken is installed (optional dependency)
+TOKENIZER_ENCODING = "o200k_base"
+
+_encoder = None
+_encoder_unavailable = False
+
+
+def estimate_text_tokens(text: str) -> int:
+    """Rough token count of a text (about 4 characters per token)"""
+    return len(text) // 4
+
+
+def estimate_tokens(messages: List[Dict[str, str]]) -> int:
+    """Rough token count of chat messages"""
+    return sum(estimate_text_tokens(message.get("content", "")) + 4 for message in messages)
+
+
+def _get_encoder():
+    """tiktoken encoder, or None when tiktoken or its encoding is unavailable"""
+    global _encoder, _encoder_unavailable
+    if _encoder is None and not _encoder_unavailable:
+        try:
+            import tiktoken
+            _encoder = tiktoken.get_encoding(TOKENIZER_ENCODING)
+        except Exception:
+            # Not installed, or the encoding file cannot be downloaded
+            _encoder_unavailable = True
+    return _encoder
+
+
+def get_tokenizer_name() -> str:
+    """Name of the tokenizer used by count_text_tokens"""
+    return f"tiktoken:{TOKENIZER_ENCODING}" if _get_encoder() else "estimate"
+
+
+def count_text_tokens(text: str) -> int:
+    """Token count of a text with the local tokenizer, estimated without tiktoken"""
+    encoder = _get_encoder()
+    if encoder is None:
+        return estimate_text_tokens(text)
+    return len(encoder.encode(text, disallowed_special=()))
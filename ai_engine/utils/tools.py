@@ -293,6 +293,80 @@ def get_process_command_tools():
         }
     ]
 
+def get_command_pipeline_tools():
+    return [
+        {
+            "type": "function",
+            "function": {
+                "name": "resolve_command",
+                "description": "Returns the analysed and resolved player command in the final game structure.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "think": {
+                            "type": "string",
+                            "description": "Your analysis: entities in game state, detected language, target mapping and validation",
+                        },
+                        "translated_command": {
+                            "type": "string",
+                            "description": "The player's command translated to English",
+                        },
+                        "valid": {
+                            "type": "boolean",
+                            "description": "Whether the command is valid and can be executed",
+                        },
+                        "action": {
+                            "type": "string",
+                            "enum": [
+                                "look",
+                                "speak",
+                                "collect",
+                                "move",
+                                "help",
+                                "nonsense",
+                            ],
+                            "description": "Action name in English",
+                        },
+                        "target": {
+                            "type": "string",
+                            "description": "Canonical English name of the target as written in the game state, empty if none",
+                        },
+                        "target_type": {
+                            "type": "string",
+                            "enum": [
+                                "character",
+                                "location",
+                                "clue",
+                                "inventory",
+                                "none",
+                            ],
+                            "description": "Type of the target entity",
+                        },
+                        "alternatives": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "2-3 suggestions referencing entities that exist in the game state",
+                        },
+                        "message": {
+                            "type": "string",
+                            "description": "Brief immersive message to the player in game master style",
+                        },
+                    },
+                    "required": [
+                        "think",
+                        "translated_command",
+                        "valid",
+                        "action",
+                        "target",
+                        "target_type",
+                        "alternatives",
+                        "message",
+                    ],
+                },
+            },
+        }
+    ]
+
 def get_character_pipeline_tools():
     return [
         {
@@ -337,7 +411,7 @@ def get_agent_tools(agent_type):
     Retourne les outils appropriés selon le type d'agent
 
     Args:
-        agent_type (str): Type d'agent ("conversation", "collect_theory", "analyse_theory", "write_ending", "process_command")
+        agent_type (str): Type d'agent ("conversation", "collect_theory", "analyse_theory", "write_ending", "process_command", "command_pipeline")
 
     Returns:
         list: Liste des outils pour le type d'agent spécifié
@@ -348,6 +422,7 @@ def get_agent_tools(agent_type):
         "analyse_theory": get_analyse_theory_tools,
         "write_ending": get_write_ending_tools,
         "process_command": get_process_command_tools,
+        "command_pipeline": get_command_pipeline_tools,
         "character_pipeline": get_character_pipeline_tools,
     }
 
@@ -7,7 +7,7 @@ from typing import Any, List
 
 from PIL import Image
 
-from game_engine.setup.game_data import create_rooms
+from game_engine.setup.game_data import get_world_template
 
 from ..core.logging_config import PerformanceTimer, state_logger
 from .static_map_generator import get_static_map_service, validate_room_positions
@@ -19,7 +19,8 @@ class MapService:
     def __init__(self):
         """Initialize map service with static map system"""
         with PerformanceTimer("map_service_init", state_logger):
-            self.room_list: List[Any] = create_rooms()
+            # Static room data only, shared with the game sessions (no parsing)
+            self.room_list: List[Any] = list(get_world_template().rooms)
             self.static_service = get_static_map_service()
             
             # Validate that all rooms have position definitions
@@ -2,10 +2,10 @@
 
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 import uuid
 
-from game_engine.models.reputation import GlobalReputation
+from game_engine.models.reputation import GlobalReputation, ReputationSeverity
 from game_engine.models.player import Player
 from game_engine.models.room import Room
 
@@ -17,7 +17,13 @@ class GameMode(Enum):
 
 @dataclass
 class GameState:
-    """Pure game state - data only"""
+    """
+    Pure game state - data only
+
+    Assigning a field bumps a monotonic version; code mutating nested state (inventory,
+    room clues, reputation) calls mark_changed(). The AI and UI projections are memoized
+    on that version and must be treated as read-only.
+    """
     
     # Basic data
     session_id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -55,6 +61,40 @@ class GameState:
         self._session_cache = get_cache_for_session(self.session_id)
         print(f"GameState created with session ID: {self.session_id}")
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Assigning a field is a state mutation, it bumps the version"""
+        object.__setattr__(self, name, value)
+        if not name.startswith("_"):
+            object.__setattr__(self, "_version", self.__dict__.get("_version", 0) + 1)
+
+    @property
+    def version(self) -> int:
+        """Monotonic version of the state, bumped by every mutation"""
+        return self.__dict__.get("_version", 0)
+
+    def mark_changed(self) -> None:
+        """Bump the version after mutating nested state (inventory, room clues, reputation)"""
+        object.__setattr__(self, "_version", self.version + 1)
+
+    def memoize(self, key: str, build: Callable[[], Any]) -> Any:
+        """
+        Value of build() for the current version, rebuilt after any mutation
+
+        Args:
+            key: Name of the projection
+            build: Computes the projection from the current state
+
+        Returns:
+            Projection of the current version (shared, read-only)
+        """
+        memo = self.__dict__.setdefault("_memo", {})
+        cached = memo.get(key)
+        if cached is not None and cached[0] == self.version:
+            return cached[1]
+        value = build()
+        memo[key] = (self.version, value)
+        return value
+
     def get_session_cache(self):
         """Get the cache instance for this session"""
         if not hasattr(self, '_session_cache'):
@@ -74,7 +114,11 @@ class GameState:
         return self.rooms.get(self.current_location)
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for UI consumption"""
+        """Convert to dictionary for UI consumption (memoized on the version)"""
+        return self.memoize("dict", self._build_dict)
+
+    def _build_dict(self) -> Dict[str, Any]:
+        """UI dictionary of the current state"""
         return {
             "mode": self.current_mode.value,
             "location": self.current_location,
@@ -90,20 +134,24 @@ class GameState:
             "lore": self.lore,
             "reputation": {
                 "total_counts": {
-                    "impromptu": self.reputation.get_total_count(GlobalReputation.ReputationSeverity.IMPROMPTU),
-                    "awkward": self.reputation.get_total_count(GlobalReputation.ReputationSeverity.AWKWARD),
-                    "dangerous": self.reputation.get_total_count(GlobalReputation.ReputationSeverity.DANGEROUS)
+                    "impromptu": self.reputation.get_total_count(ReputationSeverity.IMPROMPTU),
+                    "awkward": self.reputation.get_total_count(ReputationSeverity.AWKWARD),
+                    "dangerous": self.reputation.get_total_count(ReputationSeverity.DANGEROUS)
                 },
                 "global_status": {
-                    "impromptu": self.reputation.is_global_reputation(GlobalReputation.ReputationSeverity.IMPROMPTU),
-                    "awkward": self.reputation.is_global_reputation(GlobalReputation.ReputationSeverity.AWKWARD),
-                    "dangerous": self.reputation.is_global_reputation(GlobalReputation.ReputationSeverity.DANGEROUS)
+                    "impromptu": self.reputation.is_global_reputation(ReputationSeverity.IMPROMPTU),
+                    "awkward": self.reputation.is_global_reputation(ReputationSeverity.AWKWARD),
+                    "dangerous": self.reputation.is_global_reputation(ReputationSeverity.DANGEROUS)
                 }
             }
         }
 
     def to_ai_format(self) -> Dict[str, Any]:
-        """Convert to AI-compatible format"""
+        """Convert to AI-compatible format (memoized on the version)"""
+        return self.memoize("ai_format", self._build_ai_format)
+
+    def _build_ai_format(self) -> Dict[str, Any]:
+        """AI-compatible dictionary of the current state"""
         from game_engine.utils.state_helper import StateHelper
         
         # Prepare player data safely
@@ -166,6 +214,8 @@ class GameState:
         reputation_context = StateHelper.get_reputation_context_for_ai(self)
 
         return {
+            "session_id": self.session_id,
+            "state_version": self.version,
             "player": player_data,
             "current_room": current_room_data,
             "rooms_visited": list(self.rooms_visited),
@@ -56,9 +56,8 @@ class GameFacade:
     def get_current_state(self) -> Dict[str, Any]:
         """Get current state for UI with error handling"""
         try:
-            state_dict = self.state.to_dict()
-            state_dict["show_inventory"] = self.show_inventory
-            return state_dict
+            # to_dict() is memoized and shared, extend a copy
+            return {**self.state.to_dict(), "show_inventory": self.show_inventory}
         except Exception as e:
             GameErrorHandler.handle_state_error(e, "get current state")
             # Return minimal safe state
@@ -293,6 +292,12 @@ class GameFacade:
             
         except Exception as e:
             return False, f"Restoration failed: {e}"
+
+        finally:
+            # Nested fields are changed in place, even by a restore failing partway
+            self.state.mark_changed()
+            # Agents must not keep appending to a snapshot of the game before the restore
+            self.game_service.ai_manager.reset_state_prompts(self.state.session_id)
     
     def _restore_game_state(self, game_state_data: Dict[str, Any]) -> None:
         """Restore core game state"""
@@ -376,7 +381,8 @@ class GameFacade:
             
             # Restore memories
             character.memory_global = memory["global_memory"]
-            character.memory_current = memory["current_memory"]
+            character.memory.load_list(memory.get("memory_entries", []))
+            character.memory.load_messages(memory["current_memory"])
             character.dialogues = char_data["dialogues"]
             
             # Place character in room
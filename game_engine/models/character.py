@@ -1,5 +1,6 @@
 from typing import Dict, List, Optional
 
+from game_engine.models.character_memory import CharacterMemory
 from game_engine.models.secret_list import Secret
 
 
@@ -16,6 +17,7 @@ class Character:
         prompt: str = None,
         image_url: str = "",
         status: str = "alive",
+        aliases: Optional[List[str]] = None,
     ):
         self.name: str = name
         self.role: str = role
@@ -27,13 +29,16 @@ class Character:
             "Main Hall"
         ]  # Default location if none provided
         self.memory_global: List[str] = []  # Stores a summary of past conversations
-        self.memory_current: List[Dict[str, str]] = (
+        self.memory: CharacterMemory = CharacterMemory()  # Dialogue, witness and reputation entries
+        self.memory_pending: List[Dict[str, str]] = (
             []
-        )  # Stores the ongoing conversation context
+        )  # Ended conversation waiting for its summary
+        self.memory_digest: str = ""  # Running summary of compacted earlier turns
         self.dialogues: Dict[str, str] = {}  # Stores predefined dialogues
         self.image_url: str = image_url
         self.prompt: str = prompt
         self.status: str = status
+        self.aliases: List[str] = aliases or []  # Nicknames and translations
 
 
     def remember(self, message: str, role: str = "user") -> None:
@@ -41,13 +46,61 @@ class Character:
         if role not in {"user", "assistant"}:
             raise ValueError("Role must be either 'user' or 'assistant'.")
 
-        self.memory_current.append({"role": role, "content": message})
+        self.memory.add_dialogue(role, message)
+
+    @property
+    def memory_current(self) -> List[Dict[str, str]]:
+        """The ongoing conversation messages (a copy - use remember() to add)."""
+        return self.memory.get_dialogue()
+
+    @memory_current.setter
+    def memory_current(self, messages: List[Dict[str, str]]) -> None:
+        self.memory.set_dialogue(messages)
+
+    def render_memory(self) -> List[Dict[str, str]]:
+        """Render witness and reputation context, then the ongoing conversation, as prompt messages."""
+        return [*self.memory.render_context(), *self.get_conversation_memory()]
+
+    def get_conversation_memory(self) -> List[Dict[str, str]]:
+        """Return the ongoing conversation, led by the digest of compacted turns if any."""
+        if not self.memory_digest:
+            return list(self.memory_current)
+        return [
+            {
+                "role": "assistant",
+                "content": f"EARLIER IN THIS CONVERSATION (summary): {self.memory_digest}",
+            },
+            *self.memory_current,
+        ]
+
+    def compact_memory(self, digest: str, compacted_count: int) -> None:
+        """Replace the oldest compacted messages of the current memory with a digest."""
+        self.memory_digest = digest
+        self.memory_current = self.memory_current[compacted_count:]
 
     def summarize_and_store_memory(self, summary: str) -> None:
         """Summarize current memory and store it in global memory."""
         if self.memory_current:
             self.memory_global.append(summary)
             self.memory_current = []  # Reset current memory
+            self.memory_digest = ""
+
+    def consolidate_global_memory(self, dossier: str, merged_count: int) -> None:
+        """Replace the first merged summaries of global memory with one dossier."""
+        self.memory_global = [dossier, *self.memory_global[merged_count:]]
+
+    def freeze_current_memory(self) -> List[Dict[str, str]]:
+        """Move the current conversation to the pending slot until its summary is ready."""
+        self.memory_pending = [*self.memory_pending, *self.get_conversation_memory()]
+        self.memory_current = []
+        self.memory_digest = ""
+        return list(self.memory_pending)
+
+    def store_pending_summary(self, summary: str) -> None:
+        """Store the summary of the pending conversation in global memory."""
+        if self.memory_pending:
+            self.memory_global.append(summary)
+            self.memory_pending = []
 
     def speak(self, topic: str = "default") -> str:
         """Return the character's dialogue based on the topic."""
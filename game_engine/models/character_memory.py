@@ -0,0 +1,114 @@
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, List, Optional
+
+
+class MemoryKind(Enum):
+    DIALOGUE = "dialogue"      # Exchanged lines of the ongoing conversation
+    WITNESS = "witness"        # Detective behavior the character saw in person
+    REPUTATION = "reputation"  # Manor-wide rumors about the detective
+
+
+@dataclass
+class MemoryEntry:
+    """A typed character memory"""
+    kind: MemoryKind
+    content: str
+    role: str = "assistant"
+    key: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Optional[str]]:
+        return {"kind": self.kind.value, "content": self.content, "role": self.role, "key": self.key}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Optional[str]]) -> "MemoryEntry":
+        return cls(MemoryKind(data["kind"]), data["content"], data.get("role", "assistant"), data.get("key"))
+
+
+@dataclass
+class CharacterMemory:
+    """
+    Typed memory of a character.
+    Witness and reputation entries are deduplicated by key (a newer entry replaces the
+    older one) and rendered once, ahead of the dialogue, when building prompt messages.
+    """
+    entries: List[MemoryEntry] = field(default_factory=list)
+    max_witness: int = 3
+
+    # Legacy saves stored these as plain assistant messages in the current memory
+    LEGACY_PREFIXES = {
+        "MANOR-WIDE REPUTATION:": MemoryKind.REPUTATION,
+        "DIRECT WITNESS:": MemoryKind.WITNESS,
+    }
+
+    def add_dialogue(self, role: str, content: str) -> None:
+        self.entries.append(MemoryEntry(MemoryKind.DIALOGUE, content, role))
+
+    def add_witness(self, key: str, content: str) -> bool:
+        """Remember a witnessed event once; only the most recent ones are kept"""
+        added = self._upsert(MemoryEntry(MemoryKind.WITNESS, content, key=key))
+        witnessed = self.get_entries(MemoryKind.WITNESS)
+        for entry in witnessed[:-self.max_witness]:
+            self.entries.remove(entry)
+        return added
+
+    def add_reputation(self, key: str, content: str) -> bool:
+        """Remember a manor-wide rumor; a rumor with the same key is replaced"""
+        return self._upsert(MemoryEntry(MemoryKind.REPUTATION, content, key=key))
+
+    def _upsert(self, new_entry: MemoryEntry) -> bool:
+        """Add or replace the entry with the same kind and key; True if memory changed"""
+        for index, entry in enumerate(self.entries):
+            if entry.kind == new_entry.kind and entry.key == new_entry.key:
+                if entry.content == new_entry.content:
+                    return False
+                self.entries[index] = new_entry
+                return True
+        self.entries.append(new_entry)
+        return True
+
+    def has(self, kind: MemoryKind, key: str) -> bool:
+        return any(entry.kind == kind and entry.key == key for entry in self.entries)
+
+    def get_entries(self, kind: MemoryKind) -> List[MemoryEntry]:
+        return [entry for entry in self.entries if entry.kind == kind]
+
+    def get_dialogue(self) -> List[Dict[str, str]]:
+        return [{"role": e.role, "content": e.content} for e in self.entries if e.kind == MemoryKind.DIALOGUE]
+
+    def set_dialogue(self, messages: List[Dict[str, str]]) -> None:
+        """Replace the dialogue, keeping witness and reputation entries"""
+        self.entries = [e for e in self.entries if e.kind != MemoryKind.DIALOGUE]
+        for message in messages:
+            self.add_dialogue(message["role"], message["content"])
+
+    def load_messages(self, messages: List[Dict[str, str]]) -> None:
+        """Load plain messages, typing legacy reputation and witness lines"""
+        dialogue = []
+        for message in messages:
+            content = message.get("content", "")
+            kind = next(
+                (k for prefix, k in self.LEGACY_PREFIXES.items() if content.startswith(prefix)),
+                None,
+            )
+            if kind == MemoryKind.REPUTATION:
+                self.add_reputation(content, content)
+            elif kind == MemoryKind.WITNESS:
+                self.add_witness(content, content)
+            else:
+                dialogue.append(message)
+        self.set_dialogue(dialogue)
+
+    def render_context(self) -> List[Dict[str, str]]:
+        """Render witness and reputation entries as prompt messages"""
+        context = self.get_entries(MemoryKind.REPUTATION) + self.get_entries(MemoryKind.WITNESS)
+        return [{"role": entry.role, "content": entry.content} for entry in context]
+
+    def to_list(self) -> List[Dict[str, Optional[str]]]:
+        """Serialize witness and reputation entries (the dialogue is saved as messages)"""
+        return [e.to_dict() for e in self.entries if e.kind != MemoryKind.DIALOGUE]
+
+    def load_list(self, data: List[Dict[str, Optional[str]]]) -> None:
+        """Restore witness and reputation entries"""
+        for entry_data in data:
+            self._upsert(MemoryEntry.from_dict(entry_data))
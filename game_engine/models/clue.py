@@ -1,9 +1,11 @@
 class Clue:
-    def __init__(self, name, description, room_name):
+    def __init__(self, name, description, room_name, aliases=None, related_clues=None):
         self.name = name
         self.description = description
         self.room_name = room_name
         self.is_collected = False
+        self.aliases = aliases or []
+        self.related_clues = related_clues or []
 
     def collect(self):
         self.is_collected = True
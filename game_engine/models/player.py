@@ -1,3 +1,7 @@
+from game_engine.utils.entity_resolver import CLUE
+from game_engine.utils.game_utils import GameUtils
+
+
 class Player:
     def __init__(self, name):
         self.name = name
@@ -14,6 +18,7 @@ class Player:
     #         return f"You enter {self.current_location}.
 
     def collect_clue(self, clue_name):
+        clue_name = self._resolve_clue_name(clue_name)
         for clue in self.current_location.clues:
             if clue.name.lower() == clue_name.lower() and not clue.is_collected:
                 clue.collect()
@@ -23,3 +28,10 @@ class Player:
                 return True
         print("You can not interact with this object")
         return False
+
+    def _resolve_clue_name(self, clue_name):
+        """Map an approximate clue name to a clue of the current room"""
+        clue_names = [clue.name for clue in self.current_location.clues]
+        if clue_name.lower() in (name.lower() for name in clue_names):
+            return clue_name
+        return GameUtils.resolve_entity_name(clue_name, CLUE, clue_names) or clue_name
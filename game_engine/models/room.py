@@ -2,13 +2,14 @@ from typing import Any, Dict, List
 
 
 class Room:
-    def __init__(self, name, description, exits, image_url=""):
+    def __init__(self, name, description, exits, image_url="", aliases=None):
         self.name = name
         self.description = description
         self.exits = exits
         self.characters = []
         self.clues = []
         self.image_url = image_url
+        self.aliases = aliases or []
 
     def add_clue(self, clue):
         self.clues.append(clue)
@@ -165,11 +165,12 @@ class CommandService:
         is_clue = self.state.player.collect_clue(target)
 
         if is_clue:
+            self.state.mark_changed()
             clue = self.state.player.inventory[-1]
             analysis = self.ai_manager.analyze_clue(clue, self.state.player.inventory)
             response["message"] = f"\n{analysis}"
         else:
-            answer = self.ai_manager.give_useless_answer(target)
+            answer = self.ai_manager.give_useless_answer(target, self.state.current_location)
             response["message"] = f"\n{answer}"
         
         return response
@@ -51,6 +51,7 @@ class ConfrontationService:
         self.state.conclude_conversation.append(
             {"role": "user", "content": formatted_input}
         )
+        self.state.mark_changed()
 
         # Get theory collection result
         result = self.ai_manager.final_scene(
@@ -62,6 +63,7 @@ class ConfrontationService:
             self.state.conclude_conversation.append(
                 {"role": "assistant", "content": result["answer"]}
             )
+            self.state.mark_changed()
             if self.state.dev_mode:
                 print(json.dumps(result, indent=4, ensure_ascii=False))
             return result["answer"]
@@ -121,7 +123,10 @@ class ConfrontationService:
         ]
 
         # Get verification result
-        verification_result = self.ai_manager.verify_theory(analyzer_conversation)
+        # Clear theories are decided locally, without the verification AI call
+        verification_result = self.ai_manager.verify_theory(
+            analyzer_conversation, theory, self.state.player.inventory
+        )
 
         if self.state.dev_mode:
             print(json.dumps(verification_result, indent=4, ensure_ascii=False))
@@ -144,6 +149,7 @@ class ConfrontationService:
         self.state.conclude_conversation.append(
             {"role": "assistant", "content": verification_result["answer"]}
         )
+        self.state.mark_changed()
         return verification_result["answer"]
 
     def _wrap_with_fictional_context(self, user_input: str) -> str:
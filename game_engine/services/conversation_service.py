@@ -8,6 +8,7 @@ from ai_engine.core.ai_manager import AIManager
 from game_engine.core.game_state import GameState
 from game_engine.models.character import Character
 from game_engine.core.game_state import GameMode
+from game_engine.utils.game_utils import GameUtils
 
 
 class ConversationService:
@@ -32,6 +33,8 @@ class ConversationService:
 
         character = self._find_character_in_current_room(character_name)
         if character:
+            # The previous conversation summary must be in memory before talking again
+            self.ai_manager.wait_for_conversation_summary(character)
             self.state.current_mode = GameMode.CONVERSATION
             self.state.character_in_conversation = character_name
             self.state.characters_met.add(character_name)
@@ -108,10 +111,7 @@ class ConversationService:
         if not current_room:
             return None
 
-        for character in current_room.characters:
-            if character.name.lower() == character_name.lower():
-                return character
-        return None
+        return GameUtils.find_character_by_name(current_room.characters, character_name)
 
     def _wrap_with_fictional_context(self, user_input: str) -> str:
         """Wrap user input with fictional context for AI safety"""
@@ -136,10 +136,6 @@ class ConversationService:
         return response
 
     def _end_conversation_with_summary(self, character: Character) -> None:
-        """End conversation and create memory summary"""
-        summary = self.ai_manager.conversation_summary(character, self.state.player)
-        character.summarize_and_store_memory(summary)
-        self.end_conversation()
-
-        if self.state.dev_mode:
-            print(f"Update Character Memory: {summary}")
\ No newline at end of file
+        """End conversation and create memory summary (stored in background when enabled)"""
+        self.ai_manager.store_conversation_summary(character, self.state.player)
+        self.end_conversation()
\ No newline at end of file
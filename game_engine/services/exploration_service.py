@@ -3,6 +3,8 @@ from typing import List
 from ai_engine.core.ai_manager import AIManager
 from game_engine.core.game_state import GameState
 from game_engine.models.character import Character
+from game_engine.utils.entity_resolver import ROOM
+from game_engine.utils.game_utils import GameUtils
 
 
 class ExplorationService:
@@ -21,6 +23,11 @@ class ExplorationService:
         Returns:
             True if move was successful
         """
+        if room_name not in self.state.rooms:
+            room_name = GameUtils.resolve_entity_name(
+                room_name, ROOM, list(self.state.rooms)
+            ) or room_name
+
         new_room = self.state.rooms.get(room_name)
         if not new_room or not self.state.player:
             return False
@@ -32,6 +39,9 @@ class ExplorationService:
         self.state.current_location = room_name  # State location (string)
         self.state.player.current_location = new_room  # Player location (Room object)
 
+        # Likely next looks are generated in background when enabled
+        self.ai_manager.prefetch_room(new_room, self.state)
+
         return True
 
     def process_look_action(self, target: str, target_type: str) -> str:
@@ -57,23 +67,26 @@ class ExplorationService:
         elif target_type in ["clue", "object"]:
             is_clue = self.state.player.collect_clue(target)
             if is_clue:
+                self.state.mark_changed()
                 clue = self.state.player.inventory[-1]
                 analysis = self.ai_manager.analyze_clue(
                     clue, self.state.player.inventory
                 )
                 return f"\n{analysis}"
             else:
-                answer = self.ai_manager.give_useless_answer(target)
+                answer = self.ai_manager.give_useless_answer(
+                    target, self.state.current_location
+                )
                 return f"\n{answer}"
         elif target_type == "character":
             characters = self._get_characters_in_current_room()
-            for character in characters:
-                if character.name.lower() == target.lower():
-                    # Use unified room access
-                    room = self.state.get_current_room()
-                    return self.ai_manager.generate_character_description(
-                        character, room
-                    )
+            character = GameUtils.find_character_by_name(characters, target)
+            if character:
+                # Use unified room access
+                room = self.state.get_current_room()
+                return self.ai_manager.generate_character_description(
+                    character, room
+                )
             return f"You don't see {target} here."
         else:
             return "You see nothing special about that."
@@ -80,7 +80,7 @@ class GameService:
         
         # Add global reputation context
         for global_memory in memory_context["global_memories"]:
-            character.remember(global_memory, "assistant")
+            character.memory.add_reputation("manor", global_memory)
 
     def end_conversation(self) -> bool:
         """Delegate to conversation service"""
@@ -140,6 +140,7 @@ class GameService:
                     "traits": character.traits,
                     "location": room.name,
                 }
+        self.state.mark_changed()
 
     def _find_character_in_current_room(self, character_name: str):
         """Helper method for backwards compatibility"""
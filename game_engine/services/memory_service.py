@@ -17,34 +17,35 @@ class MemoryService:
 
     def process_nonsense_action(self, command: str) -> Dict[str, Any]:
         """Process nonsense action with global memory propagation"""
-        # 1. Generate AI response
+        # 1. Severity decided locally: an expelling action needs no AI reaction
+        severity = self.ai_manager.classify_nonsense(command)
+        if severity and self.reputation_service.would_expel(severity):
+            return self._expulsion_response()
+        
+        # 2. Generate AI response
         ai_result = self.ai_manager.nonsense_reaction(command, self.state)
         
-        # 2. Process reputation with global change detection
+        # 3. Process reputation with global change detection
         game_over, warnings, global_changes = self.reputation_service.process_nonsense_action(
             self.state.current_location, 
             command, 
             ai_result.get("severity", "awkward"),
             ai_result.get("summary", "")
         )
+        self.state.mark_changed()
         
-        # 3. Game over check
+        # 4. Game over check
         if game_over:
-            return {
-                "message": "**EXPELLED FROM BLACKWOOD MANOR**\n\nYour dangerous behavior has crossed all acceptable limits...",
-                "action_type": "expulsion",
-                "game_over": True,
-                "severity": "dangerous"
-            }
-        
-        # 4. Update character memories locally
+            return self._expulsion_response()
+        
+        # 5. Update character memories locally
         self._update_character_memories_new(self.state.current_location)
         
-        # 5. Propagate global reputation changes to ALL characters
+        # 6. Propagate global reputation changes to ALL characters
         if global_changes:
             self._propagate_global_reputation_to_all_characters(global_changes)
         
-        # 6. Return enhanced response
+        # 7. Return enhanced response
         return {
             "message": ai_result.get("message", ""),
             "action_type": "nonsense",
@@ -55,6 +56,15 @@ class MemoryService:
             "global_changes": list(global_changes.keys()) if global_changes else []
         }
     
+    def _expulsion_response(self) -> Dict[str, Any]:
+        """Game over response for a dangerous action with a manor-wide dangerous reputation"""
+        return {
+            "message": "**EXPELLED FROM BLACKWOOD MANOR**\n\nYour dangerous behavior has crossed all acceptable limits...",
+            "action_type": "expulsion",
+            "game_over": True,
+            "severity": "dangerous"
+        }
+    
     def _propagate_global_reputation_to_all_characters(self, global_changes: Dict[str, Any]) -> None:
         """Propagate global reputation changes to ALL characters"""
         
@@ -68,19 +78,10 @@ class MemoryService:
                     change_data["all_events"]
                 )
                 
-                # Propagate to ALL characters in ALL rooms
+                # Propagate to ALL characters in ALL rooms (one entry per severity)
                 for room in self.state.rooms.values():
                     for character in room.characters:
-                        # Check that character doesn't already have this global message
-                        has_global_memory = any(
-                            "MANOR-WIDE REPUTATION:" in memory.get("content", "")
-                            and severity_type in memory.get("content", "")
-                            for memory in character.memory_current
-                            if memory.get("role") == "assistant"
-                        )
-                        
-                        if not has_global_memory:
-                            character.remember(global_message, "assistant")
+                        if character.memory.add_reputation(f"manor-wide:{severity_type}", global_message):
                             characters_updated += 1
                 
                 if self.state.dev_mode:
@@ -104,13 +105,15 @@ class MemoryService:
         for character in current_room.characters:
             # Add global memories
             for global_memory in memory_context["global_memories"]:
-                character.remember(global_memory, "assistant")
+                character.memory.add_reputation("manor", global_memory)
             
             # Add local witness memories based on recent events
             if recent_events:
                 witness_memory = self._create_witness_memory(character, recent_events, room_name)
                 if witness_memory:
-                    character.remember(witness_memory, "assistant")
+                    character.memory.add_witness(
+                        self._get_event_key(recent_events[0], room_name), witness_memory
+                    )
         
         if self.state.dev_mode:
             print(f"Updated memories for {len(current_room.characters)} characters in {room_name}")
@@ -140,12 +143,17 @@ class MemoryService:
                     # Add to all characters
                     for room in self.state.rooms.values():
                         for character in room.characters:
-                            character.remember(global_message, "assistant")
-                            characters_updated += 1
+                            if character.memory.add_reputation(f"manor-wide:{severity_str}", global_message):
+                                characters_updated += 1
         
         if self.state.dev_mode:
             print(f"Refreshed global memories for {characters_updated} characters across all rooms")
 
+    @staticmethod
+    def _get_event_key(event: Dict[str, Any], room_name: str) -> str:
+        """Identify a reputation event so each character remembers it once"""
+        return f"{room_name}:{event.get('timestamp', event.get('command', ''))}"
+
     def _create_witness_memory(self, character, recent_events: List[Dict], room_name: str) -> str:
         """Create witness memory from reputation events"""
         if not recent_events:
@@ -55,6 +55,13 @@ class ReputationService:
         
         return False, warnings, global_changes
     
+    def would_expel(self, severity_str: str) -> bool:
+        """Whether an action of this severity ends the game (dangerous with a manor-wide dangerous reputation)"""
+        return (
+            severity_str == ReputationSeverity.DANGEROUS.value
+            and self.reputation.is_global_reputation(ReputationSeverity.DANGEROUS)
+        )
+    
     def _get_all_events_of_severity(self, severity: ReputationSeverity) -> List[Dict[str, Any]]:
         """Get all events of a given severity from all rooms"""
         all_events = []
@@ -146,7 +153,7 @@ class ReputationService:
                     "dangerous": self.reputation.is_global_reputation(ReputationSeverity.DANGEROUS)
                 },
                 "recent_events": [
-                    {"command": e.command, "severity": e.severity.value, "summary": e.summary}
+                    {"command": e.command, "severity": e.severity.value, "summary": e.summary, "timestamp": e.timestamp}
                     for e in room_rep.get_recent_events()
                 ]
             }
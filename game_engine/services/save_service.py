@@ -247,7 +247,9 @@ class SaveService:
                     },
                     "memory": {
                         "global_memory": character.memory_global,
-                        "current_memory": character.memory_current
+                        # A conversation still being summarized is saved as current memory
+                        "current_memory": [*character.memory_pending, *character.get_conversation_memory()],
+                        "memory_entries": character.memory.to_list()
                     },
                     "secrets": [
                         {
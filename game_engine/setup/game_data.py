@@ -1,8 +1,10 @@
 # game_engine/game_data.py
+import hashlib
 import json
+import os
 import sys
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from utils.markdown_utils import read_markdown_file
 
@@ -13,14 +15,27 @@ from game_engine.models.character import Character
 from game_engine.models.clue import Clue
 from game_engine.models.room import Room
 from game_engine.models.secret_list import Secret
+from game_engine.setup.world_bundle import BUNDLE_FILENAME, WorldBundleError, read_world_bundle
+from game_engine.setup.world_template import WorldTemplate
+from game_engine.utils.clue_graph import ClueGraph
+from game_engine.utils.entity_resolver import CHARACTER, CLUE, ROOM, EntityResolver
 
 
 class GameDataLoader:
     """Loader for modular game data structure"""
 
-    def __init__(self, data_dir: str = "data"):
+    def __init__(
+        self,
+        data_dir: str = "data",
+        bundle_path: Optional[str] = None,
+        use_bundle: bool = True,
+        check_staleness: bool = True,
+    ):
         # Adjust path relative to game_engine directory
         self.data_dir = Path(__file__).parent.parent.parent / data_dir
+        self.bundle_path = Path(bundle_path) if bundle_path else self.data_dir / BUNDLE_FILENAME
+        self.use_bundle = use_bundle
+        self.check_staleness = check_staleness
 
     def _load_json(self, file_path: Path) -> Dict[str, Any]:
         """Load JSON data from file"""
@@ -31,68 +46,77 @@ class GameDataLoader:
         """Convert folder name to snake_case for consistency"""
         return folder_name.lower().replace(" ", "_").replace("'", "")
 
-    def load_room(self, room_folder_name: str) -> Room:
-        """Load a single room from its folder structure"""
-        room_dir = self.data_dir / "rooms" / room_folder_name
+    def _read_room_data(self, room_dir: Path, hasher=None) -> Dict[str, Any]:
+        """Raw data of a room folder"""
+        return self._read_json_source(room_dir / "info.json", hasher)
+
+    def _read_clue_data(self, clue_dir: Path, hasher=None) -> Dict[str, Any]:
+        """Raw data of a clue folder"""
+        return self._read_json_source(clue_dir / "info.json", hasher)
+
+    def _read_character_data(self, char_dir: Path, hasher=None) -> Dict[str, Any]:
+        """Raw data of a character folder: info, secrets and prompt text"""
+        info = self._read_json_source(char_dir / "info.json", hasher)
+        secrets = self._read_json_source(char_dir / "secrets.json", hasher)
+
+        # Load prompt from markdown file
+        prompt = ""
+        prompt_path = char_dir / info.get("prompt_file", "prompt_memory.md")
+        if prompt_path.exists():
+            prompt = read_markdown_file(prompt_path)
+            self._hash_source(prompt_path, prompt.encode("utf-8"), hasher)
+
+        return {"info": info, "secrets": secrets["secrets"], "prompt": prompt}
+
+    def _read_json_source(self, file_path: Path, hasher=None) -> Dict[str, Any]:
+        """Load a JSON source file, adding it to the content hash"""
+        return json.loads(self._read_source(file_path, hasher).decode("utf-8"))
 
-        # Load room info
-        info = self._load_json(room_dir / "info.json")
+    def _read_source(self, file_path: Path, hasher=None) -> bytes:
+        """Read a source file, adding it to the content hash"""
+        content = file_path.read_bytes()
+        self._hash_source(file_path, content, hasher)
+        return content
 
-        # Create room object
-        room = Room(
+    def _hash_source(self, file_path: Path, content: bytes, hasher=None) -> None:
+        """Add the path and content of a source file to the content hash"""
+        if hasher is not None:
+            hasher.update(file_path.relative_to(self.data_dir).as_posix().encode("utf-8") + b"\0")
+            hasher.update(hashlib.sha256(content).digest())
+
+    @staticmethod
+    def _room_from_data(info: Dict[str, Any]) -> Room:
+        return Room(
             info["name"],
             info["description"],
             info["exits"],
             info["image"],
+            aliases=info.get("aliases", []),
         )
 
-        return room
-
-    def load_clue(self, clue_folder_name: str) -> Clue:
-        """Load a single clue from its folder structure"""
-        clue_dir = self.data_dir / "clues" / clue_folder_name
-
-        # Load clue info
-        info = self._load_json(clue_dir / "info.json")
-
-        # Create clue object
+    @staticmethod
+    def _clue_from_data(info: Dict[str, Any]) -> Clue:
         clue = Clue(
             name=info["name"],
             description=info["description"],
             room_name=info["room_name"],
+            aliases=info.get("aliases", []),
+            related_clues=info.get("related_clues", []),
         )
         clue.is_collected = info.get("is_collected", False)
-
         return clue
 
-    def load_character(self, character_folder_name: str) -> Character:
-        """Load a single character from its folder structure"""
-        char_dir = self.data_dir / "characters" / character_folder_name
-
-        # Load basic info
-        info = self._load_json(char_dir / "info.json")
-
-        # Load secrets
-        secrets_data = self._load_json(char_dir / "secrets.json")
+    @staticmethod
+    def _character_from_data(data: Dict[str, Any]) -> Character:
+        info = data["info"]
 
         # Convert secrets to Secret objects
-        secrets = []
-        for secret_data in secrets_data["secrets"]:
-            secret = Secret(
-                condition=secret_data["condition"], secret=secret_data["secret"]
-            )
-            secrets.append(secret)
-
-        # Load prompt from markdown file
-        prompt = ""
-        prompt_file = info.get("prompt_file", "prompt_memory.md")
-        prompt_path = char_dir / prompt_file
-
-        if prompt_path.exists():
-            prompt = read_markdown_file(prompt_path)
+        secrets = [
+            Secret(condition=secret_data["condition"], secret=secret_data["secret"])
+            for secret_data in data["secrets"]
+        ]
 
-        # Create character object
-        character = Character(
+        return Character(
             name=info["name"],
             role=info["role"],
             description=info["description"],
@@ -101,87 +125,207 @@ class GameDataLoader:
             secrets=secrets,
             possible_locations=info["possible_locations"],
             image_url=info["image_url"],
-            prompt=prompt,
-            status=info.get("status", "alive")
+            prompt=data["prompt"],
+            status=info.get("status", "alive"),
+            aliases=info.get("aliases", []),
         )
 
-        return character
+    def load_room(self, room_folder_name: str) -> Room:
+        """Load a single room from its folder structure"""
+        return self._room_from_data(self._read_room_data(self.data_dir / "rooms" / room_folder_name))
 
-    def load_all_rooms(self) -> List[Room]:
-        """Load all rooms from their folder structure"""
-        rooms_dir = self.data_dir / "rooms"
-        rooms = []
+    def load_clue(self, clue_folder_name: str) -> Clue:
+        """Load a single clue from its folder structure"""
+        return self._clue_from_data(self._read_clue_data(self.data_dir / "clues" / clue_folder_name))
+
+    def load_character(self, character_folder_name: str) -> Character:
+        """Load a single character from its folder structure"""
+        return self._character_from_data(
+            self._read_character_data(self.data_dir / "characters" / character_folder_name)
+        )
 
-        if not rooms_dir.exists():
-            raise FileNotFoundError(f"Rooms directory not found: {rooms_dir}")
+    def _read_folders(self, kind: str, read, hasher=None) -> List[Dict[str, Any]]:
+        """Raw data of every folder of data/<kind> holding an info.json, in name order"""
+        kind_dir = self.data_dir / kind
+        if not kind_dir.exists():
+            raise FileNotFoundError(f"{kind.capitalize()} directory not found: {kind_dir}")
 
-        # Get all room folders
-        for room_folder in sorted(rooms_dir.iterdir()):
-            if room_folder.is_dir() and (room_folder / "info.json").exists():
+        items = []
+        for folder in sorted(kind_dir.iterdir()):
+            if folder.is_dir() and (folder / "info.json").exists():
                 try:
-                    room = self.load_room(room_folder.name)
-                    rooms.append(room)
+                    items.append(read(folder, hasher))
                 except Exception as e:
-                    print(f"Error loading room {room_folder.name}: {e}")
+                    print(f"Error loading {kind[:-1]} {folder.name}: {e}")
+        return items
+
+    def read_world_data(self) -> Dict[str, Any]:
+        """
+        Walk data/ and read every room, clue and character
+
+        Returns:
+            Raw rooms, clues and characters, with the content hash of their source files
+        """
+        hasher = hashlib.sha256()
+        rooms = self._read_folders("rooms", self._read_room_data, hasher)
+        clues = self._read_folders("clues", self._read_clue_data, hasher)
+        characters = self._read_folders("characters", self._read_character_data, hasher)
+        return {
+            "content_hash": hasher.hexdigest(),
+            "rooms": rooms,
+            "clues": clues,
+            "characters": characters,
+        }
 
-        return rooms
+    def load_all_rooms(self) -> List[Room]:
+        """Load all rooms from their folder structure"""
+        return [self._room_from_data(info) for info in self._read_folders("rooms", self._read_room_data)]
 
     def load_all_clues(self) -> List[Clue]:
         """Load all clues from their folder structure"""
-        clues_dir = self.data_dir / "clues"
-        clues = []
-
-        if not clues_dir.exists():
-            raise FileNotFoundError(f"Clues directory not found: {clues_dir}")
+        return [self._clue_from_data(info) for info in self._read_folders("clues", self._read_clue_data)]
 
-        # Get all clue folders
-        for clue_folder in sorted(clues_dir.iterdir()):
-            if clue_folder.is_dir() and (clue_folder / "info.json").exists():
+    def load_all_characters(self) -> List[Character]:
+        """Load all characters from their folder structure"""
+        return [
+            self._character_from_data(data)
+            for data in self._read_folders("characters", self._read_character_data)
+        ]
+
+    def _newest_source_mtime(self) -> float:
+        """Latest modification time of the data/ source files and folders (stat only, no read)"""
+        newest = 0.0
+        for kind in ("rooms", "clues", "characters"):
+            kind_dir = self.data_dir / kind
+            if not kind_dir.exists():
+                continue
+            newest = max(newest, kind_dir.stat().st_mtime)
+            with os.scandir(kind_dir) as folders:
+                for folder in folders:
+                    if not folder.is_dir():
+                        continue
+                    newest = max(newest, folder.stat().st_mtime)
+                    with os.scandir(folder.path) as sources:
+                        for source in sources:
+                            if source.name.endswith((".json", ".md")):
+                                newest = max(newest, source.stat().st_mtime)
+        return newest
+
+    def is_bundle_stale(self) -> bool:
+        """Whether a room, clue or character file changed after the bundle was compiled"""
+        return self._newest_source_mtime() > self.bundle_path.stat().st_mtime
+
+    def load_world_template(self) -> WorldTemplate:
+        """
+        Parse every room, clue and character into the immutable world template.
+        Reads the compiled bundle when enabled, valid and not older than data/
+        (when checked), data/ otherwise.
+        """
+        world_data = None
+        if self.use_bundle and self.bundle_path.exists():
+            if self.check_staleness and self.is_bundle_stale():
+                print(
+                    f"Warning: world bundle {self.bundle_path} is older than the data directory - "
+                    "loading the data directory instead (rebuild: python -m game_engine.setup.world_bundle)"
+                )
+            else:
                 try:
-                    clue = self.load_clue(clue_folder.name)
-                    clues.append(clue)
-                except Exception as e:
-                    print(f"Error loading clue {clue_folder.name}: {e}")
+                    world_data = read_world_bundle(self.bundle_path)
+                    print(f"World bundle loaded: {self.bundle_path} (content hash {world_data['content_hash'][:16]})")
+                except WorldBundleError as e:
+                    print(f"Warning: {e} - loading the data directory instead")
+
+        if world_data is None:
+            world_data = self.read_world_data()
+
+        return WorldTemplate.from_models(
+            [self._room_from_data(info) for info in world_data["rooms"]],
+            [self._clue_from_data(info) for info in world_data["clues"]],
+            [self._character_from_data(data) for data in world_data["characters"]],
+            version=world_data["content_hash"],
+        )
 
-        return clues
 
-    def load_all_characters(self) -> List[Character]:
-        """Load all characters from their folder structure"""
-        characters_dir = self.data_dir / "characters"
-        characters = []
+# Global loader instance: compiled bundle (WORLD_BUNDLE), data directory in dev mode.
+# The staleness check (one stat per source file) is on unless WORLD_BUNDLE_CHECK
+# turns it off, as the Docker image does for a bundle built from its own data.
+_loader = GameDataLoader(
+    bundle_path=os.getenv("WORLD_BUNDLE") or None,
+    use_bundle=os.getenv("DEV_MODE", "false").lower() != "true",
+    check_staleness=os.getenv("WORLD_BUNDLE_CHECK", "true").lower() in ["true", "1", "yes", "on"],
+)
 
-        if not characters_dir.exists():
-            raise FileNotFoundError(f"Characters directory not found: {characters_dir}")
+# Global world template, parsed on first use and shared by every game
+_world_template: Optional[WorldTemplate] = None
+
+# Global entity resolver, built on first use
+_entity_resolver: Optional[EntityResolver] = None
+
+# Global clue relationship graph, built on first use
+_clue_graph: Optional[ClueGraph] = None
 
-        # Get all character folders
-        for char_folder in sorted(characters_dir.iterdir()):
-            if char_folder.is_dir() and (char_folder / "info.json").exists():
-                try:
-                    character = self.load_character(char_folder.name)
-                    characters.append(character)
-                except Exception as e:
-                    print(f"Error loading character {char_folder.name}: {e}")
 
-        return characters
+def get_world_template(reload: bool = False) -> WorldTemplate:
+    """
+    Get the world template, parsed from data/ once per process
 
+    Args:
+        reload: Parse data/ again (after editing the game data)
 
-# Global loader instance
-_loader = GameDataLoader()
+    Returns:
+        Shared, immutable world template
+    """
+    global _world_template
+    if _world_template is None or reload:
+        _world_template = _loader.load_world_template()
+    return _world_template
+
+
+def get_world_version() -> str:
+    """Content hash of the game data, changes whenever a room, clue or character file does"""
+    return get_world_template().version
 
 
 def create_rooms() -> List[Room]:
     """Generate a list of rooms"""
-    return _loader.load_all_rooms()
+    return get_world_template().create_rooms()
 
 
 def create_clues() -> List[Clue]:
     """Generate a list of clues for the Blackwood Manor mystery"""
-    return _loader.load_all_clues()
+    return get_world_template().create_clues()
 
 
 def create_characters() -> List[Character]:
     """Generate a list of characters"""
-    return _loader.load_all_characters()
+    return get_world_template().create_characters()
+
+
+def get_entity_resolver() -> EntityResolver:
+    """Get the entity resolver indexing every room, character and clue with its aliases"""
+    global _entity_resolver
+    if _entity_resolver is None:
+        resolver = EntityResolver()
+        world = get_world_template()
+        for room in world.rooms:
+            resolver.add(ROOM, room.name, room.aliases)
+        for character in world.characters:
+            resolver.add(CHARACTER, character.name, character.aliases)
+        for clue in world.clues:
+            resolver.add(CLUE, clue.name, clue.aliases)
+        _entity_resolver = resolver
+    return _entity_resolver
+
+
+def get_clue_graph() -> ClueGraph:
+    """Get the clue relationship graph built from the clues' related_clues metadata"""
+    global _clue_graph
+    if _clue_graph is None:
+        graph = ClueGraph()
+        for clue in get_world_template().clues:
+            graph.add(clue.name, clue.related_clues)
+        _clue_graph = graph
+    return _clue_graph
 
 
 # Helper functions for loading specific items
@@ -234,6 +378,12 @@ def validate_data_integrity() -> bool:
                 )
                 return False
 
+        # Check that all clue relationships point to existing clues
+        unknown = get_clue_graph().validate(clue.name for clue in clues)
+        if unknown:
+            print(f"Warning: Related clues reference non-existent clues {unknown}")
+            return False
+
         # Check that all character locations exist
         for character in characters:
             for location in character.possible_locations:
@@ -0,0 +1,124 @@
+"""
+Compiled world data bundle
+
+Packs the room, clue and character files of data/ into a single file, read with one
+open() instead of a directory walk and many small reads. The payload is compact JSON
+compressed with zlib (standard library only) and protected by a SHA-256 digest:
+
+    MAGIC | format version (2 bytes) | sha256(payload) (32 bytes) | payload
+
+The world data also carries a content hash of its source files, the same whether it
+was read from the bundle or from data/, used as the version of the game data.
+
+Usage:
+    python -m game_engine.setup.world_bundle
+    python -m game_engine.setup.world_bundle --data-dir data --output data/world.bundle
+"""
+
+import argparse
+import hashlib
+import json
+import struct
+import zlib
+from pathlib import Path
+from typing import Any, Dict
+
+BUNDLE_MAGIC = b"WMWORLD\n"
+BUNDLE_FORMAT = 1
+BUNDLE_FILENAME = "world.bundle"
+_HEADER = struct.Struct(">H32s")
+
+
+class WorldBundleError(ValueError):
+    """The bundle is missing, corrupted or from another format version"""
+
+
+def write_world_bundle(world_data: Dict[str, Any], path: Path) -> str:
+    """
+    Write world data (see GameDataLoader.read_world_data) as a bundle
+
+    Args:
+        world_data: Rooms, clues, characters and content hash
+        path: Bundle file to write
+
+    Returns:
+        Content hash of the bundled data
+    """
+    payload = zlib.compress(
+        json.dumps(world_data, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), 9
+    )
+    digest = hashlib.sha256(payload).digest()
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(BUNDLE_MAGIC + _HEADER.pack(BUNDLE_FORMAT, digest) + payload)
+    tmp_path.replace(path)
+    return world_data["content_hash"]
+
+
+def read_world_bundle(path: Path) -> Dict[str, Any]:
+    """
+    Read and verify a bundle
+
+    Args:
+        path: Bundle file
+
+    Returns:
+        World data, as written by write_world_bundle
+
+    Raises:
+        WorldBundleError: Unreadable, corrupted or other format version
+    """
+    try:
+        raw = Path(path).read_bytes()
+    except OSError as e:
+        raise WorldBundleError(f"Cannot read world bundle {path}: {e}") from e
+
+    start = len(BUNDLE_MAGIC) + _HEADER.size
+    if not raw.startswith(BUNDLE_MAGIC) or len(raw) < start:
+        raise WorldBundleError(f"Not a world bundle: {path}")
+
+    version, digest = _HEADER.unpack_from(raw, len(BUNDLE_MAGIC))
+    if version != BUNDLE_FORMAT:
+        raise WorldBundleError(f"World bundle format {version}, expected {BUNDLE_FORMAT}: {path}")
+
+    payload = memoryview(raw)[start:]
+    if hashlib.sha256(payload).digest() != digest:
+        raise WorldBundleError(f"World bundle integrity check failed: {path}")
+
+    try:
+        return json.loads(zlib.decompress(payload).decode("utf-8"))
+    except (zlib.error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise WorldBundleError(f"Cannot decode world bundle {path}: {e}") from e
+
+
+def compile_world_bundle(data_dir: str = "data", output: str = None) -> str:
+    """
+    Compile data/ into a bundle (build step)
+
+    Args:
+        data_dir: Game data directory, relative to the project root
+        output: Bundle file (defaults to world.bundle in the data directory)
+
+    Returns:
+        Content hash of the bundled data
+    """
+    from game_engine.setup.game_data import GameDataLoader
+
+    loader = GameDataLoader(data_dir, use_bundle=False)
+    path = Path(output) if output else loader.data_dir / BUNDLE_FILENAME
+    return write_world_bundle(loader.read_world_data(), path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compile the game data into a single world bundle")
+    parser.add_argument("--data-dir", default="data", help="Game data directory, relative to the project root")
+    parser.add_argument("--output", default=None, help=f"Bundle file (default: <data-dir>/{BUNDLE_FILENAME})")
+    args = parser.parse_args()
+
+    content_hash = compile_world_bundle(args.data_dir, args.output)
+    print(f"World bundle written (content hash {content_hash[:16]})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Immutable world template, parsed once per process and shared by every game session
+"""
+
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from game_engine.models.character import Character
+from game_engine.models.clue import Clue
+from game_engine.models.room import Room
+from game_engine.models.secret_list import Secret
+
+
+@dataclass(frozen=True)
+class RoomTemplate:
+    """Static data of a room"""
+    name: str
+    description: str
+    exits: Tuple[str, ...]
+    image_url: str
+    aliases: Tuple[str, ...]
+
+    @classmethod
+    def from_room(cls, room: Room) -> "RoomTemplate":
+        return cls(room.name, room.description, tuple(room.exits), room.image_url, tuple(room.aliases))
+
+    def create(self) -> Room:
+        """Session room, empty until characters and clues are placed"""
+        return Room(self.name, self.description, list(self.exits), self.image_url, aliases=list(self.aliases))
+
+
+@dataclass(frozen=True)
+class ClueTemplate:
+    """Static data of a clue"""
+    name: str
+    description: str
+    room_name: str
+    aliases: Tuple[str, ...]
+    related_clues: Tuple[str, ...]
+    is_collected: bool = False
+
+    @classmethod
+    def from_clue(cls, clue: Clue) -> "ClueTemplate":
+        return cls(
+            clue.name, clue.description, clue.room_name,
+            tuple(clue.aliases), tuple(clue.related_clues), clue.is_collected,
+        )
+
+    def create(self) -> Clue:
+        """Session clue, with its own collected state"""
+        clue = Clue(
+            name=self.name,
+            description=self.description,
+            room_name=self.room_name,
+            aliases=list(self.aliases),
+            related_clues=list(self.related_clues),
+        )
+        clue.is_collected = self.is_collected
+        return clue
+
+
+@dataclass(frozen=True)
+class SecretTemplate:
+    """Static data of a secret"""
+    condition: str
+    secret: str
+
+
+@dataclass(frozen=True)
+class CharacterTemplate:
+    """Static data of a character (the prompt and secret texts are shared by every session)"""
+    name: str
+    role: str
+    description: str
+    information_to_disclose: Tuple[str, ...]
+    traits: Tuple[str, ...]
+    secrets: Tuple[SecretTemplate, ...]
+    possible_locations: Tuple[str, ...]
+    image_url: str
+    prompt: str
+    status: str
+    aliases: Tuple[str, ...]
+
+    @classmethod
+    def from_character(cls, character: Character) -> "CharacterTemplate":
+        return cls(
+            name=character.name,
+            role=character.role,
+            description=character.description,
+            information_to_disclose=tuple(character.information_to_disclose),
+            traits=tuple(character.traits),
+            secrets=tuple(SecretTemplate(s.condition, s.secret) for s in character.secrets),
+            possible_locations=tuple(character.possible_locations),
+            image_url=character.image_url,
+            prompt=character.prompt,
+            status=character.status,
+            aliases=tuple(character.aliases),
+        )
+
+    def create(self) -> Character:
+        """Session character, with its own memories, status and revealed secrets"""
+        return Character(
+            name=self.name,
+            role=self.role,
+            description=self.description,
+            information_to_disclose=list(self.information_to_disclose),
+            traits=list(self.traits),
+            secrets=[Secret(condition=s.condition, secret=s.secret) for s in self.secrets],
+            possible_locations=list(self.possible_locations),
+            image_url=self.image_url,
+            prompt=self.prompt,
+            status=self.status,
+            aliases=list(self.aliases),
+        )
+
+
+@dataclass(frozen=True)
+class WorldTemplate:
+    """
+    Every room, clue and character of the manor, as parsed from data/.
+
+    Never mutated: each game gets its own model objects from create_rooms(),
+    create_clues() and create_characters(), which hold the session state
+    (placement, collected clues, revealed secrets, memories).
+    The version is the content hash of the data/ files it was parsed from.
+    """
+    rooms: Tuple[RoomTemplate, ...]
+    clues: Tuple[ClueTemplate, ...]
+    characters: Tuple[CharacterTemplate, ...]
+    version: str = ""
+
+    @classmethod
+    def from_models(
+        cls, rooms: List[Room], clues: List[Clue], characters: List[Character], version: str = ""
+    ) -> "WorldTemplate":
+        return cls(
+            rooms=tuple(RoomTemplate.from_room(room) for room in rooms),
+            clues=tuple(ClueTemplate.from_clue(clue) for clue in clues),
+            characters=tuple(CharacterTemplate.from_character(character) for character in characters),
+            version=version,
+        )
+
+    def create_rooms(self) -> List[Room]:
+        return [room.create() for room in self.rooms]
+
+    def create_clues(self) -> List[Clue]:
+        return [clue.create() for clue in self.clues]
+
+    def create_characters(self) -> List[Character]:
+        return [character.create() for character in self.characters]
@@ -0,0 +1,57 @@
+"""Clue relationship graph - which collected clues a clue's analysis depends on"""
+
+from typing import Dict, Iterable, List, Optional, Set
+
+
+class ClueGraph:
+    """
+    Undirected graph of clue relationships, built from the "related_clues" metadata
+    of data/clues (curated from the storylines of full_story.md).
+    A clue analysis only needs the collected clues it is related to, so the same
+    clue analysed at different points of the game shares one prompt and cache entry.
+    """
+
+    def __init__(self):
+        self._related: Dict[str, Set[str]] = {}
+
+    def add(self, name: str, related: Iterable[str] = ()) -> None:
+        """
+        Add a clue and its relationships (in both directions)
+
+        Args:
+            name: Canonical clue name
+            related: Names of the clues its analysis depends on
+        """
+        self._related.setdefault(name, set())
+        for other in related:
+            if other == name:
+                continue
+            self._related[name].add(other)
+            self._related.setdefault(other, set()).add(name)
+
+    def related(self, name: str) -> Set[str]:
+        """Names of the clues related to a clue"""
+        return set(self._related.get(name, set()))
+
+    def relevant_clues(self, clue, collected_clues: Optional[Iterable] = None) -> List:
+        """
+        Collected clues the analysis of a clue depends on, in name order
+
+        Args:
+            clue: Clue being analysed
+            collected_clues: Clues in the player's inventory (may include the clue itself)
+
+        Returns:
+            Related collected clues, without duplicates
+        """
+        related = self._related.get(clue.name, set())
+        relevant = {c.name: c for c in collected_clues or [] if c.name in related}
+        return [relevant[name] for name in sorted(relevant)]
+
+    def validate(self, clue_names: Iterable[str]) -> List[str]:
+        """Relationships pointing to unknown clues (empty when the data is consistent)"""
+        known = set(clue_names)
+        return sorted(name for name in self._related if name not in known)
+
+    def __len__(self) -> int:
+        return len(self._related)
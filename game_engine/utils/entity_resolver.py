@@ -0,0 +1,175 @@
+"""Fuzzy entity resolver - maps player/AI wording to canonical room, character and clue names"""
+
+import re
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Entity types
+ROOM = "room"
+CHARACTER = "character"
+CLUE = "clue"
+
+# Leading articles stripped before matching (English, French, Spanish, German, Italian)
+ARTICLES_PATTERN = re.compile(
+    r"^(?:the|a|an|this|that|my|le|la|les|l|un|une|ce|cette|el|los|las|der|die|das|den|dem|il|lo|gli)\s+"
+)
+
+
+class EntityResolver:
+    """
+    Index of canonical names and aliases with three lookup levels:
+    1. exact normalized name or alias (dict lookup)
+    2. unique name containing every query word ("journal page" -> "Burnt journal page")
+    3. trigram candidates ranked by edit distance, for typos and near-misses
+    """
+
+    def __init__(self, min_similarity: float = 0.75, ambiguity_margin: float = 0.1):
+        self.min_similarity = min_similarity
+        self.ambiguity_margin = ambiguity_margin
+        # normalized surface form -> {(entity_type, canonical name)}
+        self._exact: Dict[str, Set[Tuple[str, str]]] = {}
+        # trigram -> {normalized surface form}
+        self._trigrams: Dict[str, Set[str]] = {}
+
+    def add(self, entity_type: str, name: str, aliases: Iterable[str] = ()) -> None:
+        """
+        Index an entity under its canonical name and aliases
+
+        Args:
+            entity_type: One of ROOM, CHARACTER, CLUE
+            name: Canonical name used by the game state
+            aliases: Alternative names, nicknames or translations
+        """
+        for surface in [name, *aliases]:
+            normalized = normalize_entity_name(surface)
+            if not normalized:
+                continue
+            self._exact.setdefault(normalized, set()).add((entity_type, name))
+            for trigram in _trigrams(normalized):
+                self._trigrams.setdefault(trigram, set()).add(normalized)
+
+    def resolve(
+        self,
+        text: str,
+        entity_type: Optional[str] = None,
+        candidates: Optional[Iterable[str]] = None,
+    ) -> Optional[str]:
+        """
+        Resolve a mention to a single canonical name
+
+        Args:
+            text: Name as written by the player or the AI
+            entity_type: Restrict to one entity type
+            candidates: Restrict to these canonical names (e.g. clues in the current room)
+
+        Returns:
+            Canonical name, or None when nothing matches confidently
+        """
+        query = normalize_entity_name(text)
+        if not query:
+            return None
+
+        allowed = set(candidates) if candidates is not None else None
+
+        def accept(entities: Set[Tuple[str, str]]) -> Set[str]:
+            return {
+                name for etype, name in entities
+                if (entity_type is None or etype == entity_type)
+                and (allowed is None or name in allowed)
+            }
+
+        # 1. Exact name or alias
+        exact = accept(self._exact.get(query, set()))
+        if len(exact) == 1:
+            return exact.pop()
+        if exact:
+            return None
+
+        # 2. Unique surface form containing every query word
+        words = set(query.split())
+        contained: Set[str] = set()
+        for surface, entities in self._exact.items():
+            if words <= set(surface.split()):
+                contained |= accept(entities)
+        if len(contained) == 1:
+            return contained.pop()
+        if contained:
+            return None
+
+        # 3. Trigram candidates ranked by edit distance
+        return self._resolve_fuzzy(query, accept)
+
+    def _resolve_fuzzy(self, query: str, accept) -> Optional[str]:
+        """Rank trigram candidates by edit-distance similarity"""
+        shared: Dict[str, int] = {}
+        for trigram in _trigrams(query):
+            for surface in self._trigrams.get(trigram, ()):
+                shared[surface] = shared.get(surface, 0) + 1
+
+        scored: List[Tuple[float, str]] = []
+        for surface in sorted(shared, key=shared.get, reverse=True)[:10]:
+            names = accept(self._exact[surface])
+            if len(names) != 1:
+                continue
+            scored.append((similarity(query, surface), names.pop()))
+
+        if not scored:
+            return None
+
+        scored.sort(reverse=True)
+        best_score, best_name = scored[0]
+        if best_score < self.min_similarity:
+            return None
+
+        for score, name in scored[1:]:
+            if name != best_name and best_score - score < self.ambiguity_margin:
+                return None
+
+        return best_name
+
+
+def normalize_entity_name(text: str) -> str:
+    """Lowercase, strip accents, apostrophes, punctuation and leading articles"""
+    text = unicodedata.normalize("NFKD", text.lower())
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    text = text.replace("’", "'").replace("'s ", "s ").replace("'", " ")
+    text = re.sub(r"[^\w\s]", " ", text)
+    text = " ".join(text.split())
+    previous = None
+    while previous != text:
+        previous = text
+        text = ARTICLES_PATTERN.sub("", text)
+    return text
+
+
+def similarity(a: str, b: str) -> float:
+    """Normalized Levenshtein similarity between 0 and 1"""
+    if a == b:
+        return 1.0
+    longest = max(len(a), len(b))
+    if longest == 0:
+        return 1.0
+    return 1.0 - levenshtein_distance(a, b) / longest
+
+
+def levenshtein_distance(a: str, b: str) -> int:
+    """Edit distance with a two-row dynamic programming table"""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b),
+            ))
+        previous = current
+    return previous[-1]
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Character trigrams of a padded string"""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
@@ -3,6 +3,7 @@
 from typing import Any, Dict, List, Optional
 from game_engine.models.character import Character
 from game_engine.models.room import Room
+from game_engine.utils.entity_resolver import CHARACTER
 
 
 class GameUtils:
@@ -24,8 +25,39 @@ class GameUtils:
         for character in characters:
             if character.name.lower() == name_lower:
                 return character
+
+        # Fall back on aliases, translations and near-miss spellings
+        resolved = GameUtils.resolve_entity_name(
+            name, CHARACTER, [character.name for character in characters]
+        )
+        for character in characters:
+            if character.name == resolved:
+                return character
         return None
 
+    @staticmethod
+    def resolve_entity_name(
+        name: str, entity_type: str, candidates: List[str]
+    ) -> Optional[str]:
+        """
+        Resolve a name to one of the candidates through the entity resolver
+
+        Args:
+            name: Name as written by the player or the AI
+            entity_type: Entity type (room, character, clue)
+            candidates: Canonical names allowed in this context
+
+        Returns:
+            Canonical name if resolved, None otherwise
+        """
+        if not name or not candidates:
+            return None
+
+        # Imported here: the loader depends on the models using these utilities
+        from game_engine.setup.game_data import get_entity_resolver
+
+        return get_entity_resolver().resolve(name, entity_type, candidates)
+
     @staticmethod
     def get_characters_in_room(room: Room) -> List[Character]:
         """
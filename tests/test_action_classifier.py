@@ -0,0 +1,111 @@
+# test_action_classifier.py
+"""
+Test script to verify nonsense severities are classified locally in every language
+"""
+
+
+class NonsenseAPI:
+    """API stand-in returning a fixed nonsense reaction"""
+
+    def __init__(self, severity):
+        self.calls = 0
+        self.severity = severity
+
+    def make_api_call(self, messages, system_content=None, max_tokens=None, **kwargs):
+        self.calls += 1
+        return (
+            '{"message": "The butler stares at you.", "severity": "%s", '
+            '"action_category": "violence", "summary": "The detective lashed out"}' % self.severity
+        )
+
+
+def test_action_classifier():
+    """Test multilingual keywords, severity priority and the handler's severity modes"""
+    from ai_engine.cache.cache_config import CacheConfig
+    from ai_engine.cache.cache_manager import AICache
+    from ai_engine.processors.command import NonsenseHandler, NonsenseSeverityMode
+    from ai_engine.processors.command import nonsense_handler
+    from ai_engine.utils.action_classifier import SEVERITY_KEYWORDS, ActionClassifier, ActionSeverity
+
+    print("=== ACTION CLASSIFIER TEST ===\n")
+
+    # Test 1: Keywords are matched in the player's language, accents and case ignored
+    cases = [
+        ("I KICK the butler", "english", ActionSeverity.DANGEROUS),
+        ("Je pete bruyamment", "french", ActionSeverity.IMPROMPTU),
+        ("je détruis le vase", "french", ActionSeverity.DANGEROUS),
+        ("Ich tanze auf dem Tisch", "german", ActionSeverity.AWKWARD),
+        ("canto una canción", "spanish", ActionSeverity.AWKWARD),
+        ("我在桌子上跳舞", "chinese_simplified", ActionSeverity.AWKWARD),
+        ("執事を殴る", "japanese", ActionSeverity.DANGEROUS),
+        ("집사를 때리다", "korean", ActionSeverity.DANGEROUS),
+        ("я громко чихаю", "russian", ActionSeverity.IMPROMPTU),
+        ("I dance", "italian", ActionSeverity.AWKWARD),
+    ]
+    for command, language, expected in cases:
+        assert ActionClassifier.classify_action(command, language) == expected, command
+    assert set(SEVERITY_KEYWORDS) >= {"english", "french", "spanish", "german", "italian",
+                                      "portuguese", "russian", "chinese_simplified", "japanese", "korean"}
+
+    # Test 2: The most severe keyword wins, unknown actions are awkward
+    assert ActionClassifier.find_severity("I sneeze, then sing and punch the vase") == ActionSeverity.DANGEROUS
+    assert ActionClassifier.find_severity("I contemplate the ceiling") is None
+    assert ActionClassifier.classify_action("I contemplate the ceiling") == ActionSeverity.AWKWARD
+    assert ActionClassifier.find_severity("I whistle at the painting") == ActionSeverity.IMPROMPTU
+
+    # Test 3: Whole words only, harmless idioms never count as violence
+    harmless = [
+        ("I break into song", "english"),
+        ("I eat breakfast on the roof", "english"),
+        ("I beatbox loudly", "english"),
+        ("I hit the dance floor", "english"),
+        ("I kick off my shoes and dance", "english"),
+        ("I shoot a glance at the butler and wink", "english"),
+        ("je mange la casserole", "french"),
+        ("Je tue le temps en jouant aux cartes", "french"),
+        ("je frappe à la porte", "french"),
+    ]
+    for command, language in harmless:
+        assert ActionClassifier.find_severity(command, language) != ActionSeverity.DANGEROUS, command
+    assert ActionClassifier.find_severity("I broke the vase, then kicked the butler") == ActionSeverity.DANGEROUS
+
+    language = nonsense_handler.get_current_language
+    nonsense_handler.get_current_language = lambda: "english"
+    try:
+        # Test 4: Local mode keeps the classifier severity and measures agreement with the AI
+        api = NonsenseAPI("awkward")
+        handler = NonsenseHandler(api, AICache(CacheConfig(enable_cache=False)),
+                                  severity_mode=NonsenseSeverityMode.LOCAL)
+        assert handler.classify_severity("I punch the butler") == "dangerous"
+        assert handler.classify_severity("I contemplate the ceiling") is None
+
+        result = handler.handle_nonsense("I punch the butler", {})
+        assert result["severity"] == "dangerous"
+        assert result["message"] == "The butler stares at you."
+
+        api.severity = "impromptu"
+        assert handler.handle_nonsense("I burp loudly", {})["severity"] == "impromptu"
+
+        stats = handler.get_statistics()
+        print(f"  Statistics: {stats}")
+        assert stats["compared"] == 2 and stats["agreement_rate"] == 0.5
+        assert stats["disagreements"] == {"dangerous->awkward": 1}
+
+        # Test 5: Without a keyword, local mode keeps the AI severity
+        assert handler.handle_nonsense("I contemplate the ceiling", {})["severity"] == "impromptu"
+        assert handler.get_statistics()["compared"] == 2
+
+        # Test 6: Shadow mode (default) keeps the AI severity, the classifier is only compared
+        handler = NonsenseHandler(api, AICache(CacheConfig(enable_cache=False)))
+        assert handler.severity_mode == NonsenseSeverityMode.SHADOW
+        assert handler.classify_severity("I punch the butler") is None
+        assert handler.handle_nonsense("I punch the butler", {})["severity"] == "impromptu"
+        assert handler.get_statistics()["agreement_rate"] == 0.0
+    finally:
+        nonsense_handler.get_current_language = language
+
+    print("Action classifier test passed!\n")
+
+
+if __name__ == "__main__":
+    test_action_classifier()
@@ -0,0 +1,54 @@
+# test_background_summary.py
+"""
+Test script to verify conversation summaries are stored off the response path
+"""
+
+import threading
+
+
+class SlowSummaryAPI:
+    """API stand-in whose summary call blocks until released"""
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def make_api_call(self, messages, system_content, max_tokens=200, **kwargs):
+        self.release.wait(timeout=5)
+        return "- The detective asked about the will"
+
+
+def test_background_summary():
+    """Test the pending slot, the wait and the stored summary"""
+    from ai_engine.processors.character.summary import BackgroundSummaryService
+    from game_engine.models.character import Character
+    from game_engine.models.player import Player
+
+    api = SlowSummaryAPI()
+    service = BackgroundSummaryService(api)
+    character = Character("Martha Higgins", "Governess", "", [])
+    character.remember("Did you see the will?", "user")
+    character.remember("I saw nothing, sir.", "assistant")
+
+    print("=== BACKGROUND SUMMARY TEST ===\n")
+
+    # Test 1: Returns immediately with the conversation frozen
+    service.summarize_and_store(character, Player("Tester"))
+    assert character.memory_current == []
+    assert len(character.memory_pending) == 2
+    assert service.get_pending_count() == 1
+    assert not service.wait_for_summary(character, timeout=0.05)
+    print("  Conversation frozen while the summary is generated")
+
+    # Test 2: The next conversation waits for the summary
+    api.release.set()
+    assert service.wait_for_summary(character, timeout=5)
+    assert character.memory_pending == []
+    assert character.memory_global == ["- The detective asked about the will"]
+    assert service.get_pending_count() == 0
+    print(f"  Summary stored: {character.memory_global}")
+
+    print("Background summary test passed!\n")
+
+
+if __name__ == "__main__":
+    test_background_summary()
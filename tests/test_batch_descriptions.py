@@ -0,0 +1,98 @@
+# test_batch_descriptions.py
+"""
+Test script to verify a room's characters and clues are generated in one call each and cached per entity
+"""
+
+
+class BatchAPI:
+    """API stand-in answering batch prompts with one entry per entity"""
+
+    def __init__(self, characters, clues):
+        self.calls = 0
+        self.characters = characters
+        self.clues = clues
+
+    def make_api_call(self, messages, system_content=None, max_tokens=None, **kwargs):
+        import json
+        self.calls += 1
+        if '"analyses"' in messages[-1]["content"]:
+            return json.dumps({"analyses": [
+                {"name": name, "analysis": f"You study {name}."} for name in self.clues
+            ]})
+        return json.dumps({"descriptions": [
+            {"name": name.upper(), "description": f"You notice {name}."} for name in self.characters
+        ]})
+
+    def parse_json_response(self, content, fallback_response):
+        import json
+        return json.loads(content)
+
+
+def test_batch_descriptions():
+    """Test the batch APIs, per-entity caching and batched prefetch"""
+    from ai_engine.cache.cache_config import CacheConfig
+    from ai_engine.cache.cache_manager import AICache
+    from ai_engine.processors.story import StoryProcessor
+    from ai_engine.processors.story.prefetch import DescriptionPrefetcher
+    from game_engine.setup.game_setup import setup_game
+
+    rooms, player = setup_game("Tester")
+    # Characters are placed at random: gather two in the room with the most clues
+    room = max(rooms.values(), key=lambda r: len(r.clues))
+    room.characters = [c for r in rooms.values() for c in r.characters][:2]
+    characters = list(room.characters)
+    clues = list(room.clues)
+    assert len(characters) > 1 and len(clues) > 1
+
+    def new_processor():
+        api = BatchAPI([c.name for c in characters], [c.name for c in clues])
+        processor = StoryProcessor(api, AICache(CacheConfig(enable_cache=True, enable_disk_cache=False)))
+        processor.prefetcher = None
+        return api, processor
+
+    api, processor = new_processor()
+
+    print("=== BATCH DESCRIPTIONS TEST ===\n")
+
+    # Test 1: One call describes every character, names matched case-insensitively
+    descriptions = processor.generate_character_descriptions(characters, room)
+    assert api.calls == 1
+    assert descriptions == {c.name: f"You notice {c.name}." for c in characters}
+
+    # Test 2: Each description is cached on its own, later looks need no call
+    for character in characters:
+        assert processor.generate_character_description(character, room) == f"You notice {character.name}."
+    assert processor.generate_character_descriptions(characters, room) == descriptions
+    assert api.calls == 1
+
+    # Test 3: Clues are analysed together and cached per clue
+    analyses = processor.analyze_clues(clues, player.inventory)
+    assert analyses == {c.name: f"You study {c.name}." for c in clues}
+    assert processor.analyze_clue(clues[0], [*player.inventory, clues[0]]) == f"You study {clues[0].name}."
+    assert api.calls == 2
+    print(f"  {len(descriptions)} characters and {len(analyses)} clues of {room.name} in two calls")
+
+    # Test 4: Batched prefetch spends one call for the characters and one for the clues
+    api, processor = new_processor()
+    prefetcher = DescriptionPrefetcher(
+        processor.character_generator, processor.clue_analyzer, processor.cache, idle_timeout=0, batch=True
+    )
+    assert prefetcher.prefetch_room(room, player.inventory) == len(characters) + len(clues)
+    prefetcher._executor.submit(lambda: None).result(timeout=5)
+    assert api.calls == 2
+
+    processor.prefetcher = prefetcher
+    processor.generate_character_description(characters[0], room)
+    processor.analyze_clue(clues[0], [*player.inventory, clues[0]])
+    assert api.calls == 2
+
+    stats = prefetcher.get_statistics()
+    print(f"  Statistics: {stats}")
+    assert stats["batches"] == 2 and stats["generated"] == len(characters) + len(clues)
+    assert stats["hit_through_rate"] == 1.0
+
+    print("Batch descriptions test passed!\n")
+
+
+if __name__ == "__main__":
+    test_batch_descriptions()
@@ -0,0 +1,63 @@
+# test_character_memory.py
+"""
+Test script to verify typed character memories are deduplicated and rendered once
+"""
+
+def test_character_memory():
+    """Test dedup by key, witness cap, rendering and legacy save loading"""
+    from game_engine.models.character import Character
+    from game_engine.models.character_memory import MemoryKind
+
+    character = Character("Edgar Holloway", "Gardener", "", [])
+
+    print("=== CHARACTER MEMORY TEST ===\n")
+
+    # Test 1: Repeated reputation updates keep a single entry per key
+    for _ in range(5):
+        character.memory.add_reputation("manor", "The detective has gained an eccentric reputation throughout the manor")
+    assert not character.memory.add_reputation("manor", "The detective has gained an eccentric reputation throughout the manor")
+    assert character.memory.add_reputation("manor", "Word has spread throughout the manor about the detective's dangerous reputation")
+    assert len(character.memory.get_entries(MemoryKind.REPUTATION)) == 1
+    print("  Reputation deduplicated by key")
+
+    # Test 2: Each witnessed event once, most recent ones only
+    for event in range(5):
+        character.memory.add_witness(f"Kitchen:{event}", f"DIRECT WITNESS: event {event}")
+        character.memory.add_witness(f"Kitchen:{event}", f"DIRECT WITNESS: event {event}")
+    witnessed = [e.content for e in character.memory.get_entries(MemoryKind.WITNESS)]
+    assert witnessed == ["DIRECT WITNESS: event 2", "DIRECT WITNESS: event 3", "DIRECT WITNESS: event 4"]
+    print(f"  Witness entries: {witnessed}")
+
+    # Test 3: Dialogue stays separate and context is rendered once, first
+    character.remember("Where were you last night?", "user")
+    character.remember("In the garden, sir.", "assistant")
+    assert character.memory_current == [
+        {"role": "user", "content": "Where were you last night?"},
+        {"role": "assistant", "content": "In the garden, sir."},
+    ]
+    rendered = character.render_memory()
+    assert len(rendered) == 6
+    assert rendered[0]["content"].startswith("Word has spread")
+    assert rendered[-1]["content"] == "In the garden, sir."
+
+    character.summarize_and_store_memory("- Edgar was in the garden")
+    assert character.memory_current == []
+    assert len(character.render_memory()) == 4
+    print("  Dialogue reset, context kept")
+
+    # Test 4: Legacy saves with reputation lines in the current memory
+    restored = Character("Edgar Holloway", "Gardener", "", [])
+    restored.memory.load_messages([
+        {"role": "assistant", "content": "MANOR-WIDE REPUTATION: The detective's peculiar social habits..."},
+        {"role": "assistant", "content": "MANOR-WIDE REPUTATION: The detective's peculiar social habits..."},
+        {"role": "user", "content": "Hello"},
+    ])
+    assert len(restored.memory.get_entries(MemoryKind.REPUTATION)) == 1
+    assert restored.memory_current == [{"role": "user", "content": "Hello"}]
+    print("  Legacy memory typed on load")
+
+    print("Character memory test passed!\n")
+
+
+if __name__ == "__main__":
+    test_character_memory()
@@ -0,0 +1,62 @@
+# test_clue_graph.py
+"""
+Test script to verify clue analyses only depend on related collected clues
+"""
+
+
+class CountingAPI:
+    """API stand-in counting calls"""
+
+    def __init__(self):
+        self.calls = 0
+        self.prompts = []
+
+    def make_api_call(self, messages, system_content=None, max_tokens=None, **kwargs):
+        self.calls += 1
+        self.prompts.append(messages[0]["content"])
+        return f"Analysis {self.calls}"
+
+
+def test_clue_graph():
+    """Test the graph data, the relevant subset and cache reuse across inventories"""
+    from ai_engine.cache.cache_config import CacheConfig
+    from ai_engine.cache.cache_manager import AICache
+    from ai_engine.processors.story.clue_analyzer import ClueAnalyzer
+    from game_engine.setup.game_data import create_clues, get_clue_graph
+
+    clues = {clue.name: clue for clue in create_clues()}
+    graph = get_clue_graph()
+
+    print("=== CLUE GRAPH TEST ===\n")
+
+    # Test 1: Relationships are symmetric and point to existing clues
+    assert graph.validate(clues) == []
+    assert "Basin" in graph.related("Scented tea cup")
+    assert "Scented tea cup" in graph.related("Basin")
+    print(f"  Scented tea cup -> {sorted(graph.related('Scented tea cup'))}")
+
+    # Test 2: Only related collected clues are kept
+    cup = clues["Scented tea cup"]
+    inventory = [clues["Ring with initials"], clues["Basin"], cup]
+    assert [c.name for c in graph.relevant_clues(cup, inventory)] == ["Basin"]
+
+    # Test 3: Unrelated clues in the inventory do not change the analysis
+    api = CountingAPI()
+    cache = AICache(CacheConfig(enable_cache=True, enable_disk_cache=False))
+    analyzer = ClueAnalyzer(api, cache, clue_graph=graph)
+
+    analyzer.analyze_clue(cup, [clues["Ring with initials"], cup])
+    analyzer.analyze_clue(cup, [clues["Dismissal letter"], clues["Small firearm"], cup])
+    assert api.calls == 1
+    assert "Related clues" not in api.prompts[0]
+
+    # Test 4: A related clue is part of the prompt and of the cache key
+    analyzer.analyze_clue(cup, inventory)
+    assert api.calls == 2
+    assert "Basin" in api.prompts[1]
+
+    print("Clue graph test passed!\n")
+
+
+if __name__ == "__main__":
+    test_clue_graph()
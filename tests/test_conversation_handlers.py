@@ -0,0 +1,99 @@
+# test_conversation_handlers.py
+"""
+Test script to verify the conversation handlers share one flow: prompt, single call,
+post-processing, memory store and error handling
+"""
+
+import json
+
+
+class ScriptedAPI:
+    """API service stand-in returning scripted contents and keeping the system prompts"""
+
+    def __init__(self, *contents):
+        self.contents = list(contents)
+        self.system_prompts = []
+
+    def make_api_call(self, messages, system_content=None, **kwargs):
+        self.system_prompts.append(system_content)
+        return self.contents.pop(0)
+
+
+class RecordingMemory:
+    """Memory manager stand-in keeping the stored answers"""
+
+    def __init__(self):
+        self.stored = []
+
+    def get_conversation_context(self, character, topic, game_state, player):
+        return [{"role": "user", "content": topic}]
+
+    def store_conversation(self, character, topic, answer):
+        self.stored.append((character.name, topic, answer))
+
+
+class LoudPersonality:
+    """Personality engine stand-in shouting the neutral answer"""
+
+    def apply_personality(self, response, character, topic):
+        return {**response, "answer": response["answer"].upper()}
+
+
+def test_conversation_handlers():
+    """Test the fused and standard handlers on a stubbed API"""
+    from ai_engine.benchmarks.prompt_size import _get_character, create_fixtures
+    from ai_engine.processors.character import (
+        FusedConversationHandler,
+        StandardConversationHandler,
+    )
+    from ai_engine.processors.character.errors import ConversationErrorHandler
+
+    print("=== CONVERSATION HANDLERS TEST ===\n")
+
+    game_state = create_fixtures()["late"]
+    player = game_state.player
+    character = _get_character(game_state)
+    answer = json.dumps({"action": "conversation", "answer": "I was in the garden."})
+
+    # Test 1: Fused mode answers with one call and stores the answer
+    api, memory = ScriptedAPI(answer), RecordingMemory()
+    handler = FusedConversationHandler(api, memory)
+    response = json.loads(handler.handle_conversation(character, player, "Where were you?", game_state))
+    print(f"  Fused: {response}")
+    assert response["answer"] == "I was in the garden."
+    assert len(api.system_prompts) == 1 and character.name in api.system_prompts[0]
+    assert memory.stored == [(character.name, "Where were you?", "I was in the garden.")]
+
+    # Test 2: Standard mode post-processes the neutral answer before storing it
+    api, memory = ScriptedAPI(answer), RecordingMemory()
+    handler = StandardConversationHandler(api, memory, LoudPersonality())
+    response = json.loads(handler.handle_conversation(character, player, "Where were you?", game_state))
+    print(f"  Standard: {response}")
+    assert response["answer"] == "I WAS IN THE GARDEN."
+    assert memory.stored == [(character.name, "Where were you?", "I WAS IN THE GARDEN.")]
+
+    # Test 3: Invalid JSON and timeouts return the error answers, nothing is stored
+    timeout = ConversationErrorHandler.handle_ai_timeout("test")
+    parse_error = ConversationErrorHandler.handle_conversation_error(
+        Exception("JSON decode error"), "response_parsing"
+    )
+    for handler_class in (FusedConversationHandler, StandardConversationHandler):
+        api, memory = ScriptedAPI("not json", None), RecordingMemory()
+        args = (api, memory) if handler_class is FusedConversationHandler else (api, memory, LoudPersonality())
+        handler = handler_class(*args)
+        assert handler.handle_conversation(character, player, "Where were you?", game_state) == parse_error
+        assert handler.handle_conversation(character, player, "Where were you?", game_state) == timeout
+        assert memory.stored == []
+
+    # Test 4: Invalid inputs never reach the API
+    api = ScriptedAPI()
+    response = json.loads(FusedConversationHandler(api, RecordingMemory()).handle_conversation(
+        character, player, "   ", game_state
+    ))
+    assert api.system_prompts == [] and response["answer"]
+
+    print("Conversation handlers test passed!\n")
+
+
+if __name__ == "__main__":
+    test_conversation_handlers()
@@ -0,0 +1,50 @@
+# test_entity_resolver.py
+"""
+Test script to verify the entity resolver maps aliases, translations and typos to canonical names
+"""
+
+def test_entity_resolver():
+    """Test alias, translation, typo and ambiguity handling"""
+    from game_engine.setup.game_data import get_entity_resolver
+    from game_engine.setup.game_setup import setup_game
+    from game_engine.utils.entity_resolver import CHARACTER, ROOM
+    from game_engine.utils.game_utils import GameUtils
+
+    resolver = get_entity_resolver()
+
+    print("=== ENTITY RESOLVER TEST ===\n")
+
+    # Test 1: Aliases and translated room names
+    assert resolver.resolve("Lord Blackwood", CHARACTER) == "Lord Maximilian Blackwood"
+    assert resolver.resolve("la cuisine", ROOM) == "Kitchen"
+    assert resolver.resolve("Küche", ROOM) == "Kitchen"
+    assert resolver.resolve("bureau du maître", ROOM) == "Master's Study"
+    print("  Aliases and translations resolved")
+
+    # Test 2: Typos and partial names
+    assert resolver.resolve("librery", ROOM) == "Library"
+    assert resolver.resolve("servants quarters", ROOM) == "Servant's Quarters"
+    assert resolver.resolve("dismisal letter") == "Dismissal letter"
+    print("  Typos and partial names resolved")
+
+    # Test 3: Ambiguous or unknown names stay unresolved
+    assert resolver.resolve("Blackwood", CHARACTER) is None
+    assert resolver.resolve("garden shed") is None
+    print("  Ambiguous and unknown names rejected")
+
+    # Test 4: Game code resolves within the allowed candidates only
+    rooms, player = setup_game("Tester")
+    characters = [c for room in rooms.values() for c in room.characters]
+    assert GameUtils.find_character_by_name(characters, "Martha").name == "Martha Higgins"
+
+    player.current_location = rooms["Kitchen"]
+    assert player.collect_clue("the dismisal leter")
+    assert player.inventory[-1].name == "Dismissal letter"
+    assert not player.collect_clue("Burnt journal page")
+    print("  Game lookups resolved")
+
+    print("Entity resolver test passed!\n")
+
+
+if __name__ == "__main__":
+    test_entity_resolver()
@@ -0,0 +1,68 @@
+# test_lore_index.py
+"""
+Test script to verify the local lore retriever answers from the game state
+"""
+
+def test_local_lore_retriever():
+    """Test lore facts for characters, roles, collected clues and lore text"""
+    from game_engine.core.game_state import GameState
+    from game_engine.setup.game_setup import setup_game
+    from ai_engine.processors.character.memory import LocalLoreRetriever
+
+    rooms, player = setup_game("Tester")
+    state = GameState(rooms=rooms, player=player)
+    retriever = LocalLoreRetriever()
+    speaker = next(c for room in rooms.values() for c in room.characters if c.name == "Victor Langley")
+
+    martha_room = next(r.name for r in rooms.values() if any(c.name == "Martha Higgins" for c in r.characters))
+
+    print("=== LOCAL LORE RETRIEVER TEST ===\n")
+
+    # Test 1: Character location by name and by role
+    facts = retriever.get_relevant_lore(state, "Where is Martha?", player, speaker)
+    print(f"  By name: {facts}")
+    assert "Martha Higgins" in facts and martha_room in facts
+
+    facts = retriever.get_relevant_lore(state, "Where is the governess?", player, speaker)
+    print(f"  By role: {facts}")
+    assert "Martha Higgins" in facts
+
+    # Test 2: Opinion questions get no facts
+    assert retriever.get_relevant_lore(state, "What do you think about the murder?", player, speaker) is None
+
+    # Test 3: Index follows the inventory incrementally
+    player.current_location = rooms["Kitchen"]
+    facts = retriever.get_relevant_lore(state, "Look at this dismissal letter", player, speaker)
+    assert "visible in the room" in facts
+
+    assert player.collect_clue("Dismissal letter")
+    facts = retriever.get_relevant_lore(state, "Look at this dismissal letter", player, speaker)
+    print(f"  After collecting: {facts}")
+    assert facts == "The detective has Dismissal letter."
+    assert retriever.index.stats["builds"] == 1
+
+    # Test 4: Room and character lore text is searched when no name matches
+    for room in rooms.values():
+        state.lore["rooms"][room.name] = room.description
+        for character in room.characters:
+            state.lore["characters"][character.name] = {
+                "role": character.role,
+                "description": character.description,
+                "traits": character.traits,
+                "location": room.name,
+            }
+    facts = retriever.get_relevant_lore(state, "Where are the velvet sofas?", player, speaker)
+    print(f"  By room lore: {facts}")
+    assert facts.startswith("Main Salon is a room of the manor")
+
+    facts = retriever.get_relevant_lore(state, "Who has a bruised eye?", player, speaker)
+    print(f"  By character lore: {facts}")
+    assert "Inspector Ferdinand" in facts
+    assert retriever.get_relevant_lore(state, "What do you think about the murder?", player, speaker) is None
+    assert retriever.index.stats["builds"] == 1
+
+    print("Local lore retriever test passed!\n")
+
+
+if __name__ == "__main__":
+    test_local_lore_retriever()
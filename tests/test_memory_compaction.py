@@ -0,0 +1,57 @@
+# test_memory_compaction.py
+"""
+Test script to verify long conversations keep a bounded memory
+"""
+
+
+class DigestAPI:
+    """API stand-in returning a fixed digest"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def make_api_call(self, messages, system_content, max_tokens=250, **kwargs):
+        self.calls += 1
+        return f"- Digest {self.calls}: the detective asked many questions"
+
+
+def test_memory_compaction():
+    """Test that old turns fold into the digest and the prompt memory stays bounded"""
+    from ai_engine.processors.character.compaction import MemoryCompactor
+    from ai_engine.utils.tokens import estimate_tokens
+    from game_engine.models.character import Character
+    from game_engine.models.player import Player
+
+    api = DigestAPI()
+    compactor = MemoryCompactor(api, token_threshold=300, keep_messages=4)
+    character = Character("Victor Langley", "Business partner", "", [])
+    player = Player("Tester")
+
+    print("=== MEMORY COMPACTION TEST ===\n")
+
+    sizes = []
+    for turn in range(30):
+        compactor.maybe_compact(character, player)
+        for job in list(compactor._jobs.values()):
+            job.future.result(timeout=5)
+        character.remember(f"Question {turn}: " + "where were you that night? " * 5, "user")
+        character.remember(f"Answer {turn}: " + "I was in the library, alone. " * 5, "assistant")
+        sizes.append(estimate_tokens(character.get_conversation_memory()))
+
+    print(f"  Prompt memory sizes: {sizes[:3]} ... {sizes[-3:]}")
+    print(f"  Statistics: {compactor.get_statistics()}")
+    assert max(sizes[10:]) <= 300 + estimate_tokens(character.memory_current[-4:])
+    assert character.memory_digest.startswith("- Digest")
+    assert character.get_conversation_memory()[0]["content"].startswith("EARLIER IN THIS CONVERSATION")
+    assert character.memory_current[-1]["content"].startswith("Answer 29")
+
+    # Ending the conversation folds the digest into the summary input
+    conversation = character.freeze_current_memory()
+    assert conversation[0]["content"].startswith("EARLIER IN THIS CONVERSATION")
+    assert character.memory_digest == ""
+
+    print("Memory compaction test passed!\n")
+
+
+if __name__ == "__main__":
+    test_memory_compaction()
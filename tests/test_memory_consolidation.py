@@ -0,0 +1,56 @@
+# test_memory_consolidation.py
+"""
+Test script to verify past conversation summaries are merged into a bounded dossier
+"""
+
+
+class FailingAPI:
+    """API stand-in whose calls fail, forcing the local fallback"""
+
+    def make_api_call(self, messages, system_content, max_tokens=300, **kwargs):
+        return None
+
+
+def test_memory_consolidation():
+    """Test that memory_global stays bounded however many conversations happen"""
+    from ai_engine.processors.character.consolidation import (
+        ConsolidationMode,
+        GlobalMemoryConsolidator,
+    )
+    from game_engine.models.character import Character
+    from game_engine.models.player import Player
+
+    consolidator = GlobalMemoryConsolidator(
+        FailingAPI(), ConsolidationMode.LLM, max_summaries=3, max_tokens=120
+    )
+    character = Character("Judith Blackwood", "Daughter", "", [])
+    player = Player("Tester")
+
+    print("=== MEMORY CONSOLIDATION TEST ===\n")
+
+    sizes = []
+    for conversation in range(12):
+        character.memory_global.append(
+            f"- The detective asked about the will (visit {conversation})\n"
+            "- Judith denied being in the study that night"
+        )
+        consolidator.consolidate(character, player)
+        sizes.append(consolidator.global_memory_tokens[character.name])
+
+    stats = consolidator.get_statistics()
+    print(f"  Global memory tokens: {sizes}")
+    print(f"  Statistics: {stats}")
+    assert len(character.memory_global) <= 3
+    assert max(sizes) <= 120 + 3 * 30
+    assert stats["local"] == stats["consolidations"] > 0
+
+    # Duplicate points are merged, the latest visit is kept
+    dossier = character.memory_global[0]
+    assert dossier.count("Judith denied being in the study") == 1
+    assert "visit 11" in "\n".join(character.memory_global)
+
+    print("Memory consolidation test passed!\n")
+
+
+if __name__ == "__main__":
+    test_memory_consolidation()
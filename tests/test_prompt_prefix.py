@@ -0,0 +1,111 @@
+# test_prompt_prefix.py
+"""
+Test script to verify agent prompts start with a stable prefix and API usage records cached tokens
+"""
+
+from types import SimpleNamespace
+
+
+class UsageClient:
+    """Chat client stand-in answering with the given usage blocks, in order"""
+
+    def __init__(self, usages):
+        self.usages = list(usages)
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, **kwargs):
+        message = SimpleNamespace(content="ok", tool_calls=None)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=self.usages.pop(0))
+
+
+class EchoUsageClient:
+    """Chat client stand-in reporting the number in the last message as prompt tokens"""
+
+    def __init__(self):
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, **kwargs):
+        import time
+
+        time.sleep(0.001)
+        message = SimpleNamespace(content="ok", tool_calls=None)
+        usage = SimpleNamespace(prompt_tokens=int(kwargs["messages"][-1]["content"]), completion_tokens=1)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=usage)
+
+
+def test_prompt_prefix():
+    """Test the shared prefix of every agent prompt over turns and the usage statistics"""
+    from ai_engine.api.service import APIService
+    from ai_engine.benchmarks.common import create_benchmark_game_state
+    from ai_engine.benchmarks.prompt_prefix import prefix_stability, render_turns, shared_prefix_length
+
+    print("=== PROMPT PREFIX TEST ===\n")
+
+    # Test 1: Rules and formats come before the turn's data in every agent prompt
+    rendered = render_turns(create_benchmark_game_state())
+    stability = prefix_stability(rendered)
+    for agent, metrics in stability.items():
+        print(f"  {agent:<22} prefix={metrics['prefix_chars']:>5} share={metrics['prefix_share']}")
+        assert metrics["prefix_share"] >= 0.25, agent
+    for agent in ("reasoning", "executor", "pipeline", "nonsense", "lore", "summary"):
+        assert stability[agent]["prefix_share"] >= 0.8, agent
+
+    # Test 2: The shared prefix covers each agent's rules, the volatile data follows them
+    landmarks = {
+        "reasoning": "Respond in JSON format",
+        "executor": "RESPONSE GUIDELINES",
+        "pipeline": "Call the provided function",
+        "nonsense": "Remember: The goal is",
+        "neutral": "Do NOT add any additional keys",
+        "fused": "VOICE AND PERSONALITY",
+        "room_description": "NO FALSE INTRIGUE",
+    }
+    for agent, landmark in landmarks.items():
+        prompts = [turn[agent] for turn in rendered]
+        assert landmark in prompts[0][:shared_prefix_length(prompts)], agent
+
+    # Test 3: Usage is recorded per call, cached tokens included when reported
+    client = UsageClient([
+        SimpleNamespace(prompt_tokens=2000, completion_tokens=50,
+                        prompt_tokens_details=SimpleNamespace(cached_tokens=1536)),
+        SimpleNamespace(prompt_tokens=2000, completion_tokens=30),
+    ])
+    service = APIService(client, "test-deployment")
+    assert service.make_api_call([{"role": "user", "content": "hello"}]) == "ok"
+    assert service.last_usage["cached_tokens"] == 1536
+    service.make_api_call([{"role": "user", "content": "hello again"}])
+    assert service.last_usage["cached_tokens"] == 0
+
+    stats = service.get_usage_statistics()
+    print(f"  Usage: {stats}")
+    assert stats["calls"] == 2 and stats["cached_calls"] == 1
+    assert stats["prompt_tokens"] == 4000 and stats["completion_tokens"] == 80
+    assert stats["cached_token_share"] == 0.384
+
+    # Test 4: Concurrent calls each see their own usage and are counted once
+    import threading
+
+    service = APIService(EchoUsageClient(), "test-deployment")
+    mismatches = []
+
+    def worker(tokens):
+        for _ in range(20):
+            if service.make_api_call([{"role": "user", "content": str(tokens)}]) != "ok":
+                mismatches.append(("failed", tokens))
+            elif service.last_usage["prompt_tokens"] != tokens:
+                mismatches.append((service.last_usage["prompt_tokens"], tokens))
+
+    threads = [threading.Thread(target=worker, args=(tokens,)) for tokens in (10, 20, 30, 40)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stats = service.get_usage_statistics()
+    assert mismatches == []
+    assert stats["calls"] == 80 and stats["prompt_tokens"] == 20 * (10 + 20 + 30 + 40)
+
+    print("Prompt prefix test passed!\n")
+
+
+if __name__ == "__main__":
+    test_prompt_prefix()
@@ -0,0 +1,53 @@
+# test_prompt_size.py
+"""
+Test script to verify the prompt size profiler breaks every agent prompt into sections
+"""
+
+
+def test_prompt_size():
+    """Test fixtures, per-section token counts and regression detection"""
+    import copy
+
+    from ai_engine.benchmarks.prompt_size import TEMPLATE_SECTION, find_regressions, profile_fixtures
+    from ai_engine.utils.tokens import count_text_tokens, estimate_text_tokens, get_tokenizer_name
+
+    print("=== PROMPT SIZE TEST ===\n")
+
+    # Test 1: Without tiktoken, token counts fall back to the estimate
+    text = "The detective examines the letter on the desk."
+    if get_tokenizer_name() == "estimate":
+        assert count_text_tokens(text) == estimate_text_tokens(text)
+    assert 0 < count_text_tokens(text) < len(text)
+    assert count_text_tokens("") == 0
+
+    # Test 2: Every agent is profiled in every fixture, sections within the prompt
+    results = profile_fixtures()
+    agents = {"reasoning", "command", "pipeline", "neutral", "fused", "lore",
+              "personality", "summary", "collect_theory", "analyse_theory"}
+    assert set(results["fixtures"]) == {"early", "mid", "late", "long_conversation"}
+    for stage, profile in results["fixtures"].items():
+        assert set(profile) == agents, stage
+        for agent, metrics in profile.items():
+            assert metrics["sections"][TEMPLATE_SECTION] >= 0
+            assert len(metrics["sections"]) > 1, agent
+        print(f"  {stage:<18} " + " ".join(f"{a}={m['prompt_tokens']}" for a, m in profile.items()))
+
+    # Test 3: Later stages and long conversations cost more
+    fixtures = results["fixtures"]
+    assert fixtures["late"]["neutral"]["prompt_tokens"] > fixtures["early"]["neutral"]["prompt_tokens"]
+    assert fixtures["long_conversation"]["neutral"]["history_tokens"] > fixtures["mid"]["neutral"]["history_tokens"]
+    assert fixtures["long_conversation"]["summary"]["prompt_tokens"] > fixtures["mid"]["summary"]["prompt_tokens"]
+
+    # Test 4: The same tree gives the same sizes, growth beyond the tolerance is flagged
+    assert find_regressions(profile_fixtures(), results, 0.0) == []
+    grown = copy.deepcopy(results)
+    grown["fixtures"]["mid"]["lore"]["prompt_tokens"] += 100
+    regressions = find_regressions(grown, results, 0.05)
+    print(f"  Regressions: {regressions}")
+    assert len(regressions) == 1 and regressions[0].startswith("mid/lore")
+
+    print("Prompt size test passed!\n")
+
+
+if __name__ == "__main__":
+    test_prompt_size()
@@ -0,0 +1,106 @@
+# test_room_lookahead.py
+"""
+Test script to verify the room-graph lookahead turns moves into cache hits
+"""
+
+
+class CountingAPI:
+    """API stand-in counting calls"""
+
+    def __init__(self):
+        self.calls = 0
+        self.failing = False
+
+    def make_api_call(self, messages, system_content=None, max_tokens=None, **kwargs):
+        self.calls += 1
+        if self.failing:
+            return None  # Timeout or rate limit
+        return f"Generated text {self.calls}"
+
+
+def test_room_lookahead():
+    """Test the room graph, lookahead hits, stale rooms and the budget"""
+    from ai_engine.cache.cache_config import CacheConfig
+    from ai_engine.cache.cache_manager import AICache
+    from ai_engine.processors.story import RoomLookahead, StoryProcessor, build_room_graph
+    from ai_engine.benchmarks.common import create_benchmark_game_state
+
+    api = CountingAPI()
+    cache = AICache(CacheConfig(enable_cache=True, enable_disk_cache=False))
+    processor = StoryProcessor(api, cache)
+    processor.prefetcher = None
+    lookahead = RoomLookahead(processor.room_generator, cache)
+    processor.lookahead = lookahead
+
+    state = create_benchmark_game_state("Tester")
+
+    print("=== ROOM LOOKAHEAD TEST ===\n")
+
+    # Test 1: The graph only links existing rooms
+    graph = build_room_graph(state.rooms)
+    assert all(exit_name in state.rooms for exits in graph.values() for exit_name in exits)
+    neighbours = [name for name in graph[state.current_location] if name not in state.rooms_visited]
+    assert neighbours
+    print(f"  {state.current_location} -> {neighbours}")
+
+    # Test 2: Unvisited neighbours are described in background
+    queued = lookahead.schedule(state)
+    lookahead.wait_idle(timeout=5)
+    assert queued == len(neighbours)
+    assert api.calls == queued
+
+    # Test 3: Moving into a neighbour is served from cache
+    target = neighbours[0]
+    state.rooms_visited.add(state.current_location)
+    state.current_location = target
+    calls = api.calls
+    processor.generate_room_description(state.rooms[target], state, "move")
+    assert api.calls == calls
+    lookahead.wait_idle(timeout=5)
+
+    # Test 4: A described room whose state changed counts as stale, not as a hit
+    pending = [name for name in lookahead._generated if name != target]
+    assert pending
+    changed = state.rooms[pending[0]]
+    changed.nonsense_events = [*getattr(changed, "nonsense_events", []), "a dancing teapot"]
+    assert lookahead.record_entry(changed) is False
+
+    stats = lookahead.get_statistics()
+    print(f"  Statistics: {stats}")
+    assert stats["lookahead_hits"] == 1
+    assert stats["stale"] == 1
+    assert stats["tokens_spent"] > 0
+
+    # Test 5: No spending once the budget is exhausted
+    lookahead.token_budget = 0
+    state.current_location = target
+    state.rooms_visited = {target}
+    assert lookahead.schedule(state) == 0
+
+    # Test 6: A failed background call caches nothing and charges no budget
+    api = CountingAPI()
+    api.failing = True
+    cache = AICache(CacheConfig(enable_cache=True, enable_disk_cache=False))
+    processor = StoryProcessor(api, cache)
+    processor.prefetcher = None
+    lookahead = RoomLookahead(processor.room_generator, cache)
+    processor.lookahead = lookahead
+    state = create_benchmark_game_state("Tester")
+
+    lookahead.schedule(state)
+    lookahead.wait_idle(timeout=5)
+    stats = lookahead.get_statistics()
+    assert stats["failed"] == len(neighbours) and stats["tokens_spent"] == 0
+    assert lookahead._generated == {}
+
+    api.failing = False
+    state.rooms_visited.add(state.current_location)
+    state.current_location = neighbours[0]
+    description = processor.generate_room_description(state.rooms[neighbours[0]], state, "move")
+    assert description.startswith("Generated text")
+
+    print("Room lookahead test passed!\n")
+
+
+if __name__ == "__main__":
+    test_room_lookahead()
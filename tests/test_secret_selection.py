@@ -0,0 +1,77 @@
+# test_secret_selection.py
+"""
+Test script to verify character prompts only carry the secrets the detective brings up
+"""
+
+
+def test_secret_selection():
+    """Test topic and recent-turn matching, revealed references and the legacy prompt"""
+    from ai_engine.benchmarks.prompt_size import _get_character, create_fixtures
+    from ai_engine.processors.character import SecretSelector
+    from ai_engine.prompts import create_fused_character_prompt, create_neutral_character_prompt
+
+    print("=== SECRET SELECTION TEST ===\n")
+
+    game_state = create_fixtures()["late"]
+    player = game_state.player
+    character = _get_character(game_state)
+    character.memory_current = []
+    inventory = {clue.name: clue for clue in player.inventory}
+    unlocked = [s for s in character.secrets if s.condition in inventory]
+    assert len(unlocked) > 3
+    legacy = create_neutral_character_prompt(character, player)
+
+    # Test 1: Only the secret of the clue named in the topic is sent
+    selector = SecretSelector(recent_turns=2, max_revealed=2)
+    target = unlocked[0]
+    selection = selector.select(character, player, f"Tell me about the {target.condition.lower()}.")
+    print(f"  Topic on {target.condition}: {[s.condition for s in selection.secrets]}")
+    assert target in selection.triggered and target in selection.secrets
+    assert len(selection.secrets) < len(unlocked)
+    assert selection.unlocked == len(unlocked)
+    prompt = create_neutral_character_prompt(character, player, selection.secrets)
+    assert target.secret in prompt
+    assert len(prompt) < len(legacy)
+
+    # Test 2: Nothing mentioned, nothing revealed yet: no secret at all
+    assert selector.select(character, player, "Lovely weather, isn't it?").secrets == []
+
+    # Test 3: Once answered, the secret shrinks to a one-line reference
+    triggered = selection.triggered
+    selector.mark_shown(selection)
+    assert all(s.shown for s in triggered)
+    selection = selector.select(character, player, "Lovely weather, isn't it?")
+    assert selection.secrets == triggered and selection.triggered == []
+    prompt = create_neutral_character_prompt(character, player, selection.secrets)
+    assert f"ALREADY REVEALED - {target.condition}:" in prompt
+    assert target.secret not in prompt
+
+    # Test 4: The detective's recent turns also bring secrets up
+    other = next(s for s in unlocked if not s.shown)
+    character.remember(f"What about the {other.condition.lower()}?", "user")
+    character.remember("I have nothing to say about that.", "assistant")
+    selection = selector.select(character, player, "Please, go on.")
+    assert other in selection.triggered
+    assert other.secret in create_fused_character_prompt(character, player, selection.secrets)
+
+    # Test 5: At most max_revealed references
+    for secret in unlocked:
+        secret.set_shown(True)
+    selection = selector.select(character, player, "Lovely weather, isn't it?")
+    assert len(selection.secrets) == 2 and selection.triggered == []
+
+    # Test 6: Without selection every unlocked secret is sent in full, as before
+    for secret in unlocked:
+        secret.set_shown(False)
+    assert create_neutral_character_prompt(character, player) == legacy
+    assert all(s.secret in legacy for s in unlocked)
+
+    stats = selector.get_statistics()
+    print(f"  Statistics: {stats}")
+    assert stats["selections"] == 5 and stats["revealed"] == len(triggered)
+
+    print("Secret selection test passed!\n")
+
+
+if __name__ == "__main__":
+    test_secret_selection()
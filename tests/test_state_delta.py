@@ -0,0 +1,106 @@
+# test_state_delta.py
+"""
+Test script to verify multi-turn agents get a game state snapshot followed by the changes since
+"""
+
+
+class PromptRecorder:
+    """API service stand-in keeping the system prompts it was sent"""
+
+    def __init__(self):
+        self.system_prompts = []
+
+    def make_api_call(self, messages, system_content=None, **kwargs):
+        self.system_prompts.append(system_content)
+        return '{"message": "The inspector raises an eyebrow.", "severity": "awkward"}'
+
+
+class NoCache:
+    def get(self, *args):
+        return None
+
+    def put(self, *args):
+        pass
+
+
+def test_state_delta():
+    """Test snapshots, change lines, thread separation and the nonsense handler wiring"""
+    from ai_engine.benchmarks.common import create_benchmark_game_state
+    from ai_engine.benchmarks.prompt_prefix import move_player
+    from ai_engine.benchmarks.state_delta import measure_mode, populate_lore
+    from ai_engine.processors.command.nonsense_handler import NonsenseHandler
+    from ai_engine.utils import GameStateDeltaRenderer, format_game_state
+    from ai_engine.utils.state_delta import CHANGES_HEADER
+
+    print("=== STATE DELTA TEST ===\n")
+
+    game_state = create_benchmark_game_state()
+    populate_lore(game_state)
+    room = next(r for r in game_state.rooms.values() if len(r.clues) >= 2)
+    move_player(game_state, room.name)
+    session = game_state.session_id
+    renderer = GameStateDeltaRenderer(snapshot_every=3)
+
+    # Test 1: The first turn is the full snapshot, an unchanged state adds nothing
+    snapshot = renderer.render(session, "nonsense", game_state.to_ai_format())
+    assert snapshot == format_game_state(game_state.to_ai_format())
+    assert renderer.render(session, "nonsense", game_state.to_ai_format()) == snapshot
+
+    # Test 2: A clue taken is appended after the untouched snapshot
+    clue = room.clues[0]
+    game_state.player.inventory.append(clue)
+    room.remove_clue(clue)
+    game_state.mark_changed()
+    text = renderer.render(session, "nonsense", game_state.to_ai_format())
+    print(f"  Delta:\n{text[len(snapshot):]}")
+    assert text.startswith(snapshot + "\n\n" + CHANGES_HEADER)
+    assert f"- No longer visible: {clue.name}" in text
+    assert f"- Added to inventory: {clue.name}" in text
+
+    # Test 3: Other agents and sessions keep their own thread
+    assert renderer.render(session, "lore", game_state.to_ai_format()) == format_game_state(game_state.to_ai_format())
+    assert CHANGES_HEADER not in renderer.render("other-session", "nonsense", game_state.to_ai_format())
+
+    # Test 4: A new snapshot every snapshot_every turns, and on a room change
+    text = renderer.render(session, "nonsense", game_state.to_ai_format())
+    assert text == format_game_state(game_state.to_ai_format())
+    renderer.render(session, "nonsense", game_state.to_ai_format())
+    move_player(game_state, next(name for name in game_state.rooms if name != room.name))
+    assert renderer.render(session, "nonsense", game_state.to_ai_format()) == format_game_state(game_state.to_ai_format())
+
+    stats = renderer.get_statistics()
+    print(f"  Statistics: {stats}")
+    assert stats["turns"] == 8 and stats["snapshots"] == 5 and stats["deltas"] == 3
+    assert stats["threads"] == 3
+
+    # Test 5: A reset session (save restored) starts again from a snapshot
+    renderer.render(session, "nonsense", game_state.to_ai_format())
+    renderer.reset(session)
+    assert renderer.get_statistics()["threads"] == 1
+    assert renderer.render(session, "nonsense", game_state.to_ai_format()) == format_game_state(game_state.to_ai_format())
+
+    # Test 6: The nonsense handler puts the rendered state in its prompt
+    api = PromptRecorder()
+    handler = NonsenseHandler(api, NoCache(), state_renderer=GameStateDeltaRenderer())
+    handler.handle_nonsense("dance on the table", game_state.to_ai_format())
+    clue = game_state.player.current_location.clues[0] if game_state.player.current_location.clues else None
+    if clue:
+        game_state.player.inventory.append(clue)
+        game_state.player.current_location.remove_clue(clue)
+        game_state.mark_changed()
+    handler.handle_nonsense("dance on the table again", game_state.to_ai_format())
+    assert CHANGES_HEADER not in api.system_prompts[0]
+    assert (CHANGES_HEADER in api.system_prompts[1]) == (clue is not None)
+
+    # Test 7: Over a session, delta turns send fewer new tokens than fresh snapshots
+    full = measure_mode(False, rooms=3, actions=4, snapshot_every=5)
+    delta = measure_mode(True, rooms=3, actions=4, snapshot_every=5)
+    print(f"  New tokens per turn: full={full['mean_new_tokens']} delta={delta['mean_new_tokens']}")
+    assert full["turns"] == delta["turns"] == 12
+    assert delta["mean_new_tokens"] < full["mean_new_tokens"]
+
+    print("State delta test passed!\n")
+
+
+if __name__ == "__main__":
+    test_state_delta()
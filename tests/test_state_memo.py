@@ -0,0 +1,99 @@
+# test_state_memo.py
+"""
+Test script to verify the game state version and the memoized AI and UI projections
+"""
+
+
+def test_state_memo():
+    """Test version bumps, memoized projections and their invalidation"""
+    from ai_engine.benchmarks.common import create_benchmark_game_state
+    from ai_engine.benchmarks.state_memo import memoized_turn, mutate
+    from ai_engine.utils.formatters import format_game_state
+
+    print("=== STATE MEMO TEST ===\n")
+
+    game_state = create_benchmark_game_state()
+
+    # Test 1: Assigning a field or marking a nested change bumps the version
+    version = game_state.version
+    game_state.investigation_stage = 1
+    assert game_state.version == version + 1
+    game_state.mark_changed()
+    assert game_state.version == version + 2
+
+    # Test 2: Projections are built once per version
+    ai_state = game_state.to_ai_format()
+    assert game_state.to_ai_format() is ai_state
+    assert ai_state["state_version"] == game_state.version
+    assert format_game_state(ai_state) is format_game_state(game_state.to_ai_format())
+    ui_state = game_state.to_dict()
+    assert game_state.to_dict() is ui_state
+    assert ui_state["reputation"]["total_counts"] == {"impromptu": 0, "awkward": 0, "dangerous": 0}
+
+    # Test 3: A nested change shows up once marked
+    room = next(r for r in game_state.rooms.values() if r.clues)
+    game_state.current_location = room.name
+    game_state.player.current_location = room
+    clue = room.clues[0]
+    game_state.player.collect_clue(clue.name)
+    game_state.mark_changed()
+    ai_state = game_state.to_ai_format()
+    assert clue.name in [item["name"] for item in ai_state["player"]["inventory"]]
+    assert clue.name not in ai_state["current_room"]["clues"]
+    assert clue.name in format_game_state(ai_state).split("Player's inventory:")[1]
+
+    # Test 4: Memoized projections equal rebuilt ones
+    assert game_state.to_ai_format() == game_state._build_ai_format()
+    assert game_state.to_dict() == game_state._build_dict()
+
+    # Test 5: A restore failing partway still invalidates the projections
+    from types import SimpleNamespace
+
+    from game_engine.interfaces.game_facade import GameFacade
+
+    def partial_restore(game_state_data):
+        game_state.player.inventory.clear()
+        raise KeyError("rooms")
+
+    reset_sessions = []
+    ai_manager = SimpleNamespace(reset_state_prompts=reset_sessions.append)
+    facade = SimpleNamespace(
+        state=game_state, _restore_game_state=partial_restore,
+        game_service=SimpleNamespace(ai_manager=ai_manager),
+    )
+    ai_state = game_state.to_ai_format()
+    success, _ = GameFacade._restore_from_save_data(facade, {"game_state": {}})
+    assert not success
+    assert game_state.to_ai_format() is not ai_state
+    assert game_state.to_ai_format()["player"]["inventory"] == []
+    # The agents' game state snapshots are dropped as well
+    assert reset_sessions == [game_state.session_id]
+
+    # Test 6: Over a session, each projection is built once per version
+    # (timings are left to python -m ai_engine.benchmarks.state_memo)
+    game_state = create_benchmark_game_state()
+    builds = {"ai_format": [], "dict": []}
+
+    def counted(name, build):
+        def wrapper():
+            builds[name].append(game_state.version)
+            return build()
+        return wrapper
+
+    object.__setattr__(game_state, "_build_ai_format", counted("ai_format", game_state._build_ai_format))
+    object.__setattr__(game_state, "_build_dict", counted("dict", game_state._build_dict))
+    mutations = 0
+    for turn in range(30):
+        if turn % 3 == 0:
+            mutate(game_state)
+            mutations += 1
+        memoized_turn(game_state)
+    print(f"  Builds over 30 turns: {({name: len(versions) for name, versions in builds.items()})}")
+    for versions in builds.values():
+        assert len(versions) == len(set(versions)) == mutations
+
+    print("State memo test passed!\n")
+
+
+if __name__ == "__main__":
+    test_state_memo()
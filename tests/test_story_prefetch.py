@@ -0,0 +1,90 @@
+# test_story_prefetch.py
+"""
+Test script to verify room-entry prefetch turns later looks into cache hits
+"""
+
+
+class CountingAPI:
+    """API stand-in counting calls"""
+
+    def __init__(self):
+        self.calls = 0
+        self.failing = False
+
+    def make_api_call(self, messages, system_content=None, max_tokens=None, **kwargs):
+        self.calls += 1
+        if self.failing:
+            return None  # Timeout or rate limit
+        return f"Generated text {self.calls}"
+
+    def parse_json_response(self, content, fallback_response):
+        return fallback_response
+
+
+def test_story_prefetch():
+    """Test prefetch of characters and clues, hit-through, waste and the budget"""
+    from ai_engine.cache.cache_config import CacheConfig
+    from ai_engine.cache.cache_manager import AICache
+    from ai_engine.processors.story.factory import StoryComponentFactory
+    from ai_engine.processors.story.prefetch import DescriptionPrefetcher
+    from game_engine.setup.game_setup import setup_game
+
+    api = CountingAPI()
+    cache = AICache(CacheConfig(enable_cache=True, enable_disk_cache=False))
+    _, character_generator, clue_analyzer, _ = StoryComponentFactory.create_standard_setup(api, cache)
+    prefetcher = DescriptionPrefetcher(character_generator, clue_analyzer, cache, idle_timeout=0)
+
+    rooms, player = setup_game("Tester")
+    room = next(r for r in rooms.values() if r.characters and r.clues)
+
+    print("=== STORY PREFETCH TEST ===\n")
+
+    # Test 1: Entering the room pre-generates its looks
+    queued = prefetcher.prefetch_room(room, player.inventory)
+    prefetcher._executor.submit(lambda: None).result(timeout=5)
+    assert queued == len(room.characters) + len(room.clues)
+    assert api.calls == queued
+    print(f"  {queued} looks prefetched for {room.name}")
+
+    # Test 2: The player's look is served from cache
+    character = room.characters[0]
+    prefetcher.record_look(prefetcher.character_key(character.name, room.name))
+    character_generator.generate_description(character, room)
+    assert api.calls == queued
+
+    stats = prefetcher.get_statistics()
+    print(f"  Statistics: {stats}")
+    assert stats["hit_through_rate"] == 1.0
+    assert 0 < stats["wasted_token_rate"] < 1
+
+    # Test 3: No spending once the budget is exhausted
+    prefetcher.token_budget = 0
+    assert prefetcher.prefetch_room(room, player.inventory) == 0
+
+    # Test 4: A failed prefetch caches no fallback text, the player's look calls again
+    api = CountingAPI()
+    api.failing = True
+    cache = AICache(CacheConfig(enable_cache=True, enable_disk_cache=False))
+    _, character_generator, clue_analyzer, _ = StoryComponentFactory.create_standard_setup(api, cache)
+    prefetcher = DescriptionPrefetcher(character_generator, clue_analyzer, cache, idle_timeout=0)
+
+    queued = prefetcher.prefetch_room(room, player.inventory)
+    prefetcher._executor.submit(lambda: None).result(timeout=5)
+    stats = prefetcher.get_statistics()
+    assert stats["failed"] == queued and stats["generated"] == 0 and stats["tokens_spent"] == 0
+    assert not character_generator.is_cached(room.characters[0], room)
+
+    # Test 5: The single-item fallback of a batch caches nothing either
+    clue = room.clues[0]
+    assert character_generator.generate_batch([room.characters[0]], room, cache_fallback=False) == {}
+    assert clue_analyzer.analyze_batch([clue], [clue], cache_fallback=False) == {}
+    assert not clue_analyzer.is_cached(clue, [clue])
+
+    api.failing = False
+    assert character_generator.generate_description(room.characters[0], room).startswith("Generated text")
+
+    print("Story prefetch test passed!\n")
+
+
+if __name__ == "__main__":
+    test_story_prefetch()
@@ -0,0 +1,101 @@
+# test_theory_prescore.py
+"""
+Test script to verify clear theories are decided locally and ambiguous ones reach the AI
+"""
+
+
+class VerifierAPI:
+    """API stand-in returning a fixed verification"""
+
+    def __init__(self, content):
+        self.calls = 0
+        self.content = content
+
+    def make_api_call(self, messages, system_content=None, max_tokens=None, **kwargs):
+        self.calls += 1
+        return self.content
+
+    def parse_json_response(self, content, fallback_response):
+        import json
+        return json.loads(content)
+
+
+def test_theory_prescore():
+    """Test local matches, mismatches, ambiguity and agreement tracking"""
+    from ai_engine.cache.cache_config import CacheConfig
+    from ai_engine.cache.cache_manager import AICache
+    from ai_engine.processors.theory import TheoryPreScoreMode, TheoryPreScorer, TheoryProcessor
+    from ai_engine.prompts import create_analyse_theory
+    from game_engine.setup.game_data import create_clues
+
+    clues = {clue.name: clue for clue in create_clues()}
+    inventory = [clues["Empty alcohol bottles"], clues["Edgar's personal journal"]]
+    scorer = TheoryPreScorer(TheoryPreScoreMode.LOCAL)
+
+    print("=== THEORY PRE-SCORE TEST ===\n")
+
+    # Test 1: A culprit outside every scenario is a clear mismatch
+    result = scorer.score({"culprit": "Lady Blackwood", "motive": "greed", "evidence": "the firearm"})
+    assert result["valid"] is False and result["scenario"] == 0
+    assert "Lady Adelaide Blackwood" in result["answer"]
+
+    # Test 2: Culprit, motive and evidence all matching is a clear match
+    result = scorer.score({
+        "culprit": "Edgar",
+        "motive": "He was jealous of Victor because of his unrequited love for Judith",
+        "evidence": "His fingerprints on the teacup, the empty bottles and his personal journal",
+    }, inventory)
+    assert result["valid"] is True and result["scenario"] == 2
+    print(f"  {result['think']}")
+
+    # Test 3: Right culprit with vague reasoning is left to the AI
+    assert scorer.score({"culprit": "Edgar Holloway", "motive": "he is odd", "evidence": "a feeling"}) is None
+    assert scorer.score({"culprit": "someone", "motive": "", "evidence": ""}) is None
+
+    # Test 4: The processor only calls the AI for ambiguous theories
+    api = VerifierAPI('{"valid": "false", "scenario": "0", "matching_scenario": false, "answer": "No"}')
+    processor = TheoryProcessor(api, AICache(CacheConfig(enable_cache=False)))
+    processor.pre_scorer = TheoryPreScorer(TheoryPreScoreMode.LOCAL)
+    conversation = [{"role": "system", "content": create_analyse_theory()}]
+
+    theory = {"culprit": "Inspector Ferdinand", "motive": "boredom", "evidence": "none"}
+    processor.verify_theory(conversation + [{"role": "user", "content": str(theory)}], theory)
+    assert api.calls == 0
+
+    theory = {"culprit": "Victor", "motive": "love", "evidence": "boots"}
+    processor.verify_theory(conversation + [{"role": "user", "content": str(theory)}], theory)
+    assert api.calls == 1
+
+    # Test 5: Shadow mode always asks the AI and tracks agreement
+    processor.pre_scorer = TheoryPreScorer(TheoryPreScoreMode.SHADOW)
+    theory = {"culprit": "Judith", "motive": "despair", "evidence": "the basin"}
+    result = processor.verify_theory(conversation + [{"role": "user", "content": str(theory)}], theory)
+    assert api.calls == 2 and result["answer"] == "No"
+
+    stats = processor.pre_scorer.get_statistics()
+    print(f"  Statistics: {stats}")
+    assert stats["compared"] == 1 and stats["agreement_rate"] == 1.0
+
+    # Test 6: Verdicts follow the player's language, the AI answers in other languages
+    from ai_engine.processors.theory import pre_scorer
+
+    language = pre_scorer.get_current_language
+    theory = {"culprit": "Lady Blackwood", "motive": "greed", "evidence": "the firearm"}
+    try:
+        pre_scorer.get_current_language = lambda: "French"
+        result = TheoryPreScorer(TheoryPreScoreMode.LOCAL).score(theory)
+        assert result["answer"].startswith("Une accusation") and "Lady Adelaide Blackwood" in result["answer"]
+
+        pre_scorer.get_current_language = lambda: "german"
+        scorer = TheoryPreScorer(TheoryPreScoreMode.LOCAL)
+        assert scorer.score(theory) is None
+        assert scorer.get_statistics()["untranslated"] == 1
+        assert TheoryPreScorer(TheoryPreScoreMode.SHADOW).score(theory)["valid"] is False
+    finally:
+        pre_scorer.get_current_language = language
+
+    print("Theory pre-score test passed!\n")
+
+
+if __name__ == "__main__":
+    test_theory_prescore()
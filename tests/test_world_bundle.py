@@ -0,0 +1,69 @@
+# test_world_bundle.py
+"""
+Test script to verify the compiled world bundle, its integrity check and the data version
+"""
+
+
+def test_world_bundle():
+    """Test the bundle loads the same world as data/, rejects corruption and versions the cache"""
+    import tempfile
+    from pathlib import Path
+
+    from ai_engine.cache.cache_config import CacheConfig
+    from ai_engine.cache.cache_keys import CacheKeyGenerator
+    from game_engine.setup.game_data import GameDataLoader, get_world_version
+    from game_engine.setup.world_bundle import WorldBundleError, compile_world_bundle, read_world_bundle
+
+    print("=== WORLD BUNDLE TEST ===\n")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        bundle_path = Path(tmp_dir) / "world.bundle"
+
+        # Test 1: The bundle loads the same world, with the same version, as data/
+        content_hash = compile_world_bundle(output=str(bundle_path))
+        from_directory = GameDataLoader(use_bundle=False).load_world_template()
+        from_bundle = GameDataLoader(bundle_path=str(bundle_path)).load_world_template()
+        assert from_bundle == from_directory
+        assert from_bundle.version == from_directory.version == content_hash == get_world_version()
+        print(f"  {bundle_path.stat().st_size} bytes, version {content_hash[:16]}")
+
+        # Test 2: A corrupted byte is rejected
+        raw = bytearray(bundle_path.read_bytes())
+        raw[-10] ^= 0xFF
+        bundle_path.write_bytes(bytes(raw))
+        try:
+            read_world_bundle(bundle_path)
+            assert False, "corrupted bundle should be rejected"
+        except WorldBundleError:
+            pass
+
+        # Test 3: A corrupted or missing bundle falls back to data/
+        assert GameDataLoader(bundle_path=str(bundle_path)).load_world_template() == from_directory
+        missing = GameDataLoader(bundle_path=str(Path(tmp_dir) / "missing.bundle"))
+        assert missing.load_world_template() == from_directory
+
+        # Test 4: A bundle older than data/ is ignored, edits under data/ are not lost
+        import os
+
+        compile_world_bundle(output=str(bundle_path))
+        loader = GameDataLoader(bundle_path=str(bundle_path))
+        assert not loader.is_bundle_stale()
+        os.utime(bundle_path, (0, 0))
+        assert loader.is_bundle_stale()
+        assert loader.load_world_template() == from_directory
+        unchecked = GameDataLoader(bundle_path=str(bundle_path), check_staleness=False)
+        assert unchecked.load_world_template() == from_bundle
+
+    # Test 5: The data version is part of the cache key
+    config = CacheConfig()
+    assert config.data_version == content_hash
+    params = {"temperature": 0.7}
+    key = CacheKeyGenerator(config).generate_key("Describe the library", params)
+    config.data_version = "other"
+    assert CacheKeyGenerator(config).generate_key("Describe the library", params) != key
+
+    print("World bundle test passed!\n")
+
+
+if __name__ == "__main__":
+    test_world_bundle()
@@ -0,0 +1,61 @@
+# test_world_template.py
+"""
+Test script to verify games share one immutable world template and keep their own state
+"""
+
+
+def test_world_template():
+    """Test the template is parsed once, is read-only, and games do not share state"""
+    import dataclasses
+
+    from game_engine.setup.game_data import GameDataLoader, get_world_template
+    from game_engine.setup.game_setup import setup_game
+
+    print("=== WORLD TEMPLATE TEST ===\n")
+
+    # Test 1: Parsed once per process, equal to a fresh parse of data/
+    world = get_world_template()
+    assert get_world_template() is world
+    assert GameDataLoader().load_world_template() == world
+    print(f"  {len(world.rooms)} rooms, {len(world.clues)} clues, {len(world.characters)} characters")
+
+    # Test 2: The template cannot be changed
+    try:
+        world.characters[0].status = "dead"
+        assert False, "template should be frozen"
+    except dataclasses.FrozenInstanceError:
+        pass
+    assert isinstance(world.rooms[0].exits, tuple)
+
+    # Test 3: Two games get their own objects, sharing the template texts
+    rooms_a, player_a = setup_game("A")
+    rooms_b, player_b = setup_game("B")
+    characters_a = {c.name: c for r in rooms_a.values() for c in r.characters}
+    characters_b = {c.name: c for r in rooms_b.values() for c in r.characters}
+    assert set(characters_a) == set(characters_b) == {c.name for c in world.characters}
+    name = next(c.name for c in world.characters if c.secrets)
+    assert characters_a[name] is not characters_b[name]
+    assert characters_a[name].prompt is characters_b[name].prompt
+    assert characters_a[name].secrets[0].secret is characters_b[name].secrets[0].secret
+
+    # Test 4: Session state stays in its game
+    room_a = next(r for r in rooms_a.values() if r.clues)
+    player_a.current_location = room_a
+    clue = room_a.clues[0]
+    assert player_a.collect_clue(clue.name)
+    assert clue.name in [c.name for c in rooms_b[room_a.name].clues]
+    assert not any(c.is_collected for r in rooms_b.values() for c in r.clues)
+
+    characters_a[name].secrets[0].set_shown(True)
+    characters_a[name].remember("Where were you last night?", "user")
+    rooms_a["Main Hall"].exits.append("Secret Passage")
+    assert not characters_b[name].secrets[0].shown
+    assert characters_b[name].memory_current == []
+    assert "Secret Passage" not in rooms_b["Main Hall"].exits
+    assert "Secret Passage" not in next(r for r in world.rooms if r.name == "Main Hall").exits
+
+    print("World template test passed!\n")
+
+
+if __name__ == "__main__":
+    test_world_template()